@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+benchmark_markdown_formatters.py
+--------------------------------
+Benchmark the columnar markdown formatters against the original row-at-a-time
+implementations across a grid of row counts and column widths.
+
+The row-at-a-time reference implementations (``to_pylist()`` plus a dict and an
+f-string per cell) are embedded below so the comparison stays meaningful after the
+library code has moved on. Every run also checks that both implementations produce
+byte-for-byte identical output before timing them.
+
+Tables mix string, integer, boolean and float columns (round-robin) so that both the
+vectorized conversions and the per-cell ``str()`` fallback are exercised.
+
+Usage:
+    uv run scripts/benchmark_markdown_formatters.py [--rows 100 1000 10000] [--columns 5 40] [--repeat 3]
+
+Arguments:
+    --rows N [N ...]      Row counts to benchmark (default: 100 1000 10000)
+    --columns N [N ...]   Column widths to benchmark (default: 5 20 40)
+    --repeat N            Timing repetitions per case; the best time is reported (default: 3)
+    --format {markdown-table,markdown-kv,all}
+                          Formatter(s) to benchmark (default: all)
+"""
+
+import argparse
+import functools
+import timeit
+from collections.abc import Callable
+
+import pyarrow as pa
+
+from deephaven_mcp.formatters._markdown import format_markdown_kv, format_markdown_table
+
+
+def legacy_format_markdown_table(arrow_table: pa.Table) -> str:
+    """Row-at-a-time markdown-table formatter (reference implementation)."""
+    columns = arrow_table.column_names
+    header = "| " + " | ".join(columns) + " |"
+    separator = "| " + " | ".join(["---"] * len(columns)) + " |"
+    rows = []
+    for batch in arrow_table.to_batches():
+        for row_dict in batch.to_pylist():
+            cells = [str(row_dict[col]).replace("|", "\\|") for col in columns]
+            rows.append("| " + " | ".join(cells) + " |")
+    return "\n".join([header, separator] + rows)
+
+
+def legacy_format_markdown_kv(arrow_table: pa.Table) -> str:
+    """Row-at-a-time markdown-kv formatter (reference implementation)."""
+    columns = arrow_table.column_names
+    records = []
+    idx = 0
+    for batch in arrow_table.to_batches():
+        for row_dict in batch.to_pylist():
+            idx += 1
+            record_lines = [f"## Record {idx}"]
+            for col in columns:
+                value_str = str(row_dict[col]).replace(":", "\\:")
+                record_lines.append(f"{col}: {value_str}")
+            records.append("\n".join(record_lines))
+    return "\n\n".join(records)
+
+
+FORMATTERS: dict[str, tuple[Callable[[pa.Table], str], Callable[[pa.Table], str]]] = {
+    "markdown-table": (legacy_format_markdown_table, format_markdown_table),
+    "markdown-kv": (legacy_format_markdown_kv, format_markdown_kv),
+}
+
+
+def build_table(rows: int, columns: int) -> pa.Table:
+    """Build a synthetic table with a round-robin mix of column types."""
+    data: dict[str, pa.Array] = {}
+    for c in range(columns):
+        kind = c % 4
+        if kind == 0:
+            data[f"Str{c}"] = pa.array(
+                [None if r % 17 == 0 else f"sym|{r % 97}:x" for r in range(rows)]
+            )
+        elif kind == 1:
+            data[f"Int{c}"] = pa.array(
+                [None if r % 13 == 0 else r * 31 - 5000 for r in range(rows)],
+                pa.int64(),
+            )
+        elif kind == 2:
+            data[f"Bool{c}"] = pa.array([r % 3 == 0 for r in range(rows)])
+        else:
+            data[f"Dbl{c}"] = pa.array([r * 0.25 for r in range(rows)], pa.float64())
+    return pa.table(data)
+
+
+def main() -> None:
+    """Run the benchmark grid and print a results table."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark columnar vs row-at-a-time markdown formatters."
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--columns", type=int, nargs="+", default=[5, 20, 40])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--format",
+        choices=[*FORMATTERS.keys(), "all"],
+        default="all",
+    )
+    args = parser.parse_args()
+
+    names = list(FORMATTERS) if args.format == "all" else [args.format]
+
+    print(
+        f"{'format':<15} {'rows':>8} {'cols':>5} {'legacy (s)':>11} "
+        f"{'columnar (s)':>13} {'speedup':>8}"
+    )
+    for name in names:
+        legacy, columnar = FORMATTERS[name]
+        for columns in args.columns:
+            for rows in args.rows:
+                table = build_table(rows, columns)
+                if legacy(table) != columnar(table):
+                    raise SystemExit(
+                        f"Output mismatch for {name} with {rows} rows x {columns} columns"
+                    )
+
+                legacy_time = min(
+                    timeit.repeat(
+                        functools.partial(legacy, table), number=1, repeat=args.repeat
+                    )
+                )
+                columnar_time = min(
+                    timeit.repeat(
+                        functools.partial(columnar, table),
+                        number=1,
+                        repeat=args.repeat,
+                    )
+                )
+                print(
+                    f"{name:<15} {rows:>8} {columns:>5} {legacy_time:>11.4f} "
+                    f"{columnar_time:>13.4f} {legacy_time / columnar_time:>7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
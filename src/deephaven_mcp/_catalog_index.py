@@ -0,0 +1,161 @@
+"""
+In-process trigram index over catalog namespace and table names.
+
+Builds an inverted index from character trigrams to catalog rows, so fuzzy name searches
+over large enterprise catalogs are answered locally instead of with remote where clauses.
+Matches are ranked by the Jaccard similarity of their trigram sets, with bonuses for exact
+and substring matches.
+
+Used by `queries.search_catalog()`, which builds one index per catalog snapshot.
+"""
+
+import heapq
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+MIN_QUERY_COVERAGE = 1 / 3
+"""float: Minimum fraction of the query's trigrams a name must contain to be returned as a match."""
+
+_EXACT_MATCH_BONUS = 1.0
+_TABLE_SUBSTRING_BONUS = 0.5
+_NAMESPACE_SUBSTRING_BONUS = 0.25
+
+
+def _trigrams(text: str) -> set[str]:
+    """
+    Return the trigrams of a lowercased, space-padded string.
+
+    Padding lets short names and word starts and ends contribute trigrams of their own.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        set[str]: The distinct trigrams of ``f" {text.lower()} "``.
+    """
+    padded = f" {text.lower()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def trigram_similarity(query: str, text: str) -> float:
+    """
+    Score how well a text matches a query, on the same scale as CatalogIndex.search().
+
+    Args:
+        query (str): The search text.
+        text (str): The candidate name.
+
+    Returns:
+        float: Jaccard similarity of the trigram sets plus exact (1.0) or substring (0.5) match
+            bonuses, or 0.0 if the text contains less than MIN_QUERY_COVERAGE of the query's trigrams.
+    """
+    query_trigrams = _trigrams(query)
+    text_trigrams = _trigrams(text)
+    shared = len(query_trigrams & text_trigrams)
+    if shared < MIN_QUERY_COVERAGE * len(query_trigrams):
+        return 0.0
+    score = shared / (len(query_trigrams) + len(text_trigrams) - shared)
+    needle, haystack = query.lower(), text.lower()
+    if needle == haystack:
+        score += _EXACT_MATCH_BONUS
+    elif needle in haystack:
+        score += _TABLE_SUBSTRING_BONUS
+    return score
+
+
+@dataclass(frozen=True)
+class CatalogMatch:
+    """
+    One ranked catalog search result.
+
+    Attributes:
+        namespace (str): Namespace of the matching table.
+        table (str): Name of the matching table.
+        score (float): Match score; higher is better.
+        matched_columns (list[str]): Column names that matched the query, if column names were searched.
+    """
+
+    namespace: str
+    table: str
+    score: float
+    matched_columns: list[str] = field(default_factory=list)
+
+
+class CatalogIndex:
+    """
+    Trigram index over the (namespace, table_name) rows of a catalog.
+
+    Each row is indexed under the trigrams of its table name and of its namespace. A search counts,
+    for every row sharing at least one trigram with the query, how many trigrams it shares, and ranks
+    the rows by similarity. Only rows sharing a trigram are ever looked at, so selective queries cost
+    time proportional to their matches, not to the catalog size.
+
+    Instances are immutable after construction and safe to search from several tasks.
+    """
+
+    def __init__(
+        self, namespaces: Sequence[str | None], table_names: Sequence[str | None]
+    ) -> None:
+        """
+        Build the index.
+
+        Args:
+            namespaces (Sequence[str | None]): Namespace of each catalog row.
+            table_names (Sequence[str | None]): Table name of each catalog row, aligned with namespaces.
+                Rows with a null namespace or table name are skipped.
+        """
+        self._rows: list[tuple[str, str]] = []
+        self._sizes: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+
+        for namespace, table_name in zip(namespaces, table_names, strict=True):
+            if namespace is None or table_name is None:
+                continue
+            row = len(self._rows)
+            trigrams = _trigrams(table_name) | _trigrams(namespace)
+            self._rows.append((namespace, table_name))
+            self._sizes.append(len(trigrams))
+            for trigram in trigrams:
+                self._postings.setdefault(trigram, []).append(row)
+
+    def __len__(self) -> int:
+        """Return the number of indexed catalog rows."""
+        return len(self._rows)
+
+    def search(self, query: str, limit: int) -> list[CatalogMatch]:
+        """
+        Return the catalog rows that best match a query.
+
+        Args:
+            query (str): The search text, matched case-insensitively against table names and namespaces.
+            limit (int): Maximum number of matches to return.
+
+        Returns:
+            list[CatalogMatch]: Up to ``limit`` matches, best first. Ties keep catalog order.
+        """
+        query_trigrams = _trigrams(query)
+        shared: Counter[int] = Counter()
+        for trigram in query_trigrams:
+            shared.update(self._postings.get(trigram, ()))
+
+        needle = query.lower()
+        min_shared = MIN_QUERY_COVERAGE * len(query_trigrams)
+        scored = []
+        for row, count in shared.items():
+            if count < min_shared:
+                continue
+            namespace, table_name = self._rows[row]
+            score = count / (len(query_trigrams) + self._sizes[row] - count)
+            if needle == table_name.lower():
+                score += _EXACT_MATCH_BONUS
+            elif needle in table_name.lower():
+                score += _TABLE_SUBSTRING_BONUS
+            elif needle in namespace.lower():
+                score += _NAMESPACE_SUBSTRING_BONUS
+            scored.append((score, -row))
+
+        return [
+            CatalogMatch(*self._rows[-negated_row], score=round(score, 4))
+            for score, negated_row in heapq.nlargest(limit, scored)
+        ]
@@ -40,6 +40,7 @@ See Also:
 import asyncio
 import logging
 from collections.abc import Iterable
+from concurrent.futures import Executor
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
@@ -402,6 +403,64 @@ class CorePlusControllerClient(
             )
             raise QueryError(f"Failed to retrieve query state with version: {e}") from e
 
+    async def query_names_and_version(
+        self, known_version: int | None = None
+    ) -> tuple[set[str] | None, int]:
+        """Retrieve the names of all persistent queries with the map version.
+
+        A lighter form of map_and_version() for callers that only track which queries
+        exist. Query names are read straight from the raw protobuf messages, so no
+        CorePlusQueryInfo wrapper is built. When the map version equals
+        ``known_version``, the map is not walked at all and no names are returned.
+
+        Args:
+            known_version (int | None): Map version the caller already has the names
+                for, or None to always return the names.
+
+        Returns:
+            tuple[set[str] | None, int]: A tuple containing:
+                - Names of all queries, or None if the version equals ``known_version``
+                - Version number (int) representing the current map state
+
+        Raises:
+            DeephavenConnectionError: If unable to connect to the controller service.
+            QueryError: If not subscribed or subscription state is invalid
+            InternalError: If subscribe() was not called before this method
+        """
+        if not self._subscribed:
+            _LOGGER.error(
+                "[CorePlusControllerClient:query_names_and_version] subscribe() must be called before query_names_and_version(). "
+                "This indicates a programming bug - the controller client was not properly initialized."
+            )
+            raise InternalError(
+                "subscribe() must be called before query_names_and_version(). This indicates a programming bug - "
+                "the controller client was not properly initialized."
+            )
+        try:
+            raw_map, version = await asyncio.to_thread(self.wrapped.map_and_version)
+            if version == known_version:
+                _LOGGER.debug(
+                    f"[CorePlusControllerClient:query_names_and_version] Map unchanged at version={version}"
+                )
+                return None, version
+            names = {info.config.name for info in raw_map.values()}
+            _LOGGER.debug(
+                f"[CorePlusControllerClient:query_names_and_version] Retrieved {len(names)} query names, version={version}"
+            )
+            return names, version
+        except ConnectionError as e:
+            _LOGGER.error(
+                f"[CorePlusControllerClient:query_names_and_version] Connection error: {e}"
+            )
+            raise DeephavenConnectionError(
+                f"Unable to connect to controller service: {e}"
+            ) from e
+        except Exception as e:
+            _LOGGER.error(
+                f"[CorePlusControllerClient:query_names_and_version] Failed to retrieve query names: {e}"
+            )
+            raise QueryError(f"Failed to retrieve query names with version: {e}") from e
+
     async def get_serial_for_name(
         self, name: str, timeout_seconds: float = NO_WAIT_SECONDS
     ) -> CorePlusQuerySerial:
@@ -528,7 +587,10 @@ class CorePlusControllerClient(
             raise QueryError(f"Failed to wait for query state change: {e}") from e
 
     async def wait_for_change_from_version(
-        self, map_version: int, timeout_seconds: float
+        self,
+        map_version: int,
+        timeout_seconds: float,
+        executor: Executor | None = None,
     ) -> bool:
         """Wait for query map version to increment beyond specified version.
 
@@ -539,8 +601,9 @@ class CorePlusControllerClient(
 
         **Important**: ``timeout_seconds`` must be a positive value.  Passing ``0``
         has undefined behavior at the Java layer and must not be used.  This method
-        is not suitable for non-blocking staleness checks; call ``map_and_version()``
-        directly and compare the returned version yourself instead.
+        is not suitable for non-blocking staleness checks; call
+        ``query_names_and_version()`` with the known version, or ``map_and_version()``,
+        and compare versions instead.
 
         The version number is monotonically increasing and increments every time the
         subscription map changes (query created, deleted, or state modified).
@@ -556,6 +619,10 @@ class CorePlusControllerClient(
                               from a previous map_and_version() call.
             timeout_seconds (float): Maximum time to wait for version change, in seconds.
                                     Must be a positive value — zero is not supported.
+            executor (Executor | None): Executor that runs the blocking call. Defaults to
+                                    None, which uses the event loop's default executor.
+                                    Long-running watchers should pass their own executor so
+                                    their polls do not occupy default-executor threads.
 
         Returns:
             bool: True if version changed (version > map_version), False if timeout occurred
@@ -574,9 +641,19 @@ class CorePlusControllerClient(
             f"Waiting for version > {map_version}, timeout={timeout_seconds}s"
         )
         try:
-            result = await asyncio.to_thread(
-                self.wrapped.wait_for_change_from_version, map_version, timeout_seconds
-            )
+            if executor is None:
+                result = await asyncio.to_thread(
+                    self.wrapped.wait_for_change_from_version,
+                    map_version,
+                    timeout_seconds,
+                )
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    executor,
+                    self.wrapped.wait_for_change_from_version,
+                    map_version,
+                    timeout_seconds,
+                )
             _LOGGER.debug(
                 f"[CorePlusControllerClient:wait_for_change_from_version] "
                 f"Returned: {result} (version {'changed' if result else 'unchanged'})"
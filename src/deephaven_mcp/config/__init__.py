@@ -151,6 +151,7 @@ Configuration JSON Specification:
 - It may optionally contain `"community"` and/or `"enterprise"` top-level keys:
     - `"community"`: If present, this must be a dictionary containing community configuration.
     - `"enterprise"`: If present, this must be a dictionary containing enterprise configuration.
+- It may optionally contain a `"table_export"` key enabling Parquet exports to a spill directory.
 
 Example Valid Configuration (without community sessions):
 ---------------------------
@@ -256,6 +257,9 @@ __all__ = [
     "validate_single_enterprise_system",
     "redact_enterprise_system_config",
     "redact_enterprise_systems_map",
+    # Table export API
+    "DEFAULT_EXPORT_BATCH_ROWS",
+    "validate_table_export_config",
 ]
 
 import asyncio
@@ -289,6 +293,7 @@ from ._enterprise_system import (
     validate_enterprise_systems_config,
     validate_single_enterprise_system,
 )
+from ._table_export import DEFAULT_EXPORT_BATCH_ROWS, validate_table_export_config
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -373,6 +378,11 @@ _SCHEMA_PATHS: dict[tuple[str, ...], _ConfigPathSpec] = {
             else systems_dict
         ),
     ),
+    ("table_export",): _ConfigPathSpec(
+        required=False,
+        expected_type=dict,
+        validator=validate_table_export_config,
+    ),
 }
 
 
@@ -1022,6 +1032,14 @@ def validate_config(config: dict[str, Any]) -> dict[str, Any]:
                           * "private_key":
                               - 'private_key_path' (str, required): The path to the Deephaven private keypair file (proprietary format, typically named `priv-<keyname>.base64.txt`; provided by your IT/security team - this is not a standard PEM file).
 
+      - 'table_export' (dict, optional):
+            Enables exporting table data to local Parquet files (session_table_data with
+            export_parquet=True). Exports are disabled when this key is absent. Validated by
+            `src/deephaven_mcp/config/_table_export.py`. May contain:
+
+              - 'directory' (str, required): Spill directory that export files are written to.
+              - 'batch_rows' (int, optional): Rows fetched and written per batch (default 100000).
+
     Validation Rules:
       - Only known keys are allowed at each level of nesting.
       - All present sections are validated according to their schema.
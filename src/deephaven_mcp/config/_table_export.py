@@ -0,0 +1,79 @@
+"""
+Configuration handling for exporting table data to local files.
+
+This module validates the top-level `table_export` section, which enables the
+Parquet export mode of the `session_table_data` MCP tool. Exports are disabled
+unless this section is present, because they write files on the MCP server host.
+
+Fields:
+- `directory` (str, required): Spill directory that export files are written to.
+  Created on first use if it does not exist.
+- `batch_rows` (int, optional): Number of rows fetched from the server and written
+  per Parquet row group. Defaults to `DEFAULT_EXPORT_BATCH_ROWS`.
+
+All validation errors raise `ConfigurationError` with descriptive messages.
+"""
+
+__all__ = [
+    "DEFAULT_EXPORT_BATCH_ROWS",
+    "validate_table_export_config",
+]
+
+from typing import Any
+
+from deephaven_mcp._exceptions import ConfigurationError
+
+DEFAULT_EXPORT_BATCH_ROWS = 100_000
+"""int: Rows fetched and written per batch when `table_export.batch_rows` is not set."""
+
+_ALLOWED_TABLE_EXPORT_FIELDS: dict[str, type] = {
+    "directory": str,
+    "batch_rows": int,
+}
+
+
+def validate_table_export_config(table_export_config: Any) -> None:
+    """
+    Validate the 'table_export' configuration section.
+
+    Args:
+        table_export_config (Any): The value of the 'table_export' key.
+
+    Raises:
+        ConfigurationError: If the section is not a dict, contains unknown fields,
+            lacks 'directory', or if a field has the wrong type or an invalid value
+            (empty directory, non-positive batch_rows).
+    """
+    if not isinstance(table_export_config, dict):
+        raise ConfigurationError("'table_export' must be a dictionary in configuration")
+
+    unknown = set(table_export_config) - set(_ALLOWED_TABLE_EXPORT_FIELDS)
+    if unknown:
+        raise ConfigurationError(
+            f"Unknown field(s) in 'table_export' configuration: {sorted(unknown)}"
+        )
+
+    if "directory" not in table_export_config:
+        raise ConfigurationError(
+            "'table_export.directory' is required when 'table_export' is configured"
+        )
+
+    for field_name, expected_type in _ALLOWED_TABLE_EXPORT_FIELDS.items():
+        if field_name not in table_export_config:
+            continue
+        value = table_export_config[field_name]
+        # bool is a subclass of int; reject it explicitly for batch_rows
+        if not isinstance(value, expected_type) or isinstance(value, bool):
+            raise ConfigurationError(
+                f"'table_export.{field_name}' must be of type {expected_type.__name__}, "
+                f"got {type(value).__name__}"
+            )
+
+    if not table_export_config["directory"].strip():
+        raise ConfigurationError("'table_export.directory' must not be empty")
+
+    batch_rows = table_export_config.get("batch_rows")
+    if batch_rows is not None and batch_rows <= 0:
+        raise ConfigurationError(
+            f"'table_export.batch_rows' must be a positive integer, got {batch_rows}"
+        )
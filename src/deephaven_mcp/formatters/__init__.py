@@ -5,8 +5,9 @@ This module provides table data formatting optimized for AI agent consumption, w
 selection based on empirical research showing significant accuracy differences between formats.
 
 Features:
-    - Multiple output formats: JSON (row/column), CSV, Markdown (table/kv), YAML, XML
-    - Optimization strategies for rendering, accuracy, cost, and speed
+    - Multiple output formats: JSON (row/column), CSV, Markdown (table/kv), YAML, XML,
+      and base64 Arrow IPC streams for programmatic clients
+    - Optimization strategies for rendering, accuracy, cost, speed, and throughput
     - Research-backed format accuracy rankings (markdown-kv: 60.7%, csv: 44%)
     - Explicit format selection for advanced use cases
     - Comprehensive format validation with helpful error messages
@@ -25,9 +26,10 @@ Optimization Strategies:
     - optimize-accuracy: Always use markdown-kv (highest comprehension, more tokens)
     - optimize-cost: Always use csv (fewest tokens, most cost-effective)
     - optimize-speed: Always use json-column (fastest conversion)
+    - optimize-throughput: Always use arrow-ipc-lz4 (binary, exact types, no per-cell work)
 
 Supported Formats:
-    Explicit Formats (7 total):
+    Explicit Formats (10 total):
         json-row: Array of row objects (returns list[dict])
             Example: [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
 
@@ -49,11 +51,33 @@ Supported Formats:
         xml: XML with records/record structure (returns str)
             Example: "<records><record id=\\"1\\"><name>Alice</name></record></records>"
 
-    Optimization Strategies (4 total):
+        arrow-ipc: Base64-encoded Arrow IPC stream (returns str)
+            Decode: pa.ipc.open_stream(base64.b64decode(data)).read_all()
+
+        arrow-ipc-lz4, arrow-ipc-zstd: Same, with LZ4 or ZSTD compressed buffers
+            (returns str; Arrow readers decompress transparently)
+
+    Optimization Strategies (5 total):
         optimize-rendering: Always use markdown-table (best for AI agent table display)
         optimize-accuracy: Always use markdown-kv (highest accuracy)
         optimize-cost: Always use csv (most token-efficient)
         optimize-speed: Always use json-column (fastest conversion)
+        optimize-throughput: Always use arrow-ipc-lz4 (for programmatic clients)
+
+Streaming:
+    format_table_data_iter() yields the same payload as a sequence of FormattedChunk
+    objects, one record batch at a time, and stops once an optional byte or token
+    budget is reached. The final chunk reports how many rows were emitted and whether
+    the output was truncated. join_formatted_chunks() reassembles the chunks into the
+    payload format_table_data() would return for the emitted rows.
+
+Size Estimation:
+    estimate_formatted_size() predicts the rendered size of a table in a given format
+    from its column types, sampled value lengths and row count, without formatting it.
+    estimate_max_rows() inverts the same model to find how many rows fit in a byte
+    budget. Use them to reject or shrink oversized requests before formatting.
+    resolve_byte_budget() converts byte and token budgets into the single byte
+    budget that format_table_data_iter() enforces.
 
 Usage:
     >>> from deephaven_mcp.formatters import format_table_data
@@ -64,7 +88,7 @@ Usage:
     >>> # Returns: ("markdown-table", "| id | name |\\n| --- | --- |\\n...")
 
 Dependencies:
-    - pyarrow: Table data structure and CSV conversion
+    - pyarrow: Table data structure, CSV conversion and Arrow IPC serialization
     - pyyaml: YAML formatting support
     - xml.etree.ElementTree: XML formatting (standard library)
 
@@ -73,12 +97,24 @@ Thread Safety:
 """
 
 import logging
+from collections.abc import Iterator
 
 import pyarrow as pa
 
+from ._arrow import format_arrow_ipc, format_arrow_ipc_lz4, format_arrow_ipc_zstd
 from ._csv import format_csv
+from ._estimate import _estimate_formatted_size, _estimate_max_rows
 from ._json import format_json_column, format_json_row
 from ._markdown import format_markdown_kv, format_markdown_table
+from ._stream import (
+    _STREAM_SPECS,
+    ESTIMATED_BYTES_PER_TOKEN,
+    FormattedChunk,
+    _budget_bytes,
+    _iter_chunks,
+    _iter_single_chunk,
+    join_formatted_chunks,
+)
 from ._xml import format_xml
 from ._yaml import format_yaml
 
@@ -93,6 +129,9 @@ _FORMATTERS = {
     "markdown-kv": format_markdown_kv,
     "yaml": format_yaml,
     "xml": format_xml,
+    "arrow-ipc": format_arrow_ipc,
+    "arrow-ipc-lz4": format_arrow_ipc_lz4,
+    "arrow-ipc-zstd": format_arrow_ipc_zstd,
 }
 
 VALID_FORMATS: set[str] = set(_FORMATTERS.keys()) | {
@@ -100,11 +139,12 @@ VALID_FORMATS: set[str] = set(_FORMATTERS.keys()) | {
     "optimize-accuracy",
     "optimize-cost",
     "optimize-speed",
+    "optimize-throughput",
 }
 """Valid format names for table data formatting.
 
-This set contains all supported format types: 7 explicit formats and 4 optimization strategies.
-Total: 11 valid format names.
+This set contains all supported format types: 10 explicit formats and 5 optimization strategies.
+Total: 15 valid format names.
 
 Use this constant to validate format names before calling format_table_data().
 
@@ -113,9 +153,9 @@ Type:
 
 Contents:
     - Explicit formats: "json-row", "json-column", "csv", "markdown-table", 
-      "markdown-kv", "yaml", "xml"
+      "markdown-kv", "yaml", "xml", "arrow-ipc", "arrow-ipc-lz4", "arrow-ipc-zstd"
     - Optimization strategies: "optimize-rendering", "optimize-accuracy", "optimize-cost", 
-      "optimize-speed"
+      "optimize-speed", "optimize-throughput"
 
 See the module docstring's "Supported Formats" section for detailed descriptions and examples
 of each format.
@@ -142,8 +182,10 @@ def format_table_data(
             - "optimize-accuracy": Always use markdown-kv (most accurate format)
             - "optimize-cost": Always use most token-efficient format (csv)
             - "optimize-speed": Always use fastest conversion (json-column)
+            - "optimize-throughput": Always use a binary Arrow IPC stream (arrow-ipc-lz4)
             - Explicit formats: "json-row", "json-column", "csv", "markdown-table",
-                               "markdown-kv", "yaml", "xml"
+                               "markdown-kv", "yaml", "xml", "arrow-ipc",
+                               "arrow-ipc-lz4", "arrow-ipc-zstd"
 
     Returns:
         tuple[str, object]: A 2-tuple containing:
@@ -154,6 +196,7 @@ def format_table_data(
                 * json-row: list[dict] - Array of row objects
                 * json-column: dict - Column-oriented dictionary
                 * csv, markdown-table, markdown-kv, yaml, xml: str - Formatted string
+                * arrow-ipc, arrow-ipc-lz4, arrow-ipc-zstd: str - Base64 Arrow IPC stream
 
     Raises:
         ValueError: If format_type is not in VALID_FORMATS. The error message includes
@@ -173,13 +216,7 @@ def format_table_data(
         >>> # format = "csv"
     """
     # Validate format
-    if format_type not in VALID_FORMATS:
-        valid_list = ", ".join(sorted(VALID_FORMATS))
-        _LOGGER.error(
-            f"[formatters:format_table_data] Invalid format '{format_type}'. "
-            f"Valid options: {valid_list}"
-        )
-        raise ValueError(f"Invalid format '{format_type}'. Valid options: {valid_list}")
+    _validate_format("format_table_data", format_type)
 
     # Get row count from table
     row_count = len(arrow_table)
@@ -206,6 +243,195 @@ def format_table_data(
     return actual_format, data
 
 
+def format_table_data_iter(
+    arrow_table: pa.Table,
+    format_type: str,
+    *,
+    max_bytes: int | None = None,
+    max_tokens: int | None = None,
+) -> Iterator[FormattedChunk]:
+    """
+    Convert Arrow table to specified format incrementally, one record batch at a time.
+
+    Unlike format_table_data(), the full payload is never built in memory: each
+    record batch is formatted and yielded as a FormattedChunk. When a budget is given,
+    formatting stops at the last row boundary that keeps the whole payload (including
+    any headers and closing tags) within the budget, so truncated output is still
+    well formed. Batches that only partly fit are cut at the exact row.
+
+    The Arrow IPC formats are the exception: a base64 stream cannot be split into
+    independently concatenable pieces, so they are yielded as a single chunk holding
+    the longest leading slice of rows that fits the budget.
+
+    Args:
+        arrow_table (pa.Table): PyArrow Table to format
+        format_type (str): Format name or optimization strategy (see format_table_data()).
+        max_bytes (int | None): Maximum payload size in bytes. None means unbounded.
+        max_tokens (int | None): Maximum payload size in estimated tokens, converted
+            with ESTIMATED_BYTES_PER_TOKEN. None means unbounded. When both budgets are
+            given, the tighter one applies.
+
+    Yields:
+        FormattedChunk: Payload fragments in table order. At least one chunk is always
+        yielded; if no row fits in the budget, the single chunk holds the format's
+        empty-table payload. The last chunk's ``row_offset + row_count`` is the number
+        of rows emitted and its ``truncated`` flag reports whether the budget stopped
+        the stream.
+
+    Raises:
+        ValueError: If format_type is not in VALID_FORMATS, or a budget is negative.
+            Raised on the first call to ``next()``.
+
+    Examples:
+        >>> chunks = list(format_table_data_iter(table, "csv", max_tokens=2000))
+        >>> chunks[-1].truncated
+        True
+        >>> fmt, data, rows, truncated = join_formatted_chunks(chunks)
+    """
+    _validate_format("format_table_data_iter", format_type)
+    budget = _budget_bytes(max_bytes, max_tokens)
+
+    actual_format, reason = _resolve_format(format_type)
+    _LOGGER.debug(
+        f"[formatters:format_table_data_iter] Streaming {len(arrow_table)} rows as "
+        f"'{actual_format}' ({reason}), budget={budget} bytes"
+    )
+
+    # The empty-table payload doubles as the result when no row fits the budget
+    empty_payload = _FORMATTERS[actual_format](arrow_table.schema.empty_table())
+
+    if actual_format in _STREAM_SPECS:
+        chunks = _iter_chunks(arrow_table, actual_format, empty_payload, budget)
+    else:
+        # Binary payloads cannot be concatenated, so they are emitted as one chunk
+        chunks = _iter_single_chunk(
+            arrow_table, actual_format, _FORMATTERS[actual_format], budget
+        )
+
+    last: FormattedChunk | None = None
+    for last in chunks:
+        yield last
+
+    if last is not None and last.truncated:
+        _LOGGER.debug(
+            f"[formatters:format_table_data_iter] Budget of {budget} bytes reached after "
+            f"{last.row_offset + last.row_count} of {len(arrow_table)} rows"
+        )
+
+
+def resolve_byte_budget(
+    *, max_bytes: int | None = None, max_tokens: int | None = None
+) -> int | None:
+    """
+    Combine optional byte and token budgets into a single byte budget.
+
+    This is the conversion format_table_data_iter() applies to its budget arguments,
+    exposed so callers can plan how many rows to fetch before formatting anything.
+
+    Args:
+        max_bytes (int | None): Maximum payload size in bytes. None means unbounded.
+        max_tokens (int | None): Maximum payload size in estimated tokens, converted
+            with ESTIMATED_BYTES_PER_TOKEN. None means unbounded.
+
+    Returns:
+        int | None: The tighter of the two budgets in bytes, or None if neither is given.
+
+    Raises:
+        ValueError: If either budget is negative.
+
+    Examples:
+        >>> resolve_byte_budget(max_bytes=10_000, max_tokens=1_000)
+        4000
+    """
+    return _budget_bytes(max_bytes, max_tokens)
+
+
+def estimate_formatted_size(
+    arrow_table: pa.Table,
+    format_type: str,
+    *,
+    row_count: int | None = None,
+) -> int:
+    """
+    Estimate the size of a table's formatted payload without formatting it.
+
+    The estimate combines the column names and types, the average rendered length of
+    values sampled from each column (at most a few hundred evenly spaced rows), the
+    exact null fractions and the row count with a per-format layout model (delimiters,
+    quoting, record headers, tags). It is typically within a few tens of percent of the
+    real size, which is far closer than Arrow's in-memory ``nbytes`` for text output.
+
+    Args:
+        arrow_table (pa.Table): PyArrow Table to estimate.
+        format_type (str): Format name or optimization strategy (see format_table_data()).
+        row_count (int | None): Number of rows to estimate for, using this table's
+            schema and values as the sample. Defaults to the table's own row count.
+            Useful to extrapolate from a small probe to a larger request.
+
+    Returns:
+        int: Estimated payload size in bytes (UTF-8 text, or JSON-serialized size for
+        the json formats).
+
+    Raises:
+        ValueError: If format_type is not in VALID_FORMATS.
+
+    Examples:
+        >>> estimate_formatted_size(table, "markdown-kv")
+        48213
+        >>> estimate_formatted_size(probe_table, "csv", row_count=1_000_000)
+        31000021
+    """
+    _validate_format("estimate_formatted_size", format_type)
+    actual_format, _ = _resolve_format(format_type)
+    return _estimate_formatted_size(arrow_table, actual_format, row_count)
+
+
+def estimate_max_rows(arrow_table: pa.Table, format_type: str, max_bytes: int) -> int:
+    """
+    Estimate how many rows of a table fit within a byte budget once formatted.
+
+    Uses the same model as estimate_formatted_size(). The result is an estimate;
+    callers that need a hard guarantee should also format with a budget via
+    format_table_data_iter().
+
+    Args:
+        arrow_table (pa.Table): PyArrow Table whose schema and values drive the estimate.
+        format_type (str): Format name or optimization strategy (see format_table_data()).
+        max_bytes (int): Byte budget for the formatted payload.
+
+    Returns:
+        int: Estimated number of rows that fit (0 if not even headers fit). May exceed
+        the table's own row count.
+
+    Raises:
+        ValueError: If format_type is not in VALID_FORMATS.
+    """
+    _validate_format("estimate_max_rows", format_type)
+    actual_format, _ = _resolve_format(format_type)
+    return _estimate_max_rows(arrow_table, actual_format, max_bytes)
+
+
+def _validate_format(function_name: str, format_type: str) -> None:
+    """
+    Validate a format name against VALID_FORMATS.
+
+    Args:
+        function_name (str): Name of the calling function for logging.
+        format_type (str): Format name or optimization strategy to validate.
+
+    Raises:
+        ValueError: If format_type is not in VALID_FORMATS. The error message includes
+            a comma-separated list of all valid format options.
+    """
+    if format_type not in VALID_FORMATS:
+        valid_list = ", ".join(sorted(VALID_FORMATS))
+        _LOGGER.error(
+            f"[formatters:{function_name}] Invalid format '{format_type}'. "
+            f"Valid options: {valid_list}"
+        )
+        raise ValueError(f"Invalid format '{format_type}'. Valid options: {valid_list}")
+
+
 def _resolve_format(format_type: str) -> tuple[str, str]:
     """
     Resolve optimization strategy to concrete format name.
@@ -234,9 +460,22 @@ def _resolve_format(format_type: str) -> tuple[str, str]:
     elif format_type == "optimize-speed":
         return "json-column", "optimize-speed strategy"
 
+    elif format_type == "optimize-throughput":
+        return "arrow-ipc-lz4", "optimize-throughput strategy"
+
     else:
         # Explicit format specified
         return format_type, f"explicit format: {format_type}"
 
 
-__all__ = ["format_table_data", "VALID_FORMATS"]
+__all__ = [
+    "format_table_data",
+    "format_table_data_iter",
+    "estimate_formatted_size",
+    "estimate_max_rows",
+    "resolve_byte_budget",
+    "join_formatted_chunks",
+    "FormattedChunk",
+    "ESTIMATED_BYTES_PER_TOKEN",
+    "VALID_FORMATS",
+]
@@ -28,3 +28,34 @@ def format_csv(arrow_table: pa.Table) -> str:
     output = io.BytesIO()
     csv.write_csv(arrow_table, output)
     return output.getvalue().decode("utf-8")
+
+
+def _csv_header(schema: pa.Schema) -> str:
+    r"""
+    Build the CSV header line for a schema.
+
+    Args:
+        schema (pa.Schema): Schema of the table being formatted
+
+    Returns:
+        str: Header line as written by PyArrow, including the trailing newline.
+             Example: "\"id\",\"name\"\n"
+    """
+    output = io.BytesIO()
+    csv.write_csv(schema.empty_table(), output)
+    return output.getvalue().decode("utf-8")
+
+
+def _csv_rows(batch: pa.RecordBatch) -> str:
+    """
+    Format the rows of one record batch as CSV lines without a header.
+
+    Args:
+        batch (pa.RecordBatch): Record batch to format
+
+    Returns:
+        str: CSV lines for the batch, each terminated by a newline.
+    """
+    output = io.BytesIO()
+    csv.write_csv(batch, output, write_options=csv.WriteOptions(include_header=False))
+    return output.getvalue().decode("utf-8")
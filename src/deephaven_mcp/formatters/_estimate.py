@@ -0,0 +1,182 @@
+"""Rendered-size estimation for PyArrow tables, without formatting them."""
+
+import math
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ._arrow import _ARROW_IPC_FORMATS
+from ._markdown import _to_str_array
+
+_SAMPLE_ROWS = 256
+"""Maximum number of evenly spaced rows sampled per column to measure value lengths."""
+
+# Rendered length of a null value, per concrete format
+_NULL_LENGTHS: dict[str, int] = {
+    "json-row": 4,  # null
+    "json-column": 4,  # null
+    "csv": 0,  # empty field
+    "markdown-table": 4,  # None
+    "markdown-kv": 4,  # None
+    "yaml": 4,  # null
+    "xml": 4,  # None
+}
+
+# Extra characters around string values, per concrete format (quotes)
+_STRING_QUOTING: dict[str, int] = {
+    "json-row": 2,
+    "json-column": 2,
+    "csv": 2,
+}
+
+
+def _average_value_lengths(arrow_table: pa.Table) -> list[tuple[float, float, bool]]:
+    """
+    Measure the average rendered length of each column's values from a sample.
+
+    Rows are sampled at evenly spaced positions and converted with the same
+    ``str()``-compatible conversion the markdown formatters use. Null fractions are
+    exact (taken from the column null counts).
+
+    Args:
+        arrow_table (pa.Table): Table to measure.
+
+    Returns:
+        list[tuple[float, float, bool]]: Per column, a 3-tuple of
+        (average non-null value length in UTF-8 bytes, null fraction, is string type).
+    """
+    row_count = arrow_table.num_rows
+    step = max(1, row_count // _SAMPLE_ROWS)
+    indices = pa.array(range(0, row_count, step)[:_SAMPLE_ROWS], pa.int64())
+
+    stats = []
+    for column in arrow_table.columns:
+        value_type = column.type
+        if pa.types.is_dictionary(value_type):
+            value_type = value_type.value_type
+        is_string = pa.types.is_string(value_type) or pa.types.is_large_string(
+            value_type
+        )
+
+        sample = column.take(indices).combine_chunks().drop_null()
+        if len(sample):
+            lengths = pc.binary_length(_to_str_array(sample))
+            average = pc.mean(lengths).as_py()
+        else:
+            average = 0.0
+
+        null_fraction = column.null_count / row_count if row_count else 0.0
+        stats.append((average, null_fraction, is_string))
+    return stats
+
+
+def _estimate_size_model(
+    arrow_table: pa.Table, actual_format: str
+) -> tuple[int, float]:
+    """
+    Build a linear size model (fixed overhead plus bytes per row) for a format.
+
+    Args:
+        arrow_table (pa.Table): Table whose schema and sampled values drive the model.
+        actual_format (str): Concrete format name (not an optimization strategy).
+
+    Returns:
+        tuple[int, float]: (fixed overhead in bytes, estimated bytes per row).
+    """
+    if actual_format in _ARROW_IPC_FORMATS:
+        # Base64 (4/3) of the schema message, the 8-byte end-of-stream marker, per-batch
+        # metadata and padding (bounded by twice the schema message) and the raw
+        # buffers. Compression only shrinks the payload, so this is an upper bound.
+        schema_size = arrow_table.schema.serialize().size
+        batches = max(len(arrow_table.to_batches()), 1)
+        rows = max(arrow_table.num_rows, 1)
+        overhead = math.ceil((schema_size + 8 + 2 * schema_size * batches) * 4 / 3)
+        return overhead, arrow_table.nbytes / rows * 4 / 3
+
+    names = [len(name.encode("utf-8")) for name in arrow_table.column_names]
+    column_count = len(names)
+    separators = max(column_count - 1, 0)
+    null_length = _NULL_LENGTHS[actual_format]
+    quoting = _STRING_QUOTING.get(actual_format, 0)
+
+    cells = [
+        (1 - null_fraction) * (average + (quoting if is_string else 0))
+        + null_fraction * null_length
+        for average, null_fraction, is_string in _average_value_lengths(arrow_table)
+    ]
+    total_cells = sum(cells)
+    total_names = sum(names)
+    pairs = list(zip(names, cells, strict=True))
+
+    if actual_format == "markdown-table":
+        # "| a | b |\n| --- | --- |" then "\n| v1 | v2 |" per row
+        overhead = (4 + total_names + 3 * separators) + 1 + (4 + 6 * column_count - 3)
+        per_row = 1 + 4 + total_cells + 3 * separators
+    elif actual_format == "markdown-kv":
+        # "## Record N\nname: value\n...", records separated by a blank line
+        digits = len(str(max(arrow_table.num_rows, 1)))
+        overhead = 0
+        per_row = 2 + 10 + digits + sum(n + 3 + c for n, c in pairs)
+    elif actual_format == "csv":
+        # Quoted header line, then one comma-separated line per row
+        overhead = total_names + 2 * column_count + separators + 1
+        per_row = total_cells + separators + 1
+    elif actual_format == "json-row":
+        # [{"name": value, ...}, ...]
+        overhead = 2
+        per_row = 2 + sum(n + 4 + c for n, c in pairs) + 2 * separators + 2
+    elif actual_format == "json-column":
+        # {"name": [value, ...], ...}
+        overhead = 2 + total_names + 6 * column_count
+        per_row = total_cells + 2 * column_count
+    elif actual_format == "yaml":
+        # "records:\n" then "- name: value\n  name: value\n" per row
+        overhead = len("records:\n")
+        per_row = sum(n + 5 + c for n, c in pairs)
+    else:  # xml
+        # Declaration and <records>, then <record><name>value</name>...</record>
+        overhead = 60
+        per_row = 17 + sum(2 * n + 5 + c for n, c in pairs)
+
+    return overhead, per_row
+
+
+def _estimate_formatted_size(
+    arrow_table: pa.Table, actual_format: str, row_count: int | None
+) -> int:
+    """
+    Estimate the rendered size of a table in a concrete format.
+
+    Args:
+        arrow_table (pa.Table): Table to estimate.
+        actual_format (str): Concrete format name.
+        row_count (int | None): Number of rows to estimate for, or None for the
+            table's own row count.
+
+    Returns:
+        int: Estimated payload size in bytes.
+    """
+    rows = arrow_table.num_rows if row_count is None else row_count
+    overhead, per_row = _estimate_size_model(arrow_table, actual_format)
+    return math.ceil(overhead + per_row * rows)
+
+
+def _estimate_max_rows(
+    arrow_table: pa.Table, actual_format: str, max_bytes: int
+) -> int:
+    """
+    Estimate how many rows of a table fit in a byte budget in a concrete format.
+
+    Args:
+        arrow_table (pa.Table): Table whose schema and sampled values drive the model.
+        actual_format (str): Concrete format name.
+        max_bytes (int): Byte budget.
+
+    Returns:
+        int: Estimated number of rows whose rendered payload fits in ``max_bytes``
+        (0 if not even the fixed overhead fits).
+    """
+    overhead, per_row = _estimate_size_model(arrow_table, actual_format)
+    if max_bytes <= overhead:
+        return 0
+    return int((max_bytes - overhead) // max(per_row, 1.0))
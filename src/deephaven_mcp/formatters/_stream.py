@@ -0,0 +1,349 @@
+"""Streaming, budget-bounded table formatting one record batch at a time."""
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import pyarrow as pa
+
+from ._csv import _csv_header, _csv_rows
+from ._markdown import (
+    _markdown_kv_records,
+    _markdown_table_header,
+    _markdown_table_rows,
+)
+from ._xml import _XML_PREFIX, _XML_SUFFIX, _xml_records
+from ._yaml import _yaml_records
+
+ESTIMATED_BYTES_PER_TOKEN = 4
+"""
+Estimated UTF-8 bytes per LLM token, used to convert token budgets into byte budgets.
+
+Roughly four bytes per token is the usual rule of thumb for English text and
+tabular data with BPE tokenizers. It is intentionally a simple constant so that
+budgets stay predictable; it is not tied to any specific model's tokenizer.
+"""
+
+
+@dataclass(frozen=True)
+class FormattedChunk:
+    """One piece of a streamed table payload produced by format_table_data_iter().
+
+    Concatenating the ``data`` of every chunk in order (see
+    :func:`join_formatted_chunks`) yields the same payload that
+    ``format_table_data`` would return for the first ``row_offset + row_count``
+    rows of the table.
+
+    Attributes:
+        format (str): Concrete format name (optimization strategies are resolved).
+        data (object): Formatted fragment. A ``str`` for text formats, a
+            ``list[dict]`` of rows for json-row, or a ``dict[str, list]`` of column
+            values for json-column.
+        row_offset (int): Index of the first table row contained in this chunk.
+        row_count (int): Number of table rows contained in this chunk.
+        bytes_emitted (int): Cumulative size in bytes of all chunks yielded so far,
+            including this one. Exact UTF-8 size for text formats; JSON-serialized
+            size for the json formats.
+        truncated (bool): True only on the final chunk of a stream that stopped
+            because the byte or token budget was reached. Rows from
+            ``row_offset + row_count`` onwards were not formatted.
+    """
+
+    format: str
+    data: object
+    row_offset: int
+    row_count: int
+    bytes_emitted: int
+    truncated: bool = False
+
+
+@dataclass(frozen=True)
+class _StreamSpec:
+    """How to emit one concrete format incrementally.
+
+    Attributes:
+        prefix (Callable[[pa.Schema], str] | None): Text preceding the first row
+            chunk of a non-empty payload, or None for the JSON object formats.
+        rows (Callable[[pa.RecordBatch, int], object]): Formats one record batch
+            given the table row offset of its first row. Text formats include any
+            separator needed after the previous chunk.
+        suffix (str): Text following the last row chunk of a non-empty payload.
+    """
+
+    prefix: Callable[[pa.Schema], str] | None
+    rows: Callable[[pa.RecordBatch, int], object]
+    suffix: str = ""
+
+
+_STREAM_SPECS: dict[str, _StreamSpec] = {
+    "json-row": _StreamSpec(prefix=None, rows=lambda batch, offset: batch.to_pylist()),
+    "json-column": _StreamSpec(
+        prefix=None, rows=lambda batch, offset: batch.to_pydict()
+    ),
+    "csv": _StreamSpec(prefix=_csv_header, rows=lambda batch, offset: _csv_rows(batch)),
+    "markdown-table": _StreamSpec(
+        prefix=lambda schema: _markdown_table_header(schema.names),
+        rows=lambda batch, offset: "\n" + "\n".join(_markdown_table_rows(batch)),
+    ),
+    "markdown-kv": _StreamSpec(
+        prefix=lambda schema: "",
+        rows=lambda batch, offset: ("\n\n" if offset else "")
+        + "\n\n".join(_markdown_kv_records(batch, offset + 1)),
+    ),
+    "yaml": _StreamSpec(
+        prefix=lambda schema: "records:\n",
+        rows=lambda batch, offset: _yaml_records(batch),
+    ),
+    "xml": _StreamSpec(
+        prefix=lambda schema: _XML_PREFIX,
+        rows=lambda batch, offset: _xml_records(batch),
+        suffix=_XML_SUFFIX,
+    ),
+}
+
+
+def _data_size(data: object) -> int:
+    """
+    Measure the size in bytes of a formatted fragment.
+
+    Args:
+        data (object): A text fragment or a JSON-serializable fragment.
+
+    Returns:
+        int: UTF-8 size of text, or the size of the JSON serialization otherwise.
+    """
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    return len(json.dumps(data, default=str).encode("utf-8"))
+
+
+def _budget_bytes(max_bytes: int | None, max_tokens: int | None) -> int | None:
+    """
+    Combine byte and token budgets into a single byte budget.
+
+    Args:
+        max_bytes (int | None): Byte budget, or None for no byte limit.
+        max_tokens (int | None): Token budget, or None for no token limit.
+
+    Returns:
+        int | None: The tighter of the two budgets in bytes, or None if unbounded.
+
+    Raises:
+        ValueError: If either budget is negative.
+    """
+    budgets = []
+    if max_bytes is not None:
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be non-negative, got {max_bytes}")
+        budgets.append(max_bytes)
+    if max_tokens is not None:
+        if max_tokens < 0:
+            raise ValueError(f"max_tokens must be non-negative, got {max_tokens}")
+        budgets.append(max_tokens * ESTIMATED_BYTES_PER_TOKEN)
+    return min(budgets) if budgets else None
+
+
+def _rows_that_fit(
+    spec: _StreamSpec, batch: pa.RecordBatch, offset: int, remaining: int
+) -> tuple[int, object]:
+    """
+    Find the longest leading slice of a batch whose formatted size fits a budget.
+
+    Uses a binary search over the slice length; formatted size grows monotonically
+    with the number of rows.
+
+    Args:
+        spec (_StreamSpec): Stream specification of the format.
+        batch (pa.RecordBatch): Record batch that does not fit as a whole.
+        offset (int): Table row offset of the batch's first row.
+        remaining (int): Remaining budget in bytes.
+
+    Returns:
+        tuple[int, object]: Number of rows that fit (possibly 0) and their formatted
+        fragment (None when no rows fit).
+    """
+    low, high = 0, batch.num_rows - 1
+    fitted: object = None
+    while low < high:
+        mid = (low + high + 1) // 2
+        data = spec.rows(batch.slice(0, mid), offset)
+        if _data_size(data) <= remaining:
+            low, fitted = mid, data
+        else:
+            high = mid - 1
+    return low, fitted
+
+
+def _iter_chunks(
+    arrow_table: pa.Table,
+    actual_format: str,
+    empty_payload: object,
+    budget: int | None,
+) -> Iterator[FormattedChunk]:
+    """
+    Yield formatted chunks of a table in a concrete format, honoring a byte budget.
+
+    Row chunks are held back by one step so the format's suffix can be appended to
+    the final chunk, keeping every concatenated payload well formed. If not even one
+    row fits in the budget, a single chunk containing ``empty_payload`` is yielded.
+
+    Args:
+        arrow_table (pa.Table): Table to format.
+        actual_format (str): Concrete format name (key of ``_STREAM_SPECS``).
+        empty_payload (object): The format's payload for a table with no rows.
+        budget (int | None): Byte budget, or None for unbounded.
+
+    Yields:
+        FormattedChunk: Chunks in table order; the last one reports truncation.
+    """
+    spec = _STREAM_SPECS[actual_format]
+    prefix = spec.prefix(arrow_table.schema) if spec.prefix is not None else None
+    overhead = _data_size(prefix or "") + _data_size(spec.suffix)
+
+    pending: FormattedChunk | None = None
+    used = overhead
+    offset = 0
+    truncated = False
+
+    for batch in arrow_table.to_batches():
+        if batch.num_rows == 0:
+            continue
+
+        data = spec.rows(batch, offset)
+        row_count = batch.num_rows
+        size = _data_size(data)
+
+        if budget is not None and used + size > budget:
+            row_count, data = _rows_that_fit(spec, batch, offset, budget - used)
+            size = _data_size(data) if row_count else 0
+            truncated = True
+
+        if row_count:
+            if pending is None and prefix is not None:
+                data = prefix + str(data)
+            if pending is not None:
+                yield pending
+            used += size
+            pending = FormattedChunk(
+                format=actual_format,
+                data=data,
+                row_offset=offset,
+                row_count=row_count,
+                bytes_emitted=used - _data_size(spec.suffix),
+            )
+            offset += row_count
+
+        if truncated:
+            break
+
+    if pending is None:
+        yield FormattedChunk(
+            format=actual_format,
+            data=empty_payload,
+            row_offset=0,
+            row_count=0,
+            bytes_emitted=_data_size(empty_payload),
+            truncated=truncated,
+        )
+        return
+
+    yield FormattedChunk(
+        format=actual_format,
+        data=str(pending.data) + spec.suffix if spec.suffix else pending.data,
+        row_offset=pending.row_offset,
+        row_count=pending.row_count,
+        bytes_emitted=used,
+        truncated=truncated,
+    )
+
+
+def _iter_single_chunk(
+    arrow_table: pa.Table,
+    actual_format: str,
+    formatter: Callable[[pa.Table], object],
+    budget: int | None,
+) -> Iterator[FormattedChunk]:
+    """
+    Yield a table formatted as a single chunk, cut to the rows that fit a byte budget.
+
+    Used for formats whose fragments cannot be concatenated, such as base64-encoded
+    Arrow IPC streams. When the whole table does not fit, a binary search over the
+    number of leading rows finds the longest prefix whose payload fits.
+
+    Args:
+        arrow_table (pa.Table): Table to format.
+        actual_format (str): Concrete format name.
+        formatter (Callable[[pa.Table], object]): Formats a whole table.
+        budget (int | None): Byte budget, or None for unbounded.
+
+    Yields:
+        FormattedChunk: Exactly one chunk holding the complete payload.
+    """
+    data = formatter(arrow_table)
+    row_count = arrow_table.num_rows
+    truncated = False
+
+    if budget is not None and _data_size(data) > budget:
+        truncated = True
+        low, high = 0, row_count - 1
+        data = formatter(arrow_table.slice(0, 0))
+        while low < high:
+            mid = (low + high + 1) // 2
+            candidate = formatter(arrow_table.slice(0, mid))
+            if _data_size(candidate) <= budget:
+                low, data = mid, candidate
+            else:
+                high = mid - 1
+        row_count = low
+
+    yield FormattedChunk(
+        format=actual_format,
+        data=data,
+        row_offset=0,
+        row_count=row_count,
+        bytes_emitted=_data_size(data),
+        truncated=truncated,
+    )
+
+
+def join_formatted_chunks(
+    chunks: Iterable[FormattedChunk],
+) -> tuple[str, object, int, bool]:
+    """
+    Assemble streamed chunks into a single payload.
+
+    Args:
+        chunks (Iterable[FormattedChunk]): Chunks from format_table_data_iter(), in
+            order. Must contain at least one chunk.
+
+    Returns:
+        tuple[str, object, int, bool]: A 4-tuple containing:
+            - actual_format (str): The concrete format of the chunks.
+            - formatted_data (object): The assembled payload, of the same type that
+              format_table_data() returns for that format.
+            - row_count (int): Number of table rows in the payload.
+            - truncated (bool): True if the stream stopped at its budget.
+
+    Raises:
+        ValueError: If ``chunks`` is empty.
+    """
+    parts = list(chunks)
+    if not parts:
+        raise ValueError("join_formatted_chunks() requires at least one chunk")
+
+    last = parts[-1]
+    fragments: list[Any] = [chunk.data for chunk in parts]
+    data: object
+    if last.format == "json-row":
+        data = [row for rows in fragments for row in rows]
+    elif last.format == "json-column":
+        columns: dict[str, list[Any]] = {}
+        for column_values in fragments:
+            for name, values in column_values.items():
+                columns.setdefault(name, []).extend(values)
+        data = columns
+    else:
+        data = "".join(fragments)
+
+    return last.format, data, last.row_offset + last.row_count, last.truncated
@@ -4,6 +4,12 @@ import xml.etree.ElementTree as ET
 
 import pyarrow as pa
 
+_XML_PREFIX = "<?xml version='1.0' encoding='utf-8'?>\n<records>"
+"""Text that precedes the first record of a non-empty :func:`format_xml` document."""
+
+_XML_SUFFIX = "</records>"
+"""Text that follows the last record of a non-empty :func:`format_xml` document."""
+
 
 def format_xml(arrow_table: pa.Table) -> str:
     """
@@ -36,15 +42,48 @@ def format_xml(arrow_table: pa.Table) -> str:
     # Use iterator to avoid loading entire table into memory
     for batch in arrow_table.to_batches():
         for row_dict in batch.to_pylist():
-            record = ET.SubElement(root, "record")
-
-            for key, value in row_dict.items():
-                # Use first column as attribute if it's named 'id'
-                if key.lower() == "id":
-                    record.set("id", str(value))
-                else:
-                    child = ET.SubElement(record, key)
-                    child.text = str(value)
+            _append_record(root, row_dict)
 
     # Convert to string with XML declaration
     return ET.tostring(root, encoding="unicode", xml_declaration=True)
+
+
+def _append_record(parent: ET.Element, row_dict: dict[str, object]) -> ET.Element:
+    """
+    Append one ``<record>`` element for a row to a parent element.
+
+    Args:
+        parent (ET.Element): Element to append the record to
+        row_dict (dict[str, object]): Row values keyed by column name
+
+    Returns:
+        ET.Element: The appended record element.
+    """
+    record = ET.SubElement(parent, "record")
+
+    for key, value in row_dict.items():
+        # Use first column as attribute if it's named 'id'
+        if key.lower() == "id":
+            record.set("id", str(value))
+        else:
+            child = ET.SubElement(record, key)
+            child.text = str(value)
+
+    return record
+
+
+def _xml_records(batch: pa.RecordBatch) -> str:
+    """
+    Format the rows of one record batch as serialized ``<record>`` elements.
+
+    Args:
+        batch (pa.RecordBatch): Record batch to format
+
+    Returns:
+        str: Concatenated ``<record>`` elements, without the enclosing ``<records>``.
+    """
+    root = ET.Element("records")
+    return "".join(
+        ET.tostring(_append_record(root, row_dict), encoding="unicode")
+        for row_dict in batch.to_pylist()
+    )
@@ -34,3 +34,23 @@ def format_yaml(arrow_table: pa.Table) -> str:
     data = {"records": records}
     result: str = yaml.dump(data, default_flow_style=False, allow_unicode=True)
     return result
+
+
+def _yaml_records(batch: pa.RecordBatch) -> str:
+    r"""
+    Format the rows of one record batch as YAML sequence items.
+
+    The output is the body of the ``records:`` sequence produced by
+    :func:`format_yaml`, so ``"records:\n"`` followed by the output for each batch
+    equals the full document for a non-empty table.
+
+    Args:
+        batch (pa.RecordBatch): Record batch to format
+
+    Returns:
+        str: YAML sequence items ("- key: value" blocks), one per row.
+    """
+    result: str = yaml.dump(
+        batch.to_pylist(), default_flow_style=False, allow_unicode=True
+    )
+    return result
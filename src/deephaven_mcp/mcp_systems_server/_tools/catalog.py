@@ -4,32 +4,37 @@ Catalog MCP Tools - Enterprise Core+ Data Catalog Operations.
 Provides MCP tools for querying Deephaven Enterprise (Core+) data catalogs:
 - catalog_tables_list: List all tables across catalog namespaces
 - catalog_namespaces_list: List available catalog namespaces
+- catalog_search: Fuzzy-search catalog table, namespace and column names
 - catalog_tables_schema: Get schema information for catalog tables
 - catalog_table_sample: Sample data from catalog tables
 
 These tools require Deephaven Enterprise (Core+) and are not available in Community.
 """
 
+import asyncio
 import logging
 from typing import cast
 
+import pyarrow
 from mcp.server.fastmcp import Context
 
 from deephaven_mcp import queries
 from deephaven_mcp._exceptions import UnsupportedOperationError
 from deephaven_mcp.client import CorePlusSession
-from deephaven_mcp.formatters import format_table_data
+from deephaven_mcp.formatters import format_table_data, resolve_byte_budget
 from deephaven_mcp.mcp_systems_server._tools.mcp_server import (
     mcp_server,
 )
 from deephaven_mcp.mcp_systems_server._tools.shared import (
-    _check_response_size,
+    DEFAULT_SCHEMA_MAX_CONCURRENT,
+    _check_formatted_response_size,
+    _fetch_table_within_budget,
     _format_meta_table_result,
     _get_enterprise_session,
     _get_session_from_context,
+    _validate_max_concurrent,
 )
 from deephaven_mcp.mcp_systems_server._tools.table import (
-    ESTIMATED_BYTES_PER_CELL,
     _build_table_data_response,
 )
 
@@ -88,6 +93,7 @@ async def _get_catalog_data(
             max_rows=max_rows,
             filters=filters,
             distinct_namespaces=distinct_namespaces,
+            session_name=session_id,
         )
 
         row_count = len(arrow_table)
@@ -95,9 +101,10 @@ async def _get_catalog_data(
             f"[mcp_systems_server:{tool_name}] Retrieved {row_count} {data_type} (complete={is_complete})"
         )
 
-        # Estimate response size for safety
-        estimated_size = arrow_table.nbytes
-        size_check_result = _check_response_size(tool_name, estimated_size)
+        # Estimate formatted response size for safety
+        size_check_result = _check_formatted_response_size(
+            tool_name, arrow_table, format
+        )
         if size_check_result:
             return size_check_result
 
@@ -222,6 +229,8 @@ async def catalog_tables_list(
     - Combine with catalog_tables_schema to get full metadata for discovered tables
     - Essential first step before querying enterprise data sources
     - Use filters to narrow down large catalogs/databases efficiently
+    - Exact match, in, startsWith, endsWith and contains filters are answered from a local catalog snapshot
+      in milliseconds; other filters are sent to the server. Newly added tables can take a few minutes to appear
 
     Filter Syntax Reference:
     Filters use Deephaven query language with backticks (`) for string literals.
@@ -281,8 +290,9 @@ async def catalog_tables_list(
                                     Multiple filters are combined with AND logic. Use backticks (`) for string literals.
         format (str): Output format for catalog data. Default is "optimize-rendering" for best table display.
                      Options: "optimize-rendering" (default, uses markdown-table), "optimize-accuracy" (uses markdown-kv),
-                     "optimize-cost" (uses csv), "optimize-speed" (uses json-column), or explicit formats:
-                     "json-row", "json-column", "csv", "markdown-table", "markdown-kv", "yaml", "xml".
+                     "optimize-cost" (uses csv), "optimize-speed" (uses json-column),
+                     "optimize-throughput" (uses arrow-ipc-lz4), or explicit formats: "json-row", "json-column",
+                     "csv", "markdown-table", "markdown-kv", "yaml", "xml", "arrow-ipc", "arrow-ipc-lz4", "arrow-ipc-zstd".
 
     Returns:
         dict: Structured result object with keys:
@@ -438,6 +448,7 @@ async def catalog_namespaces_list(
     - Combine with catalog_tables_list to drill down into specific namespaces
     - Essential for top-down data exploration workflow
     - Returns lightweight data (just namespace names) for quick discovery
+    - Served from a local catalog snapshot, so repeated calls are fast
 
     Args:
         context (Context): The MCP context object.
@@ -448,8 +459,9 @@ async def catalog_namespaces_list(
                                     the catalog before extracting namespaces. Use backticks (`) for string literals.
         format (str): Output format for namespace data. Default is "optimize-rendering" for best table display.
                      Options: "optimize-rendering" (default, uses markdown-table), "optimize-accuracy" (uses markdown-kv),
-                     "optimize-cost" (uses csv), "optimize-speed" (uses json-column), or explicit formats:
-                     "json-row", "json-column", "csv", "markdown-table", "markdown-kv", "yaml", "xml".
+                     "optimize-cost" (uses csv), "optimize-speed" (uses json-column),
+                     "optimize-throughput" (uses arrow-ipc-lz4), or explicit formats: "json-row", "json-column",
+                     "csv", "markdown-table", "markdown-kv", "yaml", "xml", "arrow-ipc", "arrow-ipc-lz4", "arrow-ipc-zstd".
 
     Returns:
         dict: Structured result object with keys:
@@ -522,6 +534,211 @@ async def catalog_namespaces_list(
     )
 
 
+@mcp_server.tool()
+async def catalog_search(
+    context: Context,
+    session_id: str,
+    query: str,
+    max_results: int = 20,
+    include_columns: bool = True,
+) -> dict:
+    """
+    MCP Tool: Fuzzy-search table names, namespaces and column names in a Deephaven Enterprise (Core+) catalog.
+
+    **Returns**: A ranked list of catalog tables whose name, namespace or (cached) column names resemble
+    the query. Matching is typo-tolerant and case-insensitive, so "tradqoute" still finds "TradeQuotes".
+
+    The search runs entirely in the MCP server against a trigram index built from the session's local
+    catalog snapshot (the same snapshot that serves catalog_tables_list). No where clause is sent to the
+    server, so searches over catalogs with hundreds of thousands of tables return in milliseconds once
+    the snapshot is loaded. Column names are searched only for tables whose schemas are already in the
+    schema cache (for example from an earlier catalog_tables_schema call); no schemas are fetched.
+
+    Terminology Note:
+    - 'Session' and 'worker' are interchangeable terms - both refer to a running Deephaven instance
+    - 'ENTERPRISE' sessions run Deephaven Enterprise (also called 'Core+' or 'CorePlus')
+    - This tool only works with enterprise sessions; community sessions do not have catalog tables
+    - 'Catalog' and 'database' are interchangeable terms - the catalog is the database of available tables
+
+    AI Agent Usage:
+    - Use this when you know roughly what a table is called but not its exact name or namespace
+    - Prefer this over catalog_tables_list with `contains` filters: it tolerates typos and ranks results
+    - Higher 'score' means a better match; exact table name matches score above 1.0
+    - 'matched_columns' lists cached column names that matched; empty when the match is on the name only
+    - Follow up with catalog_tables_schema or catalog_table_sample on the best matches
+    - Call catalog_tables_schema on candidate tables first to make their columns searchable
+
+    Args:
+        context (Context): The MCP context object.
+        session_id (str): ID of the Deephaven enterprise session to search.
+        query (str): Search text. Must not be empty or whitespace.
+        max_results (int): Maximum number of matches to return. Default is 20. Must be at least 1.
+        include_columns (bool): Whether to also match column names of tables with cached schemas.
+                                Default is True.
+
+    Returns:
+        dict: Structured result object with keys:
+            - 'success' (bool): True if the search ran, False on error.
+            - 'session_id' (str, optional): The session ID if successful.
+            - 'query' (str, optional): The query that was searched if successful.
+            - 'count' (int, optional): Number of matches returned if successful.
+            - 'searched_rows' (int, optional): Number of catalog tables that were searched if successful.
+            - 'matches' (list[dict], optional): Matches, best first. Each dict contains:
+                - 'namespace' (str): Namespace of the table
+                - 'table' (str): Table name
+                - 'score' (float): Match score; higher is better
+                - 'matched_columns' (list[str]): Cached column names that matched the query
+            - 'error' (str, optional): Human-readable error message if the search failed. Omitted on success.
+            - 'isError' (bool, optional): Present and True only when success=False. Explicit error flag.
+
+    Error Scenarios:
+        - Non-enterprise session: Returns error if session is not an enterprise (Core+) session
+        - Session not found: Returns error if session_id does not exist or is not accessible
+        - Invalid parameters: Returns error if query is empty or max_results is less than 1
+        - Session connection issues: Returns error if the catalog snapshot cannot be loaded
+
+    Performance Considerations:
+        - The first search of a session loads the whole catalog snapshot and builds its index
+        - Later searches are answered in memory until the snapshot is refreshed
+          (DH_MCP_CATALOG_SNAPSHOT_REFRESH_SECONDS), after which the index is rebuilt once
+        - With catalog snapshots disabled, every search fetches the whole catalog
+
+    Example Usage:
+        # Find tables resembling "trade quotes"
+        Tool: catalog_search
+        Parameters: {
+            "session_id": "enterprise:prod:analytics",
+            "query": "tradequote"
+        }
+
+        # Top 5 name-only matches
+        Tool: catalog_search
+        Parameters: {
+            "session_id": "enterprise:prod:analytics",
+            "query": "fx_rates",
+            "max_results": 5,
+            "include_columns": false
+        }
+    """
+    _LOGGER.info(
+        f"[mcp_systems_server:catalog_search] Invoked: session_id={session_id!r}, query={query!r}, "
+        f"max_results={max_results}, include_columns={include_columns}"
+    )
+
+    try:
+        if not query.strip():
+            raise ValueError("query must not be empty")
+        if max_results < 1:
+            raise ValueError(f"max_results must be at least 1, got {max_results}")
+
+        session, error = await _get_enterprise_session(
+            "catalog_search", context, session_id
+        )
+
+        if error:
+            return error
+
+        session = cast(CorePlusSession, session)  # Type narrowing for mypy
+
+        matches, searched_rows = await queries.search_catalog(
+            session,
+            query,
+            session_name=session_id,
+            limit=max_results,
+            include_columns=include_columns,
+        )
+
+        _LOGGER.info(
+            f"[mcp_systems_server:catalog_search] Success: {len(matches)} matches for {query!r} "
+            f"among {searched_rows} catalog tables in session '{session_id}'"
+        )
+
+        return {
+            "success": True,
+            "session_id": session_id,
+            "query": query,
+            "count": len(matches),
+            "searched_rows": searched_rows,
+            "matches": [
+                {
+                    "namespace": match.namespace,
+                    "table": match.table,
+                    "score": match.score,
+                    "matched_columns": match.matched_columns,
+                }
+                for match in matches
+            ],
+        }
+
+    except Exception as e:
+        _LOGGER.error(
+            f"[mcp_systems_server:catalog_search] Failed for session: '{session_id}', error: {e!r}",
+            exc_info=True,
+        )
+        return {"success": False, "error": str(e), "isError": True}
+
+
+async def _fetch_catalog_meta_tables(
+    session: CorePlusSession,
+    session_id: str,
+    tables: list[tuple[str, str]],
+    max_concurrent: int,
+) -> list[pyarrow.Table | Exception]:
+    """
+    Fetch the meta tables of many catalog tables, batched when possible.
+
+    Python sessions first try queries.get_catalog_meta_tables(), which describes every table with a
+    single server-side script. If that is unsupported or fails, each table is fetched with
+    queries.get_catalog_meta_table(), at most max_concurrent at a time.
+
+    Args:
+        session (CorePlusSession): The enterprise session to query.
+        session_id (str): Full name of the session, used as the schema cache key.
+        tables (list[tuple[str, str]]): The (namespace, table_name) pairs to describe.
+        max_concurrent (int): Maximum number of per-table fetches in flight (validated, >= 1).
+
+    Returns:
+        list[pyarrow.Table | Exception]: One entry per input pair, in input order: the meta table,
+            or the exception that prevented fetching it.
+    """
+    if len(tables) > 1:
+        try:
+            return await queries.get_catalog_meta_tables(
+                session, tables, session_name=session_id
+            )
+        except UnsupportedOperationError as e:
+            _LOGGER.debug(
+                f"[mcp_systems_server:catalog_tables_schema] Batched schema script unavailable, fetching per table: {e}"
+            )
+        except Exception as e:
+            _LOGGER.warning(
+                f"[mcp_systems_server:catalog_tables_schema] Batched schema script failed, fetching per table: {e!r}"
+            )
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def fetch_one(namespace: str, table_name: str) -> pyarrow.Table | Exception:
+        """Fetch one meta table, returning the exception instead of raising it."""
+        async with semaphore:
+            _LOGGER.debug(
+                f"[mcp_systems_server:catalog_tables_schema] Retrieving schema for '{namespace}.{table_name}'"
+            )
+            try:
+                # Tables remembered as live-only go straight to live_table; others try historical_table first
+                return await queries.get_catalog_meta_table(
+                    session, namespace, table_name, session_name=session_id
+                )
+            except Exception as e:
+                return e
+
+    # gather() preserves input order, so results line up with tables
+    return list(
+        await asyncio.gather(
+            *(fetch_one(namespace, table_name) for namespace, table_name in tables)
+        )
+    )
+
+
 @mcp_server.tool()
 async def catalog_tables_schema(
     context: Context,
@@ -530,6 +747,7 @@ async def catalog_tables_schema(
     table_names: list[str] | None = None,
     filters: list[str] | None = None,
     max_tables: int | None = 100,
+    max_concurrent: int = DEFAULT_SCHEMA_MAX_CONCURRENT,
 ) -> dict:
     """
     MCP Tool: Retrieve catalog table schemas as TABULAR METADATA from a Deephaven Enterprise (Core+) session.
@@ -576,6 +794,7 @@ async def catalog_tables_schema(
     - Check 'namespace' field in each result to know which domain the table belongs to
     - Use returned schemas to generate correct `db.live_table(namespace, table_name)` calls
     - Individual table failures don't stop processing of other tables (similar to session_tables_schema)
+    - Lower max_concurrent if a busy server struggles with many parallel schema requests
     - Always check 'success' field in each schema result before using the schema data
 
     Filter Syntax Reference:
@@ -617,6 +836,9 @@ async def catalog_tables_schema(
         max_tables (int | None, optional): Maximum number of table schemas to retrieve. Defaults to 100 for safety.
                                           Set to None to retrieve all matching schemas (use with extreme caution for large catalogs).
                                           This limit is applied after all filtering.
+        max_concurrent (int, optional): Maximum number of schemas fetched in parallel when schemas are fetched
+                                        per table (must be >= 1). Defaults to 10 (override with the
+                                        DH_MCP_DEFAULT_SCHEMA_MAX_CONCURRENT environment variable).
 
     Returns:
         dict: Structured result object with keys:
@@ -643,10 +865,11 @@ async def catalog_tables_schema(
 
     Performance Considerations:
         - Default max_tables=100 is safe for most use cases
-        - Fetching schemas for 1000+ tables can take significant time (several minutes)
+        - Schemas are cached per session, namespace and table, so repeated calls are served from memory
+        - Python sessions describe all selected tables with one server-side script and two table fetches
+        - Other sessions, or a failed batch script, fall back to per-table fetches, max_concurrent at a time
         - Use namespace or filters to narrow down the search space
         - Specify exact table_names when you know what you need for fastest results
-        - Each schema fetch requires a separate query to the catalog
 
     Example Successful Response (mixed results):
         {
@@ -717,12 +940,17 @@ async def catalog_tables_schema(
     """
     _LOGGER.info(
         f"[mcp_systems_server:catalog_tables_schema] Invoked: session_id={session_id!r}, "
-        f"namespace={namespace!r}, table_names={table_names!r}, filters={filters!r}, max_tables={max_tables}"
+        f"namespace={namespace!r}, table_names={table_names!r}, filters={filters!r}, max_tables={max_tables}, "
+        f"max_concurrent={max_concurrent}"
     )
 
     schemas = []
 
     try:
+        validated_max_concurrent = _validate_max_concurrent(
+            max_concurrent, "catalog_tables_schema"
+        )
+
         # Get and validate enterprise session
         session, error = await _get_enterprise_session(
             "catalog_tables_schema", context, session_id
@@ -762,6 +990,7 @@ async def catalog_tables_schema(
             max_rows=max_tables,  # Limit catalog query to match max_tables
             filters=combined_filters if combined_filters else None,
             distinct_namespaces=False,
+            session_name=session_id,
         )
 
         # Convert to list of dicts for easier processing
@@ -778,57 +1007,45 @@ async def catalog_tables_schema(
             f"(is_complete={is_complete})"
         )
 
-        # Fetch schema for each catalog entry
-        for entry in catalog_entries:
-            # These fields are required - let it fail if they're missing
-            catalog_namespace = entry["Namespace"]
-            catalog_table_name = entry["TableName"]
-
-            _LOGGER.debug(
-                f"[mcp_systems_server:catalog_tables_schema] Processing catalog table "
-                f"'{catalog_namespace}.{catalog_table_name}'"
-            )
-
-            try:
-                # Get schema for catalog table (tries historical_table first, then live_table)
-                _LOGGER.debug(
-                    f"[mcp_systems_server:catalog_tables_schema] Retrieving schema for "
-                    f"'{catalog_namespace}.{catalog_table_name}'"
-                )
-                arrow_meta_table = await queries.get_catalog_meta_table(
-                    session, catalog_namespace, catalog_table_name
-                )
-
-                # Use helper to format result (include namespace for catalog tables)
-                result = _format_meta_table_result(
-                    arrow_meta_table, catalog_table_name, namespace=catalog_namespace
-                )
-                schemas.append(result)
-
-                _LOGGER.info(
-                    f"[mcp_systems_server:catalog_tables_schema] Success: Retrieved full schema for "
-                    f"'{catalog_namespace}.{catalog_table_name}' ({result['row_count']} columns)"
-                )
+        # These fields are required - let it fail if they're missing
+        tables = [(entry["Namespace"], entry["TableName"]) for entry in catalog_entries]
+        meta_tables = await _fetch_catalog_meta_tables(
+            session, session_id, tables, validated_max_concurrent
+        )
 
-            except Exception as table_exc:
+        for (catalog_namespace, catalog_table_name), arrow_meta_table in zip(
+            tables, meta_tables, strict=True
+        ):
+            if isinstance(arrow_meta_table, Exception):
                 _LOGGER.error(
                     f"[mcp_systems_server:catalog_tables_schema] Failed to get schema for "
-                    f"'{catalog_namespace}.{catalog_table_name}': {table_exc!r}",
-                    exc_info=True,
+                    f"'{catalog_namespace}.{catalog_table_name}': {arrow_meta_table!r}"
                 )
                 schemas.append(
                     {
                         "success": False,
                         "namespace": catalog_namespace,
                         "table": catalog_table_name,
-                        "error": str(table_exc),
+                        "error": str(arrow_meta_table),
                         "isError": True,
                     }
                 )
+                continue
+
+            # Use helper to format result (include namespace for catalog tables)
+            result = _format_meta_table_result(
+                arrow_meta_table, catalog_table_name, namespace=catalog_namespace
+            )
+            schemas.append(result)
+
+            _LOGGER.info(
+                f"[mcp_systems_server:catalog_tables_schema] Success: Retrieved full schema for "
+                f"'{catalog_namespace}.{catalog_table_name}' ({result['row_count']} columns)"
+            )
 
         _LOGGER.info(
             f"[mcp_systems_server:catalog_tables_schema] Completed: Retrieved {len(schemas)} schema(s), "
-            f"is_complete={is_complete}"
+            f"is_complete={is_complete}, schema cache: {queries.get_schema_cache_stats()}"
         )
 
         return {
@@ -855,6 +1072,10 @@ async def catalog_table_sample(
     max_rows: int | None = 100,
     head: bool = True,
     format: str = "optimize-rendering",
+    max_tokens: int | None = None,
+    max_bytes: int | None = None,
+    columns: list[str] | None = None,
+    filters: list[str] | None = None,
 ) -> dict:
     r"""
     MCP Tool: Retrieve sample TABULAR DATA from a catalog table in a Deephaven Enterprise (Core+) session.
@@ -865,6 +1086,10 @@ async def catalog_table_sample(
     This tool loads a catalog table (trying historical_table first, then live_table as fallback) and
     retrieves a sample of its data with flexible formatting options. Use this to preview catalog table
     contents before loading the full table into a session. Only works with enterprise sessions.
+    An optional max_tokens or max_bytes budget returns as many rows as fit in the chosen format
+    (measured on a small probe, then cut at the exact row) instead of a fixed row count.
+    Optional columns and filters are applied by the Deephaven engine (view and where) before any
+    data is transferred, so only the selected columns of the matching rows are sampled.
 
     **Format Accuracy for AI Agents** (based on empirical research):
     - markdown-kv: 61% accuracy (highest comprehension, more tokens)
@@ -900,6 +1125,8 @@ async def catalog_table_sample(
     - Default max_rows=100 provides safe preview without overwhelming responses
     - Use head=True (default) to get rows from table start, head=False to get from table end
     - Check 'is_complete' to know if the sample represents the entire table
+    - Use max_tokens to size the sample to your context budget instead of guessing max_rows
+    - Use columns and filters to sample only what you need from wide or large tables
     - Combine with catalog_tables_schema to understand table structure before sampling
     - Use 'optimize-rendering' (default) for best table display in AI interfaces
     - Use 'optimize-accuracy' for highest comprehension (markdown-kv format, more tokens)
@@ -920,6 +1147,7 @@ async def catalog_table_sample(
                                - "optimize-accuracy": Always use markdown-kv (better comprehension, more tokens)
                                - "optimize-cost": Always use csv (fewer tokens, may be harder to parse)
                                - "optimize-speed": Always use json-column (fastest conversion)
+                               - "optimize-throughput": Always use arrow-ipc-lz4 (binary, for programmatic clients)
                                - "markdown-table": String with pipe-delimited table (| col1 | col2 |\n| --- | --- |\n| val1 | val2 |)
                                - "markdown-kv": String with record headers and key-value pairs (## Record 1\ncol1: val1\ncol2: val2)
                                - "json-row": List of dicts, one per row
@@ -927,6 +1155,19 @@ async def catalog_table_sample(
                                - "csv": String with comma-separated values, includes header row
                                - "yaml": String with YAML-formatted records list
                                - "xml": String with XML records structure
+                               - "arrow-ipc": Base64 Arrow IPC stream with exact column types (decode with
+                                 pyarrow.ipc.open_stream(base64.b64decode(data)).read_all())
+                               - "arrow-ipc-lz4" / "arrow-ipc-zstd": Same, with LZ4 or ZSTD compressed buffers
+        max_tokens (int | None, optional): Maximum size of the formatted 'data' in estimated LLM tokens
+                                          (about 4 bytes per token). Defaults to None (no token budget).
+        max_bytes (int | None, optional): Maximum size of the formatted 'data' in bytes. Defaults to None
+                                         (no byte budget). When both budgets are given, the tighter one applies.
+                                         max_rows still caps the row count when a budget is given.
+        columns (list[str] | None, optional): Column names to return, in order. Applied server-side with view().
+                                             Defaults to None (all columns).
+        filters (list[str] | None, optional): Deephaven where clause expressions applied server-side before sampling.
+                                             Multiple filters are combined with AND logic. Use backticks (`) for
+                                             string literals. Defaults to None (no filtering).
 
     Returns:
         dict: Structured result object with the following keys:
@@ -937,7 +1178,7 @@ async def catalog_table_sample(
             - 'schema' (list[dict], optional): Array of column definitions if successful. Each dict contains:
                                               {'name': str, 'type': str} describing column name and PyArrow data type.
             - 'row_count' (int, optional): Number of rows in the returned sample if successful.
-            - 'is_complete' (bool, optional): True if entire table was retrieved if successful. False if truncated by max_rows.
+            - 'is_complete' (bool, optional): True if every row matching the filters was retrieved if successful. False if truncated by max_rows or by the budget.
             - 'data' (list | dict | str, optional): The actual sample data if successful. Type depends on format.
             - 'error' (str, optional): Human-readable error message if retrieval failed. Omitted on success.
             - 'isError' (bool, optional): Present and True only when success=False. Explicit error flag.
@@ -948,6 +1189,8 @@ async def catalog_table_sample(
         - Invalid namespace: Returns error if namespace doesn't exist in the catalog
         - Invalid table_name: Returns error if table doesn't exist in the namespace
         - Invalid format: Returns error if format is not one of the supported options
+        - Invalid budget: Returns error if max_tokens or max_bytes is negative
+        - Invalid columns or filters: Returns error if a column does not exist or a filter is invalid
         - Response too large: Returns error if estimated response would exceed 50MB limit
         - Session connection issues: Returns error if unable to communicate with Deephaven server
         - Table access errors: Returns error if table cannot be accessed via historical_table or live_table
@@ -986,13 +1229,36 @@ async def catalog_table_sample(
             "max_rows": 200,
             "format": "csv"
         }
+
+        # Sample as many rows as fit in about 2000 tokens
+        Tool: catalog_table_sample
+        Parameters: {
+            "session_id": "enterprise:prod:analytics",
+            "namespace": "market_data",
+            "table_name": "daily_prices",
+            "max_rows": null,
+            "max_tokens": 2000
+        }
+
+        # Sample two columns of one symbol's rows
+        Tool: catalog_table_sample
+        Parameters: {
+            "session_id": "enterprise:prod:analytics",
+            "namespace": "market_data",
+            "table_name": "trades",
+            "columns": ["Timestamp", "Price"],
+            "filters": ["Sym = `AAPL`"]
+        }
     """
     _LOGGER.info(
         f"[mcp_systems_server:catalog_table_sample] Invoked: session_id={session_id!r}, "
-        f"namespace={namespace!r}, table_name={table_name!r}, max_rows={max_rows}, head={head}, format={format!r}"
+        f"namespace={namespace!r}, table_name={table_name!r}, max_rows={max_rows}, head={head}, format={format!r}, "
+        f"max_tokens={max_tokens}, max_bytes={max_bytes}, columns={columns!r}, filters={filters!r}"
     )
 
     try:
+        budget = resolve_byte_budget(max_bytes=max_bytes, max_tokens=max_tokens)
+
         # Get and validate enterprise session
         session, error = await _get_enterprise_session(
             "catalog_table_sample", context, session_id
@@ -1011,15 +1277,27 @@ async def catalog_table_sample(
         _LOGGER.debug(
             f"[mcp_systems_server:catalog_table_sample] Retrieving catalog table data for '{namespace}.{table_name}'"
         )
-        arrow_table, is_complete = await queries.get_catalog_table_data(
-            session, namespace, table_name, max_rows=max_rows, head=head
+        arrow_table, is_complete = await _fetch_table_within_budget(
+            lambda rows: queries.get_catalog_table_data(
+                session,
+                namespace,
+                table_name,
+                max_rows=rows,
+                head=head,
+                columns=columns,
+                filters=filters,
+            ),
+            f"catalog table '{namespace}.{table_name}'",
+            format,
+            max_rows,
+            budget,
         )
 
-        # Check response size before formatting
+        # Check estimated formatted size before formatting
         row_count = len(arrow_table)
-        col_count = len(arrow_table.schema)
-        estimated_size = row_count * col_count * ESTIMATED_BYTES_PER_CELL
-        size_error = _check_response_size(f"{namespace}.{table_name}", estimated_size)
+        size_error = _check_formatted_response_size(
+            f"{namespace}.{table_name}", arrow_table, format
+        )
 
         if size_error:
             return size_error
@@ -1029,12 +1307,18 @@ async def catalog_table_sample(
             f"[mcp_systems_server:catalog_table_sample] Formatting {row_count} rows in format '{format}'"
         )
         response = _build_table_data_response(
-            arrow_table, is_complete, format, table_name=table_name, namespace=namespace
+            arrow_table,
+            is_complete,
+            format,
+            table_name=table_name,
+            namespace=namespace,
+            budget=budget,
+            head=head,
         )
 
         _LOGGER.info(
-            f"[mcp_systems_server:catalog_table_sample] Success: Retrieved {row_count} rows "
-            f"from '{namespace}.{table_name}' (is_complete={is_complete}, format={response['format']})"
+            f"[mcp_systems_server:catalog_table_sample] Success: Retrieved {response['row_count']} rows "
+            f"from '{namespace}.{table_name}' (is_complete={response['is_complete']}, format={response['format']})"
         )
 
         return response
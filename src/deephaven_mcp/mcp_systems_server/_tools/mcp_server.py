@@ -16,6 +16,7 @@ from contextlib import asynccontextmanager
 
 from mcp.server.fastmcp import Context, FastMCP
 
+from deephaven_mcp import queries
 from deephaven_mcp.config import ConfigManager
 from deephaven_mcp.resource_manager import CombinedSessionRegistry
 from deephaven_mcp.resource_manager._instance_tracker import (
@@ -200,6 +201,8 @@ async def mcp_reload(context: Context) -> dict:
             await config_manager.clear_config_cache()
             await session_registry.close()
             await session_registry.initialize(config_manager)
+            queries.invalidate_schema_cache()
+            queries.drop_catalog_snapshot()
         _LOGGER.info(
             "[mcp_systems_server:mcp_reload] Success: Session configuration and session cache have been reloaded."
         )
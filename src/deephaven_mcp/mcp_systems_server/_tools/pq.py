@@ -69,6 +69,7 @@ from deephaven_mcp.mcp_systems_server._tools.mcp_server import (
 )
 from deephaven_mcp.mcp_systems_server._tools.shared import (
     _get_system_config,
+    _validate_max_concurrent,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -173,27 +174,6 @@ def _validate_timeout(timeout_seconds: int, function_name: str) -> int:
     return timeout_seconds
 
 
-def _validate_max_concurrent(max_concurrent: int, function_name: str) -> int:
-    """Validate max_concurrent is valid for parallel operations.
-
-    Args:
-        max_concurrent (int): Maximum number of concurrent operations (must be >= 1).
-        function_name (str): Name of calling function, included in the error message for context.
-
-    Returns:
-        int: The validated max_concurrent value
-
-    Raises:
-        ValueError: If max_concurrent is less than 1
-    """
-    if max_concurrent < 1:
-        raise ValueError(
-            f"[{function_name}] max_concurrent must be at least 1, got {max_concurrent}. "
-            f"Use a positive integer to control parallelism (e.g., 20 for moderate concurrency)."
-        )
-    return max_concurrent
-
-
 def _format_pq_config(config: CorePlusQueryConfig) -> dict[str, object]:
     """Format PersistentQueryConfigMessage into MCP-compatible dictionary.
 
@@ -137,7 +137,12 @@ async def session_script_run(
             f"[mcp_systems_server:session_script_run] Script length: {len(script)} characters"
         )
 
-        await session.run_script(script)
+        try:
+            await session.run_script(script)
+        finally:
+            # Even a failed script may have created or replaced tables, or installed packages, before it stopped
+            queries.invalidate_schema_cache(session_id)
+            queries.invalidate_session_environment(session)
 
         _LOGGER.info(
             f"[mcp_systems_server:session_script_run] Script executed successfully on session: '{session_id}'"
@@ -4,11 +4,14 @@ Session Management MCP Tools - List and Query Sessions.
 Provides MCP tools for viewing and managing Deephaven sessions:
 - sessions_list: List all active sessions (Community and Enterprise)
 - session_details: Get detailed information about a specific session
+- sessions_details: Get detailed information about many sessions at once
 
 These tools work with both Community and Enterprise sessions.
 """
 
+import asyncio
 import logging
+import os
 import time
 from collections.abc import Awaitable, Callable
 from typing import TypeVar
@@ -20,6 +23,7 @@ from deephaven_mcp.client import BaseSession
 from deephaven_mcp.mcp_systems_server._tools.mcp_server import mcp_server
 from deephaven_mcp.mcp_systems_server._tools.shared import (
     _format_initialization_status,
+    _validate_max_concurrent,
 )
 from deephaven_mcp.resource_manager import (
     BaseItemManager,
@@ -46,6 +50,31 @@ DEFAULT_PROGRAMMING_LANGUAGE = "Python"
 """Default programming language for community and enterprise sessions when not specified in config."""
 
 
+DEFAULT_SESSION_PROPERTY_TIMEOUT_SECONDS: float = float(
+    os.environ.get("DH_MCP_SESSION_PROPERTY_TIMEOUT_SECONDS", "10")
+)
+"""Seconds session_details waits for each session property lookup (and for a liveness check that does
+not connect) before reporting that field as unavailable.
+Environment variable override: DH_MCP_SESSION_PROPERTY_TIMEOUT_SECONDS
+"""
+
+
+DEFAULT_SESSIONS_DETAILS_MAX_CONCURRENT: int = int(
+    os.environ.get("DH_MCP_DEFAULT_SESSIONS_DETAILS_MAX_CONCURRENT", "10")
+)
+"""Default cap on the number of sessions sessions_details inspects in parallel.
+Environment variable override: DH_MCP_DEFAULT_SESSIONS_DETAILS_MAX_CONCURRENT
+"""
+
+
+DEFAULT_SESSIONS_DETAILS_TIMEOUT_SECONDS: float = float(
+    os.environ.get("DH_MCP_DEFAULT_SESSIONS_DETAILS_TIMEOUT_SECONDS", "30")
+)
+"""Default time sessions_details allows for inspecting one session before reporting it as failed.
+Environment variable override: DH_MCP_DEFAULT_SESSIONS_DETAILS_TIMEOUT_SECONDS
+"""
+
+
 @mcp_server.tool()
 async def sessions_list(context: Context) -> dict:
     """
@@ -81,11 +110,15 @@ async def sessions_list(context: Context) -> dict:
                 - 'source' (str): Source system name
                 - 'session_name' (str): Session name within the source
             - 'initialization' (dict, optional): Present when enterprise session discovery is
-                still in progress or completed with errors. Contains:
-                - 'status' (str): Human-readable description of the initialization state.
+                still in progress or completed with errors, or community session warm-up is
+                running or had failures. Contains:
+                - 'status' (str, optional): Human-readable description of the discovery state.
                 - 'errors' (dict[str, str], optional): Present when one or more enterprise systems
                     had connection errors during initial discovery. Keys are factory names, values
                     are error descriptions.
+                - 'community_warm_up' (dict, optional): Present while community sessions are
+                    being connected at startup, or when some failed to connect. Contains 'status'
+                    (str) and 'errors' (dict[str, str], optional) keyed by session_id.
             - 'error' (str, optional): Error message if retrieval failed.
             - 'isError' (bool, optional): Present and True if this is an error response.
 
@@ -169,7 +202,10 @@ async def sessions_list(context: Context) -> dict:
 
         # Surface initialization status from the same atomic snapshot
         init_info = _format_initialization_status(
-            snapshot.initialization_phase, snapshot.initialization_errors
+            snapshot.initialization_phase,
+            snapshot.initialization_errors,
+            warm_up_phase=snapshot.warm_up_phase,
+            warm_up_errors=snapshot.warm_up_errors,
         )
         if init_info:
             response["initialization"] = init_info
@@ -221,111 +257,265 @@ async def _get_session_liveness_info(
 async def _get_session_property(
     mgr: BaseItemManager,
     session_id: str,
-    available: bool,
     property_name: str,
     getter_func: Callable[[BaseSession], Awaitable[T]],
-) -> T | None:
+) -> T:
     """
-    Safely get a session property.
+    Get a session property from an available session.
 
     Args:
         mgr (BaseItemManager): Session manager
         session_id (str): Session identifier
-        available (bool): Whether the session is available
         property_name (str): Name of the property for logging
         getter_func (Callable[[BaseSession], Awaitable[T]]): Async function to get the property from the session
 
     Returns:
-        T | None: The property value or None if unavailable/failed
-    """
-    if not available:
-        return None
+        T: The property value
 
-    try:
-        session = await mgr.get()
-        result = await getter_func(session)
-        _LOGGER.debug(
-            f"[mcp_systems_server:session_details] Session '{session_id}' {property_name}: {result}"
-        )
-        return result
-    except Exception as e:
-        _LOGGER.warning(
-            f"[mcp_systems_server:session_details] Could not get {property_name} for '{session_id}': {e!r}"
-        )
-        return None
+    Raises:
+        Exception: If the session or the property cannot be retrieved.
+    """
+    session = await mgr.get()
+    result = await getter_func(session)
+    _LOGGER.debug(
+        f"[mcp_systems_server:session_details] Session '{session_id}' {property_name}: {result}"
+    )
+    return result
 
 
 async def _get_session_programming_language(
-    mgr: BaseItemManager, session_id: str, available: bool
-) -> str | None:
+    mgr: BaseItemManager, session_id: str
+) -> str:
     """
-    Get the programming language of a session.
+    Get the programming language of an available session.
 
     This function retrieves the programming language (e.g., "python", "groovy")
-    associated with the session. If the session is not available, it returns None
-    immediately without attempting to connect.
+    associated with the session.
 
     Args:
         mgr (BaseItemManager): Session manager for the target session
         session_id (str): Session identifier for logging purposes
-        available (bool): Whether the session is available (pre-checked)
 
     Returns:
-        str | None: The programming language name (e.g., "python") or None if
-                   unavailable/failed to retrieve
-    """
-    if not available:
-        return None
+        str: The programming language name (e.g., "python")
 
-    try:
-        session: BaseSession = await mgr.get()
-        programming_language = str(session.programming_language)
-        _LOGGER.debug(
-            f"[mcp_systems_server:session_details] Session '{session_id}' programming_language: {programming_language}"
-        )
-        return programming_language
-    except Exception as e:
-        _LOGGER.warning(
-            f"[mcp_systems_server:session_details] Could not get programming_language for '{session_id}': {e!r}"
-        )
-        return None
+    Raises:
+        Exception: If the session or its programming language cannot be retrieved.
+    """
+    session: BaseSession = await mgr.get()
+    programming_language = str(session.programming_language)
+    _LOGGER.debug(
+        f"[mcp_systems_server:session_details] Session '{session_id}' programming_language: {programming_language}"
+    )
+    return programming_language
 
 
 async def _get_session_versions(
-    mgr: BaseItemManager, session_id: str, available: bool
+    mgr: BaseItemManager, session_id: str
 ) -> tuple[str | None, str | None]:
     """
-    Get Deephaven version information from a session.
+    Get Deephaven version information from an available session.
 
     Retrieves both community (Core) and enterprise (Core+) version information.
-    Returns (None, None) immediately without connecting if the session is unavailable.
 
     Args:
         mgr (BaseItemManager): Session manager for the target session
         session_id (str): Session identifier for logging purposes
-        available (bool): Whether the session is available (pre-checked)
 
     Returns:
         tuple[str | None, str | None]: A 2-tuple containing:
             - community_version (str | None): Deephaven Community/Core version (e.g., "0.24.0")
             - enterprise_version (str | None): Deephaven Enterprise/Core+ version
                                               (e.g., "0.24.0") or None if not enterprise
+
+    Raises:
+        Exception: If the session or its versions cannot be retrieved.
     """
-    if not available:
-        return None, None
+    session = await mgr.get()
+    community_version, enterprise_version = await queries.get_dh_versions(session)
+    _LOGGER.debug(
+        f"[mcp_systems_server:session_details] Session '{session_id}' versions: community={community_version}, enterprise={enterprise_version}"
+    )
+    return community_version, enterprise_version
+
+
+async def _get_session_field(
+    lookup: Awaitable[T],
+    session_id: str,
+    field_name: str,
+    timeout_seconds: float,
+    field_errors: dict[str, str],
+) -> T | None:
+    """
+    Await one session_details lookup with a timeout, degrading to None on failure.
 
+    Args:
+        lookup (Awaitable[T]): The lookup to await.
+        session_id (str): Session identifier for logging purposes
+        field_name (str): Name of the looked up field, used as key in field_errors
+        timeout_seconds (float): Seconds to wait before giving up on the lookup
+        field_errors (dict[str, str]): Receives a detail message under field_name if the lookup fails
+
+    Returns:
+        T | None: The lookup result, or None if it failed or timed out
+    """
     try:
-        session = await mgr.get()
-        community_version, enterprise_version = await queries.get_dh_versions(session)
-        _LOGGER.debug(
-            f"[mcp_systems_server:session_details] Session '{session_id}' versions: community={community_version}, enterprise={enterprise_version}"
-        )
-        return community_version, enterprise_version
+        return await asyncio.wait_for(lookup, timeout_seconds)
+    except TimeoutError:
+        field_errors[field_name] = f"Timed out after {timeout_seconds:g}s"
     except Exception as e:
-        _LOGGER.warning(
-            f"[mcp_systems_server:session_details] Could not get Deephaven versions for '{session_id}': {e!r}"
+        field_errors[field_name] = f"{type(e).__name__}: {e}"
+    _LOGGER.warning(
+        f"[mcp_systems_server:session_details] Could not get {field_name} for '{session_id}': {field_errors[field_name]}"
+    )
+    return None
+
+
+async def _collect_session_info(
+    mgr: BaseItemManager,
+    session_id: str,
+    attempt_to_connect: bool,
+    timeout_seconds: float,
+) -> dict[str, object]:
+    """
+    Collect the session_details information of one session.
+
+    Args:
+        mgr (BaseItemManager): Session manager for the target session
+        session_id (str): Fully qualified session identifier
+        attempt_to_connect (bool): Whether to attempt connecting to verify the session's status
+        timeout_seconds (float): Timeout for each property lookup, and for the liveness check when
+            attempt_to_connect is False
+
+    Returns:
+        dict[str, object]: The session info as documented by session_details(), without None values.
+
+    Raises:
+        Exception: If the manager's basic metadata cannot be read.
+    """
+    # Get basic metadata
+    _LOGGER.debug(
+        f"[mcp_systems_server:session_details] Extracting metadata for session '{session_id}'"
+    )
+    system_type_str = mgr.system_type.name
+    source = mgr.source
+    session_name = mgr.name
+    _LOGGER.debug(
+        f"[mcp_systems_server:session_details] Session '{session_id}' metadata: type={system_type_str}, source={source}, name={session_name}"
+    )
+
+    # Get liveness status and availability
+    _LOGGER.debug(
+        f"[mcp_systems_server:session_details] Checking liveness for session '{session_id}' (attempt_to_connect={attempt_to_connect})"
+    )
+    _t1 = time.monotonic()
+    liveness = _get_session_liveness_info(mgr, session_id, attempt_to_connect)
+    if attempt_to_connect:
+        # Connecting may legitimately take long (e.g. starting a worker), so it is not bounded
+        available, liveness_status, liveness_detail = await liveness
+    else:
+        try:
+            available, liveness_status, liveness_detail = await asyncio.wait_for(
+                liveness, timeout_seconds
+            )
+        except TimeoutError:
+            _LOGGER.warning(
+                f"[mcp_systems_server:session_details] Liveness check for '{session_id}' timed out"
+            )
+            available, liveness_status, liveness_detail = (
+                False,
+                "UNKNOWN",
+                f"Liveness check timed out after {timeout_seconds:g}s",
+            )
+    _LOGGER.debug(
+        f"[mcp_systems_server:session_details] Liveness check for '{session_id}' took {time.monotonic() - _t1:.2f}s"
+    )
+
+    # Get session properties using helper functions
+    _LOGGER.debug(
+        f"[mcp_systems_server:session_details] Retrieving session properties for '{session_id}' (available={available})"
+    )
+    programming_language = programming_language_version = None
+    community_version = enterprise_version = None
+    field_errors: dict[str, str] = {}
+    if available:
+        # Independent lookups run concurrently; each degrades to None on its own.
+        # Version lookups share one environment probe, cached per session object by queries.
+        programming_language, programming_language_version, versions = (
+            await asyncio.gather(
+                _get_session_field(
+                    _get_session_programming_language(mgr, session_id),
+                    session_id,
+                    "programming_language",
+                    timeout_seconds,
+                    field_errors,
+                ),
+                _get_session_field(
+                    _get_session_property(
+                        mgr,
+                        session_id,
+                        "programming_language_version",
+                        queries.get_programming_language_version,
+                    ),
+                    session_id,
+                    "programming_language_version",
+                    timeout_seconds,
+                    field_errors,
+                ),
+                _get_session_field(
+                    _get_session_versions(mgr, session_id),
+                    session_id,
+                    "deephaven_versions",
+                    timeout_seconds,
+                    field_errors,
+                ),
+            )
         )
-        return None, None
+        if versions is not None:
+            community_version, enterprise_version = versions
+    _LOGGER.debug(
+        f"[mcp_systems_server:session_details] Completed property retrieval for session '{session_id}'"
+    )
+
+    # Build session info dictionary with all potential fields
+    session_info_with_nones = {
+        "session_id": session_id,
+        "type": system_type_str,
+        "source": source,
+        "session_name": session_name,
+        "available": available,
+        "liveness_status": liveness_status,
+        "liveness_detail": liveness_detail,
+        "programming_language": programming_language,
+        "programming_language_version": programming_language_version,
+        "deephaven_community_version": community_version,
+        "deephaven_enterprise_version": enterprise_version,
+        "field_errors": field_errors or None,
+    }
+
+    # Add dynamic session information if applicable
+    # Check if this is a manager type that provides additional session details
+    if isinstance(mgr, DynamicCommunitySessionManager):
+        try:
+            dynamic_info = mgr.to_dict()
+            # Merge all fields from to_dict() into session_info
+            # This automatically includes any new fields added to to_dict() in the future
+            session_info_with_nones.update(dynamic_info)
+            _LOGGER.debug(
+                f"[mcp_systems_server:session_details] Added dynamic session info for '{session_id}'"
+            )
+        except Exception as e:
+            _LOGGER.warning(
+                f"[mcp_systems_server:session_details] Could not retrieve dynamic session info for '{session_id}': {e}"
+            )
+
+    # Filter out None values
+    session_info = {k: v for k, v in session_info_with_nones.items() if v is not None}
+    _LOGGER.debug(
+        f"[mcp_systems_server:session_details] Built session info for '{session_id}' with {len(session_info)} fields"
+    )
+
+    return session_info
 
 
 @mcp_server.tool()
@@ -385,6 +575,9 @@ async def session_details(
                 - port (int, optional): Port number for dynamically created sessions
                 - container_id (str, optional): Docker container ID for Docker-launched sessions
                 - process_id (int, optional): Process ID for python-launched sessions
+                - field_errors (dict[str, str], optional): Why a lookup failed, keyed by
+                  "programming_language", "programming_language_version" or "deephaven_versions";
+                  present only if a lookup of an available session failed or timed out
             - 'error' (str, optional): Error message if retrieval failed.
             - 'isError' (bool, optional): Present and True if this is an error response.
 
@@ -392,6 +585,11 @@ async def session_details(
         deephaven_enterprise_version) will only be present if the session is available and
         the information could be retrieved successfully. Fields with null values are excluded
         from the response.
+
+    Performance:
+        The property lookups run concurrently, each bounded by DH_MCP_SESSION_PROPERTY_TIMEOUT_SECONDS
+        (default 10s), so a slow lookup only drops its own field. The liveness check is bounded by the
+        same timeout unless attempt_to_connect=True, because connecting may start a worker.
     """
     _LOGGER.info(
         f"[mcp_systems_server:session_details] Invoked for session_id: {session_id}"
@@ -422,92 +620,12 @@ async def session_details(
             }
 
         try:
-            # Get basic metadata
-            _LOGGER.debug(
-                f"[mcp_systems_server:session_details] Extracting metadata for session '{session_id}'"
-            )
-            system_type_str = mgr.system_type.name
-            source = mgr.source
-            session_name = mgr.name
-            _LOGGER.debug(
-                f"[mcp_systems_server:session_details] Session '{session_id}' metadata: type={system_type_str}, source={source}, name={session_name}"
-            )
-
-            # Get liveness status and availability
-            _LOGGER.debug(
-                f"[mcp_systems_server:session_details] Checking liveness for session '{session_id}' (attempt_to_connect={attempt_to_connect})"
-            )
-            _t1 = time.monotonic()
-            available, liveness_status, liveness_detail = (
-                await _get_session_liveness_info(mgr, session_id, attempt_to_connect)
-            )
-            _LOGGER.debug(
-                f"[mcp_systems_server:session_details] Liveness check for '{session_id}' took {time.monotonic() - _t1:.2f}s"
-            )
-
-            # Get session properties using helper functions
-            _LOGGER.debug(
-                f"[mcp_systems_server:session_details] Retrieving session properties for '{session_id}' (available={available})"
-            )
-            programming_language = await _get_session_programming_language(
-                mgr, session_id, available
-            )
-
-            # TODO: should the versions be cached?
-            programming_language_version = await _get_session_property(
+            session_info = await _collect_session_info(
                 mgr,
                 session_id,
-                available,
-                "programming_language_version",
-                queries.get_programming_language_version,
-            )
-
-            community_version, enterprise_version = await _get_session_versions(
-                mgr, session_id, available
-            )
-            _LOGGER.debug(
-                f"[mcp_systems_server:session_details] Completed property retrieval for session '{session_id}'"
+                attempt_to_connect,
+                DEFAULT_SESSION_PROPERTY_TIMEOUT_SECONDS,
             )
-
-            # Build session info dictionary with all potential fields
-            session_info_with_nones = {
-                "session_id": session_id,
-                "type": system_type_str,
-                "source": source,
-                "session_name": session_name,
-                "available": available,
-                "liveness_status": liveness_status,
-                "liveness_detail": liveness_detail,
-                "programming_language": programming_language,
-                "programming_language_version": programming_language_version,
-                "deephaven_community_version": community_version,
-                "deephaven_enterprise_version": enterprise_version,
-            }
-
-            # Add dynamic session information if applicable
-            # Check if this is a manager type that provides additional session details
-            if isinstance(mgr, DynamicCommunitySessionManager):
-                try:
-                    dynamic_info = mgr.to_dict()
-                    # Merge all fields from to_dict() into session_info
-                    # This automatically includes any new fields added to to_dict() in the future
-                    session_info_with_nones.update(dynamic_info)
-                    _LOGGER.debug(
-                        f"[mcp_systems_server:session_details] Added dynamic session info for '{session_id}'"
-                    )
-                except Exception as e:
-                    _LOGGER.warning(
-                        f"[mcp_systems_server:session_details] Could not retrieve dynamic session info for '{session_id}': {e}"
-                    )
-
-            # Filter out None values
-            session_info = {
-                k: v for k, v in session_info_with_nones.items() if v is not None
-            }
-            _LOGGER.debug(
-                f"[mcp_systems_server:session_details] Built session info for '{session_id}' with {len(session_info)} fields"
-            )
-
             return {"success": True, "session": session_info}
 
         except Exception as e:
@@ -525,3 +643,172 @@ async def session_details(
             f"[mcp_systems_server:session_details] Failed: {e!r}", exc_info=True
         )
         return {"success": False, "error": str(e), "isError": True}
+
+
+@mcp_server.tool()
+async def sessions_details(
+    context: Context,
+    session_ids: list[str] | None = None,
+    attempt_to_connect: bool = False,
+    max_concurrent: int = DEFAULT_SESSIONS_DETAILS_MAX_CONCURRENT,
+    timeout_seconds: float = DEFAULT_SESSIONS_DETAILS_TIMEOUT_SECONDS,
+) -> dict:
+    """
+    MCP Tool: Get detailed information about many sessions in one call.
+
+    Bulk variant of session_details. Inspects the given sessions, or every session from sessions_list,
+    with bounded parallelism and returns one session_details-style entry per session. Use this instead
+    of calling session_details once per session.
+
+    **Best-Effort Execution**: Each session is inspected independently. A session that cannot be found,
+    fails or exceeds timeout_seconds is reported as a failed entry; the other sessions are unaffected.
+
+    Terminology Note:
+    - 'Session' and 'worker' are interchangeable terms - both refer to a running Deephaven instance
+    - 'Deephaven Community' and 'Deephaven Core' are interchangeable names for the same product
+    - 'Deephaven Enterprise', 'Deephaven Core+', and 'Deephaven CorePlus' are interchangeable names for the same product
+    - 'DHC' is shorthand for Deephaven Community (also called 'Core')
+    - 'DHE' is shorthand for Deephaven Enterprise (also called 'Core+')
+
+    AI Agent Usage:
+    - Use this for dashboards and overviews that need details of several sessions
+    - Omit session_ids to inspect every session; pass a list to inspect only those
+    - Results are in completion order (fastest sessions first), not input order; match entries by 'session_id'
+    - Use attempt_to_connect=False (default) for status overviews; True connects to every listed session
+    - IMPORTANT: attempt_to_connect=True without session_ids opens a connection to every session
+
+    Args:
+        context (Context): The MCP context object.
+        session_ids (list[str] | None): Session identifiers (fully qualified names) to inspect. Duplicates
+            are inspected once. Defaults to None, which inspects every session from sessions_list.
+        attempt_to_connect (bool, optional): Whether to attempt connecting to each session to verify its
+            status. Defaults to False for faster response.
+        max_concurrent (int): Maximum number of sessions inspected in parallel. Default is 10, overridable
+            with DH_MCP_DEFAULT_SESSIONS_DETAILS_MAX_CONCURRENT. Must be at least 1.
+        timeout_seconds (float): Maximum time for inspecting one session, counted from when it starts.
+            Default is 30, overridable with DH_MCP_DEFAULT_SESSIONS_DETAILS_TIMEOUT_SECONDS. Must be positive.
+
+    Returns:
+        dict: Structured result object with keys:
+            - 'success' (bool): True if the sessions could be enumerated, False otherwise.
+            - 'results' (list[dict]): One entry per session, in completion order. Each contains:
+                - 'session_id' (str): The session identifier
+                - 'success' (bool): Whether the session could be inspected
+                - 'session' (dict, optional): Session details as returned by session_details, if successful
+                - 'error' (str, optional): Error message, if not successful
+            - 'summary' (dict): Counts with keys 'total', 'succeeded' and 'failed'.
+            - 'initialization' (dict, optional): Initialization status, as in sessions_list. Only
+                present when session_ids is omitted.
+            - 'error' (str, optional): Error message if the call failed.
+            - 'isError' (bool, optional): Present and True if this is an error response.
+
+    Error Scenarios:
+        - Invalid max_concurrent or timeout_seconds: Returns error before inspecting any session
+        - Registry errors: Returns error if the session registry cannot be read
+        - Unknown session_id, failures and timeouts: Reported per entry with success=False
+
+    Performance Considerations:
+        - Sessions are inspected max_concurrent at a time, so the call takes roughly
+          (sessions / max_concurrent) times the slowest inspection, bounded by timeout_seconds each
+        - Property lookups inside each session are bounded by DH_MCP_SESSION_PROPERTY_TIMEOUT_SECONDS
+
+    Example Usage:
+        # Status of every session
+        Tool: sessions_details
+        Parameters: {}
+
+        # Selected sessions, verifying connectivity
+        Tool: sessions_details
+        Parameters: {
+            "session_ids": ["enterprise:prod:analytics", "community:local:default"],
+            "attempt_to_connect": true
+        }
+    """
+    _LOGGER.info(
+        f"[mcp_systems_server:sessions_details] Invoked: session_ids={session_ids!r}, "
+        f"attempt_to_connect={attempt_to_connect}, max_concurrent={max_concurrent}, "
+        f"timeout_seconds={timeout_seconds}"
+    )
+    try:
+        validated_max_concurrent = _validate_max_concurrent(
+            max_concurrent, "sessions_details"
+        )
+        if timeout_seconds <= 0:
+            raise ValueError(
+                f"[sessions_details] timeout_seconds must be positive, got {timeout_seconds}"
+            )
+
+        session_registry: CombinedSessionRegistry = (
+            context.request_context.lifespan_context["session_registry"]
+        )
+
+        response: dict[str, object] = {"success": True}
+        managers: dict[str, BaseItemManager | None]
+        if session_ids is None:
+            snapshot = await session_registry.get_all()
+            managers = dict(snapshot.items)
+            init_info = _format_initialization_status(
+                snapshot.initialization_phase,
+                snapshot.initialization_errors,
+                warm_up_phase=snapshot.warm_up_phase,
+                warm_up_errors=snapshot.warm_up_errors,
+            )
+            if init_info:
+                response["initialization"] = init_info
+        else:
+            managers = dict.fromkeys(session_ids)
+
+        semaphore = asyncio.Semaphore(validated_max_concurrent)
+
+        async def describe(
+            session_id: str, mgr: BaseItemManager | None
+        ) -> dict[str, object]:
+            """Inspect one session within the concurrency limit and the per-session timeout."""
+            async with semaphore:
+                try:
+                    async with asyncio.timeout(timeout_seconds):
+                        if mgr is None:
+                            mgr = await session_registry.get(session_id)
+                        session_info = await _collect_session_info(
+                            mgr,
+                            session_id,
+                            attempt_to_connect,
+                            DEFAULT_SESSION_PROPERTY_TIMEOUT_SECONDS,
+                        )
+                    return {
+                        "session_id": session_id,
+                        "success": True,
+                        "session": session_info,
+                    }
+                except TimeoutError:
+                    error = f"Timed out after {timeout_seconds:g}s"
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                _LOGGER.warning(
+                    f"[mcp_systems_server:sessions_details] Could not inspect session '{session_id}': {error}"
+                )
+                return {"session_id": session_id, "success": False, "error": error}
+
+        results: list[dict[str, object]] = []
+        for next_result in asyncio.as_completed(
+            [describe(session_id, mgr) for session_id, mgr in managers.items()]
+        ):
+            results.append(await next_result)
+
+        succeeded = sum(1 for r in results if r["success"])
+        _LOGGER.info(
+            f"[mcp_systems_server:sessions_details] Inspected {len(results)} session(s): "
+            f"{succeeded} succeeded, {len(results) - succeeded} failed"
+        )
+        response["results"] = results
+        response["summary"] = {
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+        }
+        return response
+    except Exception as e:
+        _LOGGER.error(
+            f"[mcp_systems_server:sessions_details] Failed: {e!r}", exc_info=True
+        )
+        return {"success": False, "error": str(e), "isError": True}
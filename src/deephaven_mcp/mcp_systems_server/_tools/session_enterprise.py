@@ -9,7 +9,9 @@ Provides MCP tools for managing Deephaven Enterprise (Core+) sessions:
 These tools require Deephaven Enterprise (Core+) and are not available in Community.
 """
 
+import asyncio
 import logging
+import os
 from datetime import datetime
 from typing import Any
 
@@ -39,6 +41,7 @@ from deephaven_mcp.resource_manager import (
     CombinedSessionRegistry,
     EnterpriseSessionManager,
     InitializationPhase,
+    ResourceLivenessStatus,
     SystemType,
 )
 
@@ -54,6 +57,14 @@ DEFAULT_TIMEOUT_SECONDS = 60
 """Default timeout for enterprise session operations when not specified in config."""
 
 
+SYSTEM_STATUS_TIMEOUT_SECONDS: float = float(
+    os.environ.get("DH_MCP_SYSTEM_STATUS_TIMEOUT_SECONDS", "30")
+)
+"""Time enterprise_systems_status allows each system's liveness check before reporting it as UNKNOWN.
+Environment variable override: DH_MCP_SYSTEM_STATUS_TIMEOUT_SECONDS
+"""
+
+
 @mcp_server.tool()
 async def enterprise_systems_status(
     context: Context, attempt_to_connect: bool = False
@@ -116,11 +127,15 @@ async def enterprise_systems_status(
                 - 'is_alive' (bool): Simple boolean indicating if the system is responsive
                 - 'config' (dict): System configuration with sensitive fields redacted
             - 'initialization' (dict, optional): Present when enterprise session discovery is
-                still in progress or completed with errors. Contains:
-                - 'status' (str): Human-readable description of the initialization state.
+                still in progress or completed with errors, or community session warm-up is
+                running or had failures. Contains:
+                - 'status' (str, optional): Human-readable description of the discovery state.
                 - 'errors' (dict[str, str], optional): Present when one or more enterprise systems
                     had connection errors during initial discovery. Keys are factory names, values
                     are error descriptions.
+                - 'community_warm_up' (dict, optional): Present while community sessions are
+                    being connected at startup, or when some failed to connect. Contains 'status'
+                    (str) and 'errors' (dict[str, str], optional) keyed by session_id.
             - 'error' (str, optional): Error message if retrieval failed.
             - 'isError' (bool, optional): Present and True if this is an error response.
 
@@ -144,6 +159,10 @@ async def enterprise_systems_status(
     Performance Considerations:
         - With attempt_to_connect=False: Typically completes in milliseconds
         - With attempt_to_connect=True: May take seconds due to connection operations
+        - Systems are checked concurrently with one liveness check each, so the call takes about as
+          long as the slowest system
+        - Each check is bounded by DH_MCP_SYSTEM_STATUS_TIMEOUT_SECONDS (default 30); a system whose
+          check times out is reported as "UNKNOWN" instead of stalling the other systems
     """
     _LOGGER.info("[mcp_systems_server:enterprise_systems_status] Invoked.")
     try:
@@ -184,16 +203,40 @@ async def enterprise_systems_status(
         except KeyError:
             systems_config = {}
 
-        systems = []
-        for name, factory in factory_snapshot.items.items():
-            # Use liveness_status() for detailed health information
-            status_enum, liveness_detail = await factory.liveness_status(
-                ensure_item=attempt_to_connect
+        async def check_liveness(
+            name: str, factory: BaseItemManager
+        ) -> tuple[ResourceLivenessStatus, str | None]:
+            """Check one system, reporting UNKNOWN if it does not answer in time."""
+            try:
+                return await asyncio.wait_for(
+                    factory.liveness_status(ensure_item=attempt_to_connect),
+                    timeout=SYSTEM_STATUS_TIMEOUT_SECONDS,
+                )
+            except TimeoutError:
+                _LOGGER.warning(
+                    f"[mcp_systems_server:enterprise_systems_status] Liveness check of system '{name}' "
+                    f"timed out after {SYSTEM_STATUS_TIMEOUT_SECONDS:g}s"
+                )
+                return (
+                    ResourceLivenessStatus.UNKNOWN,
+                    f"Liveness check timed out after {SYSTEM_STATUS_TIMEOUT_SECONDS:g}s",
+                )
+
+        # One liveness check per system, all systems at once
+        liveness_results = await asyncio.gather(
+            *(
+                check_liveness(name, factory)
+                for name, factory in factory_snapshot.items.items()
             )
-            liveness_status = status_enum.name
+        )
 
-            # Also get simple is_alive boolean
-            is_alive = await factory.is_alive()
+        systems = []
+        for name, (status_enum, liveness_detail) in zip(
+            factory_snapshot.items, liveness_results, strict=True
+        ):
+            liveness_status = status_enum.name
+            # is_alive() is liveness_status(ensure_item=False) == ONLINE; derive it instead of asking again
+            is_alive = status_enum == ResourceLivenessStatus.ONLINE
 
             # Redact config for output
             raw_config = systems_config.get(name, {})
@@ -216,7 +259,10 @@ async def enterprise_systems_status(
 
         # Surface initialization status from the combined registry snapshot
         init_info = _format_initialization_status(
-            snapshot.initialization_phase, snapshot.initialization_errors
+            snapshot.initialization_phase,
+            snapshot.initialization_errors,
+            warm_up_phase=snapshot.warm_up_phase,
+            warm_up_errors=snapshot.warm_up_errors,
         )
         if init_info:
             response["initialization"] = init_info
@@ -5,17 +5,25 @@ Provides internal helper functions used across multiple MCP tool modules:
 - Response size checking and validation
 - Common error handling patterns
 - Shared data formatting utilities
+- Concurrency limits for tools that fan out per-table requests
 
 This module contains private helper functions not exposed as MCP tools.
 """
 
 import logging
+import os
+from collections.abc import Awaitable, Callable
 
 import pyarrow
 from mcp.server.fastmcp import Context
 
 from deephaven_mcp.client import BaseSession, CorePlusSession
 from deephaven_mcp.config import ConfigManager, get_config_section
+from deephaven_mcp.formatters import (
+    estimate_formatted_size,
+    estimate_max_rows,
+    format_table_data_iter,
+)
 from deephaven_mcp.resource_manager import (
     CombinedSessionRegistry,
     InitializationPhase,
@@ -27,6 +35,8 @@ _LOGGER = logging.getLogger(__name__)
 def _format_initialization_status(
     phase: InitializationPhase,
     init_errors: dict[str, str],
+    warm_up_phase: InitializationPhase | None = None,
+    warm_up_errors: dict[str, str] | None = None,
 ) -> dict[str, object] | None:
     """Format initialization phase and errors into a response-ready dict.
 
@@ -36,7 +46,8 @@ def _format_initialization_status(
     registry instance).
 
     Returns ``None`` when there is nothing to report (completed without
-    errors), so callers can simply do::
+    errors and no community warm-up running or failed), so callers can simply
+    do::
 
         init_info = _format_initialization_status(phase, errors)
         if init_info:
@@ -45,11 +56,16 @@ def _format_initialization_status(
     Args:
         phase: The current initialization phase.
         init_errors: Dict mapping factory names to error descriptions.
+        warm_up_phase: Community session warm-up phase, or ``None`` if no
+            warm-up was started.
+        warm_up_errors: Dict mapping community session names to warm-up
+            error descriptions.
 
     Returns:
-        A dict with ``status`` (str, always) and ``errors``
-        (dict[str, str], only when present), or ``None`` if initialization
-        completed cleanly.
+        A dict with ``status`` (str) and ``errors`` (dict[str, str]) for
+        enterprise discovery, and ``community_warm_up`` (dict with ``status``
+        and optional ``errors``) for warm-up, each only when there is
+        something to report; or ``None`` if initialization completed cleanly.
     """
     init_info: dict[str, object] = {}
     if phase == InitializationPhase.FAILED:
@@ -74,6 +90,22 @@ def _format_initialization_status(
         )
     if init_errors:
         init_info["errors"] = init_errors
+
+    warm_up_info: dict[str, object] = {}
+    if warm_up_phase == InitializationPhase.LOADING:
+        warm_up_info["status"] = (
+            "Community session warm-up is running. "
+            "Sessions not yet connected connect on first use."
+        )
+    elif warm_up_errors:
+        warm_up_info["status"] = (
+            "Some community sessions could not be warmed up. "
+            "They connect on first use."
+        )
+    if warm_up_errors:
+        warm_up_info["errors"] = warm_up_errors
+    if warm_up_info:
+        init_info["community_warm_up"] = warm_up_info
     return init_info or None
 
 
@@ -184,7 +216,9 @@ MAX_RESPONSE_SIZE = 50_000_000  # 50MB hard limit
 WARNING_SIZE = 5_000_000  # 5MB warning threshold
 
 
-def _check_response_size(table_name: str, estimated_size: int) -> dict | None:
+def _check_response_size(
+    table_name: str, estimated_size: int, suggested_max_rows: int | None = None
+) -> dict | None:
     """
     Check if estimated response size is within acceptable limits.
 
@@ -195,6 +229,9 @@ def _check_response_size(table_name: str, estimated_size: int) -> dict | None:
     Args:
         table_name (str): Name of the table being processed, used for logging context.
         estimated_size (int): Estimated response size in bytes.
+        suggested_max_rows (int | None): Optional row count estimated to fit within
+            MAX_RESPONSE_SIZE. When provided, the error message suggests it as the
+            max_rows to retry with. Defaults to None.
 
     Returns:
         dict | None: Returns None if size is acceptable, or a structured error dict
@@ -212,15 +249,158 @@ def _check_response_size(table_name: str, estimated_size: int) -> dict | None:
         )
 
     if estimated_size > MAX_RESPONSE_SIZE:
+        error = f"Response would be ~{estimated_size/1_000_000:.1f}MB (max 50MB). Please reduce max_rows."
+        if suggested_max_rows is not None:
+            error += f" About {suggested_max_rows} rows fit in this format."
         return {
             "success": False,
-            "error": f"Response would be ~{estimated_size/1_000_000:.1f}MB (max 50MB). Please reduce max_rows.",
+            "error": error,
             "isError": True,
         }
 
     return None  # Size is acceptable
 
 
+def _check_formatted_response_size(
+    table_name: str, arrow_table: pyarrow.Table, format: str
+) -> dict | None:
+    """
+    Check the estimated formatted size of a table against the response size limits.
+
+    Estimates the size of the payload in the requested format with
+    formatters.estimate_formatted_size() (column types, sampled value lengths and row
+    count) instead of Arrow's in-memory size, which badly underestimates text formats.
+    Nothing is formatted, so oversized requests are rejected before any formatting
+    work. When the limit is exceeded, the error suggests a max_rows that would fit.
+
+    Args:
+        table_name (str): Name of the table being processed, used for logging context.
+        arrow_table (pyarrow.Table): Table that is about to be formatted.
+        format (str): Requested format name or optimization strategy.
+
+    Returns:
+        dict | None: None if the size is acceptable, otherwise the structured error dict
+                     from _check_response_size().
+
+    Raises:
+        ValueError: If format is not a valid format name.
+    """
+    estimated_size = estimate_formatted_size(arrow_table, format)
+    suggested_max_rows = None
+    if estimated_size > MAX_RESPONSE_SIZE:
+        suggested_max_rows = estimate_max_rows(arrow_table, format, MAX_RESPONSE_SIZE)
+    return _check_response_size(table_name, estimated_size, suggested_max_rows)
+
+
+BUDGET_PROBE_ROWS = 100
+"""Rows fetched to measure the rendered bytes per row before a budgeted fetch."""
+
+
+def _rendered_size(arrow_table: pyarrow.Table, format: str) -> int:
+    """
+    Measure the exact rendered size of a table in a format.
+
+    Args:
+        arrow_table (pyarrow.Table): Table to render.
+        format (str): Format name or optimization strategy.
+
+    Returns:
+        int: Size of the rendered payload in bytes.
+    """
+    size = 0
+    for chunk in format_table_data_iter(arrow_table, format):
+        size = chunk.bytes_emitted
+    return size
+
+
+async def _fetch_table_within_budget(
+    fetch: Callable[[int | None], Awaitable[tuple[pyarrow.Table, bool]]],
+    context_name: str,
+    format: str,
+    max_rows: int | None,
+    budget: int | None,
+) -> tuple[pyarrow.Table, bool]:
+    """
+    Fetch only as many rows as are expected to fit in a byte budget.
+
+    Without a budget, or when max_rows is already no larger than the probe, this is a
+    single ``fetch(max_rows)``. Otherwise a probe of BUDGET_PROBE_ROWS rows is fetched
+    and rendered in the requested format to measure the fixed overhead and the bytes
+    per row, and only the rows that fit (capped at max_rows) are fetched. If the probe
+    already holds the whole table or every row that fits, it is returned as is.
+
+    The result is a fetch plan, not a guarantee: callers must still format with the
+    budget (see _build_table_data_response) to cut the payload at the exact row.
+
+    Args:
+        fetch (Callable[[int | None], Awaitable[tuple[pyarrow.Table, bool]]]):
+            Fetches up to the given number of rows (None for all), returning the Arrow
+            table and whether it holds the entire source table, like queries.get_table.
+        context_name (str): Table description used for logging.
+        format (str): Format name or optimization strategy the rows will be rendered in.
+        max_rows (int | None): Row limit requested by the caller, or None for no limit.
+        budget (int | None): Byte budget from formatters.resolve_byte_budget(), or
+            None for no budget.
+
+    Returns:
+        tuple[pyarrow.Table, bool]: The fetched table and whether it holds the
+        entire source table.
+
+    Raises:
+        ValueError: If format is not a valid format name.
+    """
+    if budget is None or (max_rows is not None and max_rows <= BUDGET_PROBE_ROWS):
+        return await fetch(max_rows)
+
+    probe, is_complete = await fetch(BUDGET_PROBE_ROWS)
+    if is_complete or len(probe) == 0:
+        return probe, is_complete
+
+    overhead = _rendered_size(probe.schema.empty_table(), format)
+    per_row = max((_rendered_size(probe, format) - overhead) / len(probe), 1.0)
+    rows_that_fit = int(max(budget - overhead, 0) // per_row)
+    _LOGGER.debug(
+        f"[mcp_systems_server:_fetch_table_within_budget] {context_name}: "
+        f"~{per_row:.1f} bytes/row in '{format}', {rows_that_fit} rows fit in {budget} bytes"
+    )
+
+    if max_rows is not None:
+        rows_that_fit = min(rows_that_fit, max_rows)
+    if rows_that_fit <= len(probe):
+        return probe, False
+    return await fetch(rows_that_fit)
+
+
+DEFAULT_SCHEMA_MAX_CONCURRENT: int = int(
+    os.environ.get("DH_MCP_DEFAULT_SCHEMA_MAX_CONCURRENT", "10")
+)
+"""Default cap on the number of table schemas fetched in parallel within a single
+schema tool call (session_tables_schema, catalog_tables_schema).
+Environment variable override: DH_MCP_DEFAULT_SCHEMA_MAX_CONCURRENT
+"""
+
+
+def _validate_max_concurrent(max_concurrent: int, function_name: str) -> int:
+    """Validate max_concurrent is valid for parallel operations.
+
+    Args:
+        max_concurrent (int): Maximum number of concurrent operations (must be >= 1).
+        function_name (str): Name of calling function, included in the error message for context.
+
+    Returns:
+        int: The validated max_concurrent value
+
+    Raises:
+        ValueError: If max_concurrent is less than 1
+    """
+    if max_concurrent < 1:
+        raise ValueError(
+            f"[{function_name}] max_concurrent must be at least 1, got {max_concurrent}. "
+            f"Use a positive integer to control parallelism (e.g., 20 for moderate concurrency)."
+        )
+    return max_concurrent
+
+
 def _format_meta_table_result(
     arrow_meta_table: pyarrow.Table,
     table_name: str,
@@ -9,42 +9,78 @@ Provides MCP tools for working with tables in Deephaven sessions:
 These tools work with both Community and Enterprise sessions.
 """
 
+import asyncio
+import contextlib
 import logging
+import os
+import re
+import uuid
 
 import pyarrow
 from mcp.server.fastmcp import Context
 
 from deephaven_mcp import queries
-from deephaven_mcp.formatters import format_table_data
+from deephaven_mcp.client import BaseSession
+from deephaven_mcp.config import DEFAULT_EXPORT_BATCH_ROWS, ConfigManager
+from deephaven_mcp.formatters import (
+    format_table_data,
+    format_table_data_iter,
+    join_formatted_chunks,
+    resolve_byte_budget,
+)
 from deephaven_mcp.mcp_systems_server._tools.mcp_server import (
     mcp_server,
 )
 from deephaven_mcp.mcp_systems_server._tools.shared import (
-    _check_response_size,
+    DEFAULT_SCHEMA_MAX_CONCURRENT,
+    _check_formatted_response_size,
+    _fetch_table_within_budget,
     _format_meta_table_result,
     _get_session_from_context,
+    _validate_max_concurrent,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNSAFE_FILE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+"""Characters replaced with '_' when deriving an export file name from a table name."""
 
-# Response size estimation constants
-# Conservative estimate: ~20 chars + 8 bytes numeric + JSON overhead + safety margin
-ESTIMATED_BYTES_PER_CELL = 50
-"""
-Estimated bytes per table cell for response size calculation.
-
-This rough estimate is used to prevent memory issues when retrieving large tables.
-The estimation assumes:
-- Average string length: ~20 characters (20 bytes)
-- Numeric values: ~8 bytes (int64/double)
-- Null values and metadata: ~5 bytes overhead
-- JSON formatting overhead: ~15-20 bytes per cell
-- Safety margin: 50 bytes total per cell
-
-This conservative estimate helps catch potentially problematic responses before
-expensive formatting operations. Can be tuned based on actual data patterns.
-"""
+
+def _format_within_budget(
+    arrow_table: pyarrow.Table, format: str, budget: int, head: bool
+) -> tuple[str, object, int, bool]:
+    """
+    Format as many rows of a table as fit in a byte budget.
+
+    With head=True the leading rows are kept. With head=False the trailing rows are kept:
+    the window is shifted to the end of the table and shrunk until it fits, so a
+    budgeted tail request still returns the most recent rows.
+
+    Args:
+        arrow_table (pyarrow.Table): The Arrow table to format.
+        format (str): Format name or optimization strategy.
+        budget (int): Byte budget for the formatted payload.
+        head (bool): True to keep the first rows, False to keep the last rows.
+
+    Returns:
+        tuple[str, object, int, bool]: The actual format, the formatted data, the number
+        of rows formatted, and whether any rows were dropped to honor the budget.
+    """
+    actual_format, formatted_data, row_count, truncated = join_formatted_chunks(
+        format_table_data_iter(arrow_table, format, max_bytes=budget)
+    )
+    while not head and truncated and row_count:
+        # Trailing rows can render larger than leading ones; shrink until they fit
+        tail = arrow_table.slice(len(arrow_table) - row_count)
+        actual_format, formatted_data, tail_rows, tail_truncated = (
+            join_formatted_chunks(
+                format_table_data_iter(tail, format, max_bytes=budget)
+            )
+        )
+        if not tail_truncated:
+            break
+        row_count = tail_rows
+    return actual_format, formatted_data, row_count, truncated
 
 
 def _build_table_data_response(
@@ -53,6 +89,8 @@ def _build_table_data_response(
     format: str,
     table_name: str | None = None,
     namespace: str | None = None,
+    budget: int | None = None,
+    head: bool = True,
 ) -> dict:
     """
     Build a standardized table data response with schema, formatting, and metadata.
@@ -71,6 +109,11 @@ def _build_table_data_response(
         format (str): Desired output format (may be optimization strategy or specific format like "csv", "json-row", etc.).
         table_name (str | None): Optional table name to include in response. Recommended for clarity.
         namespace (str | None): Optional namespace to include in response. Use for catalog tables only.
+        budget (int | None): Optional byte budget for the formatted data. When given, rows are
+            dropped at the exact row boundary that keeps the payload within the budget, and
+            is_complete becomes False if any row was dropped.
+        head (bool): Which end of the table to keep when the budget drops rows. True keeps the
+            first rows, False keeps the last rows (matching a tail() fetch). Defaults to True.
 
     Returns:
         dict: Standardized response with success=True and fields:
@@ -78,7 +121,7 @@ def _build_table_data_response(
             - format (str): Actual format used (resolved from optimization strategies to specific format).
             - schema (list[dict]): Column definitions with name and type.
             - row_count (int): Number of rows in the response.
-            - is_complete (bool): Whether entire table was retrieved.
+            - is_complete (bool): Whether entire table was retrieved and formatted.
             - data (varies): Formatted table data (type depends on format).
             - table_name (str, optional): Included if table_name parameter provided.
             - namespace (str, optional): Included if namespace parameter provided (catalog tables).
@@ -89,14 +132,23 @@ def _build_table_data_response(
     ]
 
     # Format data
-    actual_format, formatted_data = format_table_data(arrow_table, format_type=format)
+    if budget is None:
+        actual_format, formatted_data = format_table_data(
+            arrow_table, format_type=format
+        )
+        row_count = len(arrow_table)
+    else:
+        actual_format, formatted_data, row_count, truncated = _format_within_budget(
+            arrow_table, format, budget, head
+        )
+        is_complete = is_complete and not truncated
 
     # Build response
     response = {
         "success": True,
         "format": actual_format,
         "schema": schema,
-        "row_count": len(arrow_table),
+        "row_count": row_count,
         "is_complete": is_complete,
         "data": formatted_data,
     }
@@ -110,9 +162,151 @@ def _build_table_data_response(
     return response
 
 
+async def _total_row_count(
+    session: BaseSession,
+    table_name: str,
+    filters: list[str] | None,
+    fetched_rows: int,
+    is_complete: bool,
+) -> int | None:
+    """
+    Return the total number of rows matching the filters, asking the server only when needed.
+
+    A complete fetch already holds every row, so its row count is the total. Only a truncated
+    fetch costs an extra call to queries.get_table_row_count().
+
+    Args:
+        session (BaseSession): The session that owns the table.
+        table_name (str): Name of the table.
+        filters (list[str] | None): The where clause expressions the fetch used.
+        fetched_rows (int): Number of rows the fetch returned.
+        is_complete (bool): Whether the fetch returned every matching row.
+
+    Returns:
+        int | None: The total row count, or None if the server did not report a size.
+    """
+    if is_complete:
+        return fetched_rows
+    return await queries.get_table_row_count(session, table_name, filters=filters)
+
+
+def _remove_partial_export(path: str) -> None:
+    """
+    Delete a partially written export file, if the export created one.
+
+    Args:
+        path (str): Path of the export file.
+    """
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
+async def _export_table_data_to_parquet(
+    context: Context,
+    session: BaseSession,
+    table_name: str,
+    max_rows: int | None,
+    head: bool,
+    columns: list[str] | None,
+    filters: list[str] | None,
+) -> dict:
+    """
+    Export a session table to a Parquet file in the configured spill directory.
+
+    The file is written batch by batch by queries.export_table_to_parquet(), so neither the
+    response nor the server's memory has to hold the whole table. Requires the 'table_export'
+    configuration section; exports are disabled without it. A partially written file is removed
+    if the export fails.
+
+    Args:
+        context (Context): The MCP context object, used to read the configuration.
+        session (BaseSession): The session that owns the table.
+        table_name (str): Name of the table to export.
+        max_rows (int | None): Maximum number of rows to export, or None for the whole table.
+        head (bool): True to export the first rows, False to export the last rows.
+        columns (list[str] | None): Columns to export, or None for all columns.
+        filters (list[str] | None): Deephaven where clause expressions to apply, or None.
+
+    Returns:
+        dict: On success, a dict with success=True and fields:
+            - table_name (str): Name of the exported table.
+            - format (str): Always "parquet".
+            - path (str): Absolute path of the written Parquet file.
+            - schema (list[dict]): Column definitions with name and type.
+            - row_count (int): Number of rows written.
+            - is_complete (bool): Whether the entire table was exported.
+            - file_size_bytes (int): Size of the written file.
+        If exports are not configured, a dict with success=False, error and isError=True.
+
+    Raises:
+        Exception: If the table cannot be fetched or the file cannot be written.
+    """
+    config_manager: ConfigManager = context.request_context.lifespan_context[
+        "config_manager"
+    ]
+    config = await config_manager.get_config()
+    export_config = config.get("table_export")
+    if export_config is None:
+        _LOGGER.warning(
+            "[mcp_systems_server:session_table_data] Parquet export requested but 'table_export' is not configured"
+        )
+        return {
+            "success": False,
+            "error": (
+                "Parquet export is disabled. To enable, configure a spill directory in deephaven_mcp.json:\n\n"
+                "{\n"
+                '  "table_export": {\n'
+                '    "directory": "/var/tmp/deephaven-mcp-exports"\n'
+                "  }\n"
+                "}"
+            ),
+            "isError": True,
+        }
+
+    directory = os.path.abspath(os.path.expanduser(export_config["directory"]))
+    batch_rows = export_config.get("batch_rows", DEFAULT_EXPORT_BATCH_ROWS)
+    file_name = (
+        f"{_UNSAFE_FILE_NAME_CHARS.sub('_', table_name)}-{uuid.uuid4().hex}.parquet"
+    )
+    path = os.path.join(directory, file_name)
+    await asyncio.to_thread(os.makedirs, directory, exist_ok=True)
+
+    _LOGGER.debug(
+        f"[mcp_systems_server:session_table_data] Exporting '{table_name}' to '{path}' in batches of {batch_rows} rows"
+    )
+    try:
+        schema, row_count, is_complete = await queries.export_table_to_parquet(
+            session,
+            table_name,
+            path,
+            max_rows=max_rows,
+            head=head,
+            batch_rows=batch_rows,
+            columns=columns,
+            filters=filters,
+        )
+    except Exception:
+        await asyncio.to_thread(_remove_partial_export, path)
+        raise
+
+    return {
+        "success": True,
+        "table_name": table_name,
+        "format": "parquet",
+        "path": path,
+        "schema": [{"name": field.name, "type": str(field.type)} for field in schema],
+        "row_count": row_count,
+        "is_complete": is_complete,
+        "file_size_bytes": await asyncio.to_thread(os.path.getsize, path),
+    }
+
+
 @mcp_server.tool()
 async def session_tables_schema(
-    context: Context, session_id: str, table_names: list[str] | None = None
+    context: Context,
+    session_id: str,
+    table_names: list[str] | None = None,
+    max_concurrent: int = DEFAULT_SCHEMA_MAX_CONCURRENT,
 ) -> dict:
     """
     MCP Tool: Retrieve table schemas as TABULAR METADATA from a Deephaven session.
@@ -124,7 +318,10 @@ async def session_tables_schema(
     Returns complete metadata information for the specified tables including column names, data types,
     and all metadata properties. If no table_names are provided, returns schemas for all available
     tables in the session. This provides the FULL schema with all metadata properties, not just
-    simplified name/type pairs.
+    simplified name/type pairs. Schemas are fetched in parallel, at most max_concurrent at a time,
+    and results are returned in the same order as the requested (or discovered) table names.
+    Schemas are cached per session and table; running a script in the session with
+    session_script_run drops that session's cached schemas.
 
     Terminology Note:
     - 'Session' and 'worker' are interchangeable terms - both refer to a running Deephaven instance
@@ -151,12 +348,15 @@ async def session_tables_schema(
     - Essential before calling session_table_data or session_script_run to understand table structure
     - Individual table failures don't stop processing of other tables
     - This returns FULL metadata, not simplified schema - use for complete table understanding
+    - Lower max_concurrent if a busy server struggles with many parallel schema requests
 
     Args:
         context (Context): The MCP context object.
         session_id (str): ID of the Deephaven session to query. This argument is required.
         table_names (list[str], optional): List of table names to retrieve schemas for.
             If None, all available tables will be queried. Defaults to None.
+        max_concurrent (int, optional): Maximum number of schemas fetched in parallel (must be >= 1).
+            Defaults to 10 (override with the DH_MCP_DEFAULT_SCHEMA_MAX_CONCURRENT environment variable).
 
     Returns:
         dict: Structured result object with keys:
@@ -217,10 +417,14 @@ async def session_tables_schema(
         }
     """
     _LOGGER.info(
-        f"[mcp_systems_server:session_tables_schema] Invoked: session_id={session_id!r}, table_names={table_names!r}"
+        f"[mcp_systems_server:session_tables_schema] Invoked: session_id={session_id!r}, "
+        f"table_names={table_names!r}, max_concurrent={max_concurrent}"
     )
-    schemas = []
     try:
+        validated_max_concurrent = _validate_max_concurrent(
+            max_concurrent, "session_tables_schema"
+        )
+
         # Use helper to get session from context
         session = await _get_session_from_context(
             "session_tables_schema", context, session_id
@@ -240,42 +444,48 @@ async def session_tables_schema(
                 f"[mcp_systems_server:session_tables_schema] Fetching schemas for all tables in session: {selected_table_names!r}"
             )
 
-        for table_name in selected_table_names:
-            _LOGGER.debug(
-                f"[mcp_systems_server:session_tables_schema] Processing table '{table_name}' in session '{session_id}'"
-            )
-            try:
-                meta_arrow_table = await queries.get_session_meta_table(
-                    session, table_name
-                )
+        semaphore = asyncio.Semaphore(validated_max_concurrent)
 
-                # Use helper to format result (no namespace for session tables)
-                result = _format_meta_table_result(
-                    meta_arrow_table, table_name, namespace=None
+        async def fetch_schema(table_name: str) -> dict:
+            """Fetch one table's schema, turning failures into a per-table error entry."""
+            async with semaphore:
+                _LOGGER.debug(
+                    f"[mcp_systems_server:session_tables_schema] Processing table '{table_name}' in session '{session_id}'"
                 )
-                schemas.append(result)
-
-                _LOGGER.info(
-                    f"[mcp_systems_server:session_tables_schema] Success: Retrieved full schema for table '{table_name}' ({result['row_count']} columns)"
-                )
-            except Exception as table_exc:
-                _LOGGER.error(
-                    f"[mcp_systems_server:session_tables_schema] Failed to get schema for table '{table_name}': {table_exc!r}",
-                    exc_info=True,
-                )
-                schemas.append(
-                    {
+                try:
+                    meta_arrow_table = await queries.get_session_meta_table(
+                        session, table_name, session_name=session_id
+                    )
+                    # Use helper to format result (no namespace for session tables)
+                    result = _format_meta_table_result(
+                        meta_arrow_table, table_name, namespace=None
+                    )
+                    _LOGGER.info(
+                        f"[mcp_systems_server:session_tables_schema] Success: Retrieved full schema for table '{table_name}' ({result['row_count']} columns)"
+                    )
+                    return result
+                except Exception as table_exc:
+                    _LOGGER.error(
+                        f"[mcp_systems_server:session_tables_schema] Failed to get schema for table '{table_name}': {table_exc!r}",
+                        exc_info=True,
+                    )
+                    return {
                         "success": False,
                         "table": table_name,
                         "error": str(table_exc),
                         "isError": True,
                     }
-                )
+
+        # gather() preserves input order, so results line up with selected_table_names
+        schemas = await asyncio.gather(
+            *(fetch_schema(table_name) for table_name in selected_table_names)
+        )
 
         _LOGGER.info(
-            f"[mcp_systems_server:session_tables_schema] Returning {len(schemas)} table results"
+            f"[mcp_systems_server:session_tables_schema] Returning {len(schemas)} table results "
+            f"(schema cache: {queries.get_schema_cache_stats()})"
         )
-        return {"success": True, "schemas": schemas, "count": len(schemas)}
+        return {"success": True, "schemas": list(schemas), "count": len(schemas)}
     except Exception as e:
         _LOGGER.error(
             f"[mcp_systems_server:session_tables_schema] Failed for session: '{session_id}', error: {e!r}",
@@ -391,6 +601,12 @@ async def session_table_data(
     max_rows: int | None = 1000,
     head: bool = True,
     format: str = "optimize-rendering",
+    max_tokens: int | None = None,
+    max_bytes: int | None = None,
+    export_parquet: bool = False,
+    columns: list[str] | None = None,
+    filters: list[str] | None = None,
+    include_total_row_count: bool = False,
 ) -> dict:
     r"""
     MCP Tool: Retrieve TABULAR DATA from a specified Deephaven session table.
@@ -409,7 +625,18 @@ async def session_table_data(
     - xml: 45% accuracy
     - csv: 44% accuracy (lowest comprehension, fewest tokens)
 
-    Includes safety limits (50MB max response size) to prevent memory issues.
+    Includes safety limits (50MB max response size) to prevent memory issues. An optional
+    max_tokens or max_bytes budget returns as many rows as fit in the chosen format instead
+    of a fixed row count: a small probe is fetched to measure the rendered bytes per row,
+    only the rows that fit are fetched, and the payload is cut at the exact row that keeps
+    it within the budget.
+
+    Optional columns and filters are applied by the Deephaven engine (view and where) before any data is
+    transferred, so wide or large tables only ship the selected columns of the matching rows.
+
+    For pulls too large to return inline, export_parquet=True writes the rows to a Parquet file in the
+    server's configured spill directory ('table_export' in deephaven_mcp.json) batch by batch, and returns
+    only the file path, schema, row count and file size. Export mode is disabled unless configured.
 
     Terminology Note:
     - 'Session' and 'worker' are interchangeable terms - both refer to a running Deephaven instance
@@ -434,6 +661,7 @@ async def session_table_data(
                                - "optimize-accuracy": Always use markdown-kv (best comprehension, more tokens)
                                - "optimize-cost": Always use csv (fewer tokens, may be harder to parse)
                                - "optimize-speed": Always use json-column (fastest conversion)
+                               - "optimize-throughput": Always use arrow-ipc-lz4 (binary, for programmatic clients)
                                - "markdown-table": String with pipe-delimited table (| col1 | col2 |\n| --- | --- |\n| val1 | val2 |)
                                - "markdown-kv": String with record headers and key-value pairs (## Record 1\ncol1: val1\ncol2: val2)
                                - "json-row": List of dicts, one per row: [{col1: val1, col2: val2}, ...]
@@ -441,6 +669,25 @@ async def session_table_data(
                                - "csv": String with comma-separated values, includes header row
                                - "yaml": String with YAML-formatted records list
                                - "xml": String with XML records structure
+                               - "arrow-ipc": Base64 Arrow IPC stream with exact column types (decode with
+                                 pyarrow.ipc.open_stream(base64.b64decode(data)).read_all())
+                               - "arrow-ipc-lz4" / "arrow-ipc-zstd": Same, with LZ4 or ZSTD compressed buffers
+        max_tokens (int | None, optional): Maximum size of the formatted 'data' in estimated LLM tokens
+                                          (about 4 bytes per token). Defaults to None (no token budget).
+        max_bytes (int | None, optional): Maximum size of the formatted 'data' in bytes. Defaults to None
+                                         (no byte budget). When both budgets are given, the tighter one applies.
+                                         max_rows still caps the row count when a budget is given.
+        export_parquet (bool, optional): If True, write the rows to a Parquet file in the configured spill
+                                        directory instead of returning them inline. format, max_tokens and
+                                        max_bytes are ignored in this mode. Defaults to False.
+        columns (list[str] | None, optional): Column names to return, in order. Applied server-side with view().
+                                             Defaults to None (all columns).
+        filters (list[str] | None, optional): Deephaven where clause expressions applied server-side before the row
+                                             limit. Multiple filters are combined with AND logic. Use backticks (`)
+                                             for string literals. Defaults to None (no filtering).
+        include_total_row_count (bool, optional): If True, add 'total_row_count' with the number of rows in the
+                                                 (filtered) table. Costs one extra server call, and only when the
+                                                 result is truncated. Defaults to False.
 
     Returns:
         dict: Structured result object with the following keys:
@@ -451,8 +698,13 @@ async def session_table_data(
                                               {'name': str, 'type': str} describing column name and PyArrow data type
                                               (e.g., 'int64', 'string', 'double', 'timestamp[ns]').
             - 'row_count' (int, optional): Number of rows in the returned data if successful. May be less than max_rows.
-            - 'is_complete' (bool, optional): True if entire table was retrieved if successful. False if truncated by max_rows.
+            - 'is_complete' (bool, optional): True if every row matching the filters was retrieved if successful. False if truncated by max_rows or by the budget.
+            - 'total_row_count' (int | None, optional): Total rows matching the filters. Present only when
+                                                      include_total_row_count=True.
             - 'data' (list | dict | str, optional): The actual table data if successful. Type depends on format.
+                                                  Omitted in export mode.
+            - 'path' (str, optional): Absolute path of the written Parquet file. Present only in export mode.
+            - 'file_size_bytes' (int, optional): Size of the written Parquet file. Present only in export mode.
             - 'error' (str, optional): Human-readable error message if retrieval failed. Omitted on success.
             - 'isError' (bool, optional): Present and True only when success=False. Explicit error flag for frameworks.
 
@@ -460,6 +712,9 @@ async def session_table_data(
         - Invalid session_id: Returns error if session doesn't exist or is not accessible
         - Invalid table_name: Returns error if table doesn't exist in the session
         - Invalid format: Returns error if format is not one of the supported options listed above
+        - Invalid budget: Returns error if max_tokens or max_bytes is negative
+        - Invalid columns or filters: Returns error if a column does not exist or a filter is invalid
+        - Export not configured: Returns error if export_parquet=True and 'table_export' is not configured
         - Response too large: Returns error if estimated response would exceed 50MB limit
         - Session connection issues: Returns error if unable to communicate with Deephaven server
         - Query execution errors: Returns error if table query fails (permissions, syntax, etc.)
@@ -472,6 +727,7 @@ async def session_table_data(
 
     Performance Considerations:
         - Large tables: Use csv format or limit max_rows to avoid memory issues
+        - Wide tables: Use columns to fetch only the columns you need
         - Column analysis: Use json-column format for efficient column-wise operations
         - Row processing: Use json-row format for record-by-record iteration
         - Response size limit: 50MB maximum to prevent memory issues
@@ -479,12 +735,16 @@ async def session_table_data(
     AI Agent Usage:
         - Always check 'success' field before accessing data fields
         - Use 'is_complete' to determine if more data exists beyond max_rows limit
+        - Set include_total_row_count=True only when you need the exact size of a truncated table
         - Parse 'schema' array to understand column types before processing 'data'
         - Use head=True (default) to get rows from table start, head=False to get from table end
         - Start with small max_rows values for large tables to avoid memory issues
+        - Prefer max_tokens over guessing max_rows: it returns as many rows as fit your context budget in one call
         - Use 'optimize-rendering' (default) for best table display in AI interfaces
         - Use 'optimize-accuracy' for highest comprehension (markdown-kv format, more tokens)
         - Use 'optimize-cost' for fewest tokens (csv format, may be harder to parse)
+        - Use 'optimize-throughput' (arrow-ipc-lz4) when a program, not a model, consumes the data: it keeps exact types and skips per-cell conversion
+        - Use export_parquet=True for bulk pulls (e.g. max_rows=null on large tables) and hand the returned 'path' to downstream tools
         - Check 'format' field in response to know actual format used
 
     Example Usage:
@@ -539,33 +799,92 @@ async def session_table_data(
             "max_rows": 50,
             "format": "markdown-table"
         }
+
+        # Get as many of the most recent rows as fit in about 4000 tokens
+        Tool: session_table_data
+        Parameters: {
+            "session_id": "community:localhost:10000",
+            "table_name": "trades",
+            "max_rows": null,
+            "head": false,
+            "max_tokens": 4000
+        }
+
+        # Get two columns of the rows for one symbol
+        Tool: session_table_data
+        Parameters: {
+            "session_id": "community:localhost:10000",
+            "table_name": "trades",
+            "columns": ["Timestamp", "Price"],
+            "filters": ["Sym = `AAPL`", "Price > 100"]
+        }
+
+        # Export an entire large table to a Parquet file instead of returning it inline
+        Tool: session_table_data
+        Parameters: {
+            "session_id": "community:localhost:10000",
+            "table_name": "trades",
+            "max_rows": null,
+            "export_parquet": true
+        }
     """
     _LOGGER.info(
         f"[mcp_systems_server:session_table_data] Invoked: session_id={session_id!r}, "
-        f"table_name={table_name!r}, max_rows={max_rows}, head={head}, format={format!r}"
+        f"table_name={table_name!r}, max_rows={max_rows}, head={head}, format={format!r}, "
+        f"max_tokens={max_tokens}, max_bytes={max_bytes}, export_parquet={export_parquet}, "
+        f"columns={columns!r}, filters={filters!r}, include_total_row_count={include_total_row_count}"
     )
 
     result: dict[str, object] = {"success": False}
 
     try:
+        budget = resolve_byte_budget(max_bytes=max_bytes, max_tokens=max_tokens)
+
         # Use helper to get session from context
         session = await _get_session_from_context(
             "session_table_data", context, session_id
         )
 
+        if export_parquet:
+            export_result = await _export_table_data_to_parquet(
+                context, session, table_name, max_rows, head, columns, filters
+            )
+            if export_result["success"] and include_total_row_count:
+                export_result["total_row_count"] = await _total_row_count(
+                    session,
+                    table_name,
+                    filters,
+                    export_result["row_count"],
+                    export_result["is_complete"],
+                )
+            if export_result["success"]:
+                _LOGGER.info(
+                    f"[mcp_systems_server:session_table_data] Exported {export_result['row_count']} rows of "
+                    f"'{table_name}' to '{export_result['path']}'"
+                )
+            return export_result
+
         # Get table data using queries module
         _LOGGER.debug(
             f"[mcp_systems_server:session_table_data] Retrieving table data for '{table_name}'"
         )
-        arrow_table, is_complete = await queries.get_table(
-            session, table_name, max_rows=max_rows, head=head
+        arrow_table, is_complete = await _fetch_table_within_budget(
+            lambda rows: queries.get_table(
+                session,
+                table_name,
+                max_rows=rows,
+                head=head,
+                columns=columns,
+                filters=filters,
+            ),
+            f"table '{table_name}'",
+            format,
+            max_rows,
+            budget,
         )
 
-        # Check response size before formatting (rough estimation to avoid memory overhead)
-        row_count = len(arrow_table)
-        col_count = len(arrow_table.schema)
-        estimated_size = row_count * col_count * ESTIMATED_BYTES_PER_CELL
-        size_error = _check_response_size(table_name, estimated_size)
+        # Check estimated formatted size before spending CPU on formatting
+        size_error = _check_formatted_response_size(table_name, arrow_table, format)
 
         if size_error:
             return size_error
@@ -575,22 +894,31 @@ async def session_table_data(
             f"[mcp_systems_server:session_table_data] Formatting data with format='{format}'"
         )
         response = _build_table_data_response(
-            arrow_table, is_complete, format, table_name=table_name
+            arrow_table,
+            is_complete,
+            format,
+            table_name=table_name,
+            budget=budget,
+            head=head,
         )
         result.update(response)
+        if include_total_row_count:
+            result["total_row_count"] = await _total_row_count(
+                session, table_name, filters, len(arrow_table), is_complete
+            )
 
         _LOGGER.info(
-            f"[mcp_systems_server:session_table_data] Successfully retrieved {row_count} rows "
+            f"[mcp_systems_server:session_table_data] Successfully retrieved {response['row_count']} rows "
             f"from '{table_name}' in '{response['format']}' format"
         )
 
     except ValueError as e:
-        # Format validation error from formatters package
+        # Format or budget validation error from formatters package
         _LOGGER.error(
-            f"[mcp_systems_server:session_table_data] Invalid format parameter: {e!r}"
+            f"[mcp_systems_server:session_table_data] Invalid format or budget parameter: {e!r}"
         )
         result["error"] = (
-            f"Invalid format parameter for table '{table_name}': {type(e).__name__}: {e}"
+            f"Invalid format or budget parameter for table '{table_name}': {type(e).__name__}: {e}"
         )
         result["isError"] = True
 
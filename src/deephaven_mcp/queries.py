@@ -5,13 +5,21 @@ This module provides coroutine-compatible utility functions for querying Deephav
 
 **Functions Provided:**
     - `get_table(session, table_name)`: Retrieve a Deephaven table as a pyarrow.Table snapshot.
+    - `get_table_row_count(session, table_name)`: Count the rows of a Deephaven table without fetching any data.
+    - `export_table_to_parquet(session, table_name, path)`: Stream a Deephaven table into a local Parquet file in row batches.
     - `get_session_meta_table(session, table_name)`: Retrieve a session table's schema/meta table as a pyarrow.Table snapshot.
     - `get_catalog_meta_table(session, namespace, table_name)`: Retrieve a catalog table's schema/meta table as a pyarrow.Table snapshot.
+    - `get_catalog_meta_tables(session, tables)`: Retrieve the meta tables of many catalog tables with one server-side script.
     - `get_catalog_table(session)`: Retrieve the catalog table from an enterprise session with optional filtering and namespace extraction.
     - `get_pip_packages_table(session)`: Get a table of installed pip packages as a pyarrow.Table.
     - `get_programming_language_version_table(session)`: Get a table with Python version information as a pyarrow.Table.
     - `get_programming_language_version(session)`: Get the programming language version string from a Deephaven session.
     - `get_dh_versions(session)`: Get the installed Deephaven Core and Core+ version strings from the session's pip environment.
+    - `get_session_environment_table(session)`: Probe the Python version and installed packages of a session with one script.
+    - `invalidate_session_environment(session)`: Forget the environment table cached for a session object.
+    - `invalidate_schema_cache(session_name)` / `get_schema_cache_stats()`: Manage the in-memory meta table cache used by the meta table functions.
+    - `drop_catalog_snapshot(session_name)`: Discard the local catalog copy that get_catalog_table() keeps per enterprise session.
+    - `search_catalog(session, query)`: Fuzzy-search catalog table and namespace names (and cached column names) with a local trigram index.
 
 **Notes:**
 - All functions are async coroutines and must be awaited.
@@ -21,17 +29,55 @@ This module provides coroutine-compatible utility functions for querying Deephav
 """
 
 import asyncio
+import json
 import logging
+import os
+import re
 import textwrap
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import cast
 
 import pyarrow
+import pyarrow.compute
+import pyarrow.parquet
 from pydeephaven.table import Table
 
+from deephaven_mcp._catalog_index import CatalogIndex, CatalogMatch, trigram_similarity
 from deephaven_mcp._exceptions import UnsupportedOperationError
 from deephaven_mcp.client import BaseSession, CorePlusSession
+from deephaven_mcp.resource_manager import register_close_callback
 
 _LOGGER = logging.getLogger(__name__)
 
+SCHEMA_CACHE_TTL_SECONDS: float = float(
+    os.environ.get("DH_MCP_SCHEMA_CACHE_TTL_SECONDS", "300.0")
+)
+"""Seconds a cached meta table stays valid. Set to 0 to disable the schema cache.
+
+Environment variable override: DH_MCP_SCHEMA_CACHE_TTL_SECONDS
+"""
+
+SCHEMA_CACHE_MAX_ENTRIES: int = int(
+    os.environ.get("DH_MCP_SCHEMA_CACHE_MAX_ENTRIES", "1024")
+)
+"""Maximum number of meta tables held in the schema cache; least recently used entries are evicted first.
+
+Environment variable override: DH_MCP_SCHEMA_CACHE_MAX_ENTRIES
+"""
+
+CATALOG_SNAPSHOT_REFRESH_SECONDS: float = float(
+    os.environ.get("DH_MCP_CATALOG_SNAPSHOT_REFRESH_SECONDS", "300.0")
+)
+"""Age in seconds after which a local catalog snapshot is refreshed in the background. Set to 0 to disable snapshots.
+
+Environment variable override: DH_MCP_CATALOG_SNAPSHOT_REFRESH_SECONDS
+"""
+
 
 # ===== Private Helper Functions =====
 
@@ -96,6 +142,69 @@ async def _apply_filters(
     return table
 
 
+async def _apply_view(
+    table: Table,
+    columns: list[str] | None,
+    *,
+    context_name: str,
+) -> Table:
+    """
+    Project a Deephaven table onto a subset of columns with view().
+
+    The projection runs in the Deephaven engine, so columns that are not selected are never
+    transferred to the client.
+
+    Args:
+        table (Table): The Deephaven table to project (must have .view() method).
+        columns (list[str] | None): Column names (or Deephaven view expressions) to keep, in order.
+                                    None or empty list means keep all columns.
+        context_name (str): Context description for logging (e.g., "table 'my_table'").
+
+    Returns:
+        Table: The projected table (or original if no columns provided).
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    if columns:
+        _LOGGER.debug(
+            f"[queries:_apply_view] Selecting {len(columns)} column(s) of {context_name}: {columns}"
+        )
+        table = await asyncio.to_thread(table.view, columns)
+    else:
+        _LOGGER.debug("[queries:_apply_view] No column projection to apply.")
+
+    return table
+
+
+async def _apply_filters_and_view(
+    table: Table,
+    filters: list[str] | None,
+    columns: list[str] | None,
+    *,
+    context_name: str,
+) -> Table:
+    """
+    Apply where clause filters and then a column projection to a Deephaven table.
+
+    Filters run before the projection so they may reference columns that are not selected.
+
+    Args:
+        table (Table): The Deephaven table to narrow.
+        filters (list[str] | None): Deephaven where clause expressions (AND logic), or None.
+        columns (list[str] | None): Column names to keep, or None for all columns.
+        context_name (str): Context description for logging.
+
+    Returns:
+        Table: The filtered and projected table.
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    table = await _apply_filters(table, filters, context_name=context_name)
+    return await _apply_view(table, columns, context_name=context_name)
+
+
 async def _apply_row_limit(
     table: Table,
     max_rows: int | None,
@@ -157,11 +266,76 @@ async def _apply_row_limit(
         return table, True
 
 
+async def _fetch_limited_arrow(
+    table: Table,
+    max_rows: int | None,
+    *,
+    head: bool = True,
+    context_name: str,
+) -> tuple[pyarrow.Table, bool]:
+    """
+    Fetch up to max_rows rows of a Deephaven table as Arrow and determine if the result is complete.
+
+    Rather than reading the table size and then limiting, this fetches one row more than requested
+    (head(max_rows + 1) or tail(max_rows + 1)) and converts it to Arrow in a single worker-thread call.
+    Completeness follows from the number of rows returned, and the extra row (if any) is dropped
+    locally. The size of the source table is never needed, which also keeps is_complete correct for
+    ticking tables whose size changes between calls.
+
+    Args:
+        table (Table): The Deephaven table to fetch (must have .head(), .tail() and .to_arrow() methods).
+        max_rows (int | None): Maximum number of rows to return.
+                               None means fetch the entire table (logs warning).
+        head (bool): If True, fetch the first rows. If False, fetch the last rows.
+                    Ignored when max_rows=None. Default is True.
+        context_name (str): Context description for logging (e.g., "table 'my_table'", "catalog table").
+
+    Returns:
+        tuple[pyarrow.Table, bool]: A tuple containing:
+            - pyarrow.Table: At most max_rows rows of the table
+            - bool: True if the entire table was fetched, False if rows were left out
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    if max_rows is None:
+        # Full table requested - log warning for safety
+        _LOGGER.warning(
+            f"[queries:_fetch_limited_arrow] Retrieving ENTIRE {context_name} - this may cause memory issues for large tables!"
+        )
+        return await asyncio.to_thread(table.to_arrow), True
+
+    def fetch() -> pyarrow.Table:
+        limited = table.head(max_rows + 1) if head else table.tail(max_rows + 1)
+        return limited.to_arrow()
+
+    arrow_table = await asyncio.to_thread(fetch)
+    is_complete = arrow_table.num_rows <= max_rows
+    if not is_complete:
+        # Drop the sentinel row: it is the last row for head() and the first for tail()
+        arrow_table = (
+            arrow_table.slice(0, max_rows)
+            if head
+            else arrow_table.slice(arrow_table.num_rows - max_rows)
+        )
+    _LOGGER.debug(
+        f"[queries:_fetch_limited_arrow] Fetched {arrow_table.num_rows} {'first' if head else 'last'} rows "
+        f"of {context_name} (max_rows={max_rows}, is_complete={is_complete})"
+    )
+    return arrow_table, is_complete
+
+
 # ===== Public API Functions =====
 
 
 async def get_table(
-    session: BaseSession, table_name: str, *, max_rows: int | None, head: bool = True
+    session: BaseSession,
+    table_name: str,
+    *,
+    max_rows: int | None,
+    head: bool = True,
+    columns: list[str] | None = None,
+    filters: list[str] | None = None,
 ) -> tuple[pyarrow.Table, bool]:
     """
     Asynchronously retrieve a Deephaven table as a pyarrow.Table snapshot from a live session.
@@ -179,14 +353,19 @@ async def get_table(
         head (bool): If True and max_rows is not None, retrieve rows from the beginning using head().
                     If False and max_rows is not None, retrieve rows from the end using tail().
                     This parameter is ignored when max_rows=None (full table retrieval). Default is True.
+        columns (list[str] | None): Columns to retrieve, applied server-side with view(). Default is None (all columns).
+        filters (list[str] | None): Deephaven where clause expressions applied server-side before the column
+                                    projection and row limit. Multiple filters are combined with AND logic.
+                                    Default is None (no filtering).
 
     Returns:
         tuple[pyarrow.Table, bool]: A tuple containing:
             - pyarrow.Table: The requested table (or subset) as a pyarrow.Table snapshot
-            - bool: True if the entire table was retrieved, False if only a subset was returned
+            - bool: True if all rows matching the filters were retrieved, False if only a subset was returned
 
     Raises:
-        Exception: If the table does not exist, the session is closed, or if conversion to Arrow fails.
+        Exception: If the table does not exist, the session is closed, a filter or column is invalid,
+            or if conversion to Arrow fails.
 
     Warning:
         Setting max_rows=None on large tables (millions/billions of rows) can cause memory exhaustion and system crashes.
@@ -199,6 +378,11 @@ async def get_table(
         # Get last 1000 rows
         table, is_complete = await get_table(session, "my_table", max_rows=1000, head=False)
 
+        # Two columns of the matching rows only
+        table, is_complete = await get_table(
+            session, "trades", max_rows=100, columns=["Sym", "Price"], filters=["Sym = `AAPL`"]
+        )
+
         # Full table retrieval (dangerous for large tables)
         table, is_complete = await get_table(session, "small_table", max_rows=None)  # is_complete will be True
 
@@ -209,29 +393,174 @@ async def get_table(
         - This function is intended for internal use only
     """
     _LOGGER.debug(
-        f"[queries:get_table] Retrieving table '{table_name}' from session (max_rows={max_rows}, head={head})..."
+        f"[queries:get_table] Retrieving table '{table_name}' from session (max_rows={max_rows}, head={head}, "
+        f"columns={columns}, filters={filters})..."
     )
 
     # Open the table
     original_table = await session.open_table(table_name)
+    context_name = f"table '{table_name}'"
 
-    # Apply row limiting using helper function
-    table, is_complete = await _apply_row_limit(
-        original_table,
+    # Narrow rows and columns in the engine before anything is transferred
+    narrowed_table = await _apply_filters_and_view(
+        original_table, filters, columns, context_name=context_name
+    )
+
+    # Limit rows and convert to Arrow format (single conversion point)
+    arrow_table, is_complete = await _fetch_limited_arrow(
+        narrowed_table,
         max_rows,
         head=head,
-        context_name=f"table '{table_name}'",
+        context_name=context_name,
     )
 
-    # Convert to Arrow format (single conversion point)
-    arrow_table = await asyncio.to_thread(table.to_arrow)
-
     _LOGGER.debug(
         f"[queries:get_table] Table '{table_name}' converted to Arrow format successfully."
     )
     return arrow_table, is_complete
 
 
+async def get_table_row_count(
+    session: BaseSession, table_name: str, *, filters: list[str] | None = None
+) -> int | None:
+    """
+    Asynchronously count the rows of a Deephaven table (optionally after filtering) without fetching data.
+
+    get_table() no longer reads the table size to decide completeness, so callers that need the exact
+    total request it separately, and only when a read was truncated.
+
+    Args:
+        session (BaseSession): An active Deephaven session. Must not be closed.
+        table_name (str): The name of the table to count.
+        filters (list[str] | None): Deephaven where clause expressions applied server-side before counting.
+                                    Default is None (count every row).
+
+    Returns:
+        int | None: The number of rows reported by the server, or None if the server did not report a size.
+            For ticking tables this is the size at the time the (filtered) table was exported.
+
+    Raises:
+        Exception: If the table does not exist, the session is closed, or a filter is invalid.
+
+    Note:
+        - This function is intended for internal use only
+    """
+    _LOGGER.debug(
+        f"[queries:get_table_row_count] Counting rows of table '{table_name}' (filters={filters})..."
+    )
+    original_table = await session.open_table(table_name)
+    table = await _apply_filters(
+        original_table, filters, context_name=f"table '{table_name}'"
+    )
+    row_count: int | None = await asyncio.to_thread(lambda: table.size)
+    _LOGGER.debug(
+        f"[queries:get_table_row_count] Table '{table_name}' has {row_count} rows."
+    )
+    return row_count
+
+
+async def export_table_to_parquet(
+    session: BaseSession,
+    table_name: str,
+    path: str,
+    *,
+    max_rows: int | None,
+    head: bool = True,
+    batch_rows: int,
+    columns: list[str] | None = None,
+    filters: list[str] | None = None,
+) -> tuple[pyarrow.Schema, int, bool]:
+    """
+    Asynchronously stream a Deephaven table into a local Parquet file, one row batch at a time.
+
+    The table is optionally limited with head()/tail(), snapshotted if it is refreshing so that
+    every batch sees the same rows, and then fetched in windows of batch_rows rows with
+    Table.slice().to_arrow(). Each window is written as a Parquet row group and released before
+    the next one is fetched, so peak memory is bounded by one batch rather than the whole table.
+
+    Args:
+        session (BaseSession): An active Deephaven session. Must not be closed.
+        table_name (str): The name of the table to export.
+        path (str): Destination file path. The parent directory must exist; the file is overwritten.
+        max_rows (int | None): Maximum number of rows to export. Must be specified as keyword argument.
+                               Set to None to export the entire table.
+        head (bool): If True and max_rows is not None, export rows from the beginning using head().
+                    If False and max_rows is not None, export rows from the end using tail().
+                    Ignored when max_rows=None. Default is True.
+        batch_rows (int): Number of rows fetched and written per batch. Must be positive.
+        columns (list[str] | None): Columns to export, applied server-side with view(). Default is None (all columns).
+        filters (list[str] | None): Deephaven where clause expressions applied server-side before the column
+                                    projection and row limit. Default is None (no filtering).
+
+    Returns:
+        tuple[pyarrow.Schema, int, bool]: A tuple containing:
+            - pyarrow.Schema: The Arrow schema of the exported data
+            - int: Number of rows written
+            - bool: True if the entire table was exported, False if limited by max_rows
+
+    Raises:
+        Exception: If the table does not exist, the session is closed, or fetching or writing fails.
+            A partially written file may be left at path; callers should remove it on failure.
+
+    Note:
+        - This function is intended for internal use only
+    """
+    _LOGGER.debug(
+        f"[queries:export_table_to_parquet] Exporting table '{table_name}' to '{path}' "
+        f"(max_rows={max_rows}, head={head}, batch_rows={batch_rows}, columns={columns}, filters={filters})..."
+    )
+
+    original_table = await session.open_table(table_name)
+    context_name = f"table '{table_name}'"
+    narrowed_table = await _apply_filters_and_view(
+        original_table, filters, columns, context_name=context_name
+    )
+    table, is_complete = await _apply_row_limit(
+        narrowed_table,
+        max_rows,
+        head=head,
+        context_name=context_name,
+    )
+
+    # Freeze ticking tables so consecutive slices are consistent
+    if table.is_refreshing:
+        table = await asyncio.to_thread(table.snapshot)
+
+    def fetch_window(start: int, stop: int) -> pyarrow.Table:
+        return table.slice(start, stop).to_arrow()
+
+    total_rows: int = await asyncio.to_thread(lambda: table.size or 0)
+    writer: pyarrow.parquet.ParquetWriter | None = None
+    rows_written = 0
+    try:
+        for start in range(0, total_rows, batch_rows):
+            stop = min(start + batch_rows, total_rows)
+            batch = await asyncio.to_thread(fetch_window, start, stop)
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(path, batch.schema)
+            await asyncio.to_thread(writer.write_table, batch)
+            rows_written += batch.num_rows
+            _LOGGER.debug(
+                f"[queries:export_table_to_parquet] Wrote rows {start}-{stop} of {total_rows} "
+                f"from '{table_name}'"
+            )
+
+        if writer is None:
+            # Empty table: still produce a valid file carrying the schema
+            empty = await asyncio.to_thread(table.to_arrow)
+            writer = pyarrow.parquet.ParquetWriter(path, empty.schema)
+            await asyncio.to_thread(writer.write_table, empty)
+        schema = writer.schema
+    finally:
+        if writer is not None:
+            await asyncio.to_thread(writer.close)
+
+    _LOGGER.debug(
+        f"[queries:export_table_to_parquet] Exported {rows_written} rows of '{table_name}' to '{path}'."
+    )
+    return schema, rows_written, is_complete
+
+
 async def _extract_meta_table(table: Table, context: str) -> pyarrow.Table:
     """
     Extract meta_table from a Deephaven table and convert to Arrow format.
@@ -260,8 +589,181 @@ async def _extract_meta_table(table: Table, context: str) -> pyarrow.Table:
     return arrow_meta_table
 
 
+_SchemaCacheKey = tuple[str, str | None, str]
+"""Schema cache key: (session full name, catalog namespace or None for session tables, table name)."""
+
+
+class _SchemaCache:
+    """
+    In-memory LRU cache of meta tables with time-based expiry.
+
+    Entries are keyed by session full name, namespace and table name. Every session has a generation
+    counter that invalidate() bumps, and put() only stores a meta table if the generation it was read
+    under is still current. A fetch that races with an invalidation therefore never repopulates the
+    cache with a schema from before the invalidation.
+
+    All methods are synchronous and never await, so they are atomic on the event loop.
+
+    Note:
+        This is a private helper class for internal use only.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl_seconds (float): Seconds an entry stays valid. Values <= 0 disable caching.
+            max_entries (int): Maximum number of entries. Values <= 0 disable caching.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[_SchemaCacheKey, tuple[float, pyarrow.Table]] = (
+            OrderedDict()
+        )
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores entries at all."""
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def generation(self, session_name: str) -> tuple[int, int]:
+        """
+        Return the current generation of a session, to be passed back to put().
+
+        Args:
+            session_name (str): Full name of the session.
+
+        Returns:
+            tuple[int, int]: The global epoch and the session's own generation counter.
+        """
+        return self._epoch, self._generations.get(session_name, 0)
+
+    def get(self, key: _SchemaCacheKey) -> pyarrow.Table | None:
+        """
+        Look up a meta table, counting a hit or a miss.
+
+        Args:
+            key (_SchemaCacheKey): The cache key.
+
+        Returns:
+            pyarrow.Table | None: The cached meta table, or None if absent or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        key: _SchemaCacheKey,
+        meta_table: pyarrow.Table,
+        generation: tuple[int, int],
+    ) -> None:
+        """
+        Store a meta table unless its session was invalidated since the fetch started.
+
+        Args:
+            key (_SchemaCacheKey): The cache key.
+            meta_table (pyarrow.Table): The meta table to store.
+            generation (tuple[int, int]): Value of generation() taken before the fetch started.
+        """
+        if not self.enabled or generation != self.generation(key[0]):
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, meta_table)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def entries(self, session_name: str) -> list[tuple[_SchemaCacheKey, pyarrow.Table]]:
+        """
+        List the unexpired entries of a session without counting hits or changing their recency.
+
+        Args:
+            session_name (str): Full name of the session.
+
+        Returns:
+            list[tuple[_SchemaCacheKey, pyarrow.Table]]: The session's keys and meta tables.
+        """
+        now = time.monotonic()
+        return [
+            (key, meta_table)
+            for key, (expires_at, meta_table) in self._entries.items()
+            if key[0] == session_name and expires_at > now
+        ]
+
+    def invalidate(self, session_name: str | None) -> int:
+        """
+        Drop the entries of one session, or of all sessions.
+
+        Args:
+            session_name (str | None): Full name of the session, or None to clear the whole cache.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        if session_name is None:
+            self._epoch += 1
+            removed = len(self._entries)
+            self._entries.clear()
+            self._generations.clear()
+            return removed
+
+        self._generations[session_name] = self._generations.get(session_name, 0) + 1
+        keys = [key for key in self._entries if key[0] == session_name]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+
+_SCHEMA_CACHE = _SchemaCache(SCHEMA_CACHE_TTL_SECONDS, SCHEMA_CACHE_MAX_ENTRIES)
+"""Process-wide meta table cache shared by the meta table functions."""
+
+
+def invalidate_schema_cache(session_name: str | None = None) -> None:
+    """
+    Drop cached meta tables so the next schema request goes back to the server.
+
+    Called when a session's tables may have changed (a script ran in it), when a session is closed,
+    and when the server configuration is reloaded.
+
+    Args:
+        session_name (str | None): Full name of the session whose entries are dropped, or None to
+            clear the cache for all sessions.
+    """
+    removed = _SCHEMA_CACHE.invalidate(session_name)
+    _LOGGER.debug(
+        f"[queries:invalidate_schema_cache] Dropped {removed} cached meta tables for "
+        f"{repr(session_name) if session_name is not None else 'all sessions'}."
+    )
+
+
+def get_schema_cache_stats() -> dict[str, int]:
+    """
+    Return the counters of the meta table cache.
+
+    Returns:
+        dict[str, int]: 'hits' and 'misses' since process start, and 'size', the number of entries
+            currently cached (expired entries included until they are looked up or evicted).
+    """
+    return {
+        "hits": _SCHEMA_CACHE.hits,
+        "misses": _SCHEMA_CACHE.misses,
+        "size": len(_SCHEMA_CACHE._entries),
+    }
+
+
 async def get_session_meta_table(
-    session: BaseSession, table_name: str
+    session: BaseSession, table_name: str, *, session_name: str | None = None
 ) -> pyarrow.Table:
     """
     Asynchronously retrieve the meta table (schema/metadata) for a Deephaven session table as a pyarrow.Table.
@@ -272,6 +774,8 @@ async def get_session_meta_table(
     Args:
         session (BaseSession): An active Deephaven session. Must not be closed.
         table_name (str): The name of the table to retrieve the meta table for.
+        session_name (str | None): Full name of the session. When given, the meta table is served from
+            and stored in the schema cache. Defaults to None (always query the server).
 
     Returns:
         pyarrow.Table: The meta table containing schema/metadata information for the specified table.
@@ -288,8 +792,32 @@ async def get_session_meta_table(
     _LOGGER.debug(
         f"[queries:get_session_meta_table] Retrieving meta table for session table '{table_name}'..."
     )
+    if session_name is None:
+        table = await session.open_table(table_name)
+        return await _extract_meta_table(table, table_name)
+
+    key: _SchemaCacheKey = (session_name, None, table_name)
+    cached = _SCHEMA_CACHE.get(key)
+    if cached is not None:
+        _LOGGER.debug(
+            f"[queries:get_session_meta_table] Schema cache hit for '{table_name}' in '{session_name}'."
+        )
+        return cached
+
+    generation = _SCHEMA_CACHE.generation(session_name)
     table = await session.open_table(table_name)
-    return await _extract_meta_table(table, table_name)
+    arrow_meta_table = await _extract_meta_table(table, table_name)
+    _SCHEMA_CACHE.put(key, arrow_meta_table, generation)
+    return arrow_meta_table
+
+
+_LIVE_ONLY_CATALOG_TABLES: (
+    "weakref.WeakKeyDictionary[CorePlusSession, set[tuple[str, str]]]"
+) = weakref.WeakKeyDictionary()
+"""Per session, the (namespace, table_name) pairs whose historical_table failed but live_table succeeded.
+
+Entries disappear with their session object, so a reconnected session starts with an empty memo.
+"""
 
 
 async def _load_catalog_table(
@@ -301,7 +829,11 @@ async def _load_catalog_table(
     Load a catalog table, trying historical_table first, then live_table as fallback.
 
     This helper consolidates the common pattern of loading catalog tables with
-    historical/live fallback logic.
+    historical/live fallback logic. Tables that only loaded via live_table (typically
+    intraday-only tables) are remembered per session, so later loads go straight to
+    live_table instead of paying for a failed historical_table round trip. If a
+    remembered live_table load fails, the memo entry is dropped and the full
+    historical/live sequence runs again.
 
     Args:
         session (CorePlusSession): An active Deephaven Enterprise (Core+) session.
@@ -321,6 +853,21 @@ async def _load_catalog_table(
         f"[queries:_load_catalog_table] Loading catalog table '{namespace}.{table_name}'"
     )
 
+    live_only = _LIVE_ONLY_CATALOG_TABLES.setdefault(session, set())
+    if (namespace, table_name) in live_only:
+        try:
+            table = await session.live_table(namespace, table_name)
+            _LOGGER.debug(
+                f"[queries:_load_catalog_table] Loaded '{namespace}.{table_name}' via remembered live_table"
+            )
+            return table
+        except Exception as memo_exc:
+            _LOGGER.debug(
+                f"[queries:_load_catalog_table] Remembered live_table failed for '{namespace}.{table_name}', "
+                f"retrying historical_table: {memo_exc}"
+            )
+            live_only.discard((namespace, table_name))
+
     # Try historical_table first (immutable snapshot, preferred)
     try:
         _LOGGER.debug(
@@ -341,6 +888,7 @@ async def _load_catalog_table(
             _LOGGER.debug(
                 f"[queries:_load_catalog_table] Successfully loaded '{namespace}.{table_name}' via live_table"
             )
+            live_only.add((namespace, table_name))
             return table
         except Exception as live_exc:
             _LOGGER.error(
@@ -360,6 +908,8 @@ async def get_catalog_table_data(
     *,
     max_rows: int | None,
     head: bool = True,
+    columns: list[str] | None = None,
+    filters: list[str] | None = None,
 ) -> tuple[pyarrow.Table, bool]:
     """
     Asynchronously retrieve data from a specific catalog table as a pyarrow.Table from a Deephaven Enterprise session.
@@ -376,15 +926,19 @@ async def get_catalog_table_data(
         head (bool): If True and max_rows is not None, retrieve rows from the beginning using head().
                     If False and max_rows is not None, retrieve rows from the end using tail().
                     Ignored when max_rows=None. Default is True.
+        columns (list[str] | None): Columns to retrieve, applied server-side with view(). Default is None (all columns).
+        filters (list[str] | None): Deephaven where clause expressions applied server-side before the column
+                                    projection and row limit. Multiple filters are combined with AND logic.
+                                    Default is None (no filtering).
 
     Returns:
         tuple[pyarrow.Table, bool]: A tuple containing:
             - pyarrow.Table: The requested table (or subset) as a pyarrow.Table snapshot
-            - bool: True if the entire table was retrieved, False if only a subset was returned
+            - bool: True if all rows matching the filters were retrieved, False if only a subset was returned
 
     Raises:
         Exception: If the table cannot be accessed via either historical_table or live_table,
-                  or if conversion to Arrow fails.
+                  if a filter or column is invalid, or if conversion to Arrow fails.
 
     Note:
         - Tries historical_table first (immutable snapshot, preferred for data sampling)
@@ -395,23 +949,26 @@ async def get_catalog_table_data(
     """
     _LOGGER.debug(
         f"[queries:get_catalog_table_data] Retrieving catalog table data for '{namespace}.{table_name}' "
-        f"(max_rows={max_rows}, head={head})"
+        f"(max_rows={max_rows}, head={head}, columns={columns}, filters={filters})"
     )
 
     # Load catalog table using helper
     table = await _load_catalog_table(session, namespace, table_name)
+    context_name = f"catalog table '{namespace}.{table_name}'"
 
-    # Apply row limiting using helper function
-    limited_table, is_complete = await _apply_row_limit(
+    # Narrow rows and columns in the engine before anything is transferred
+    table = await _apply_filters_and_view(
+        table, filters, columns, context_name=context_name
+    )
+
+    # Limit rows and convert to Arrow format
+    arrow_table, is_complete = await _fetch_limited_arrow(
         table,
         max_rows,
         head=head,
-        context_name=f"catalog table '{namespace}.{table_name}'",
+        context_name=context_name,
     )
 
-    # Convert to Arrow format
-    arrow_table = await asyncio.to_thread(limited_table.to_arrow)
-
     _LOGGER.debug(
         f"[queries:get_catalog_table_data] Catalog table '{namespace}.{table_name}' converted to Arrow format successfully "
         f"({arrow_table.num_rows} rows, is_complete={is_complete})"
@@ -420,7 +977,11 @@ async def get_catalog_table_data(
 
 
 async def get_catalog_meta_table(
-    session: CorePlusSession, namespace: str, table_name: str
+    session: CorePlusSession,
+    namespace: str,
+    table_name: str,
+    *,
+    session_name: str | None = None,
 ) -> pyarrow.Table:
     """
     Asynchronously retrieve the meta table (schema/metadata) for a catalog table in a Deephaven Enterprise session.
@@ -432,6 +993,8 @@ async def get_catalog_meta_table(
         session (CorePlusSession): An active Deephaven Enterprise (Core+) session.
         namespace (str): The catalog namespace containing the table.
         table_name (str): The name of the table within the namespace.
+        session_name (str | None): Full name of the session. When given, the meta table is served from
+            and stored in the schema cache. Defaults to None (always query the server).
 
     Returns:
         pyarrow.Table: The meta table containing schema/metadata information for the specified catalog table.
@@ -452,111 +1015,525 @@ async def get_catalog_meta_table(
         f"[queries:get_catalog_meta_table] Retrieving meta table for catalog table '{namespace}.{table_name}'..."
     )
 
+    key: _SchemaCacheKey | None = None
+    if session_name is not None:
+        key = (session_name, namespace, table_name)
+        cached = _SCHEMA_CACHE.get(key)
+        if cached is not None:
+            _LOGGER.debug(
+                f"[queries:get_catalog_meta_table] Schema cache hit for '{namespace}.{table_name}' in '{session_name}'."
+            )
+            return cached
+        generation = _SCHEMA_CACHE.generation(session_name)
+
     # Load catalog table using helper
     table = await _load_catalog_table(session, namespace, table_name)
 
     # Extract meta table using common helper
-    return await _extract_meta_table(table, f"{namespace}.{table_name}")
+    arrow_meta_table = await _extract_meta_table(table, f"{namespace}.{table_name}")
+    if key is not None:
+        _SCHEMA_CACHE.put(key, arrow_meta_table, generation)
+    return arrow_meta_table
 
 
-async def get_programming_language_version_table(session: BaseSession) -> pyarrow.Table:
+_CATALOG_META_INDEX_COLUMN = "McpCatalogIndex"
+"""Column added by get_catalog_meta_tables() to tag each meta row with the position of its catalog table."""
+
+_CATALOG_META_LIVE_COLUMN = "McpLiveOnly"
+"""Column added by get_catalog_meta_tables() to flag meta rows of tables that were loaded with live_table."""
+
+_CATALOG_META_VARIABLE_PREFIX = "_dh_mcp_catalog_meta"
+"""Prefix of the worker variables the meta table script binds; each call adds a unique suffix and deletes them."""
+
+
+async def get_catalog_meta_tables(
+    session: CorePlusSession,
+    tables: list[tuple[str, str]],
+    *,
+    session_name: str | None = None,
+) -> list[pyarrow.Table | Exception]:
     """
-    Asynchronously retrieve Python version information from a Deephaven session as a pyarrow.Table.
+    Asynchronously retrieve the meta tables of many catalog tables with a single server-side script.
 
-    This function runs a Python script in the given session to create a temporary table with Python version details,
-    then retrieves it as a pyarrow.Table snapshot. Useful for environment inspection and compatibility checking.
+    One Python script runs on the Enterprise worker. For each (namespace, table_name) pair it loads the
+    table with the same historical_table/live_table fallback as get_catalog_meta_table(), including its
+    per-session memo of live-only tables: remembered pairs are sent along and loaded with live_table
+    directly, and the script reports which pairs needed live_table so the memo is updated. It tags each
+    meta table with the pair's position, and merges all meta tables into one table. Per-table failures are
+    collected in a second table instead of aborting the script. The client then fetches the two tables
+    and splits the merged meta table back into one pyarrow.Table per pair, replacing 2N round trips
+    with one script execution and two table fetches.
 
     Args:
-        session (BaseSession): An active Deephaven session in which to run the script and retrieve the resulting table.
+        session (CorePlusSession): An active Deephaven Enterprise (Core+) Python session.
+        tables (list[tuple[str, str]]): The (namespace, table_name) pairs to describe.
+        session_name (str | None): Full name of the session. When given, cached meta tables are reused and
+            only the remaining pairs are sent to the server; fetched meta tables are cached. Defaults to
+            None (always query the server).
 
     Returns:
-        pyarrow.Table: A table with columns for Python version information, including:
-            - 'Version' (str): The short Python version string (e.g., '3.9.7')
-            - 'Major' (int): Major version number
-            - 'Minor' (int): Minor version number
-            - 'Micro' (int): Micro/patch version number
-            - 'Implementation' (str): Python implementation (e.g., 'CPython')
-            - 'FullVersion' (str): The complete Python version string with build info
+        list[pyarrow.Table | Exception]: One entry per input pair, in input order: the pair's meta table
+            (same columns as get_catalog_meta_table() returns) or an Exception describing why that
+            table could not be described.
 
     Raises:
         UnsupportedOperationError: If the session is not a Python session.
-        Exception: If the script fails to execute, the table cannot be retrieved, or conversion to Arrow fails.
-
-    Example:
-        >>> arrow_table = await get_programming_language_version_table(session)
+        Exception: If the script fails to execute or the result tables cannot be retrieved. Callers can
+            fall back to get_catalog_meta_table() per table.
 
     Note:
-        - The temporary table '_python_version_table' is created in the session and is not automatically deleted.
-        - Logging is performed at DEBUG level for script execution and table retrieval.
-        - Currently only supports Python sessions. Support for other programming languages may be added in the future.
+        - The script binds its two result tables to worker variables with a per-call unique suffix, so
+          concurrent calls on one session never read each other's results. Both variables are deleted
+          once fetched; failing to delete them is logged and otherwise ignored.
+        - This function is intended for internal use only
     """
     _LOGGER.debug(
-        "[queries:get_programming_language_version_table] Retrieving Python version information from session..."
+        f"[queries:get_catalog_meta_tables] Retrieving meta tables for {len(tables)} catalog tables..."
+    )
+    _validate_python_session("get_catalog_meta_tables", session)
+
+    cached: list[pyarrow.Table | None] = [None] * len(tables)
+    if session_name is not None:
+        cached = [
+            _SCHEMA_CACHE.get((session_name, namespace, table_name))
+            for namespace, table_name in tables
+        ]
+        generation = _SCHEMA_CACHE.generation(session_name)
+    missing = [index for index, meta in enumerate(cached) if meta is None]
+
+    fetched = await _run_catalog_meta_tables_script(
+        session, [tables[index] for index in missing]
     )
 
-    # Check if the session is a Python session
-    # TODO: Add support for other programming languages.
-    _validate_python_session("get_programming_language_version_table", session)
-
-    script = textwrap.dedent("""
-        from deephaven import new_table
-        from deephaven.column import string_col, int_col
-        import sys
-        import platform
-
-        def _make_python_version_table():
-            version_info = sys.version_info
-            version_str = sys.version.split()[0]
-            implementation = platform.python_implementation()
-            
-            return new_table([
-                string_col('Version', [version_str]),
-                int_col('Major', [version_info.major]),
-                int_col('Minor', [version_info.minor]),
-                int_col('Micro', [version_info.micro]),
-                string_col('Implementation', [implementation]),
-                string_col('FullVersion', [sys.version]),
-            ])
+    fetched_by_index = dict(zip(missing, fetched, strict=True))
+    results: list[pyarrow.Table | Exception] = []
+    for index, (namespace, table_name) in enumerate(tables):
+        cached_meta = cached[index]
+        if cached_meta is not None:
+            results.append(cached_meta)
+            continue
+        meta = fetched_by_index[index]
+        if session_name is not None and isinstance(meta, pyarrow.Table):
+            _SCHEMA_CACHE.put((session_name, namespace, table_name), meta, generation)
+        results.append(meta)
 
-        _python_version_table = _make_python_version_table()
-        """)
-    _LOGGER.debug(
-        "[queries:get_programming_language_version_table] Running Python version script in session..."
-    )
-    await session.run_script(script)
     _LOGGER.debug(
-        "[queries:get_programming_language_version_table] Script executed successfully."
+        f"[queries:get_catalog_meta_tables] Served {len(tables) - len(missing)} of {len(tables)} "
+        "meta tables from the schema cache."
     )
-    arrow_table, _ = await get_table(session, "_python_version_table", max_rows=None)
-    _LOGGER.debug(
-        "[queries:get_programming_language_version_table] Table '_python_version_table' retrieved successfully."
-    )
-    return arrow_table
+    return results
 
 
-async def get_programming_language_version(session: BaseSession) -> str:
+async def _run_catalog_meta_tables_script(
+    session: CorePlusSession, tables: list[tuple[str, str]]
+) -> list[pyarrow.Table | Exception]:
     """
-    Asynchronously retrieve the programming language version string from a Deephaven session.
-
-    This function gets the programming language version table and extracts the version string.
+    Describe catalog tables with the batched meta table script; see get_catalog_meta_tables().
 
     Args:
-        session (BaseSession): An active Deephaven session.
+        session (CorePlusSession): An active Deephaven Enterprise (Core+) Python session.
+        tables (list[tuple[str, str]]): The (namespace, table_name) pairs to describe.
 
     Returns:
-        str: The programming language version string (e.g., "3.9.7").
+        list[pyarrow.Table | Exception]: One meta table or Exception per input pair, in input order.
 
     Raises:
-        UnsupportedOperationError: If the session is not a Python session.
-        Exception: If the version information cannot be retrieved.
+        Exception: If the script fails to execute or the result tables cannot be retrieved.
+
+    Note:
+        This is a private helper function for internal use only.
     """
-    _LOGGER.debug(
-        "[queries:get_programming_language_version] Retrieving programming language version..."
+    if not tables:
+        return []
+
+    # The pairs travel as a JSON string literal, so names are never spliced into code or formulas
+    payload = json.dumps([[namespace, table_name] for namespace, table_name in tables])
+    live_only = _LIVE_ONLY_CATALOG_TABLES.setdefault(session, set())
+    live_only_payload = json.dumps(
+        [index for index, pair in enumerate(tables) if pair in live_only]
     )
-    version_table = await get_programming_language_version_table(session)
+    suffix = uuid.uuid4().hex
+    merged_variable = f"{_CATALOG_META_VARIABLE_PREFIX}_tables_{suffix}"
+    errors_variable = f"{_CATALOG_META_VARIABLE_PREFIX}_errors_{suffix}"
+    script = textwrap.dedent(f"""
+        def _dh_mcp_make_catalog_meta_tables(pairs_json, live_only_json):
+            import json
+
+            from deephaven import merge, new_table
+            from deephaven.column import bool_col, int_col, string_col
+
+            remembered_live = set(json.loads(live_only_json))
+            metas = []
+            error_indices = []
+            error_messages = []
+            for index, (namespace, table_name) in enumerate(json.loads(pairs_json)):
+                try:
+                    table = None
+                    live = False
+                    if index in remembered_live:
+                        try:
+                            table = db.live_table(namespace, table_name)
+                            live = True
+                        except Exception:
+                            pass
+                    if table is None:
+                        try:
+                            table = db.historical_table(namespace, table_name)
+                        except Exception as hist_exc:
+                            try:
+                                table = db.live_table(namespace, table_name)
+                                live = True
+                            except Exception as live_exc:
+                                raise Exception(
+                                    f"Failed to load catalog table '{{namespace}}.{{table_name}}': "
+                                    f"historical_table error: {{hist_exc}}, live_table error: {{live_exc}}"
+                                )
+                    metas.append(table.meta_table.update_view([
+                        f"{_CATALOG_META_INDEX_COLUMN} = (int) {{index}}",
+                        f"{_CATALOG_META_LIVE_COLUMN} = {{'true' if live else 'false'}}",
+                    ]))
+                except Exception as exc:
+                    error_indices.append(index)
+                    error_messages.append(str(exc))
+            if metas:
+                merged = merge(metas)
+            else:
+                merged = new_table([
+                    int_col("{_CATALOG_META_INDEX_COLUMN}", []),
+                    bool_col("{_CATALOG_META_LIVE_COLUMN}", []),
+                ])
+            errors = new_table([
+                int_col("{_CATALOG_META_INDEX_COLUMN}", error_indices),
+                string_col("Error", error_messages),
+            ])
+            return merged, errors
 
-    # Extract the version string from the first row of the Version column
-    version_column = version_table.column("Version")
+        try:
+            {merged_variable}, {errors_variable} = _dh_mcp_make_catalog_meta_tables(
+                {payload!r}, {live_only_payload!r}
+            )
+        finally:
+            del _dh_mcp_make_catalog_meta_tables
+        """)
+
+    _LOGGER.debug(
+        "[queries:_run_catalog_meta_tables_script] Running catalog meta table script in session..."
+    )
+    await session.run_script(script)
+    try:
+        merged, _ = await get_table(session, merged_variable, max_rows=None)
+        errors, _ = await get_table(session, errors_variable, max_rows=None)
+    finally:
+        try:
+            await session.run_script(
+                f"globals().pop({merged_variable!r}, None)\n"
+                f"globals().pop({errors_variable!r}, None)"
+            )
+        except Exception as e:
+            _LOGGER.warning(
+                f"[queries:_run_catalog_meta_tables_script] Could not remove '{merged_variable}' and "
+                f"'{errors_variable}' from the session: {e!r}"
+            )
+
+    results: list[pyarrow.Table | Exception] = [
+        Exception(
+            f"No meta table returned for catalog table '{namespace}.{table_name}'"
+        )
+        for namespace, table_name in tables
+    ]
+    for index, message in zip(
+        errors.column(_CATALOG_META_INDEX_COLUMN).to_pylist(),
+        errors.column("Error").to_pylist(),
+        strict=True,
+    ):
+        results[index] = Exception(message)
+        live_only.discard(tables[index])
+
+    # merge() keeps input order, so each table's meta rows form one contiguous run
+    indices = merged.column(_CATALOG_META_INDEX_COLUMN).to_pylist()
+    live_flags = merged.column(_CATALOG_META_LIVE_COLUMN).to_pylist()
+    meta_rows = merged.drop_columns(
+        [_CATALOG_META_INDEX_COLUMN, _CATALOG_META_LIVE_COLUMN]
+    )
+    start = 0
+    for end in range(1, len(indices) + 1):
+        if end == len(indices) or indices[end] != indices[start]:
+            results[indices[start]] = meta_rows.slice(start, end - start)
+            if live_flags[start]:
+                live_only.add(tables[indices[start]])
+            else:
+                live_only.discard(tables[indices[start]])
+            start = end
+
+    _LOGGER.debug(
+        f"[queries:_run_catalog_meta_tables_script] Retrieved {len(tables) - errors.num_rows} meta tables "
+        f"({errors.num_rows} failed)."
+    )
+    return results
+
+
+_SESSION_ENVIRONMENT: "weakref.WeakKeyDictionary[BaseSession, pyarrow.Table]" = (
+    weakref.WeakKeyDictionary()
+)
+"""Per session object, the environment table returned by get_session_environment_table().
+
+Entries disappear with their session object, so a session recreated by its manager is probed again.
+"""
+
+_SESSION_ENVIRONMENT_PROBES: (
+    "weakref.WeakKeyDictionary[BaseSession, asyncio.Task[pyarrow.Table]]"
+) = weakref.WeakKeyDictionary()
+"""Per session object, the environment probe in flight, shared by every caller that needs it."""
+
+_ENVIRONMENT_VARIABLE = "_dh_mcp_session_environment"
+"""Worker variable the environment probe binds its table to; it is deleted once the table is fetched."""
+
+_ENVIRONMENT_PROBE_SCRIPT = textwrap.dedent(f"""
+    def _dh_mcp_probe_environment():
+        import importlib.metadata
+        import platform
+        import sys
+
+        from deephaven import new_table
+        from deephaven.column import string_col
+
+        version_info = sys.version_info
+        rows = [
+            ("python", "Version", sys.version.split()[0]),
+            ("python", "Major", str(version_info.major)),
+            ("python", "Minor", str(version_info.minor)),
+            ("python", "Micro", str(version_info.micro)),
+            ("python", "Implementation", platform.python_implementation()),
+            ("python", "FullVersion", sys.version),
+        ]
+        rows.extend(
+            ("package", dist.metadata["Name"], dist.version)
+            for dist in importlib.metadata.distributions()
+        )
+        kinds, names, values = (list(column) for column in zip(*rows))
+        return new_table([
+            string_col("Kind", kinds),
+            string_col("Name", names),
+            string_col("Value", values),
+        ])
+
+    try:
+        {_ENVIRONMENT_VARIABLE} = _dh_mcp_probe_environment()
+    finally:
+        del _dh_mcp_probe_environment
+    """)
+
+
+def invalidate_session_environment(session: BaseSession) -> None:
+    """
+    Forget the environment table cached for a session.
+
+    Call this when the session's environment may have changed, for example after a user script
+    (which may install packages) or when the session is closed.
+
+    Args:
+        session (BaseSession): The session whose cached environment to drop. Sessions without
+            a cached environment are ignored.
+    """
+    # A probe in flight finishes, but its result is no longer cached
+    _SESSION_ENVIRONMENT_PROBES.pop(session, None)
+    if _SESSION_ENVIRONMENT.pop(session, None) is not None:
+        _LOGGER.debug(
+            "[queries:invalidate_session_environment] Dropped cached environment table for session."
+        )
+
+
+async def get_session_environment_table(session: BaseSession) -> pyarrow.Table:
+    """
+    Asynchronously retrieve the Python version and installed packages of a Deephaven session in one probe.
+
+    A single script gathers every environment fact into one table, which is fetched and then removed
+    from the worker, so only its one variable exists in the user's namespace, and only while the probe
+    runs. The table is cached per session object, so the probe runs once per session until
+    invalidate_session_environment() is called. Concurrent callers share a single probe.
+
+    Args:
+        session (BaseSession): An active Deephaven session.
+
+    Returns:
+        pyarrow.Table: A table with string columns 'Kind', 'Name' and 'Value'. Rows of kind 'python'
+            are named 'Version', 'Major', 'Minor', 'Micro', 'Implementation' and 'FullVersion'; rows of
+            kind 'package' hold the name and version of each installed distribution.
+
+    Raises:
+        UnsupportedOperationError: If the session is not a Python session.
+        Exception: If the script fails to execute or the table cannot be retrieved.
+
+    Note:
+        - Failing to delete the probe variable after the fetch is logged and otherwise ignored.
+        - Currently only supports Python sessions. Support for other programming languages may be added in the future.
+    """
+    # TODO: Add support for other programming languages.
+    _validate_python_session("get_session_environment_table", session)
+
+    cached = _SESSION_ENVIRONMENT.get(session)
+    if cached is not None:
+        _LOGGER.debug(
+            "[queries:get_session_environment_table] Using cached environment table for session."
+        )
+        return cached
+
+    probe = _SESSION_ENVIRONMENT_PROBES.get(session)
+    if probe is None:
+        probe = asyncio.create_task(_probe_session_environment(session))
+        _SESSION_ENVIRONMENT_PROBES[session] = probe
+        probe.add_done_callback(lambda task: _finish_environment_probe(session, task))
+    # Shielded, so a caller that times out or is cancelled does not abort the shared probe
+    return await asyncio.shield(probe)
+
+
+async def _probe_session_environment(session: BaseSession) -> pyarrow.Table:
+    """
+    Run the environment probe script and fetch its table; see get_session_environment_table().
+
+    Args:
+        session (BaseSession): An active Deephaven Python session.
+
+    Returns:
+        pyarrow.Table: The environment table.
+
+    Raises:
+        Exception: If the script fails to execute or the table cannot be retrieved.
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    _LOGGER.debug(
+        "[queries:get_session_environment_table] Running probe script in session..."
+    )
+    await session.run_script(_ENVIRONMENT_PROBE_SCRIPT)
+    try:
+        arrow_table, _ = await get_table(session, _ENVIRONMENT_VARIABLE, max_rows=None)
+    finally:
+        try:
+            await session.run_script(f"globals().pop({_ENVIRONMENT_VARIABLE!r}, None)")
+        except Exception as e:
+            _LOGGER.warning(
+                f"[queries:get_session_environment_table] Could not remove '{_ENVIRONMENT_VARIABLE}' "
+                f"from the session: {e!r}"
+            )
+    _LOGGER.debug(
+        f"[queries:get_session_environment_table] Retrieved environment table ({arrow_table.num_rows} rows)."
+    )
+    return arrow_table
+
+
+def _finish_environment_probe(
+    session: BaseSession, task: "asyncio.Task[pyarrow.Table]"
+) -> None:
+    """
+    Cache the result of a finished environment probe unless the session was invalidated meanwhile.
+
+    Args:
+        session (BaseSession): The probed session.
+        task (asyncio.Task[pyarrow.Table]): The finished probe task.
+
+    Note:
+        This is a private helper function for internal use only. Failed probes are not cached; their
+        exception is raised to the waiting callers.
+    """
+    if _SESSION_ENVIRONMENT_PROBES.get(session) is not task:
+        return
+    del _SESSION_ENVIRONMENT_PROBES[session]
+    if not task.cancelled() and task.exception() is None:
+        _SESSION_ENVIRONMENT[session] = task.result()
+
+
+def _environment_rows(environment: pyarrow.Table, kind: str) -> pyarrow.Table:
+    """
+    Select the rows of one kind from an environment table.
+
+    Args:
+        environment (pyarrow.Table): A table returned by get_session_environment_table().
+        kind (str): The kind of rows to select ('python' or 'package').
+
+    Returns:
+        pyarrow.Table: The matching rows, with 'Name' and 'Value' columns.
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    rows = environment.filter(pyarrow.compute.equal(environment["Kind"], kind))
+    return rows.select(["Name", "Value"])
+
+
+async def get_programming_language_version_table(session: BaseSession) -> pyarrow.Table:
+    """
+    Asynchronously retrieve Python version information from a Deephaven session as a pyarrow.Table.
+
+    The table is built from the session's environment probe (see get_session_environment_table()), so
+    it costs no worker round trip once the probe has run for the session. Useful for environment
+    inspection and compatibility checking.
+
+    Args:
+        session (BaseSession): An active Deephaven session.
+
+    Returns:
+        pyarrow.Table: A one-row table with columns for Python version information, including:
+            - 'Version' (str): The short Python version string (e.g., '3.9.7')
+            - 'Major' (int): Major version number
+            - 'Minor' (int): Minor version number
+            - 'Micro' (int): Micro/patch version number
+            - 'Implementation' (str): Python implementation (e.g., 'CPython')
+            - 'FullVersion' (str): The complete Python version string with build info
+
+    Raises:
+        UnsupportedOperationError: If the session is not a Python session.
+        Exception: If the environment probe fails.
+
+    Example:
+        >>> arrow_table = await get_programming_language_version_table(session)
+
+    Note:
+        - Logging is performed at DEBUG level.
+        - Currently only supports Python sessions. Support for other programming languages may be added in the future.
+    """
+    _LOGGER.debug(
+        "[queries:get_programming_language_version_table] Retrieving Python version information from session..."
+    )
+    environment = await get_session_environment_table(session)
+    facts = _environment_rows(environment, "python").to_pydict()
+    python = dict(zip(facts["Name"], facts["Value"], strict=True))
+    return pyarrow.table(
+        {
+            "Version": [python["Version"]],
+            "Major": pyarrow.array([int(python["Major"])], pyarrow.int32()),
+            "Minor": pyarrow.array([int(python["Minor"])], pyarrow.int32()),
+            "Micro": pyarrow.array([int(python["Micro"])], pyarrow.int32()),
+            "Implementation": [python["Implementation"]],
+            "FullVersion": [python["FullVersion"]],
+        }
+    )
+
+
+async def get_programming_language_version(session: BaseSession) -> str:
+    """
+    Asynchronously retrieve the programming language version string from a Deephaven session.
+
+    This function gets the programming language version table and extracts the version string.
+
+    Args:
+        session (BaseSession): An active Deephaven session.
+
+    Returns:
+        str: The programming language version string (e.g., "3.9.7").
+
+    Raises:
+        UnsupportedOperationError: If the session is not a Python session.
+        Exception: If the version information cannot be retrieved.
+    """
+    _LOGGER.debug(
+        "[queries:get_programming_language_version] Retrieving programming language version..."
+    )
+    version_table = await get_programming_language_version_table(session)
+
+    # Extract the version string from the first row of the Version column
+    version_column = version_table.column("Version")
     version_str = str(version_column[0].as_py())
 
     _LOGGER.debug(
@@ -569,62 +1546,34 @@ async def get_pip_packages_table(session: BaseSession) -> pyarrow.Table:
     """
     Asynchronously retrieve a table of installed pip packages from a Deephaven session as a pyarrow.Table.
 
-    This function runs a Python script in the given session to create a temporary table listing all installed pip packages and their versions, then retrieves it as a pyarrow.Table snapshot. Useful for environment inspection and version reporting.
+    The table is built from the session's environment probe (see get_session_environment_table()), so
+    it costs no worker round trip once the probe has run for the session. Useful for environment
+    inspection and version reporting.
 
     Args:
-        session (BaseSession): An active Deephaven session in which to run the script and retrieve the resulting table.
+        session (BaseSession): An active Deephaven session.
 
     Returns:
         pyarrow.Table: A table with columns 'Package' (str) and 'Version' (str), listing all installed pip packages.
 
     Raises:
         UnsupportedOperationError: If the session is not a Python session.
-        Exception: If the script fails to execute, the table cannot be retrieved, or conversion to Arrow fails.
+        Exception: If the environment probe fails.
 
     Example:
         >>> arrow_table = await get_pip_packages_table(session)
 
     Note:
-        - The temporary table '_pip_packages_table' is created in the session and is not automatically deleted.
-        - Logging is performed at DEBUG level for script execution and table retrieval.
+        - Logging is performed at DEBUG level.
         - Currently only supports Python sessions. Support for other programming languages may be added in the future.
     """
     _LOGGER.debug(
         "[queries:get_pip_packages_table] Retrieving pip packages from session..."
     )
-
-    # Check if the session is a Python session
-    # TODO: Add support for other programming languages.
-    _validate_python_session("get_pip_packages_table", session)
-
-    script = textwrap.dedent("""
-        from deephaven import new_table
-        from deephaven.column import string_col
-        import importlib.metadata as importlib_metadata
-
-        def _make_pip_packages_table():
-            names = []
-            versions = []
-            for dist in importlib_metadata.distributions():
-                names.append(dist.metadata['Name'])
-                versions.append(dist.version)
-            return new_table([
-                string_col('Package', names),
-                string_col('Version', versions),
-            ])
-
-        _pip_packages_table = _make_pip_packages_table()
-        """)
-    _LOGGER.debug(
-        "[queries:get_pip_packages_table] Running pip packages script in session..."
-    )
-    await session.run_script(script)
-    _LOGGER.debug("[queries:get_pip_packages_table] Script executed successfully.")
-    arrow_table, _ = await get_table(session, "_pip_packages_table", max_rows=None)
-    _LOGGER.debug(
-        "[queries:get_pip_packages_table] Table '_pip_packages_table' retrieved successfully."
+    environment = await get_session_environment_table(session)
+    return _environment_rows(environment, "package").rename_columns(
+        ["Package", "Version"]
     )
-    return arrow_table
 
 
 async def get_dh_versions(session: BaseSession) -> tuple[str | None, str | None]:
@@ -688,12 +1637,537 @@ async def get_dh_versions(session: BaseSession) -> tuple[str | None, str | None]
     return dh_core_version, dh_coreplus_version
 
 
+_CatalogFilter = Callable[[pyarrow.Table], pyarrow.Array | pyarrow.ChunkedArray]
+"""A filter compiled for local evaluation: maps a table to a boolean mask over its rows."""
+
+_LITERAL = r"`([^`]*)`"
+_COMPARISON_FILTER = re.compile(rf"^\s*(\w+)\s*(==|=|!=)\s*{_LITERAL}\s*$")
+_IN_FILTER = re.compile(
+    rf"^\s*(\w+)\s+(not\s+)?in\s+({_LITERAL}(?:\s*,\s*{_LITERAL})*)\s*$"
+)
+_METHOD_FILTER = re.compile(
+    rf"^\s*(\w+)\.(startsWith|endsWith|contains)\(\s*{_LITERAL}\s*\)\s*$"
+)
+_STRING_METHODS = {
+    "startsWith": pyarrow.compute.starts_with,
+    "endsWith": pyarrow.compute.ends_with,
+    "contains": pyarrow.compute.match_substring,
+}
+
+
+def _compile_catalog_filter(
+    filter_str: str, schema: pyarrow.Schema
+) -> _CatalogFilter | None:
+    """
+    Compile a simple Deephaven where clause on a string column for local evaluation.
+
+    Supported forms, where Col is a string column of the schema and values are backtick literals:
+    ``Col = `v```, ``Col == `v```, ``Col != `v```, ``Col in `a`, `b```, ``Col not in `a`, `b```,
+    ``Col.startsWith(`v`)``, ``Col.endsWith(`v`)`` and ``Col.contains(`v`)``. Null values match the
+    negated forms only, as in Deephaven.
+
+    Args:
+        filter_str (str): The Deephaven where clause.
+        schema (pyarrow.Schema): Schema of the table the filter will run against.
+
+    Returns:
+        _CatalogFilter | None: The compiled filter, or None if the clause is not one of the supported
+            forms and must be evaluated by the server.
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    negated = False
+    if match := _COMPARISON_FILTER.match(filter_str):
+        column, operator, value = match.groups()
+        values = [value]
+        negated = operator == "!="
+    elif match := _IN_FILTER.match(filter_str):
+        column = match.group(1)
+        negated = match.group(2) is not None
+        values = re.findall(_LITERAL, match.group(3))
+    elif match := _METHOD_FILTER.match(filter_str):
+        column, method, value = match.groups()
+        if column not in schema.names or not pyarrow.types.is_string(
+            schema.field(column).type
+        ):
+            return None
+        string_method = _STRING_METHODS[method]
+        return lambda table: pyarrow.compute.fill_null(
+            string_method(table[column], value), False
+        )
+    else:
+        return None
+
+    if column not in schema.names or not pyarrow.types.is_string(
+        schema.field(column).type
+    ):
+        return None
+    value_set = pyarrow.array(values, pyarrow.string())
+    if negated:
+        return lambda table: pyarrow.compute.fill_null(
+            pyarrow.compute.invert(pyarrow.compute.is_in(table[column], value_set)),
+            True,
+        )
+    return lambda table: pyarrow.compute.fill_null(
+        pyarrow.compute.is_in(table[column], value_set), False
+    )
+
+
+@dataclass
+class _CatalogSnapshot:
+    """
+    Local Arrow copy of one enterprise session's catalog table.
+
+    Attributes:
+        table (pyarrow.Table | None): The catalog rows, or None until the first fetch completes.
+        fetched_at (float): time.monotonic() value when table was fetched.
+        refresh_task (asyncio.Task[pyarrow.Table] | None): The fetch in progress, if any.
+        index (CatalogIndex | None): Search index built from index_source by search_catalog(), if any.
+        index_source (pyarrow.Table | None): The catalog rows index was built from; a refresh replaces
+            table, which makes the index stale.
+
+    Note:
+        This is a private helper class for internal use only.
+    """
+
+    table: pyarrow.Table | None = None
+    fetched_at: float = 0.0
+    refresh_task: "asyncio.Task[pyarrow.Table] | None" = None
+    index: CatalogIndex | None = None
+    index_source: pyarrow.Table | None = None
+
+
+_CATALOG_SNAPSHOTS: dict[str, _CatalogSnapshot] = {}
+"""Catalog snapshots keyed by session full name."""
+
+
+async def _refresh_catalog_snapshot(
+    snapshot: _CatalogSnapshot, session: CorePlusSession, session_name: str
+) -> pyarrow.Table:
+    """
+    Fetch the whole catalog table of a session into a snapshot.
+
+    Args:
+        snapshot (_CatalogSnapshot): The snapshot to update.
+        session (CorePlusSession): The session to read the catalog from.
+        session_name (str): Full name of the session, for logging.
+
+    Returns:
+        pyarrow.Table: The fetched catalog rows.
+
+    Raises:
+        Exception: If the catalog cannot be fetched; the snapshot keeps its previous table.
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    try:
+        catalog_table = await session.catalog_table()
+        arrow_table = await asyncio.to_thread(catalog_table.to_arrow)
+        snapshot.table = arrow_table
+        snapshot.fetched_at = time.monotonic()
+        _LOGGER.debug(
+            f"[queries:_refresh_catalog_snapshot] Catalog snapshot for '{session_name}' refreshed "
+            f"({arrow_table.num_rows} rows)."
+        )
+        return arrow_table
+    finally:
+        snapshot.refresh_task = None
+
+
+def _log_catalog_refresh_failure(
+    session_name: str, task: "asyncio.Task[pyarrow.Table]"
+) -> None:
+    """
+    Log the failure of a background catalog snapshot refresh.
+
+    Args:
+        session_name (str): Full name of the session.
+        task (asyncio.Task[pyarrow.Table]): The finished refresh task.
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    if not task.cancelled() and task.exception() is not None:
+        _LOGGER.warning(
+            f"[queries:get_catalog_table] Background catalog refresh failed for '{session_name}', "
+            f"keeping the previous snapshot: {task.exception()!r}"
+        )
+
+
+async def _get_catalog_snapshot(
+    session: CorePlusSession, session_name: str
+) -> pyarrow.Table:
+    """
+    Return the local catalog snapshot of a session, fetching or refreshing it as needed.
+
+    The first call fetches the catalog and waits for it. Later calls return the snapshot immediately;
+    once it is older than CATALOG_SNAPSHOT_REFRESH_SECONDS, a background refresh is started and the
+    current snapshot is served until the refresh completes.
+
+    Args:
+        session (CorePlusSession): The session to read the catalog from.
+        session_name (str): Full name of the session, used as the snapshot key.
+
+    Returns:
+        pyarrow.Table: The catalog rows.
+
+    Raises:
+        Exception: If the first fetch fails.
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    snapshot = _CATALOG_SNAPSHOTS.setdefault(session_name, _CatalogSnapshot())
+
+    if snapshot.table is None:
+        if snapshot.refresh_task is None:
+            snapshot.refresh_task = asyncio.create_task(
+                _refresh_catalog_snapshot(snapshot, session, session_name)
+            )
+        # Concurrent first callers share one fetch; shield it so one cancelled caller does not cancel it
+        return await asyncio.shield(snapshot.refresh_task)
+
+    age = time.monotonic() - snapshot.fetched_at
+    if age >= CATALOG_SNAPSHOT_REFRESH_SECONDS and snapshot.refresh_task is None:
+        _LOGGER.debug(
+            f"[queries:get_catalog_table] Catalog snapshot for '{session_name}' is {age:.0f}s old, "
+            "refreshing in the background."
+        )
+        task = asyncio.create_task(
+            _refresh_catalog_snapshot(snapshot, session, session_name)
+        )
+        task.add_done_callback(
+            lambda done: _log_catalog_refresh_failure(session_name, done)
+        )
+        snapshot.refresh_task = task
+    return snapshot.table
+
+
+def drop_catalog_snapshot(session_name: str | None = None) -> None:
+    """
+    Discard local catalog snapshots and cancel their background refreshes.
+
+    Called when a session is closed and when the server configuration is reloaded. A first fetch that
+    callers are waiting for is left to finish; its result is simply not kept.
+
+    Args:
+        session_name (str | None): Full name of the session whose snapshot is dropped, or None to drop
+            the snapshots of all sessions.
+    """
+    names = list(_CATALOG_SNAPSHOTS) if session_name is None else [session_name]
+    for name in names:
+        snapshot = _CATALOG_SNAPSHOTS.pop(name, None)
+        if (
+            snapshot is not None
+            and snapshot.table is not None
+            and snapshot.refresh_task is not None
+        ):
+            snapshot.refresh_task.cancel()
+            _LOGGER.debug(
+                f"[queries:drop_catalog_snapshot] Cancelled catalog refresh for '{name}'."
+            )
+
+
+def _forget_closed_session(session_name: str, item: object | None) -> None:
+    """
+    Drop every per-session cache of a session whose manager was closed.
+
+    Registered with resource_manager.register_close_callback(), so it runs on every
+    BaseItemManager.close(). Schemas and catalog snapshots read through the closed session
+    may not hold for its replacement.
+
+    Args:
+        session_name (str): Full name of the closed session manager.
+        item (object | None): The session object the manager had cached, or None.
+    """
+    if isinstance(item, BaseSession):
+        invalidate_session_environment(item)
+    invalidate_schema_cache(session_name)
+    drop_catalog_snapshot(session_name)
+
+
+register_close_callback(_forget_closed_session)
+
+
+_CATALOG_STRING_COLUMNS = pyarrow.schema(
+    [
+        pyarrow.field("Namespace", pyarrow.string()),
+        pyarrow.field("TableName", pyarrow.string()),
+    ]
+)
+"""Catalog columns known to be strings before the first snapshot of a session's catalog is fetched."""
+
+
+def _catalog_filter_schema(
+    schema: pyarrow.Schema, distinct_namespaces: bool
+) -> pyarrow.Schema:
+    """
+    Return the schema catalog filters run against: the catalog's, or only Namespace for distinct namespaces.
+
+    Args:
+        schema (pyarrow.Schema): Schema of the catalog rows.
+        distinct_namespaces (bool): Whether the request selects distinct namespaces.
+
+    Returns:
+        pyarrow.Schema: The schema to compile filters against.
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    return (
+        pyarrow.schema([schema.field("Namespace")]) if distinct_namespaces else schema
+    )
+
+
+async def _compile_catalog_snapshot_filters(
+    session: CorePlusSession,
+    session_name: str,
+    filters: list[str] | None,
+    distinct_namespaces: bool,
+) -> tuple[pyarrow.Table, list[_CatalogFilter]] | None:
+    """
+    Compile catalog filters for a local snapshot, fetching the snapshot only if they all compile.
+
+    The filters are first compiled against the schema of the existing snapshot or, before the first
+    fetch, against _CATALOG_STRING_COLUMNS. If any of them must run on the server, the snapshot is not
+    fetched, so a cold request does not download the whole catalog and then query the server anyway.
+
+    Args:
+        session (CorePlusSession): The session to read the catalog from.
+        session_name (str): Full name of the session, used as the snapshot key.
+        filters (list[str] | None): The Deephaven where clauses of the request.
+        distinct_namespaces (bool): Whether the request selects distinct namespaces.
+
+    Returns:
+        tuple[pyarrow.Table, list[_CatalogFilter]] | None: The snapshot rows and the compiled filters,
+            or None if the request must be answered by the server.
+
+    Raises:
+        Exception: If the first fetch of the snapshot fails.
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    cached = _CATALOG_SNAPSHOTS.get(session_name)
+    known_schema = _catalog_filter_schema(
+        (
+            cached.table.schema
+            if cached is not None and cached.table is not None
+            else _CATALOG_STRING_COLUMNS
+        ),
+        distinct_namespaces,
+    )
+    if any(_compile_catalog_filter(f, known_schema) is None for f in filters or []):
+        return None
+
+    snapshot = await _get_catalog_snapshot(session, session_name)
+    schema = _catalog_filter_schema(snapshot.schema, distinct_namespaces)
+    compiled = [_compile_catalog_filter(f, schema) for f in filters or []]
+    local_filters = [f for f in compiled if f is not None]
+    if len(local_filters) != len(compiled):
+        return None
+    return snapshot, local_filters
+
+
+def _query_catalog_snapshot(
+    snapshot: pyarrow.Table,
+    compiled_filters: list[_CatalogFilter],
+    *,
+    max_rows: int | None,
+    distinct_namespaces: bool,
+) -> tuple[pyarrow.Table, bool]:
+    """
+    Answer a get_catalog_table() request from a local catalog snapshot.
+
+    Mirrors the server-side pipeline: optional distinct-and-sort on Namespace, then the filters, then
+    the row limit from the head.
+
+    Args:
+        snapshot (pyarrow.Table): The catalog rows.
+        compiled_filters (list[_CatalogFilter]): Filters from _compile_catalog_filter(), combined with AND.
+        max_rows (int | None): Maximum number of rows to return, or None for all rows.
+        distinct_namespaces (bool): If True, query the sorted distinct namespaces instead of the catalog.
+
+    Returns:
+        tuple[pyarrow.Table, bool]: The result rows and whether they are complete.
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    table = snapshot
+    if distinct_namespaces:
+        namespaces = pyarrow.compute.unique(snapshot["Namespace"])
+        table = pyarrow.table({"Namespace": namespaces}).sort_by("Namespace")
+    for compiled_filter in compiled_filters:
+        table = table.filter(compiled_filter(table))
+    if max_rows is not None and table.num_rows > max_rows:
+        return table.slice(0, max_rows), False
+    return table, True
+
+
+COLUMN_MATCH_WEIGHT = 0.5
+"""float: Factor applied to column name scores in search_catalog(), so table and namespace matches rank first."""
+
+
+def _build_catalog_index(catalog: pyarrow.Table) -> CatalogIndex:
+    """
+    Build a CatalogIndex from catalog rows.
+
+    Args:
+        catalog (pyarrow.Table): Catalog rows with Namespace and TableName columns.
+
+    Returns:
+        CatalogIndex: The index.
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    return CatalogIndex(
+        catalog["Namespace"].to_pylist(), catalog["TableName"].to_pylist()
+    )
+
+
+def _match_cached_columns(
+    session_name: str, query: str
+) -> dict[tuple[str, str], tuple[float, list[str]]]:
+    """
+    Match a query against the column names of the catalog schemas in the schema cache.
+
+    Args:
+        session_name (str): Full name of the session.
+        query (str): The search text.
+
+    Returns:
+        dict[tuple[str, str], tuple[float, list[str]]]: For each (namespace, table_name) with matching
+            columns, the best column score (weighted by COLUMN_MATCH_WEIGHT) and the matching column
+            names, best first.
+
+    Note:
+        This is a private helper function for internal use only.
+    """
+    matches: dict[tuple[str, str], tuple[float, list[str]]] = {}
+    for (_, namespace, table_name), meta_table in _SCHEMA_CACHE.entries(session_name):
+        if namespace is None or "Name" not in meta_table.column_names:
+            continue
+        scored = [
+            (trigram_similarity(query, column), column)
+            for column in meta_table["Name"].to_pylist()
+            if column is not None
+        ]
+        matched = sorted(
+            ((score, column) for score, column in scored if score > 0),
+            key=lambda match: -match[0],
+        )
+        if matched:
+            matches[(namespace, table_name)] = (
+                matched[0][0] * COLUMN_MATCH_WEIGHT,
+                [column for _, column in matched],
+            )
+    return matches
+
+
+async def search_catalog(
+    session: BaseSession,
+    query: str,
+    *,
+    session_name: str,
+    limit: int,
+    include_columns: bool = True,
+) -> tuple[list[CatalogMatch], int]:
+    """
+    Asynchronously fuzzy-search the catalog of a Deephaven Enterprise (Core+) session.
+
+    Table names and namespaces are matched with a trigram index built from the session's local catalog
+    snapshot (see get_catalog_table()). The index is built once per snapshot, off the event loop, and
+    reused until the snapshot is refreshed; searches then run in memory without any server round trip.
+    Column names are matched too for catalog tables whose schemas are in the schema cache, so tables
+    described earlier with catalog_tables_schema can be found by their columns.
+
+    Args:
+        session (BaseSession): An active Deephaven enterprise session. Must be a CorePlusSession.
+        query (str): The search text, matched case-insensitively.
+        session_name (str): Full name of the session, used as the snapshot and schema cache key.
+        limit (int): Maximum number of matches to return.
+        include_columns (bool): Whether to also match column names from cached schemas. Defaults to True.
+
+    Returns:
+        tuple[list[CatalogMatch], int]: A tuple containing:
+            - list[CatalogMatch]: Up to ``limit`` matches, best first.
+            - int: Number of catalog rows that were searched.
+
+    Raises:
+        UnsupportedOperationError: If the session is not an enterprise (Core+) session.
+        Exception: If the catalog cannot be retrieved.
+
+    Note:
+        - With catalog snapshots disabled (CATALOG_SNAPSHOT_REFRESH_SECONDS = 0), every search fetches the
+          whole catalog and builds a throwaway index
+        - This function is intended for internal use by MCP tools
+    """
+    from deephaven_mcp.client import CorePlusSession
+
+    _LOGGER.debug(
+        f"[queries:search_catalog] Searching catalog of '{session_name}' for {query!r} (limit={limit})..."
+    )
+    if not isinstance(session, CorePlusSession):
+        raise UnsupportedOperationError(
+            f"search_catalog only supports enterprise (Core+) sessions, "
+            f"but session is {type(session).__name__}."
+        )
+
+    if CATALOG_SNAPSHOT_REFRESH_SECONDS > 0:
+        catalog = await _get_catalog_snapshot(session, session_name)
+        snapshot = _CATALOG_SNAPSHOTS.get(session_name)
+        if snapshot is not None and snapshot.index_source is catalog:
+            index = cast(CatalogIndex, snapshot.index)
+        else:
+            index = await asyncio.to_thread(_build_catalog_index, catalog)
+            if snapshot is not None:
+                snapshot.index, snapshot.index_source = index, catalog
+            _LOGGER.debug(
+                f"[queries:search_catalog] Built catalog index for '{session_name}' ({len(index)} rows)."
+            )
+    else:
+        catalog, _ = await get_catalog_table(
+            session, max_rows=None, distinct_namespaces=False
+        )
+        index = await asyncio.to_thread(_build_catalog_index, catalog)
+
+    name_matches = index.search(query, limit)
+    if not include_columns:
+        return name_matches, len(index)
+
+    column_matches = _match_cached_columns(session_name, query)
+    combined: dict[tuple[str, str], CatalogMatch] = {
+        (match.namespace, match.table): match for match in name_matches
+    }
+    for (namespace, table_name), (score, columns) in column_matches.items():
+        previous = combined.get((namespace, table_name))
+        combined[(namespace, table_name)] = CatalogMatch(
+            namespace,
+            table_name,
+            score=round(max(score, previous.score if previous else 0.0), 4),
+            matched_columns=columns,
+        )
+
+    # sorted() is stable, so name matches keep their relative order on equal scores
+    matches = sorted(combined.values(), key=lambda match: -match.score)[:limit]
+    _LOGGER.debug(
+        f"[queries:search_catalog] Found {len(matches)} matches "
+        f"({len(column_matches)} tables with matching cached columns)."
+    )
+    return matches, len(index)
+
+
 async def get_catalog_table(
     session: BaseSession,
     *,
     max_rows: int | None,
     filters: list[str] | None = None,
     distinct_namespaces: bool,
+    session_name: str | None = None,
 ) -> tuple[pyarrow.Table, bool]:
     """
     Asynchronously retrieve the catalog table from a Deephaven Enterprise (Core+) session.
@@ -718,6 +2192,10 @@ async def get_catalog_table(
                                     language syntax with backticks (`) for string literals.
         distinct_namespaces (bool): Required. If True, returns only distinct namespaces (sorted) instead of full catalog.
                                    Filters are applied after selecting distinct namespaces. Must be explicitly specified.
+        session_name (str | None): Full name of the session. When given, the request is answered from a local
+                                   Arrow snapshot of the catalog if every filter is a simple string comparison
+                                   (see _compile_catalog_filter()); other filters still run on the server.
+                                   Defaults to None (always query the server).
 
     Returns:
         tuple[pyarrow.Table, bool]: A tuple containing:
@@ -778,6 +2256,8 @@ async def get_catalog_table(
         - String literals in filters must use backticks (`), not single or double quotes
         - This function is intended for internal use by MCP tools
         - Only works with enterprise (Core+) sessions that have catalog_table() method
+        - Catalog snapshots are refreshed in the background every CATALOG_SNAPSHOT_REFRESH_SECONDS, so tables
+          added to the catalog can take that long to appear when session_name is given
     """
     from deephaven_mcp.client import CorePlusSession
 
@@ -795,6 +2275,28 @@ async def get_catalog_table(
             f"but session is {type(session).__name__}."
         )
 
+    if session_name is not None and CATALOG_SNAPSHOT_REFRESH_SECONDS > 0:
+        local_filters = await _compile_catalog_snapshot_filters(
+            session, session_name, filters, distinct_namespaces
+        )
+        if local_filters is not None:
+            snapshot, compiled_filters = local_filters
+            arrow_table, is_complete = await asyncio.to_thread(
+                _query_catalog_snapshot,
+                snapshot,
+                compiled_filters,
+                max_rows=max_rows,
+                distinct_namespaces=distinct_namespaces,
+            )
+            _LOGGER.debug(
+                f"[queries:get_catalog_table] Answered from the catalog snapshot of '{session_name}' "
+                f"({arrow_table.num_rows} rows, complete={is_complete})."
+            )
+            return arrow_table, is_complete
+        _LOGGER.debug(
+            "[queries:get_catalog_table] Filters need the server, bypassing the catalog snapshot."
+        )
+
     # Get the catalog table
     catalog_table = await session.catalog_table()
     _LOGGER.debug("[queries:get_catalog_table] Catalog table retrieved successfully.")
@@ -820,17 +2322,14 @@ async def get_catalog_table(
         catalog_table, filters, context_name=table_type
     )
 
-    # Apply row limiting using helper function (always from head for catalog tables)
-    catalog_table, is_complete = await _apply_row_limit(
+    # Limit rows (always from head for catalog tables) and convert to Arrow format
+    arrow_table, is_complete = await _fetch_limited_arrow(
         catalog_table,
         max_rows,
         head=True,
         context_name=table_type,
     )
 
-    # Convert to Arrow format
-    arrow_table = await asyncio.to_thread(catalog_table.to_arrow)
-
     _LOGGER.debug(
         "[queries:get_catalog_table] Catalog table converted to Arrow format successfully."
     )
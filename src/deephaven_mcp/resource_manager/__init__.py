@@ -71,6 +71,14 @@ Exports - Utility Functions:
     - generate_auth_token: Generate cryptographically secure PSK authentication token.
       Creates 32-character hex string with 128 bits of entropy. Used for session security.
 
+Exports - Close Callbacks:
+    - register_close_callback / unregister_close_callback: Add or remove a callback that
+      every BaseItemManager.close() runs with the manager's full name and the closed item.
+      Used by higher layers (e.g. queries) to drop per-session caches without the managers
+      importing them.
+
+    - CloseCallback: Type of a close callback.
+
 Exports - Enums:
     - SystemType: Backend system type enum with values COMMUNITY and ENTERPRISE. Used to
       distinguish between Deephaven Community and Enterprise (Core+) deployments.
@@ -149,6 +157,11 @@ Usage Example - Dynamic Sessions:
     >>> await launched.stop()
 """
 
+from ._close_callbacks import (
+    CloseCallback,
+    register_close_callback,
+    unregister_close_callback,
+)
 from ._launcher import (
     DockerLaunchedSession,
     LaunchedSession,
@@ -194,4 +207,7 @@ __all__ = [
     "launch_session",
     "find_available_port",
     "generate_auth_token",
+    "CloseCallback",
+    "register_close_callback",
+    "unregister_close_callback",
 ]
@@ -0,0 +1,69 @@
+"""
+Callbacks run when an item manager closes its cached resource.
+
+Layers above the resource managers keep per-session caches (schemas, catalog snapshots,
+environment probes) that must not outlive the session they were read through. Rather than
+have ``BaseItemManager.close()`` import those layers, they register a callback here, and
+``close()`` runs every registered callback after it has cleared its cache.
+
+Usage:
+    def forget_session(full_name: str, item: object | None) -> None:
+        ...
+
+    register_close_callback(forget_session)
+"""
+
+import logging
+from collections.abc import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+CloseCallback = Callable[[str, object | None], None]
+"""Signature of a close callback: the manager's full name and the closed item (None if none was cached)."""
+
+_CLOSE_CALLBACKS: list[CloseCallback] = []
+
+
+def register_close_callback(callback: CloseCallback) -> None:
+    """
+    Register a callback to run whenever an item manager is closed.
+
+    Callbacks run synchronously, in registration order, while the manager holds its lock, so
+    they must be fast and must not await. Registering the same callback twice has no effect.
+
+    Args:
+        callback (CloseCallback): Called with the manager's full name and the item it had
+            cached, or None if nothing was cached.
+    """
+    if callback not in _CLOSE_CALLBACKS:
+        _CLOSE_CALLBACKS.append(callback)
+
+
+def unregister_close_callback(callback: CloseCallback) -> None:
+    """
+    Remove a callback added with register_close_callback().
+
+    Args:
+        callback (CloseCallback): The callback to remove. Unknown callbacks are ignored.
+    """
+    if callback in _CLOSE_CALLBACKS:
+        _CLOSE_CALLBACKS.remove(callback)
+
+
+def run_close_callbacks(full_name: str, item: object | None) -> None:
+    """
+    Run every registered close callback for one closed manager.
+
+    A callback that raises is logged and does not stop the remaining callbacks.
+
+    Args:
+        full_name (str): Full name of the closed manager.
+        item (object | None): The item the manager had cached, or None.
+    """
+    for callback in list(_CLOSE_CALLBACKS):
+        try:
+            callback(full_name, item)
+        except Exception as e:
+            _LOGGER.warning(
+                f"[resource_manager:run_close_callbacks] Close callback {callback!r} failed for '{full_name}': {e!r}"
+            )
@@ -103,6 +103,7 @@ from deephaven_mcp.config._enterprise_system import (
     DEFAULT_CONNECTION_TIMEOUT_SECONDS,
 )
 
+from ._close_callbacks import run_close_callbacks
 from ._launcher import (
     DockerLaunchedSession,
     PythonLaunchedSession,
@@ -1356,6 +1357,8 @@ class BaseItemManager(Generic[T], ABC):
         Resource State Management:
             After this method completes:
             - The internal cache is guaranteed to be cleared (set to None)
+            - Meta tables cached for this manager's full_name are dropped from the schema cache
+            - The local catalog snapshot for this manager's full_name is discarded
             - Future get() calls will create a new resource instance
             - The manager returns to its initial uninitialized state
             - Any existing resource references become independent of the manager
@@ -1426,6 +1429,7 @@ class BaseItemManager(Generic[T], ABC):
         )
 
         async with self._lock:
+            closed_item = self._item_cache
             if self._item_cache:
                 _LOGGER.debug(
                     f"[{self.__class__.__name__}] Found cached item for '{self.full_name}', checking liveness before close"
@@ -1468,6 +1472,8 @@ class BaseItemManager(Generic[T], ABC):
                 )
 
             self._item_cache = None
+            # Caches read through the closed item may not hold for its replacement
+            run_close_callbacks(self.full_name, closed_item)
             _LOGGER.debug(
                 f"[{self.__class__.__name__}] Cleared cache for '{self.full_name}', close operation complete"
             )
@@ -27,7 +27,7 @@ import enum
 import logging
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 if TYPE_CHECKING:
@@ -110,11 +110,18 @@ class RegistrySnapshot(Generic[T]):
         initialization_errors: Errors recorded during background
             initialization.  Maps source names to error descriptions.
             Empty dict means no errors.
+        warm_up_phase: Phase of the optional community session warm-up,
+            ``LOADING`` while it runs and ``COMPLETED`` once it has finished,
+            or ``None`` if no warm-up was started.
+        warm_up_errors: Community sessions that failed or timed out during
+            warm-up.  Maps full session names to error descriptions.
     """
 
     items: dict[str, T]
     initialization_phase: InitializationPhase
     initialization_errors: dict[str, str]
+    warm_up_phase: InitializationPhase | None = None
+    warm_up_errors: dict[str, str] = field(default_factory=dict)
 
     @classmethod
     def simple(cls, items: dict[str, T]) -> "RegistrySnapshot[T]":
@@ -141,6 +148,8 @@ class RegistrySnapshot(Generic[T]):
         items: dict[str, T],
         phase: InitializationPhase,
         errors: dict[str, str],
+        warm_up_phase: InitializationPhase | None = None,
+        warm_up_errors: dict[str, str] | None = None,
     ) -> "RegistrySnapshot[T]":
         """Create a snapshot that includes initialization state.
 
@@ -151,6 +160,9 @@ class RegistrySnapshot(Generic[T]):
             items: Copy of the registry items dictionary.
             phase: Current initialization lifecycle phase.
             errors: Per-factory error descriptions from enterprise discovery.
+            warm_up_phase: Community session warm-up phase, or ``None`` if
+                no warm-up was started.
+            warm_up_errors: Per-session error descriptions from warm-up.
 
         Returns:
             A snapshot with the given initialization state.
@@ -159,6 +171,8 @@ class RegistrySnapshot(Generic[T]):
             items=items,
             initialization_phase=phase,
             initialization_errors=errors,
+            warm_up_phase=warm_up_phase,
+            warm_up_errors=warm_up_errors or {},
         )
 
 
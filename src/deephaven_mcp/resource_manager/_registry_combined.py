@@ -12,11 +12,26 @@ Architecture
 
 - ``_community_registry`` / ``_enterprise_registry`` — sub-registries.
 - ``_controller_clients`` — per-factory controller client cache.
+- ``_map_versions`` — controller map version each factory's sessions were last
+  reconciled against, valid only for the cached client.
+- ``_client_verified_at`` — when each cached controller client last completed
+  a controller RPC (connect or ping), so recently verified clients skip the ping.
 - ``_added_session_ids`` — tracks sessions explicitly added via
   ``add_session()`` for MCP-created session counting.
 - ``_phase`` / ``_errors`` — enterprise discovery lifecycle state.
 - ``_discovery_task`` — background task for initial enterprise discovery.
+- ``_warm_up_task`` — optional background task that connects the configured
+  community sessions at startup.
+- ``_warm_up_phase`` / ``_warm_up_errors`` — warm-up progress and per-session
+  failures, reported by ``get_all()`` alongside the discovery state.
 - ``_refresh_lock`` — serializes concurrent enterprise refresh operations.
+- ``_sync_flights`` / ``_synced_at`` — in-flight refresh task and last
+  refresh time per factory, so concurrent and back-to-back lookups share one
+  refresh (see ``_sync_enterprise_sessions``).
+- ``_watch_tasks`` / ``_watched_factories`` — per-factory background watchers
+  that keep ``_items`` current from controller map version changes.
+- ``_watch_executor`` — thread pool that runs the watchers' long-polls, so
+  they never occupy default-executor threads.
 
 Locking contract (strict ordering, no exceptions)
 --------------------------------------------------
@@ -37,12 +52,44 @@ Enterprise refresh is a four-phase operation:
 3. **Apply**    (``self._lock``): mutate ``_items``/caches, collect managers
    to close.
 4. **Close**    (no lock): close stale managers outside the lock.
+
+Enterprise watchers
+-------------------
+A successful refresh starts a watcher task for the factory (``_watch_factory``).
+The watcher long-polls the controller client with
+``wait_for_change_from_version`` and, when the map version changes, applies the
+new PQ names under ``_refresh_lock`` and ``self._lock`` (same order as a
+refresh).  While a factory's watcher is running, the factory is listed in
+``_watched_factories`` and ``get()`` / ``get_all()`` skip its refresh, so
+lookups are pure in-memory reads.  A watcher that fails removes its factory
+from ``_watched_factories`` and exits; the next lookup falls back to a refresh,
+which starts a new watcher once the controller answers again.  A refresh that
+fails for a watched factory stops its watcher the same way.
+
+The long-polls run on the registry's own ``_watch_executor``, capped at
+``ENTERPRISE_WATCH_MAX_THREADS`` threads, so watchers cannot starve other
+``asyncio.to_thread`` work.  With more watched factories than threads, polls
+queue and a change may be seen up to one poll interval later.
+
+Community session warm-up
+-------------------------
+Community sessions are connected lazily on first use.  When warm-up is enabled
+(``COMMUNITY_WARMUP_MAX_CONCURRENT`` or the ``initialize()`` argument), a
+separate background task connects every configured community session,
+concurrently with enterprise discovery, with bounded parallelism and a
+per-session timeout.  Warm-up does not affect ``_phase``, which gates
+enterprise refreshes; its progress is tracked in ``_warm_up_phase`` and
+``_warm_up_errors`` and reported by ``get_all()``.  A session that fails to
+warm up is retried on first use.
 """
 
 import asyncio
 import logging
+import math
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -74,6 +121,66 @@ from ._registry import (
 _LOGGER = logging.getLogger(__name__)
 
 
+ENTERPRISE_WATCH_POLL_SECONDS: float = float(
+    os.environ.get("DH_MCP_ENTERPRISE_WATCH_POLL_SECONDS", "5.0")
+)
+"""Long-poll timeout of each enterprise factory watcher, in seconds; 0 disables the watchers.
+
+Each wait holds one thread of the watcher pool (see ENTERPRISE_WATCH_MAX_THREADS)
+for up to this long, so keep it short. With watchers disabled, every enterprise
+lookup refreshes the factory from the controller.
+Environment variable override: DH_MCP_ENTERPRISE_WATCH_POLL_SECONDS
+"""
+
+ENTERPRISE_WATCH_MAX_THREADS: int = int(
+    os.environ.get("DH_MCP_ENTERPRISE_WATCH_MAX_THREADS", "8")
+)
+"""Threads available to the enterprise watchers' long-polls.
+
+The watchers use their own pool so they never hold default-executor threads. With more
+watched factories than threads, polls wait for a free thread and changes are noticed later.
+Environment variable override: DH_MCP_ENTERPRISE_WATCH_MAX_THREADS
+"""
+
+ENTERPRISE_SYNC_MAX_AGE_SECONDS: float = float(
+    os.environ.get("DH_MCP_ENTERPRISE_SYNC_MAX_AGE_SECONDS", "1.0")
+)
+"""Age in seconds below which a finished enterprise refresh is reused instead of repeated; 0 disables reuse.
+
+Fractions are allowed (e.g. 0.25). A lookup that misses always refreshes again, so new
+PQs are found even inside the window.
+Environment variable override: DH_MCP_ENTERPRISE_SYNC_MAX_AGE_SECONDS
+"""
+
+CONTROLLER_PING_INTERVAL_SECONDS: float = float(
+    os.environ.get("DH_MCP_CONTROLLER_PING_INTERVAL_SECONDS", "30.0")
+)
+"""Seconds after a successful connect or ping during which a cached controller client is not pinged again; 0 always pings.
+
+Inside the window a failed map read is the liveness signal instead: the client is
+recreated and the read retried once.
+Environment variable override: DH_MCP_CONTROLLER_PING_INTERVAL_SECONDS
+"""
+
+COMMUNITY_WARMUP_MAX_CONCURRENT: int = int(
+    os.environ.get("DH_MCP_COMMUNITY_WARMUP_MAX_CONCURRENT", "0")
+)
+"""Configured community sessions connected concurrently at startup; 0 disables warm-up.
+
+With warm-up disabled, each community session connects on its first use.
+Environment variable override: DH_MCP_COMMUNITY_WARMUP_MAX_CONCURRENT
+"""
+
+COMMUNITY_WARMUP_TIMEOUT_SECONDS: float = float(
+    os.environ.get("DH_MCP_COMMUNITY_WARMUP_TIMEOUT_SECONDS", "30.0")
+)
+"""Maximum seconds spent connecting one community session during warm-up.
+
+A session that times out is left unconnected and connects on its first use.
+Environment variable override: DH_MCP_COMMUNITY_WARMUP_TIMEOUT_SECONDS
+"""
+
+
 # ---------------------------------------------------------------------------
 # Module-level result types
 # ---------------------------------------------------------------------------
@@ -89,11 +196,18 @@ class _FactorySnapshot:
             a connected factory instance and its controller client.
         client (CorePlusControllerClient | None): Cached controller client from
             the previous refresh cycle, or ``None`` if this is the first query.
+        map_version (int | None): Controller map version the factory's sessions
+            were last reconciled against using ``client``, or ``None`` if they
+            must be reconciled from a full map.
+        verified_at (float | None): ``time.monotonic()`` of the last connect or
+            successful ping of ``client``, or ``None`` if unknown.
     """
 
     factory_name: str
     factory_manager: CorePlusSessionFactoryManager
     client: CorePlusControllerClient | None
+    map_version: int | None = None
+    verified_at: float | None = None
 
 
 @dataclass
@@ -105,13 +219,21 @@ class _FactoryQueryResult:
         new_client (CorePlusControllerClient): The live client used for this
             query — either the cached client (if ping succeeded) or a freshly
             created one (if the cached client was dead or absent).
-        query_names (set[str]): Names of all persistent queries currently
-            reported by the controller.
+        query_names (set[str] | None): Names of all persistent queries currently
+            reported by the controller, or ``None`` if the controller map has
+            not changed since the snapshot's ``map_version``.
+        map_version (int | None): Controller map version ``query_names`` were
+            read at, or ``None`` if unknown.
+        verified_at (float | None): ``time.monotonic()`` at which this query
+            connected or pinged ``new_client``, or ``None`` if the ping was
+            skipped.
     """
 
     factory_name: str
     new_client: CorePlusControllerClient
-    query_names: set[str]
+    query_names: set[str] | None
+    map_version: int | None = None
+    verified_at: float | None = None
 
 
 @dataclass
@@ -142,6 +264,60 @@ class _PingFailed(Exception):
     """Sentinel raised when a controller client ping returns False."""
 
 
+async def _connect_controller(
+    snapshot: _FactorySnapshot, reason: str
+) -> CorePlusControllerClient:
+    """Obtain a fresh controller client from the snapshot's factory manager.
+
+    Args:
+        snapshot (_FactorySnapshot): Per-factory state captured in Phase 1.
+        reason (str): Why a client is needed, for logging.
+
+    Returns:
+        CorePlusControllerClient: The factory instance's controller client.
+    """
+    name = snapshot.factory_name
+    _LOGGER.debug(f"[_fetch_factory_pqs] '{name}': {reason}, creating client")
+    t0 = time.monotonic()
+    factory_instance = await snapshot.factory_manager.get()
+    _LOGGER.debug(
+        f"[_fetch_factory_pqs] '{name}': client created in {time.monotonic()-t0:.2f}s"
+    )
+    return factory_instance.controller_client
+
+
+async def _read_pq_names(
+    name: str, client: CorePlusControllerClient, map_version: int | None
+) -> tuple[set[str] | None, int]:
+    """Read the PQ names from a controller client's map.
+
+    No names are collected when the map is still at ``map_version``.
+
+    Args:
+        name (str): Factory name, for logging.
+        client (CorePlusControllerClient): Controller client to read from.
+        map_version (int | None): Map version previously read from ``client``,
+            or ``None`` to always return the names.
+
+    Returns:
+        tuple[set[str] | None, int]: The PQ names, or ``None`` if the map is
+            still at ``map_version``, and the map version they were read at.
+    """
+    _LOGGER.debug(f"[_fetch_factory_pqs] '{name}': calling query_names_and_version()")
+    t0 = time.monotonic()
+    query_names, new_version = await client.query_names_and_version(map_version)
+    if query_names is None:
+        _LOGGER.debug(
+            f"[_fetch_factory_pqs] '{name}': map unchanged at version {new_version}"
+        )
+        return None, new_version
+    _LOGGER.debug(
+        f"[_fetch_factory_pqs] '{name}': query_names_and_version() returned {len(query_names)} "
+        f"names at version {new_version} in {time.monotonic()-t0:.2f}s"
+    )
+    return query_names, new_version
+
+
 async def _fetch_factory_pqs(
     snapshot: _FactorySnapshot,
 ) -> _FactoryQueryResult | _FactoryQueryError:
@@ -151,8 +327,16 @@ async def _fetch_factory_pqs(
 
     Algorithm:
         1. If no cached client, create one via ``factory_manager.get()``.
-        2. If cached client exists, ping to verify liveness; recreate if dead.
-        3. Call ``map()`` to get the current PQ list.
+        2. If the cached client was connected or pinged within
+           ``CONTROLLER_PING_INTERVAL_SECONDS``, skip the ping.  Otherwise ping
+           to verify liveness and recreate the client if it is dead.
+        3. Call ``query_names_and_version()`` with the snapshot's
+           ``map_version`` if the cached client is still in use.
+        4. If the version is unchanged, return a result without
+           ``query_names`` — no PQ is read and the apply phase skips
+           reconciling the factory's sessions.
+        5. If steps 3-4 fail on a client whose ping was skipped, treat the
+           client as dead: recreate it and read the full map once more.
 
     Args:
         snapshot (_FactorySnapshot): Per-factory state captured in Phase 1.
@@ -163,16 +347,21 @@ async def _fetch_factory_pqs(
     name = snapshot.factory_name
     client = snapshot.client
     new_client: CorePlusControllerClient | None = None
+    verified_at: float | None = None
 
     try:
         if client is None:
-            _LOGGER.debug(f"[_fetch_factory_pqs] '{name}': no cached client, creating")
-            t0 = time.monotonic()
-            factory_instance = await snapshot.factory_manager.get()
-            client = factory_instance.controller_client
-            new_client = client
+            client = new_client = await _connect_controller(
+                snapshot, "no cached client"
+            )
+            verified_at = time.monotonic()
+        elif (
+            snapshot.verified_at is not None
+            and time.monotonic() - snapshot.verified_at
+            < CONTROLLER_PING_INTERVAL_SECONDS
+        ):
             _LOGGER.debug(
-                f"[_fetch_factory_pqs] '{name}': client created in {time.monotonic()-t0:.2f}s"
+                f"[_fetch_factory_pqs] '{name}': cached client verified recently, skipping ping"
             )
         else:
             try:
@@ -188,26 +377,35 @@ async def _fetch_factory_pqs(
                 _LOGGER.warning(
                     f"[_fetch_factory_pqs] cached client for '{name}' dead ({ping_err}); recreating"
                 )
-                t0 = time.monotonic()
-                factory_instance = await snapshot.factory_manager.get()
-                client = factory_instance.controller_client
-                new_client = client
-                _LOGGER.debug(
-                    f"[_fetch_factory_pqs] '{name}': client recreated in {time.monotonic()-t0:.2f}s"
+                client = new_client = await _connect_controller(
+                    snapshot, "cached client dead"
                 )
+            verified_at = time.monotonic()
+
+        # Map versions are per client, so only compare against the cached one.
+        try:
+            query_names, map_version = await _read_pq_names(
+                name, client, snapshot.map_version if new_client is None else None
+            )
+        except Exception as read_err:
+            if verified_at is not None:
+                raise
+            _LOGGER.warning(
+                f"[_fetch_factory_pqs] unpinged cached client for '{name}' failed "
+                f"({read_err}); recreating and retrying once"
+            )
+            client = new_client = await _connect_controller(
+                snapshot, "cached client failed"
+            )
+            verified_at = time.monotonic()
+            query_names, map_version = await _read_pq_names(name, client, None)
 
-        _LOGGER.debug(f"[_fetch_factory_pqs] '{name}': calling map()")
-        t0 = time.monotonic()
-        query_map = await client.map()
-        _LOGGER.debug(
-            f"[_fetch_factory_pqs] '{name}': map() returned {len(query_map)} entries in {time.monotonic()-t0:.2f}s"
-        )
-        query_names = {info.config.pb.name for info in query_map.values()}
-        _LOGGER.debug(f"[_fetch_factory_pqs] factory '{name}': {len(query_names)} PQs")
         return _FactoryQueryResult(
             factory_name=name,
             new_client=client,
             query_names=query_names,
+            map_version=map_version,
+            verified_at=verified_at,
         )
 
     except Exception as e:
@@ -274,11 +472,22 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
         self._community_registry: CommunitySessionRegistry | None = None
         self._enterprise_registry: CorePlusSessionFactoryRegistry | None = None
         self._controller_clients: dict[str, CorePlusControllerClient] = {}
+        self._map_versions: dict[str, int] = {}
+        self._client_verified_at: dict[str, float] = {}
         self._added_session_ids: set[str] = set()
         self._phase: InitializationPhase = InitializationPhase.NOT_STARTED
         self._errors: dict[str, str] = {}
         self._discovery_task: asyncio.Task[None] | None = None
+        self._warm_up_task: asyncio.Task[None] | None = None
+        self._warm_up_phase: InitializationPhase | None = None
+        self._warm_up_errors: dict[str, str] = {}
+        self._warm_up_max_concurrent: int = 0
         self._refresh_lock = asyncio.Lock()
+        self._sync_flights: dict[str, asyncio.Task[None]] = {}
+        self._synced_at: dict[str, float] = {}
+        self._watch_tasks: dict[str, asyncio.Task[None]] = {}
+        self._watched_factories: set[str] = set()
+        self._watch_executor: ThreadPoolExecutor | None = None
 
     # ------------------------------------------------------------------
     # BaseRegistry overrides — lifecycle
@@ -326,29 +535,54 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
         )
 
     @override
-    async def initialize(self, config_manager: ConfigManager) -> None:
+    async def initialize(
+        self,
+        config_manager: ConfigManager,
+        warm_up_max_concurrent: int | None = None,
+    ) -> None:
         """Initialize the registry and start background enterprise discovery.
 
         Phase 1 (under ``self._lock``): calls ``super().initialize()`` which
         calls ``_load_items`` — loads community sessions and sub-registries.
 
-        Phase 2 (background task): discovers enterprise sessions from all
-        configured factories in parallel.
+        Phase 2 (background tasks): discovers enterprise sessions from all
+        configured factories in parallel and, if warm-up is enabled, connects
+        the configured community sessions in a separate task.
 
         Idempotent — if ``initialize()`` has already been called, subsequent calls
         return immediately without restarting discovery.
 
         Args:
             config_manager: Configuration source.
+            warm_up_max_concurrent (int | None): Number of community sessions to
+                connect concurrently in the background; ``0`` disables warm-up.
+                Defaults to ``COMMUNITY_WARMUP_MAX_CONCURRENT``.
         """
         await super().initialize(config_manager)
 
         async with self._lock:
             if self._discovery_task is not None:
                 return
+            self._warm_up_max_concurrent = (
+                COMMUNITY_WARMUP_MAX_CONCURRENT
+                if warm_up_max_concurrent is None
+                else warm_up_max_concurrent
+            )
             self._discovery_task = asyncio.create_task(
                 self._discover_enterprise_sessions()
             )
+            if self._warm_up_max_concurrent > 0:
+                community_managers = [
+                    mgr
+                    for mgr in self._items.values()
+                    if mgr.system_type == SystemType.COMMUNITY
+                ]
+                self._warm_up_phase = InitializationPhase.LOADING
+                self._warm_up_task = asyncio.create_task(
+                    self._warm_up_community_sessions(
+                        community_managers, self._warm_up_max_concurrent
+                    )
+                )
 
     @override
     async def close(self) -> None:
@@ -357,12 +591,16 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
         Shutdown sequence (all steps are safe against concurrent callers):
 
         1. Under ``self._lock``: verify initialized, set ``_initialized=False``
-           (gates all other operations immediately), grab the discovery task
-           reference, and null out sub-registry refs so ``_snapshot_factory_state``
-           sees ``None`` on its next lock-free read.
+           (gates all other operations immediately, including starting new
+           watchers), grab the discovery, warm-up and watcher task references, and null
+           out sub-registry refs so ``_snapshot_factory_state`` sees ``None`` on
+           its next lock-free read.
         2. Acquire ``_refresh_lock`` as a barrier — waits for any in-flight
-           ``_sync_enterprise_sessions`` to finish before proceeding.
-        3. Cancel and await the background discovery task (outside lock).
+           ``_sync_enterprise_sessions`` to finish before proceeding — then wait
+           for refresh tasks still queued behind it.
+        3. Cancel and await the background discovery and warm-up tasks and the
+           enterprise watchers (outside lock), then shut down the watcher
+           thread pool.
         4. Close sub-registries using the local refs captured in step 1.
         5. Under ``self._lock``: clear remaining mutable state and ``_items``.
 
@@ -377,6 +615,15 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
             self._initialized = False
             task = self._discovery_task
             self._discovery_task = None
+            warm_up_task = self._warm_up_task
+            self._warm_up_task = None
+            watch_tasks = list(self._watch_tasks.values())
+            self._watch_tasks.clear()
+            watch_executor = self._watch_executor
+            self._watch_executor = None
+            sync_flights = set(self._sync_flights.values())
+            self._sync_flights.clear()
+            self._watched_factories.clear()
             community = self._community_registry
             enterprise = self._enterprise_registry
             self._community_registry = None
@@ -387,17 +634,17 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
         # so acquiring it here guarantees no sync is mutating state when we proceed.
         async with self._refresh_lock:
             pass
+        await asyncio.gather(*sync_flights, return_exceptions=True)
 
-        # Step 3: cancel the background task (outside lock to avoid deadlock).
-        if task is not None and not task.done():
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            _LOGGER.info(
-                f"[{self.__class__.__name__}] cancelled background enterprise discovery"
-            )
+        # Step 3: cancel the background tasks (outside lock to avoid deadlock).
+        await self._cancel_background_task(task, "background enterprise discovery")
+        await self._cancel_background_task(warm_up_task, "community session warm-up")
+
+        await self._stop_watchers(watch_tasks)
+        if watch_executor is not None:
+            # Do not wait for polls still blocked in the controller; they
+            # return within ENTERPRISE_WATCH_POLL_SECONDS.
+            watch_executor.shutdown(wait=False, cancel_futures=True)
 
         # Step 4: close sub-registries via local refs captured under the lock.
         if community is not None:
@@ -421,9 +668,14 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
         # (super().close() would fail _check_initialized()). Close _items inline.
         async with self._lock:
             self._controller_clients.clear()
+            self._map_versions.clear()
+            self._client_verified_at.clear()
+            self._synced_at.clear()
             self._added_session_ids.clear()
             self._phase = InitializationPhase.NOT_STARTED
             self._errors = {}
+            self._warm_up_phase = None
+            self._warm_up_errors = {}
             items_to_close = list(self._items.values())
             self._items.clear()
 
@@ -447,8 +699,12 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
         """Return the session manager for *name*, refreshing enterprise data if needed.
 
         For enterprise session names, triggers an on-demand refresh of the
-        relevant factory before looking up the item.  For community sessions,
-        no refresh is needed.
+        relevant factory before looking up the item, unless a watcher is
+        keeping that factory current.  A refresh finished within
+        ``ENTERPRISE_SYNC_MAX_AGE_SECONDS`` is reused.  If the enterprise
+        session is still not found, the factory is refreshed once more,
+        ignoring the watcher and the reuse window, so a PQ created moments ago
+        is found.  For community sessions, no refresh is needed.
 
         Refresh only runs after initial discovery completes (``COMPLETED``
         phase); during ``LOADING`` or ``PARTIAL`` the background task is the
@@ -475,7 +731,8 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
         if is_enterprise:
             async with self._lock:
                 phase = self._phase
-            if phase == InitializationPhase.COMPLETED:
+                watched = source in self._watched_factories
+            if phase == InitializationPhase.COMPLETED and not watched:
                 _LOGGER.debug(
                     f"[{self.__class__.__name__}:get] enterprise sync starting for '{name}' (acquiring _refresh_lock)"
                 )
@@ -484,6 +741,18 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
                     f"[{self.__class__.__name__}:get] enterprise sync complete for '{name}'"
                 )
 
+        async with self._lock:
+            self._check_initialized()
+            if name in self._items:
+                return self._items[name]
+            if not is_enterprise or self._phase != InitializationPhase.COMPLETED:
+                raise RegistryItemNotFoundError(self._build_not_found_message(name))
+
+        _LOGGER.debug(
+            f"[{self.__class__.__name__}:get] '{name}' not found; refreshing factory '{source}' again"
+        )
+        await self._sync_enterprise_sessions([source], max_age_seconds=0)
+
         async with self._lock:
             self._check_initialized()
             if name not in self._items:
@@ -494,15 +763,15 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
     async def get_all(self) -> RegistrySnapshot[BaseItemManager]:
         """Return an atomic snapshot of all sessions, refreshing enterprise data if needed.
 
-        Triggers an on-demand refresh of all enterprise factories before
-        returning the snapshot.  Refresh only runs after initial discovery
+        Triggers an on-demand refresh of the enterprise factories that no
+        watcher is keeping current before returning the snapshot.  Refresh only runs after initial discovery
         completes (``COMPLETED`` phase); during ``LOADING`` or ``PARTIAL`` the
         snapshot reflects whatever sessions have been discovered so far.
 
         Returns:
             RegistrySnapshot[BaseItemManager]: Snapshot containing ``items``
-                (all currently known sessions), ``initialization_phase``, and
-                ``initialization_errors``.
+                (all currently known sessions), ``initialization_phase``,
+                ``initialization_errors``, and the community warm-up state.
 
         Raises:
             InternalError: If the registry has not been initialized.
@@ -515,7 +784,12 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
 
         if phase == InitializationPhase.COMPLETED and enterprise_registry is not None:
             factory_snapshot = await enterprise_registry.get_all()
-            factory_names = list(factory_snapshot.items.keys())
+            async with self._lock:
+                factory_names = [
+                    name
+                    for name in factory_snapshot.items
+                    if name not in self._watched_factories
+                ]
             if factory_names:
                 await self._sync_enterprise_sessions(factory_names)
 
@@ -525,6 +799,8 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
                 items=self._items.copy(),
                 phase=self._phase,
                 errors=self._errors.copy(),
+                warm_up_phase=self._warm_up_phase,
+                warm_up_errors=self._warm_up_errors.copy(),
             )
 
     async def community_registry(self) -> CommunitySessionRegistry:
@@ -588,6 +864,7 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
                 raise ValueError(f"Session '{session_id}' already exists in registry")
             self._items[session_id] = manager
             self._added_session_ids.add(session_id)
+            self._forget_map_version(manager)
             _LOGGER.debug(f"[{self.__class__.__name__}] added session '{session_id}'")
 
     async def remove_session(self, session_id: str) -> BaseItemManager | None:
@@ -612,6 +889,7 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
             manager = self._items.pop(session_id, None)
             if manager is not None:
                 self._added_session_ids.discard(session_id)
+                self._forget_map_version(manager)
                 _LOGGER.debug(
                     f"[{self.__class__.__name__}] removed session '{session_id}'"
                 )
@@ -678,9 +956,76 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
     # Private — enterprise refresh (four single-responsibility methods)
     # ------------------------------------------------------------------
 
-    async def _sync_enterprise_sessions(self, factory_names: list[str]) -> None:
+    def _forget_map_version(self, manager: BaseItemManager) -> None:
+        """Force the next refresh of an enterprise session's factory to reconcile fully.
+
+        Called when ``_items`` changes outside a refresh, so an unchanged
+        controller map no longer implies ``_items`` matches it.
+
+        Synchronous — no ``await``.  Must be called under ``self._lock``.
+
+        Args:
+            manager (BaseItemManager): Session that was added or removed.
+        """
+        if manager.system_type == SystemType.ENTERPRISE:
+            self._map_versions.pop(manager.source, None)
+
+    async def _sync_enterprise_sessions(
+        self, factory_names: list[str], max_age_seconds: float | None = None
+    ) -> None:
+        """Refresh enterprise sessions for the given factories, sharing work with other callers.
+
+        Single-flight per factory: a factory whose refresh is already in
+        progress is not refreshed again — the caller waits for that refresh.
+        A factory refreshed successfully less than ``max_age_seconds`` ago is
+        skipped.  The remaining factories are refreshed together by one task
+        (``_refresh_enterprise_factories``) that later callers can join.  The
+        task is shielded, so a cancelled caller does not cancel it for others.
+
+        Args:
+            factory_names (list[str]): Factory names to refresh.
+            max_age_seconds (float | None): Reuse refreshes newer than this.
+                Defaults to ``ENTERPRISE_SYNC_MAX_AGE_SECONDS``; ``0`` always
+                refreshes (but still joins a refresh in progress).
+
+        Raises:
+            Exception: Whatever the shared refresh raised.
+        """
+        if max_age_seconds is None:
+            max_age_seconds = ENTERPRISE_SYNC_MAX_AGE_SECONDS
+
+        async with self._lock:
+            now = time.monotonic()
+            flights: list[asyncio.Task[None]] = []
+            stale: list[str] = []
+            for name in dict.fromkeys(factory_names):
+                flight = self._sync_flights.get(name)
+                if flight is not None:
+                    if flight not in flights:
+                        flights.append(flight)
+                elif now - self._synced_at.get(name, -math.inf) >= max_age_seconds:
+                    stale.append(name)
+            if stale:
+                flight = asyncio.create_task(self._refresh_enterprise_factories(stale))
+                for name in stale:
+                    self._sync_flights[name] = flight
+                flights.append(flight)
+
+        if not stale:
+            _LOGGER.debug(
+                f"[{self.__class__.__name__}:_sync_enterprise_sessions] reusing recent or in-flight "
+                f"refresh for {factory_names}"
+            )
+        for flight in flights:
+            await asyncio.shield(flight)
+
+    async def _refresh_enterprise_factories(self, factory_names: list[str]) -> None:
         """Refresh enterprise sessions for the given factories.
 
+        Runs as the shared task started by ``_sync_enterprise_sessions``.
+        Records the refresh time of each factory whose controller answered; in
+        all cases, unregisters itself as the factory's in-flight refresh.
+
         Serialized by ``_refresh_lock`` so concurrent callers queue rather than
         duplicate work.  ``self._lock`` and ``_refresh_lock`` are never held
         simultaneously — ``self._lock`` is acquired briefly inside this method
@@ -689,60 +1034,77 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
         Phases:
             1. Snapshot state (``self._lock``, fast).
             2. Query each factory (no lock, network I/O, parallel).
-            3. Apply results (``self._lock``, fast).
+            3. Apply results (``self._lock``, fast) and start watchers for
+               factories that answered.
             4. Close stale managers (no lock).
 
         Args:
             factory_names (list[str]): Factory names to refresh.
         """
-        _LOGGER.debug(
-            f"[{self.__class__.__name__}:_sync_enterprise_sessions] waiting for _refresh_lock, factories={factory_names}"
-        )
-        async with self._refresh_lock:
+        try:
             _LOGGER.debug(
-                f"[{self.__class__.__name__}:_sync_enterprise_sessions] acquired _refresh_lock, refreshing {len(factory_names)} factory(ies): {factory_names}"
+                f"[{self.__class__.__name__}:_sync_enterprise_sessions] waiting for _refresh_lock, factories={factory_names}"
             )
-            snapshots = await self._snapshot_factory_state(factory_names)
-
-            # Factories that disappeared from the enterprise registry produce no
-            # snapshot.  Synthesize a _FactoryQueryError for each so that
-            # _apply_results removes any stale sessions they left behind.
-            snapshot_names = {s.factory_name for s in snapshots}
-            missing_errors: list[_FactoryQueryResult | _FactoryQueryError] = [
-                _FactoryQueryError(
-                    factory_name=name,
-                    new_client=None,
-                    error="factory no longer present in enterprise registry",
+            async with self._refresh_lock:
+                _LOGGER.debug(
+                    f"[{self.__class__.__name__}:_sync_enterprise_sessions] acquired _refresh_lock, refreshing {len(factory_names)} factory(ies): {factory_names}"
                 )
-                for name in factory_names
-                if name not in snapshot_names
-            ]
+                snapshots = await self._snapshot_factory_state(factory_names)
+
+                # Factories that disappeared from the enterprise registry produce no
+                # snapshot.  Synthesize a _FactoryQueryError for each so that
+                # _apply_results removes any stale sessions they left behind.
+                snapshot_names = {s.factory_name for s in snapshots}
+                missing_errors: list[_FactoryQueryResult | _FactoryQueryError] = [
+                    _FactoryQueryError(
+                        factory_name=name,
+                        new_client=None,
+                        error="factory no longer present in enterprise registry",
+                    )
+                    for name in factory_names
+                    if name not in snapshot_names
+                ]
 
-            _LOGGER.debug(
-                f"[{self.__class__.__name__}:_sync_enterprise_sessions] querying {len(snapshots)} factory(ies) in parallel"
-            )
-            t0 = time.monotonic()
-            raw = await asyncio.gather(
-                *(_fetch_factory_pqs(s) for s in snapshots),
-                return_exceptions=False,
-            )
-            _LOGGER.debug(
-                f"[{self.__class__.__name__}:_sync_enterprise_sessions] factory queries completed in {time.monotonic()-t0:.2f}s"
-            )
-            results: list[_FactoryQueryResult | _FactoryQueryError] = (
-                list(raw) + missing_errors
-            )
+                _LOGGER.debug(
+                    f"[{self.__class__.__name__}:_sync_enterprise_sessions] querying {len(snapshots)} factory(ies) in parallel"
+                )
+                t0 = time.monotonic()
+                raw = await asyncio.gather(
+                    *(_fetch_factory_pqs(s) for s in snapshots),
+                    return_exceptions=False,
+                )
+                _LOGGER.debug(
+                    f"[{self.__class__.__name__}:_sync_enterprise_sessions] factory queries completed in {time.monotonic()-t0:.2f}s"
+                )
+                results: list[_FactoryQueryResult | _FactoryQueryError] = (
+                    list(raw) + missing_errors
+                )
 
+                async with self._lock:
+                    managers_to_close = self._apply_results(results, snapshots)
+                    self._start_watchers(results)
+                    # Only factories that answered may be reused; a failed
+                    # factory is queried again by the next lookup.
+                    synced_at = time.monotonic()
+                    for result in results:
+                        if isinstance(result, _FactoryQueryResult):
+                            self._synced_at[result.factory_name] = synced_at
+                        else:
+                            self._synced_at.pop(result.factory_name, None)
+
+            for manager in managers_to_close:
+                try:
+                    await manager.close()
+                except Exception as e:
+                    _LOGGER.warning(
+                        f"[{self.__class__.__name__}] error closing stale session '{manager.full_name}': {e}"
+                    )
+        finally:
             async with self._lock:
-                managers_to_close = self._apply_results(results, snapshots)
-
-        for manager in managers_to_close:
-            try:
-                await manager.close()
-            except Exception as e:
-                _LOGGER.warning(
-                    f"[{self.__class__.__name__}] error closing stale session '{manager.full_name}': {e}"
-                )
+                current = asyncio.current_task()
+                for name in factory_names:
+                    if self._sync_flights.get(name) is current:
+                        del self._sync_flights[name]
 
     async def _snapshot_factory_state(
         self, factory_names: list[str]
@@ -767,6 +1129,8 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
         async with self._lock:
             enterprise_registry = self._enterprise_registry
             clients_snapshot = self._controller_clients.copy()
+            versions_snapshot = self._map_versions.copy()
+            verified_snapshot = self._client_verified_at.copy()
 
         if enterprise_registry is None:
             return []
@@ -782,6 +1146,8 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
                     factory_name=name,
                     factory_manager=factory_manager,
                     client=clients_snapshot.get(name),
+                    map_version=versions_snapshot.get(name),
+                    verified_at=verified_snapshot.get(name),
                 )
             )
         return snapshots
@@ -868,9 +1234,13 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
 
         Synchronous — no ``await``.  Must be called under ``self._lock``.
 
-        - Caches the live client returned by the query.
-        - Adds sessions the controller reports that we do not yet have.
-        - Removes sessions we have that the controller no longer reports.
+        - Caches the live client returned by the query, and records when it
+          was last verified if the query connected or pinged it.
+        - If the controller map did not change (``query_names`` is ``None``),
+          leaves ``_items`` untouched.
+        - Otherwise adds sessions the controller reports that we do not yet
+          have, removes sessions we have that the controller no longer reports,
+          and records the map version they were reconciled against.
         - Clears any previous error recorded for this factory.
 
         Args:
@@ -890,6 +1260,19 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
 
         # Cache the live client returned by this successful query.
         self._controller_clients[name] = result.new_client
+        if result.verified_at is not None:
+            self._client_verified_at[name] = result.verified_at
+
+        # Clear any previous error for this factory — query succeeded.
+        self._errors.pop(name, None)
+
+        if result.query_names is None:
+            return []
+
+        if result.map_version is None:
+            self._map_versions.pop(name, None)
+        else:
+            self._map_versions[name] = result.map_version
 
         # All keys currently in _items that belong to this factory.
         existing_keys = self._get_factory_keys(name)
@@ -915,9 +1298,6 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
         # Remove stale sessions and collect them for closing.
         managers_to_close = self._remove_factory_sessions_by_keys(keys_to_remove)
 
-        # Clear any previous error for this factory — query succeeded.
-        self._errors.pop(name, None)
-
         if keys_to_add:
             _LOGGER.debug(
                 f"[{self.__class__.__name__}] factory '{name}': added {len(keys_to_add)} sessions"
@@ -941,6 +1321,7 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
           created before the failure, or evicts the dead cached client so
           the next refresh creates a fresh connection.
         - Records the error in ``_errors`` for surfacing via ``get_all()``.
+        - Unmarks the factory as watched and cancels its watcher, if any.
         - Removes all sessions for the factory from ``_items``.
 
         Args:
@@ -962,10 +1343,23 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
             self._controller_clients[name] = result.new_client
         else:
             self._controller_clients.pop(name, None)
+        # Whatever client is cached must be pinged before it is trusted again.
+        self._client_verified_at.pop(name, None)
+
+        # Sessions are removed below, so the next success must reconcile fully.
+        self._map_versions.pop(name, None)
 
         # Record the error so callers can surface it via get_all().
         self._errors[name] = result.error
 
+        # A watcher only re-applies names when they change, so it would never
+        # restore the sessions removed below.  Stop it; the next successful
+        # refresh starts a new one.
+        self._watched_factories.discard(name)
+        watch_task = self._watch_tasks.pop(name, None)
+        if watch_task is not None:
+            watch_task.cancel()
+
         managers_to_close = self._remove_factory_sessions(name)
 
         _LOGGER.warning(
@@ -1020,10 +1414,184 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
 
         return managers_to_close
 
+    # ------------------------------------------------------------------
+    # Private — enterprise watchers
+    # ------------------------------------------------------------------
+
+    def _start_watchers(
+        self, results: list[_FactoryQueryResult | _FactoryQueryError]
+    ) -> None:
+        """Start a watcher for each successfully queried factory that has none.
+
+        Synchronous — no ``await``.  Must be called under ``self._lock``.
+        Does nothing when watchers are disabled or the registry is closing.
+
+        Args:
+            results: Results of the refresh that just applied.
+        """
+        if ENTERPRISE_WATCH_POLL_SECONDS <= 0 or not self._initialized:
+            return
+        for result in results:
+            if not isinstance(result, _FactoryQueryResult):
+                continue
+            name = result.factory_name
+            if name in self._watch_tasks:
+                continue
+            if self._watch_executor is None:
+                self._watch_executor = ThreadPoolExecutor(
+                    max_workers=max(1, ENTERPRISE_WATCH_MAX_THREADS),
+                    thread_name_prefix="dh-mcp-enterprise-watch",
+                )
+            self._watch_tasks[name] = asyncio.create_task(
+                self._watch_factory(name, result.new_client, self._watch_executor)
+            )
+            _LOGGER.debug(
+                f"[{self.__class__.__name__}] started enterprise watcher for factory '{name}'"
+            )
+
+    async def _stop_watchers(self, watch_tasks: list[asyncio.Task[None]]) -> None:
+        """Cancel watcher tasks and wait for them to finish.
+
+        Must be called without holding ``self._lock`` — watchers take it while
+        exiting.
+
+        Args:
+            watch_tasks (list[asyncio.Task[None]]): Watcher tasks to stop.
+        """
+        for watch_task in watch_tasks:
+            watch_task.cancel()
+        if watch_tasks:
+            await asyncio.gather(*watch_tasks, return_exceptions=True)
+            _LOGGER.info(
+                f"[{self.__class__.__name__}] stopped {len(watch_tasks)} enterprise watcher(s)"
+            )
+
+    async def _watch_factory(
+        self,
+        factory_name: str,
+        client: CorePlusControllerClient,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> None:
+        """Keep one factory's sessions current from controller map version changes.
+
+        Reads the map and its version, applies the PQ names, marks the factory
+        as watched, then blocks on ``wait_for_change_from_version``.  Version
+        changes that leave the set of PQ names unchanged (for example a PQ
+        changing state) are not applied.
+
+        On any error the factory is unmarked, its controller client is evicted
+        if it is still the cached one, and the watcher exits so the next lookup
+        falls back to a full refresh.
+
+        Args:
+            factory_name (str): Name of the enterprise factory to watch.
+            client (CorePlusControllerClient): Live controller client from the
+                refresh that started this watcher.
+            executor (ThreadPoolExecutor | None): Pool that runs the long-polls;
+                ``None`` uses the default executor.
+        """
+        try:
+            applied_names: set[str] | None = None
+            version: int | None = None
+            while True:
+                if version is None or await client.wait_for_change_from_version(
+                    version, ENTERPRISE_WATCH_POLL_SECONDS, executor=executor
+                ):
+                    query_names, version = await client.query_names_and_version(version)
+                    if query_names is not None and query_names != applied_names:
+                        if not await self._apply_watched_names(
+                            factory_name, client, query_names, version
+                        ):
+                            return
+                        applied_names = query_names
+        except Exception as e:
+            _LOGGER.warning(
+                f"[{self.__class__.__name__}] enterprise watcher for factory '{factory_name}' "
+                f"stopped: {type(e).__name__}: {e}; falling back to on-demand refresh"
+            )
+            async with self._lock:
+                if self._controller_clients.get(factory_name) is client:
+                    del self._controller_clients[factory_name]
+                    self._client_verified_at.pop(factory_name, None)
+        finally:
+            async with self._lock:
+                # Leave the mark alone if a newer watcher already replaced this one.
+                registered = self._watch_tasks.get(factory_name)
+                if registered is None or registered is asyncio.current_task():
+                    self._watched_factories.discard(factory_name)
+                    self._watch_tasks.pop(factory_name, None)
+
+    async def _apply_watched_names(
+        self,
+        factory_name: str,
+        client: CorePlusControllerClient,
+        query_names: set[str],
+        map_version: int | None = None,
+    ) -> bool:
+        """Apply the PQ names reported to a watcher and mark the factory as watched.
+
+        Takes ``_refresh_lock`` then ``self._lock``, as a refresh does, so a
+        watcher update never interleaves with a refresh of the same factory.
+
+        Args:
+            factory_name (str): Name of the watched enterprise factory.
+            client (CorePlusControllerClient): The watcher's controller client.
+            query_names (set[str]): Names of all PQs the controller reports.
+            map_version (int | None): Controller map version the names were read at.
+
+        Returns:
+            bool: ``False`` if the factory is gone or the registry is closing and
+                the watcher should stop, ``True`` otherwise.
+        """
+        async with self._refresh_lock:
+            snapshots = await self._snapshot_factory_state([factory_name])
+            if not snapshots:
+                return False
+            async with self._lock:
+                if not self._initialized:
+                    return False
+                managers_to_close = self._apply_factory_success(
+                    _FactoryQueryResult(
+                        factory_name=factory_name,
+                        new_client=client,
+                        query_names=query_names,
+                        map_version=map_version,
+                    ),
+                    snapshots[0].factory_manager,
+                )
+                self._watched_factories.add(factory_name)
+
+        for manager in managers_to_close:
+            try:
+                await manager.close()
+            except Exception as e:
+                _LOGGER.warning(
+                    f"[{self.__class__.__name__}] error closing stale session '{manager.full_name}': {e}"
+                )
+        return True
+
     # ------------------------------------------------------------------
     # Private — background discovery task
     # ------------------------------------------------------------------
 
+    async def _cancel_background_task(
+        self, task: asyncio.Task[None] | None, description: str
+    ) -> None:
+        """Cancel a background task, if still running, and wait for it to finish.
+
+        Args:
+            task (asyncio.Task[None] | None): The task to cancel, or ``None``.
+            description (str): What the task does, for the log message.
+        """
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        _LOGGER.info(f"[{self.__class__.__name__}] cancelled {description}")
+
     async def _discover_enterprise_sessions(self) -> None:
         """One-shot background task: discover enterprise sessions at startup.
 
@@ -1081,6 +1649,57 @@ class CombinedSessionRegistry(BaseRegistry[BaseItemManager]):
                 self._errors["enterprise_discovery"] = f"{type(e).__name__}: {e}"
                 self._phase = InitializationPhase.COMPLETED
 
+    async def _warm_up_community_sessions(
+        self, managers: list[BaseItemManager], max_concurrent: int
+    ) -> None:
+        """Connect community sessions ahead of their first use.
+
+        Runs as ``_warm_up_task``, independently of enterprise discovery and
+        ``_phase``.  At most *max_concurrent* sessions connect at once, and each
+        gets ``COMMUNITY_WARMUP_TIMEOUT_SECONDS``.  Failures and timeouts are
+        logged and recorded in ``_warm_up_errors`` — the session connects on
+        its first use instead.  Sets ``_warm_up_phase`` to ``COMPLETED`` when
+        done.  Never raises except ``CancelledError``.
+
+        Args:
+            managers (list[BaseItemManager]): Community session managers to connect.
+            max_concurrent (int): Maximum number of concurrent connections.
+        """
+        start = time.monotonic()
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def warm_up(manager: BaseItemManager) -> bool:
+            """Connect one session within the concurrency limit and timeout."""
+            async with semaphore:
+                try:
+                    async with asyncio.timeout(COMMUNITY_WARMUP_TIMEOUT_SECONDS):
+                        await manager.get()
+                    return True
+                except TimeoutError:
+                    error = f"timed out after {COMMUNITY_WARMUP_TIMEOUT_SECONDS}s"
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+            _LOGGER.warning(
+                f"[{self.__class__.__name__}] warm-up of community session "
+                f"'{manager.full_name}' failed: {error}"
+            )
+            async with self._lock:
+                self._warm_up_errors[manager.full_name] = error
+            return False
+
+        if managers:
+            _LOGGER.info(
+                f"[{self.__class__.__name__}] warming up {len(managers)} community sessions "
+                f"(max_concurrent={max_concurrent})"
+            )
+            connected = await asyncio.gather(*(warm_up(mgr) for mgr in managers))
+            _LOGGER.info(
+                f"[{self.__class__.__name__}] warmed up {sum(connected)}/{len(managers)} "
+                f"community sessions in {time.monotonic() - start:.2f}s"
+            )
+        async with self._lock:
+            self._warm_up_phase = InitializationPhase.COMPLETED
+
     # ------------------------------------------------------------------
     # Private — error message helper
     # ------------------------------------------------------------------
@@ -1,6 +1,8 @@
 import asyncio
 import sys
+import threading
 import types
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -1085,6 +1087,84 @@ async def test_map_and_version_other_error(
     assert "Failed to retrieve query state with version" in str(exc_info.value)
 
 
+# --- query_names_and_version() tests ---
+
+
+@pytest.mark.asyncio
+async def test_query_names_and_version_reads_raw_names(
+    coreplus_controller_client, dummy_controller_client
+):
+    coreplus_controller_client._subscribed = True
+    info_a, info_b = MagicMock(), MagicMock()
+    info_a.config.name = "a"
+    info_b.config.name = "b"
+    dummy_controller_client.map_and_version.return_value = ({1: info_a, 2: info_b}, 7)
+
+    with patch("deephaven_mcp.client._controller_client.CorePlusQueryInfo") as wrapper:
+        names, version = await coreplus_controller_client.query_names_and_version(3)
+
+    assert names == {"a", "b"}
+    assert version == 7
+    wrapper.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_query_names_and_version_unchanged_skips_map(
+    coreplus_controller_client, dummy_controller_client
+):
+    """An unchanged version returns no names and never touches the map's values."""
+    coreplus_controller_client._subscribed = True
+    raw_map = MagicMock()
+    dummy_controller_client.map_and_version.return_value = (raw_map, 7)
+
+    with patch("deephaven_mcp.client._controller_client.CorePlusQueryInfo") as wrapper:
+        result = await coreplus_controller_client.query_names_and_version(7)
+
+    assert result == (None, 7)
+    raw_map.values.assert_not_called()
+    raw_map.items.assert_not_called()
+    wrapper.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_query_names_and_version_not_subscribed(coreplus_controller_client):
+    from deephaven_mcp._exceptions import InternalError
+
+    coreplus_controller_client._subscribed = False
+
+    with pytest.raises(InternalError) as exc_info:
+        await coreplus_controller_client.query_names_and_version()
+    assert "subscribe() must be called before query_names_and_version()" in str(
+        exc_info.value
+    )
+
+
+@pytest.mark.asyncio
+async def test_query_names_and_version_connection_error(
+    coreplus_controller_client, dummy_controller_client
+):
+    coreplus_controller_client._subscribed = True
+    dummy_controller_client.map_and_version.side_effect = ConnectionError(
+        "connection failed"
+    )
+
+    with pytest.raises(DeephavenConnectionError) as exc_info:
+        await coreplus_controller_client.query_names_and_version()
+    assert "Unable to connect to controller service" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_query_names_and_version_other_error(
+    coreplus_controller_client, dummy_controller_client
+):
+    coreplus_controller_client._subscribed = True
+    dummy_controller_client.map_and_version.side_effect = Exception("unexpected error")
+
+    with pytest.raises(QueryError) as exc_info:
+        await coreplus_controller_client.query_names_and_version()
+    assert "Failed to retrieve query names with version" in str(exc_info.value)
+
+
 # --- wait_for_change_from_version() tests ---
 
 
@@ -1116,6 +1196,28 @@ async def test_wait_for_change_from_version_timeout(
     )
 
 
+@pytest.mark.asyncio
+async def test_wait_for_change_from_version_uses_given_executor(
+    coreplus_controller_client, dummy_controller_client
+):
+    dummy_controller_client.wait_for_change_from_version.return_value = True
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="watch-test") as pool:
+        dummy_controller_client.wait_for_change_from_version.side_effect = (
+            lambda version, timeout: threading.current_thread().name.startswith(
+                "watch-test"
+            )
+        )
+        result = await coreplus_controller_client.wait_for_change_from_version(
+            42, 10.0, executor=pool
+        )
+
+    assert result is True
+    dummy_controller_client.wait_for_change_from_version.assert_called_once_with(
+        42, 10.0
+    )
+
+
 @pytest.mark.asyncio
 async def test_wait_for_change_from_version_connection_error(
     coreplus_controller_client, dummy_controller_client
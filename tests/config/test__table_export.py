@@ -0,0 +1,67 @@
+"""Unit tests for the table_export configuration validation."""
+
+import pytest
+
+from deephaven_mcp._exceptions import ConfigurationError
+from deephaven_mcp.config._table_export import (
+    DEFAULT_EXPORT_BATCH_ROWS,
+    validate_table_export_config,
+)
+
+
+def test_default_export_batch_rows_is_positive():
+    assert DEFAULT_EXPORT_BATCH_ROWS > 0
+
+
+def test_validate_table_export_config_directory_only():
+    validate_table_export_config({"directory": "/tmp/exports"})
+
+
+def test_validate_table_export_config_with_batch_rows():
+    validate_table_export_config({"directory": "/tmp/exports", "batch_rows": 5000})
+
+
+@pytest.mark.parametrize("value", [None, [], "dir"])
+def test_validate_table_export_config_not_dict(value):
+    with pytest.raises(ConfigurationError, match="must be a dictionary"):
+        validate_table_export_config(value)
+
+
+def test_validate_table_export_config_unknown_field():
+    with pytest.raises(ConfigurationError, match=r"Unknown field\(s\).*'compression'"):
+        validate_table_export_config({"directory": "/tmp", "compression": "zstd"})
+
+
+def test_validate_table_export_config_missing_directory():
+    with pytest.raises(
+        ConfigurationError, match="'table_export.directory' is required"
+    ):
+        validate_table_export_config({"batch_rows": 10})
+
+
+@pytest.mark.parametrize(
+    "config, field",
+    [
+        ({"directory": 42}, "directory"),
+        ({"directory": "/tmp", "batch_rows": "10"}, "batch_rows"),
+        ({"directory": "/tmp", "batch_rows": 1.5}, "batch_rows"),
+        ({"directory": "/tmp", "batch_rows": True}, "batch_rows"),
+    ],
+)
+def test_validate_table_export_config_wrong_type(config, field):
+    with pytest.raises(
+        ConfigurationError, match=f"'table_export.{field}' must be of type"
+    ):
+        validate_table_export_config(config)
+
+
+@pytest.mark.parametrize("directory", ["", "   "])
+def test_validate_table_export_config_empty_directory(directory):
+    with pytest.raises(ConfigurationError, match="must not be empty"):
+        validate_table_export_config({"directory": directory})
+
+
+@pytest.mark.parametrize("batch_rows", [0, -5])
+def test_validate_table_export_config_non_positive_batch_rows(batch_rows):
+    with pytest.raises(ConfigurationError, match="must be a positive integer"):
+        validate_table_export_config({"directory": "/tmp", "batch_rows": batch_rows})
@@ -114,6 +114,16 @@ def test_validate_config_rejects_unknown_top_level():
         validate_config({"foo": {}})
 
 
+def test_validate_config_accepts_table_export():
+    cfg = {"table_export": {"directory": "/tmp/exports", "batch_rows": 1000}}
+    assert validate_config(cfg) == cfg
+
+
+def test_validate_config_rejects_invalid_table_export():
+    with pytest.raises(ConfigurationError, match="table_export"):
+        validate_config({"table_export": {"batch_rows": 1000}})
+
+
 # --- Community session validation ---
 from deephaven_mcp.config._community_session import (
     redact_community_session_config,
@@ -0,0 +1,73 @@
+"""Tests for formatters/_arrow.py - base64 Arrow IPC stream formatters."""
+
+import base64
+import datetime
+import decimal
+
+import pyarrow as pa
+import pytest
+
+from deephaven_mcp.formatters._arrow import (
+    format_arrow_ipc,
+    format_arrow_ipc_lz4,
+    format_arrow_ipc_zstd,
+)
+
+FORMATTERS = [format_arrow_ipc, format_arrow_ipc_lz4, format_arrow_ipc_zstd]
+
+
+def _decode(data: str) -> pa.Table:
+    """Decode a base64 Arrow IPC stream back into a table."""
+    return pa.ipc.open_stream(base64.b64decode(data)).read_all()
+
+
+def _typed_table() -> pa.Table:
+    """Build a table whose types do not survive text formats."""
+    return pa.table(
+        {
+            "ts": pa.array(
+                [datetime.datetime(2024, 1, 1, 9, 30), None], pa.timestamp("ns")
+            ),
+            "px": pa.array(
+                [decimal.Decimal("1.25"), decimal.Decimal("-3.50")],
+                pa.decimal128(10, 2),
+            ),
+            "sym": pa.array(["AAPL", "AAPL"]).dictionary_encode(),
+            "tags": pa.array([["a", "b"], []], pa.list_(pa.string())),
+            "f": pa.array([1.5, None], pa.float32()),
+        }
+    )
+
+
+@pytest.mark.parametrize("formatter", FORMATTERS)
+def test_format_arrow_ipc_round_trips_types(formatter):
+    """Test that decoding the payload returns an identical table, types included."""
+    table = _typed_table()
+
+    result = formatter(table)
+
+    assert isinstance(result, str)
+    decoded = _decode(result)
+    assert decoded.schema == table.schema
+    assert decoded.equals(table)
+
+
+@pytest.mark.parametrize("formatter", FORMATTERS)
+def test_format_arrow_ipc_empty_table(formatter):
+    """Test that an empty table round-trips with its schema."""
+    table = pa.table({"id": pa.array([], pa.int64())})
+
+    decoded = _decode(formatter(table))
+
+    assert decoded.schema == table.schema
+    assert decoded.num_rows == 0
+
+
+def test_format_arrow_ipc_compression():
+    """Test that compressed variants are smaller for repetitive data."""
+    table = pa.table({"s": ["repeated value"] * 5000, "i": [7] * 5000})
+
+    plain = len(format_arrow_ipc(table))
+
+    assert len(format_arrow_ipc_lz4(table)) < plain
+    assert len(format_arrow_ipc_zstd(table)) < plain
@@ -0,0 +1,156 @@
+"""Tests for formatters/_estimate.py - formatted size estimation."""
+
+import datetime
+import json
+
+import pyarrow as pa
+import pytest
+
+from deephaven_mcp.formatters import _FORMATTERS
+from deephaven_mcp.formatters._arrow import _ARROW_IPC_FORMATS
+from deephaven_mcp.formatters._estimate import (
+    _SAMPLE_ROWS,
+    _average_value_lengths,
+    _estimate_formatted_size,
+    _estimate_max_rows,
+)
+
+_COMPRESSED_FORMATS = {"arrow-ipc-lz4", "arrow-ipc-zstd"}
+
+
+def _actual_size(data: object) -> int:
+    """Measure a formatter result the way the estimator models it."""
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    return len(json.dumps(data, default=str).encode("utf-8"))
+
+
+def _realistic_table(rows: int) -> pa.Table:
+    """Build a table mixing strings, numbers, booleans, timestamps and nulls."""
+    return pa.table(
+        {
+            "Sym": [["AAPL", "MSFT", "GOOG", None][i % 4] for i in range(rows)],
+            "Price": [i * 1.37 for i in range(rows)],
+            "Size": [i * 7 for i in range(rows)],
+            "Flag": [i % 2 == 0 for i in range(rows)],
+            "Ts": [
+                datetime.datetime(2024, 1, 1) + datetime.timedelta(seconds=i)
+                for i in range(rows)
+            ],
+            "Note": [None if i % 3 == 0 else "x" * (i % 40) for i in range(rows)],
+            "Cat": pa.array(
+                [["a", "bb"][i % 2] for i in range(rows)]
+            ).dictionary_encode(),
+        }
+    )
+
+
+def test_average_value_lengths_measures_sample():
+    """Test per-column average lengths, null fractions and string detection."""
+    table = pa.table(
+        {
+            "s": ["ab", "abcd", None, None],
+            "i": [1, 22, 333, 4444],
+            "d": pa.array(["xyz", "xyz", "xyz", "xyz"]).dictionary_encode(),
+            "n": pa.array([None] * 4),
+        }
+    )
+
+    stats = _average_value_lengths(table)
+
+    assert stats[0] == (3.0, 0.5, True)
+    assert stats[1] == (2.5, 0.0, False)
+    assert stats[2] == (3.0, 0.0, True)
+    assert stats[3] == (0.0, 1.0, False)
+
+
+def test_average_value_lengths_samples_bounded_rows():
+    """Test that only a bounded number of evenly spaced rows are sampled."""
+    rows = _SAMPLE_ROWS * 10
+    # Only every 10th value is long; an evenly spaced sample sees exactly those
+    table = pa.table({"s": ["x" * 10 if i % 10 == 0 else "x" for i in range(rows)]})
+
+    ((average, null_fraction, is_string),) = _average_value_lengths(table)
+
+    assert average == 10.0
+    assert null_fraction == 0.0
+    assert is_string is True
+
+
+def test_average_value_lengths_empty_table():
+    """Test that an empty table yields zero lengths without errors."""
+    table = pa.table({"s": pa.array([], pa.string())})
+
+    assert _average_value_lengths(table) == [(0.0, 0.0, True)]
+
+
+@pytest.mark.parametrize("fmt", sorted(set(_FORMATTERS) - _COMPRESSED_FORMATS))
+def test_estimate_formatted_size_close_to_actual(fmt):
+    """Test that estimates are within 25% of the real formatted size."""
+    table = _realistic_table(2000)
+
+    estimate = _estimate_formatted_size(table, fmt, None)
+    actual = _actual_size(_FORMATTERS[fmt](table))
+
+    assert abs(estimate - actual) / actual < 0.25
+
+
+@pytest.mark.parametrize("fmt", sorted(set(_FORMATTERS) - _ARROW_IPC_FORMATS))
+def test_estimate_formatted_size_empty_table_is_overhead(fmt):
+    """Test that an empty table estimate stays small (fixed overhead only)."""
+    table = _realistic_table(0)
+
+    assert 0 <= _estimate_formatted_size(table, fmt, None) < 200
+
+
+@pytest.mark.parametrize("rows", [0, 2000])
+@pytest.mark.parametrize("fmt", sorted(_ARROW_IPC_FORMATS))
+def test_estimate_formatted_size_arrow_ipc_is_upper_bound(fmt, rows):
+    """Test that Arrow IPC estimates bound the real (possibly compressed) size."""
+    table = _realistic_table(rows)
+
+    estimate = _estimate_formatted_size(table, fmt, None)
+    actual = _actual_size(_FORMATTERS[fmt](table))
+
+    assert actual <= estimate
+    if fmt == "arrow-ipc":
+        assert estimate - actual < 0.05 * actual + 2000
+
+
+def test_estimate_formatted_size_extrapolates_row_count():
+    """Test that row_count extrapolates linearly from a probe table."""
+    probe = _realistic_table(100)
+
+    small = _estimate_formatted_size(probe, "csv", 1_000)
+    large = _estimate_formatted_size(probe, "csv", 101_000)
+
+    assert large - small == pytest.approx(
+        100 * (small - _estimate_formatted_size(probe, "csv", 0)), rel=0.01
+    )
+
+
+def test_estimate_formatted_size_no_columns():
+    """Test estimation for a table without columns."""
+    table = pa.table({"id": [1, 2]}).select([])
+
+    assert _estimate_formatted_size(table, "markdown-table", None) > 0
+
+
+@pytest.mark.parametrize("fmt", sorted(_FORMATTERS))
+def test_estimate_max_rows_inverts_size(fmt):
+    """Test that the estimated row count fits the budget under the same model."""
+    table = _realistic_table(500)
+    budget = 20_000
+
+    rows = _estimate_max_rows(table, fmt, budget)
+
+    assert rows > 0
+    assert _estimate_formatted_size(table, fmt, rows) <= budget
+    assert _estimate_formatted_size(table, fmt, rows + 1) > budget
+
+
+def test_estimate_max_rows_budget_below_overhead():
+    """Test that a budget smaller than the fixed overhead fits no rows."""
+    table = _realistic_table(10)
+
+    assert _estimate_max_rows(table, "xml", 10) == 0
@@ -1,8 +1,55 @@
 """Tests for formatters/_markdown.py - Markdown formatters with escaping tests."""
 
+import datetime
+import decimal
+
 import pyarrow as pa
 
-from deephaven_mcp.formatters._markdown import format_markdown_kv, format_markdown_table
+from deephaven_mcp.formatters._markdown import (
+    _to_str_array,
+    format_markdown_kv,
+    format_markdown_table,
+)
+
+
+def _mixed_type_table() -> pa.Table:
+    """Build a table covering vectorized and fallback string conversions."""
+    return pa.table(
+        {
+            "s": ["a|b", "é|ü", None, ""],
+            "i8": pa.array([1, -2, None, 127], pa.int8()),
+            "u64": pa.array([2**64 - 1, 0, None, 1], pa.uint64()),
+            "b": [True, False, None, True],
+            "f": [1.0, 1e20, None, -0.0],
+            "ts": [
+                datetime.datetime(2024, 1, 1),
+                None,
+                datetime.datetime(2024, 1, 1, 1, 2, 3, 4),
+                datetime.datetime(2024, 1, 1),
+            ],
+            "d": pa.array(["a", "b", None, "a"]).dictionary_encode(),
+            "n": pa.array([None] * 4),
+            "l": [[1, 2], None, [], [None]],
+            "dec": [decimal.Decimal("1.50"), None, decimal.Decimal("2"), None],
+        }
+    )
+
+
+# === String Conversion Tests ===
+
+
+def test_to_str_array_matches_python_str():
+    """Test that vectorized string conversion matches str() of Python values."""
+    table = _mixed_type_table()
+
+    for column in table.columns:
+        array = column.combine_chunks()
+        result = _to_str_array(array)
+
+        assert result.type == pa.large_string()
+        assert result.null_count == 0
+        assert result.to_pylist() == [str(value) for value in array.to_pylist()]
+
 
 # === Markdown Table Tests ===
 
@@ -96,6 +143,45 @@ def test_format_markdown_table_special_characters():
     assert "With * asterisk" in result
 
 
+def test_format_markdown_table_mixed_types_match_str():
+    """Test that markdown table cells match str() of each value across types."""
+    table = _mixed_type_table()
+
+    result = format_markdown_table(table)
+
+    lines = result.split("\n")
+    assert len(lines) == 2 + table.num_rows
+    for line, row in zip(lines[2:], table.to_pylist(), strict=True):
+        cells = [str(row[col]).replace("|", "\\|") for col in table.column_names]
+        assert line == "| " + " | ".join(cells) + " |"
+
+
+def test_format_markdown_table_multiple_batches():
+    """Test that markdown table rows from multiple record batches are all included."""
+    part = pa.table({"id": [1, 2], "name": ["Alice", "Bob"]})
+    table = pa.concat_tables([part, part.slice(1, 1)])
+    assert len(table.to_batches()) == 2
+
+    result = format_markdown_table(table)
+
+    assert result == (
+        "| id | name |\n"
+        "| --- | --- |\n"
+        "| 1 | Alice |\n"
+        "| 2 | Bob |\n"
+        "| 2 | Bob |"
+    )
+
+
+def test_format_markdown_table_no_columns():
+    """Test markdown table with rows but no columns."""
+    table = pa.table({"id": [1, 2]}).select([])
+
+    result = format_markdown_table(table)
+
+    assert result == "|  |\n|  |\n|  |\n|  |"
+
+
 # === Markdown Key-Value Tests ===
 
 
@@ -231,3 +317,32 @@ def test_format_markdown_kv_column_order():
     city_pos = result.find("city:")
 
     assert id_pos < name_pos < age_pos < city_pos
+
+
+def test_format_markdown_kv_mixed_types_match_str():
+    """Test that markdown key-value values match str() of each value across types."""
+    table = _mixed_type_table()
+
+    result = format_markdown_kv(table)
+
+    expected = []
+    for idx, row in enumerate(table.to_pylist(), start=1):
+        lines = [f"## Record {idx}"]
+        for col in table.column_names:
+            lines.append(f"{col}: " + str(row[col]).replace(":", "\\:"))
+        expected.append("\n".join(lines))
+    assert result == "\n\n".join(expected)
+
+
+def test_format_markdown_kv_multiple_batches():
+    """Test that markdown key-value numbering continues across record batches."""
+    part = pa.table({"id": [1, 2], "name": ["Alice", "Bob"]})
+    table = pa.concat_tables([part, part.slice(0, 0), part.slice(1, 1)])
+
+    result = format_markdown_kv(table)
+
+    assert result == (
+        "## Record 1\nid: 1\nname: Alice\n\n"
+        "## Record 2\nid: 2\nname: Bob\n\n"
+        "## Record 3\nid: 2\nname: Bob"
+    )
@@ -0,0 +1,259 @@
+"""Tests for formatters/_stream.py - streaming chunk assembly and budget enforcement."""
+
+import pyarrow as pa
+import pytest
+
+from deephaven_mcp.formatters import _FORMATTERS
+from deephaven_mcp.formatters._arrow import _ARROW_IPC_FORMATS
+from deephaven_mcp.formatters._stream import (
+    _STREAM_SPECS,
+    ESTIMATED_BYTES_PER_TOKEN,
+    FormattedChunk,
+    _budget_bytes,
+    _data_size,
+    _iter_chunks,
+    _iter_single_chunk,
+    _rows_that_fit,
+    join_formatted_chunks,
+)
+
+
+def _multi_batch_table() -> pa.Table:
+    """Build a table split across several record batches, including an empty one."""
+    part = pa.table(
+        {
+            "id": [1, 2, 3],
+            "name": ["Alice", "Bob|Builder", "Charlie: C"],
+            "score": [1.5, None, 3.25],
+        }
+    )
+    return pa.concat_tables([part, part.slice(0, 0), part.slice(1, 2), part])
+
+
+def _stream(table: pa.Table, fmt: str, budget: int | None) -> list[FormattedChunk]:
+    """Stream a table in a concrete format with the given byte budget."""
+    empty_payload = _FORMATTERS[fmt](table.schema.empty_table())
+    return list(_iter_chunks(table, fmt, empty_payload, budget))
+
+
+# === Stream spec registry ===
+
+
+def test_stream_specs_cover_all_text_formatters():
+    """Test that every concrete format except the binary Arrow IPC ones can be streamed."""
+    assert set(_STREAM_SPECS) == set(_FORMATTERS) - _ARROW_IPC_FORMATS
+
+
+# === _data_size ===
+
+
+def test_data_size_text_is_utf8_length():
+    """Test that text fragments are measured in UTF-8 bytes."""
+    assert _data_size("abc") == 3
+    assert _data_size("é") == 2
+
+
+def test_data_size_objects_use_json_length():
+    """Test that JSON object fragments are measured by their serialized size."""
+    assert _data_size([{"a": 1}]) == len('[{"a": 1}]')
+
+
+# === _budget_bytes ===
+
+
+def test_budget_bytes_unbounded():
+    """Test that no budgets means no limit."""
+    assert _budget_bytes(None, None) is None
+
+
+def test_budget_bytes_tokens_converted():
+    """Test that token budgets are converted to bytes."""
+    assert _budget_bytes(None, 10) == 10 * ESTIMATED_BYTES_PER_TOKEN
+
+
+def test_budget_bytes_tighter_budget_wins():
+    """Test that the smaller of the byte and token budgets applies."""
+    assert _budget_bytes(100, 10) == min(100, 10 * ESTIMATED_BYTES_PER_TOKEN)
+    assert _budget_bytes(10, 100) == 10
+
+
+@pytest.mark.parametrize("max_bytes,max_tokens", [(-1, None), (None, -1)])
+def test_budget_bytes_negative_rejected(max_bytes, max_tokens):
+    """Test that negative budgets raise ValueError."""
+    with pytest.raises(ValueError, match="must be non-negative"):
+        _budget_bytes(max_bytes, max_tokens)
+
+
+# === _rows_that_fit ===
+
+
+def test_rows_that_fit_finds_longest_prefix():
+    """Test that the binary search returns the longest slice within budget."""
+    spec = _STREAM_SPECS["csv"]
+    batch = pa.record_batch({"id": list(range(10, 20))})
+
+    rows, data = _rows_that_fit(spec, batch, 0, len("10\n11\n12\n") + 1)
+
+    assert rows == 3
+    assert data == "10\n11\n12\n"
+
+
+def test_rows_that_fit_none_fit():
+    """Test that zero rows are reported when even one row exceeds the budget."""
+    spec = _STREAM_SPECS["csv"]
+    batch = pa.record_batch({"id": list(range(10, 20))})
+
+    assert _rows_that_fit(spec, batch, 0, 1) == (0, None)
+
+
+# === _iter_chunks ===
+
+
+@pytest.mark.parametrize("fmt", sorted(_STREAM_SPECS))
+def test_iter_chunks_unbounded_matches_formatter(fmt):
+    """Test that joined chunks equal the whole-table formatter output."""
+    table = _multi_batch_table()
+
+    chunks = _stream(table, fmt, None)
+
+    assert len(chunks) == 3  # one chunk per non-empty batch
+    assert [c.row_offset for c in chunks] == [0, 3, 5]
+    assert not any(c.truncated for c in chunks)
+    assert join_formatted_chunks(chunks) == (
+        fmt,
+        _FORMATTERS[fmt](table),
+        table.num_rows,
+        False,
+    )
+
+
+@pytest.mark.parametrize("fmt", sorted(_STREAM_SPECS))
+@pytest.mark.parametrize("budget", [0, 60, 150, 250, 400])
+def test_iter_chunks_budget_truncates_at_row_boundary(fmt, budget):
+    """Test that truncated output equals formatting only the emitted rows."""
+    table = _multi_batch_table()
+
+    chunks = _stream(table, fmt, budget)
+    actual_format, data, row_count, truncated = join_formatted_chunks(chunks)
+
+    assert actual_format == fmt
+    assert data == _FORMATTERS[fmt](table.slice(0, row_count))
+    assert truncated == (row_count < table.num_rows)
+    if row_count:
+        assert chunks[-1].bytes_emitted <= budget
+
+
+@pytest.mark.parametrize("fmt", ["csv", "markdown-table", "markdown-kv", "yaml", "xml"])
+def test_iter_chunks_text_bytes_emitted_exact(fmt):
+    """Test that bytes_emitted is the exact cumulative UTF-8 size for text formats."""
+    table = _multi_batch_table()
+
+    chunks = _stream(table, fmt, None)
+
+    total = 0
+    for chunk in chunks:
+        total += _data_size(chunk.data)
+        assert chunk.bytes_emitted == total
+
+
+def test_iter_chunks_empty_table_yields_empty_payload():
+    """Test that an empty table yields a single chunk with the empty payload."""
+    table = pa.table({"id": pa.array([], pa.int64())})
+
+    chunks = _stream(table, "xml", None)
+
+    assert chunks == [
+        FormattedChunk(
+            format="xml",
+            data=_FORMATTERS["xml"](table),
+            row_offset=0,
+            row_count=0,
+            bytes_emitted=_data_size(_FORMATTERS["xml"](table)),
+            truncated=False,
+        )
+    ]
+
+
+def test_iter_chunks_nothing_fits_reports_truncation():
+    """Test that a budget too small for one row yields the empty payload, truncated."""
+    table = _multi_batch_table()
+
+    chunks = _stream(table, "markdown-table", 5)
+
+    assert len(chunks) == 1
+    assert chunks[0].row_count == 0
+    assert chunks[0].truncated is True
+    assert chunks[0].data == _FORMATTERS["markdown-table"](table.slice(0, 0))
+
+
+# === join_formatted_chunks ===
+
+
+def test_join_formatted_chunks_json_column_merges_columns():
+    """Test that json-column chunks are merged column by column."""
+    chunks = [
+        FormattedChunk("json-column", {"a": [1], "b": ["x"]}, 0, 1, 10),
+        FormattedChunk("json-column", {"a": [2], "b": ["y"]}, 1, 1, 20, True),
+    ]
+
+    assert join_formatted_chunks(chunks) == (
+        "json-column",
+        {"a": [1, 2], "b": ["x", "y"]},
+        2,
+        True,
+    )
+
+
+def test_join_formatted_chunks_requires_chunks():
+    """Test that joining no chunks raises ValueError."""
+    with pytest.raises(ValueError, match="at least one chunk"):
+        join_formatted_chunks([])
+
+
+# === _iter_single_chunk ===
+
+
+@pytest.mark.parametrize("fmt", sorted(_ARROW_IPC_FORMATS))
+def test_iter_single_chunk_unbounded(fmt):
+    """Test that a binary format is yielded whole as one chunk."""
+    table = _multi_batch_table()
+
+    chunks = list(_iter_single_chunk(table, fmt, _FORMATTERS[fmt], None))
+
+    assert chunks == [
+        FormattedChunk(
+            format=fmt,
+            data=_FORMATTERS[fmt](table),
+            row_offset=0,
+            row_count=table.num_rows,
+            bytes_emitted=_data_size(_FORMATTERS[fmt](table)),
+        )
+    ]
+
+
+@pytest.mark.parametrize("fmt", sorted(_ARROW_IPC_FORMATS))
+def test_iter_single_chunk_budget_keeps_longest_prefix(fmt):
+    """Test that the budget keeps the longest leading slice whose payload fits."""
+    table = pa.table({"id": list(range(1000)), "name": [f"n{i}" for i in range(1000)]})
+    formatter = _FORMATTERS[fmt]
+    budget = _data_size(formatter(table.slice(0, 400)))
+
+    (chunk,) = _iter_single_chunk(table, fmt, formatter, budget)
+
+    assert chunk.truncated is True
+    assert chunk.data == formatter(table.slice(0, chunk.row_count))
+    assert chunk.bytes_emitted <= budget
+    assert _data_size(formatter(table.slice(0, chunk.row_count + 1))) > budget
+    assert chunk.row_count >= 400
+
+
+def test_iter_single_chunk_nothing_fits():
+    """Test that a budget below the schema size yields the empty-table payload."""
+    table = _multi_batch_table()
+    formatter = _FORMATTERS["arrow-ipc"]
+
+    (chunk,) = _iter_single_chunk(table, "arrow-ipc", formatter, 0)
+
+    assert chunk.data == formatter(table.slice(0, 0))
+    assert chunk.row_count == 0
+    assert chunk.truncated is True
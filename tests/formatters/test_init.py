@@ -1,9 +1,20 @@
 """Tests for formatters/__init__.py - format_table_data() and optimization strategies."""
 
+import base64
+
 import pyarrow as pa
 import pytest
 
-from deephaven_mcp.formatters import VALID_FORMATS, _resolve_format, format_table_data
+from deephaven_mcp.formatters import (
+    VALID_FORMATS,
+    _resolve_format,
+    estimate_formatted_size,
+    estimate_max_rows,
+    format_table_data,
+    format_table_data_iter,
+    join_formatted_chunks,
+    resolve_byte_budget,
+)
 
 
 # Helper to create test tables
@@ -28,6 +39,7 @@ def test_valid_formats_contains_all_expected():
         "optimize-accuracy",
         "optimize-cost",
         "optimize-speed",
+        "optimize-throughput",
         "json-row",
         "json-column",
         "csv",
@@ -35,6 +47,9 @@ def test_valid_formats_contains_all_expected():
         "markdown-kv",
         "yaml",
         "xml",
+        "arrow-ipc",
+        "arrow-ipc-lz4",
+        "arrow-ipc-zstd",
     }
     assert VALID_FORMATS == expected
 
@@ -70,6 +85,13 @@ def test_resolve_format_optimize_speed():
     assert reason == "optimize-speed strategy"
 
 
+def test_resolve_format_optimize_throughput():
+    """Test _resolve_format with optimize-throughput strategy."""
+    actual_format, reason = _resolve_format("optimize-throughput")
+    assert actual_format == "arrow-ipc-lz4"
+    assert reason == "optimize-throughput strategy"
+
+
 def test_resolve_format_explicit_json_row():
     """Test _resolve_format with explicit json-row format."""
     actual_format, reason = _resolve_format("json-row")
@@ -155,6 +177,16 @@ def test_optimize_speed_always_json_column():
     assert actual_format == "json-column"
 
 
+def test_optimize_throughput_round_trips_arrow():
+    """Test optimize-throughput returns a base64 Arrow IPC stream of the table."""
+    table = create_test_table(100)
+
+    actual_format, data = format_table_data(table, "optimize-throughput")
+
+    assert actual_format == "arrow-ipc-lz4"
+    assert pa.ipc.open_stream(base64.b64decode(data)).read_all().equals(table)
+
+
 # === Explicit format tests ===
 
 
@@ -324,3 +356,141 @@ def test_optimize_rendering_with_zero_rows():
 
     actual_format, data = format_table_data(empty_table, "optimize-rendering")
     assert actual_format == "markdown-table"  # Should use markdown-table
+
+
+# === format_table_data_iter() tests ===
+
+
+@pytest.mark.parametrize("format_type", sorted(VALID_FORMATS))
+def test_format_table_data_iter_matches_format_table_data(format_type):
+    """Test that streamed output equals format_table_data() for every format."""
+    table = pa.concat_tables([create_test_table(5), create_test_table(3)])
+
+    chunks = list(format_table_data_iter(table, format_type))
+
+    assert join_formatted_chunks(chunks) == (
+        *format_table_data(table, format_type),
+        8,
+        False,
+    )
+
+
+def test_format_table_data_iter_max_bytes_truncates():
+    """Test that a byte budget stops the stream and reports where it stopped."""
+    table = create_test_table(100)
+
+    chunks = list(format_table_data_iter(table, "csv", max_bytes=200))
+    actual_format, data, row_count, truncated = join_formatted_chunks(chunks)
+
+    assert actual_format == "csv"
+    assert truncated is True
+    assert 0 < row_count < 100
+    assert len(data.encode("utf-8")) <= 200
+    assert data == format_table_data(table.slice(0, row_count), "csv")[1]
+
+
+def test_format_table_data_iter_max_tokens_truncates():
+    """Test that a token budget is converted to bytes and applied."""
+    table = create_test_table(100)
+
+    by_tokens = list(format_table_data_iter(table, "markdown-kv", max_tokens=50))
+    by_bytes = list(format_table_data_iter(table, "markdown-kv", max_bytes=200))
+
+    assert by_tokens == by_bytes
+    assert by_tokens[-1].truncated is True
+
+
+def test_format_table_data_iter_budget_not_reached():
+    """Test that a generous budget returns the complete payload."""
+    table = create_test_table(10)
+
+    chunks = list(format_table_data_iter(table, "json-row", max_bytes=1_000_000))
+
+    assert chunks[-1].truncated is False
+    assert join_formatted_chunks(chunks)[1] == table.to_pylist()
+
+
+def test_format_table_data_iter_invalid_format():
+    """Test that an invalid format raises ValueError on first iteration."""
+    stream = format_table_data_iter(create_test_table(1), "invalid-format")
+
+    with pytest.raises(ValueError, match="Invalid format 'invalid-format'"):
+        next(stream)
+
+
+def test_format_table_data_iter_negative_budget():
+    """Test that a negative budget raises ValueError on first iteration."""
+    stream = format_table_data_iter(create_test_table(1), "csv", max_tokens=-5)
+
+    with pytest.raises(ValueError, match="max_tokens must be non-negative"):
+        next(stream)
+
+
+# === estimate_formatted_size() / estimate_max_rows() tests ===
+
+
+def test_estimate_formatted_size_resolves_strategy():
+    """Test that optimization strategies are resolved before estimating."""
+    table = create_test_table(50)
+
+    assert estimate_formatted_size(table, "optimize-cost") == estimate_formatted_size(
+        table, "csv"
+    )
+
+
+def test_estimate_formatted_size_row_count():
+    """Test that row_count overrides the table's row count."""
+    table = create_test_table(10)
+
+    assert estimate_formatted_size(table, "csv", row_count=1000) > (
+        estimate_formatted_size(table, "csv")
+    )
+
+
+def test_estimate_max_rows_resolves_strategy():
+    """Test that estimate_max_rows resolves strategies and applies the budget."""
+    table = create_test_table(50)
+
+    rows = estimate_max_rows(table, "optimize-accuracy", 5_000)
+
+    assert rows == estimate_max_rows(table, "markdown-kv", 5_000)
+    assert estimate_formatted_size(table, "markdown-kv", row_count=rows) <= 5_000
+
+
+@pytest.mark.parametrize("func", [estimate_formatted_size, estimate_max_rows])
+def test_estimate_functions_reject_invalid_format(func):
+    """Test that the estimators validate format names."""
+    args = (1000,) if func is estimate_max_rows else ()
+
+    with pytest.raises(ValueError, match="Invalid format 'bogus'"):
+        func(create_test_table(1), "bogus", *args)
+
+
+def test_resolve_byte_budget():
+    """Test resolve_byte_budget converts tokens and picks the tighter budget."""
+    assert resolve_byte_budget() is None
+    assert resolve_byte_budget(max_bytes=500) == 500
+    assert resolve_byte_budget(max_tokens=100) == 400
+    assert resolve_byte_budget(max_bytes=10_000, max_tokens=1_000) == 4000
+
+
+def test_resolve_byte_budget_rejects_negative():
+    """Test resolve_byte_budget raises ValueError for a negative budget."""
+    with pytest.raises(ValueError, match="max_tokens must be non-negative"):
+        resolve_byte_budget(max_tokens=-1)
+
+
+def test_format_table_data_iter_arrow_ipc_single_chunk():
+    """Test that Arrow IPC formats stream as one chunk cut to the budget."""
+    table = create_test_table(1000)
+    _, full = format_table_data(table, "arrow-ipc")
+
+    chunks = list(format_table_data_iter(table, "arrow-ipc", max_bytes=len(full) // 2))
+
+    assert len(chunks) == 1
+    fmt, data, row_count, truncated = join_formatted_chunks(chunks)
+    assert fmt == "arrow-ipc"
+    assert truncated is True
+    assert 0 < row_count < 1000
+    decoded = pa.ipc.open_stream(base64.b64decode(data)).read_all()
+    assert decoded.equals(table.slice(0, row_count))
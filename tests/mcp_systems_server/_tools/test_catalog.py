@@ -3,11 +3,13 @@ Tests for deephaven_mcp.mcp_systems_server._tools.catalog.
 """
 
 import asyncio
+import json
 import os
 import warnings
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
+import pyarrow as pa
 import pytest
 from conftest import MockContext, create_mock_instance_tracker
 
@@ -69,7 +71,7 @@ def create_mock_catalog_schema_function(schema_data_map, error_tables=None):
     """
     error_tables = error_tables or set()
 
-    def mock_get_catalog_meta_table(session, namespace, table_name):
+    def mock_get_catalog_meta_table(session, namespace, table_name, **kwargs):
         if table_name in error_tables:
             raise Exception(f"Table '{table_name}' not found in catalog")
 
@@ -84,6 +86,7 @@ def create_mock_catalog_schema_function(schema_data_map, error_tables=None):
 from deephaven_mcp import config
 from deephaven_mcp.mcp_systems_server._tools.catalog import (
     catalog_namespaces_list,
+    catalog_search,
     catalog_table_sample,
     catalog_tables_list,
     catalog_tables_schema,
@@ -113,7 +116,6 @@ async def test_catalog_tables_success_no_filters():
     # Mock catalog arrow table
     mock_catalog_table = MagicMock()
     mock_catalog_table.__len__ = MagicMock(return_value=100)
-    mock_catalog_table.nbytes = 5000  # Small size, under limit
     mock_field1 = MagicMock()
     mock_field1.name = "Namespace"
     mock_field1.type = "string"
@@ -122,9 +124,15 @@ async def test_catalog_tables_success_no_filters():
     mock_field2.type = "string"
     mock_catalog_table.schema = [mock_field1, mock_field2]
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
-    ) as mock_get_catalog:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+        ) as mock_get_catalog,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=5000,
+        ),
+    ):
         mock_get_catalog.return_value = (mock_catalog_table, True)
 
         with patch(
@@ -146,7 +154,11 @@ async def test_catalog_tables_success_no_filters():
             assert result["data"] == [{"Namespace": "ns1", "TableName": "t1"}]
 
             mock_get_catalog.assert_called_once_with(
-                mock_session, max_rows=10000, filters=None, distinct_namespaces=False
+                mock_session,
+                max_rows=10000,
+                filters=None,
+                distinct_namespaces=False,
+                session_name="enterprise:prod:analytics",
             )
 
 
@@ -165,15 +177,20 @@ async def test_catalog_tables_success_with_filters():
     # Mock catalog arrow table
     mock_catalog_table = MagicMock()
     mock_catalog_table.__len__ = MagicMock(return_value=50)
-    mock_catalog_table.nbytes = 2500
     mock_field1 = MagicMock()
     mock_field1.name = "Namespace"
     mock_field1.type = "string"
     mock_catalog_table.schema = [mock_field1]
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
-    ) as mock_get_catalog:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+        ) as mock_get_catalog,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=2500,
+        ),
+    ):
         mock_get_catalog.return_value = (mock_catalog_table, True)
 
         with patch(
@@ -191,7 +208,11 @@ async def test_catalog_tables_success_with_filters():
             assert result["is_complete"] is True
 
             mock_get_catalog.assert_called_once_with(
-                mock_session, max_rows=10000, filters=filters, distinct_namespaces=False
+                mock_session,
+                max_rows=10000,
+                filters=filters,
+                distinct_namespaces=False,
+                session_name="enterprise:prod:analytics",
             )
 
 
@@ -210,15 +231,20 @@ async def test_catalog_tables_success_csv_format():
     # Mock catalog arrow table
     mock_catalog_table = MagicMock()
     mock_catalog_table.__len__ = MagicMock(return_value=10)
-    mock_catalog_table.nbytes = 500
     mock_field1 = MagicMock()
     mock_field1.name = "Namespace"
     mock_field1.type = "string"
     mock_catalog_table.schema = [mock_field1]
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
-    ) as mock_get_catalog:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+        ) as mock_get_catalog,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=500,
+        ),
+    ):
         mock_get_catalog.return_value = (mock_catalog_table, True)
 
         with patch(
@@ -252,15 +278,20 @@ async def test_catalog_tables_incomplete_results():
     # Mock catalog arrow table
     mock_catalog_table = MagicMock()
     mock_catalog_table.__len__ = MagicMock(return_value=1000)
-    mock_catalog_table.nbytes = 50000
     mock_field1 = MagicMock()
     mock_field1.name = "Namespace"
     mock_field1.type = "string"
     mock_catalog_table.schema = [mock_field1]
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
-    ) as mock_get_catalog:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+        ) as mock_get_catalog,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=50000,
+        ),
+    ):
         mock_get_catalog.return_value = (mock_catalog_table, False)  # Incomplete
 
         with patch(
@@ -361,11 +392,16 @@ async def test_catalog_tables_invalid_format():
     # Mock catalog arrow table
     mock_catalog_table = MagicMock()
     mock_catalog_table.__len__ = MagicMock(return_value=10)
-    mock_catalog_table.nbytes = 500
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
-    ) as mock_get_catalog:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+        ) as mock_get_catalog,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=500,
+        ),
+    ):
         mock_get_catalog.return_value = (mock_catalog_table, True)
 
         with patch(
@@ -397,11 +433,20 @@ async def test_catalog_tables_size_limit_exceeded():
     # Mock catalog arrow table with size exceeding limit
     mock_catalog_table = MagicMock()
     mock_catalog_table.__len__ = MagicMock(return_value=1000000)
-    mock_catalog_table.nbytes = 60_000_000  # 60MB, exceeds 50MB limit
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
-    ) as mock_get_catalog:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+        ) as mock_get_catalog,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=60_000_000,
+        ),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_max_rows",
+            return_value=800,
+        ),
+    ):
         mock_get_catalog.return_value = (mock_catalog_table, False)
 
         result = await catalog_tables_list(context, "enterprise:prod:analytics")
@@ -426,15 +471,20 @@ async def test_catalog_namespaces_success_no_filters():
     # Mock namespaces arrow table
     namespaces_table_mock = MagicMock()
     namespaces_table_mock.__len__ = MagicMock(return_value=25)
-    namespaces_table_mock.nbytes = 1000  # Small size, under limit
     mock_field = MagicMock()
     mock_field.name = "Namespace"
     mock_field.type = "string"
     namespaces_table_mock.schema = [mock_field]
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
-    ) as mock_get_namespaces:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+        ) as mock_get_namespaces,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=1000,
+        ),
+    ):
         mock_get_namespaces.return_value = (namespaces_table_mock, True)
 
         with patch(
@@ -453,7 +503,11 @@ async def test_catalog_namespaces_success_no_filters():
             assert result["data"] == [{"Namespace": "market_data"}]
 
             mock_get_namespaces.assert_called_once_with(
-                mock_session, max_rows=1000, filters=None, distinct_namespaces=True
+                mock_session,
+                max_rows=1000,
+                filters=None,
+                distinct_namespaces=True,
+                session_name="enterprise:prod:analytics",
             )
 
 
@@ -472,15 +526,20 @@ async def test_catalog_namespaces_success_with_filters():
     # Mock namespaces arrow table
     namespaces_table_mock = MagicMock()
     namespaces_table_mock.__len__ = MagicMock(return_value=5)
-    namespaces_table_mock.nbytes = 500
     mock_field = MagicMock()
     mock_field.name = "Namespace"
     mock_field.type = "string"
     namespaces_table_mock.schema = [mock_field]
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
-    ) as mock_get_namespaces:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+        ) as mock_get_namespaces,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=500,
+        ),
+    ):
         mock_get_namespaces.return_value = (namespaces_table_mock, True)
 
         with patch(
@@ -498,7 +557,11 @@ async def test_catalog_namespaces_success_with_filters():
             assert result["is_complete"] is True
 
             mock_get_namespaces.assert_called_once_with(
-                mock_session, max_rows=1000, filters=filters, distinct_namespaces=True
+                mock_session,
+                max_rows=1000,
+                filters=filters,
+                distinct_namespaces=True,
+                session_name="enterprise:prod:analytics",
             )
 
 
@@ -517,15 +580,20 @@ async def test_catalog_namespaces_success_csv_format():
     # Mock namespaces arrow table
     namespaces_table_mock = MagicMock()
     namespaces_table_mock.__len__ = MagicMock(return_value=10)
-    namespaces_table_mock.nbytes = 500
     mock_field = MagicMock()
     mock_field.name = "Namespace"
     mock_field.type = "string"
     namespaces_table_mock.schema = [mock_field]
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
-    ) as mock_get_namespaces:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+        ) as mock_get_namespaces,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=500,
+        ),
+    ):
         mock_get_namespaces.return_value = (namespaces_table_mock, True)
 
         with patch(
@@ -559,15 +627,20 @@ async def test_catalog_namespaces_incomplete_results():
     # Mock namespaces arrow table
     namespaces_table_mock = MagicMock()
     namespaces_table_mock.__len__ = MagicMock(return_value=500)
-    namespaces_table_mock.nbytes = 25000
     mock_field = MagicMock()
     mock_field.name = "Namespace"
     mock_field.type = "string"
     namespaces_table_mock.schema = [mock_field]
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
-    ) as mock_get_namespaces:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+        ) as mock_get_namespaces,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=25000,
+        ),
+    ):
         mock_get_namespaces.return_value = (namespaces_table_mock, False)  # Incomplete
 
         with patch(
@@ -642,11 +715,16 @@ async def test_catalog_namespaces_invalid_format():
     # Mock namespaces arrow table
     namespaces_table_mock = MagicMock()
     namespaces_table_mock.__len__ = MagicMock(return_value=10)
-    namespaces_table_mock.nbytes = 500
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
-    ) as mock_get_namespaces:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+        ) as mock_get_namespaces,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=500,
+        ),
+    ):
         mock_get_namespaces.return_value = (namespaces_table_mock, True)
 
         with patch(
@@ -678,11 +756,20 @@ async def test_catalog_namespaces_size_limit_exceeded():
     # Mock namespaces arrow table with size exceeding limit
     namespaces_table_mock = MagicMock()
     namespaces_table_mock.__len__ = MagicMock(return_value=100000)
-    namespaces_table_mock.nbytes = 60_000_000  # 60MB, exceeds 50MB limit
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
-    ) as mock_get_namespaces:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+        ) as mock_get_namespaces,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=60_000_000,
+        ),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_max_rows",
+            return_value=800,
+        ),
+    ):
         mock_get_namespaces.return_value = (namespaces_table_mock, False)
 
         result = await catalog_namespaces_list(context, "enterprise:prod:analytics")
@@ -692,6 +779,122 @@ async def test_catalog_namespaces_size_limit_exceeded():
         assert result["isError"] is True
 
 
+def _search_context():
+    """Create a context whose registry returns a mock CorePlusSession."""
+    from deephaven_mcp.client import CorePlusSession
+
+    mock_session = MagicMock(spec=CorePlusSession)
+    mock_session_manager = MagicMock()
+    mock_session_manager.get = AsyncMock(return_value=mock_session)
+    mock_registry = MagicMock()
+    mock_registry.get = AsyncMock(return_value=mock_session_manager)
+    return MockContext({"session_registry": mock_registry}), mock_session
+
+
+@pytest.mark.asyncio
+async def test_catalog_search_success():
+    """Test catalog_search returns ranked matches from queries.search_catalog."""
+    from deephaven_mcp._catalog_index import CatalogMatch
+
+    context, mock_session = _search_context()
+    matches = [
+        CatalogMatch("market_data", "trades", score=1.5),
+        CatalogMatch("market_data", "quotes", score=0.3, matched_columns=["Trade"]),
+    ]
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.search_catalog",
+        new=AsyncMock(return_value=(matches, 1200)),
+    ) as mock_search:
+        result = await catalog_search(
+            context, "enterprise:prod:analytics", "trade", max_results=5
+        )
+
+    mock_search.assert_awaited_once_with(
+        mock_session,
+        "trade",
+        session_name="enterprise:prod:analytics",
+        limit=5,
+        include_columns=True,
+    )
+    assert result == {
+        "success": True,
+        "session_id": "enterprise:prod:analytics",
+        "query": "trade",
+        "count": 2,
+        "searched_rows": 1200,
+        "matches": [
+            {
+                "namespace": "market_data",
+                "table": "trades",
+                "score": 1.5,
+                "matched_columns": [],
+            },
+            {
+                "namespace": "market_data",
+                "table": "quotes",
+                "score": 0.3,
+                "matched_columns": ["Trade"],
+            },
+        ],
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query, max_results, message",
+    [
+        ("  ", 20, "query must not be empty"),
+        ("trade", 0, "max_results must be at least 1"),
+    ],
+)
+async def test_catalog_search_invalid_parameters(query, max_results, message):
+    """Test catalog_search rejects empty queries and non-positive max_results."""
+    context, _ = _search_context()
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.search_catalog"
+    ) as mock_search:
+        result = await catalog_search(
+            context, "enterprise:prod:analytics", query, max_results=max_results
+        )
+
+    mock_search.assert_not_called()
+    assert result["success"] is False
+    assert message in result["error"]
+    assert result["isError"] is True
+
+
+@pytest.mark.asyncio
+async def test_catalog_search_not_enterprise_session():
+    """Test catalog_search fails with non-enterprise session."""
+    mock_session_manager = MagicMock()
+    mock_session_manager.get = AsyncMock(return_value=MagicMock())
+    mock_registry = MagicMock()
+    mock_registry.get = AsyncMock(return_value=mock_session_manager)
+    context = MockContext({"session_registry": mock_registry})
+
+    result = await catalog_search(context, "community:local:test", "trade")
+
+    assert result["success"] is False
+    assert result["isError"] is True
+    assert "enterprise" in result["error"].lower() or "Core+" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_catalog_search_catalog_error():
+    """Test catalog_search reports failures to load the catalog."""
+    context, _ = _search_context()
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.search_catalog",
+        new=AsyncMock(side_effect=RuntimeError("worker down")),
+    ):
+        result = await catalog_search(context, "enterprise:prod:analytics", "trade")
+
+    assert result == {"success": False, "error": "worker down", "isError": True}
+
+
 @pytest.mark.asyncio
 async def test_catalog_tables_schema_success_with_namespace():
     """Test catalog_schemas with namespace filter."""
@@ -1054,6 +1257,190 @@ async def test_catalog_tables_schema_with_filters():
     assert result["schemas"][0]["table"] == "daily_prices"
 
 
+def _catalog_schema_context(catalog_data):
+    """Build a context whose enterprise session lists catalog_data, plus the session and catalog mock."""
+    from deephaven_mcp.client import CorePlusSession
+
+    mock_session = MagicMock(spec=CorePlusSession)
+
+    mock_catalog_table = MagicMock()
+    mock_catalog_table.to_pylist = MagicMock(return_value=catalog_data)
+
+    mock_session_manager = MagicMock()
+    mock_session_manager.get = AsyncMock(return_value=mock_session)
+
+    mock_registry = MagicMock()
+    mock_registry.get = AsyncMock(return_value=mock_session_manager)
+
+    return (
+        MockContext({"session_registry": mock_registry}),
+        mock_session,
+        mock_catalog_table,
+    )
+
+
+@pytest.mark.asyncio
+async def test_catalog_tables_schema_batched():
+    """Test catalog_tables_schema uses the batched meta table script when it succeeds."""
+    catalog_data = [
+        {"Namespace": "market_data", "TableName": "trades"},
+        {"Namespace": "reference", "TableName": "missing"},
+    ]
+    context, mock_session, mock_catalog_table = _catalog_schema_context(catalog_data)
+    trades_meta = create_mock_arrow_meta_table([{"Name": "Sym", "DataType": "String"}])
+
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table",
+            new=AsyncMock(return_value=(mock_catalog_table, True)),
+        ),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_meta_tables",
+            new=AsyncMock(return_value=[trades_meta, Exception("table not found")]),
+        ) as mock_batch,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_meta_table"
+        ) as mock_get_schema,
+    ):
+        result = await catalog_tables_schema(context, "enterprise:prod:analytics")
+
+    mock_batch.assert_awaited_once_with(
+        mock_session,
+        [("market_data", "trades"), ("reference", "missing")],
+        session_name="enterprise:prod:analytics",
+    )
+    mock_get_schema.assert_not_called()
+    assert result["success"] is True
+    assert result["schemas"][0]["success"] is True
+    assert result["schemas"][0]["namespace"] == "market_data"
+    assert result["schemas"][0]["data"] == [{"Name": "Sym", "DataType": "String"}]
+    assert result["schemas"][1] == {
+        "success": False,
+        "namespace": "reference",
+        "table": "missing",
+        "error": "table not found",
+        "isError": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_catalog_tables_schema_batch_failure_falls_back(caplog):
+    """Test catalog_tables_schema fetches per table when the batched script fails."""
+    catalog_data = [
+        {"Namespace": "market_data", "TableName": "trades"},
+        {"Namespace": "market_data", "TableName": "quotes"},
+    ]
+    context, _, mock_catalog_table = _catalog_schema_context(catalog_data)
+
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table",
+            new=AsyncMock(return_value=(mock_catalog_table, True)),
+        ),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_meta_tables",
+            new=AsyncMock(side_effect=RuntimeError("script failed")),
+        ),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_meta_table",
+            side_effect=create_mock_catalog_schema_function({}),
+        ) as mock_get_schema,
+    ):
+        result = await catalog_tables_schema(context, "enterprise:prod:analytics")
+
+    assert mock_get_schema.call_count == 2
+    assert [schema["table"] for schema in result["schemas"]] == ["trades", "quotes"]
+    assert all(schema["success"] for schema in result["schemas"])
+    assert "Batched schema script failed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_catalog_tables_schema_single_table_skips_batch():
+    """Test catalog_tables_schema fetches a single table directly, without the batch script."""
+    context, _, mock_catalog_table = _catalog_schema_context(
+        [{"Namespace": "market_data", "TableName": "trades"}]
+    )
+
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table",
+            new=AsyncMock(return_value=(mock_catalog_table, True)),
+        ),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_meta_tables",
+            new=AsyncMock(),
+        ) as mock_batch,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_meta_table",
+            side_effect=create_mock_catalog_schema_function({}),
+        ),
+    ):
+        result = await catalog_tables_schema(context, "enterprise:prod:analytics")
+
+    mock_batch.assert_not_called()
+    assert result["count"] == 1
+    assert result["schemas"][0]["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_catalog_tables_schema_fallback_bounded_concurrency():
+    """Test per-table schema fetches run concurrently, bounded by max_concurrent, in order."""
+    catalog_data = [
+        {"Namespace": "market_data", "TableName": f"t{i}"} for i in range(6)
+    ]
+    context, _, mock_catalog_table = _catalog_schema_context(catalog_data)
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_get_catalog_meta_table(session, namespace, table_name, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later tables finish first, so ordering must come from gather()
+        await asyncio.sleep(0.001 * (6 - int(table_name[1:])))
+        in_flight -= 1
+        return create_mock_arrow_meta_table([{"Name": table_name, "DataType": "int"}])
+
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table",
+            new=AsyncMock(return_value=(mock_catalog_table, True)),
+        ),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_meta_table",
+            new=fake_get_catalog_meta_table,
+        ),
+    ):
+        # MagicMock sessions are not Python sessions, so the batch script is unsupported
+        result = await catalog_tables_schema(
+            context, "enterprise:prod:analytics", max_concurrent=2
+        )
+
+    assert peak == 2
+    assert [schema["table"] for schema in result["schemas"]] == [
+        f"t{i}" for i in range(6)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_catalog_tables_schema_invalid_max_concurrent():
+    """Test catalog_tables_schema rejects a max_concurrent below 1."""
+    context, _, _ = _catalog_schema_context([])
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table"
+    ) as mock_get_catalog:
+        result = await catalog_tables_schema(
+            context, "enterprise:prod:analytics", max_concurrent=0
+        )
+
+    assert result["success"] is False
+    assert result["isError"] is True
+    assert "max_concurrent" in result["error"]
+    mock_get_catalog.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_catalog_tables_schema_empty_catalog():
     """Test catalog_schemas when catalog has no matching tables."""
@@ -1117,9 +1504,15 @@ async def test_catalog_table_sample_success():
         }
     )
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table_data"
-    ) as mock_get_data:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table_data"
+        ) as mock_get_data,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=1000,
+        ),
+    ):
         mock_get_data.return_value = (mock_arrow_table, True)
 
         result = await catalog_table_sample(
@@ -1137,6 +1530,52 @@ async def test_catalog_table_sample_success():
     assert "data" in result
 
 
+@pytest.mark.asyncio
+async def test_catalog_table_sample_columns_and_filters():
+    """Test catalog_table_sample forwards columns and filters to the server-side query."""
+    from deephaven_mcp.client import CorePlusSession
+
+    mock_session = MagicMock(spec=CorePlusSession)
+    mock_session_manager = MagicMock()
+    mock_session_manager.get = AsyncMock(return_value=mock_session)
+
+    mock_registry = MagicMock()
+    mock_registry.get = AsyncMock(return_value=mock_session_manager)
+
+    context = MockContext({"session_registry": mock_registry})
+    source = pa.table({"Sym": ["AAPL", "AAPL"], "Price": [1.5, 2.5]})
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table_data",
+        new=AsyncMock(return_value=(source, True)),
+    ) as mock_get_data:
+        result = await catalog_table_sample(
+            context,
+            "enterprise:prod:analytics",
+            "market_data",
+            "trades",
+            max_rows=10,
+            format="csv",
+            columns=["Sym", "Price"],
+            filters=["Sym = `AAPL`"],
+        )
+
+    mock_get_data.assert_awaited_once_with(
+        mock_session,
+        "market_data",
+        "trades",
+        max_rows=10,
+        head=True,
+        columns=["Sym", "Price"],
+        filters=["Sym = `AAPL`"],
+    )
+    assert result["success"] is True
+    assert result["schema"] == [
+        {"name": "Sym", "type": "string"},
+        {"name": "Price", "type": "double"},
+    ]
+
+
 @pytest.mark.asyncio
 async def test_catalog_table_sample_with_format():
     """Test catalog_table_sample with different format."""
@@ -1159,9 +1598,15 @@ async def test_catalog_table_sample_with_format():
         return_value={"id": [1, 2, 3], "name": ["Alice", "Bob", "Charlie"]}
     )
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table_data"
-    ) as mock_get_data:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table_data"
+        ) as mock_get_data,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=1000,
+        ),
+    ):
         mock_get_data.return_value = (mock_arrow_table, False)
 
         result = await catalog_table_sample(
@@ -1178,6 +1623,63 @@ async def test_catalog_table_sample_with_format():
     assert result["is_complete"] is False
 
 
+@pytest.mark.asyncio
+async def test_catalog_table_sample_byte_budget():
+    """Test catalog_table_sample returns the trailing rows that fit in a byte budget."""
+    from deephaven_mcp.client import CorePlusSession
+
+    mock_session = MagicMock(spec=CorePlusSession)
+    mock_session_manager = MagicMock()
+    mock_session_manager.get = AsyncMock(return_value=mock_session)
+    mock_registry = MagicMock()
+    mock_registry.get = AsyncMock(return_value=mock_session_manager)
+    context = MockContext({"session_registry": mock_registry})
+
+    source = pa.table({"id": list(range(10_000, 10_500))})
+
+    async def fake_get_data(
+        session, namespace, table_name, *, max_rows, head, **kwargs
+    ):
+        assert head is False
+        return source.slice(len(source) - max_rows), False
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table_data",
+        side_effect=fake_get_data,
+    ) as mock_get_data:
+        result = await catalog_table_sample(
+            context,
+            "enterprise:prod:analytics",
+            "public",
+            "users",
+            max_rows=400,
+            head=False,
+            format="json-row",
+            max_bytes=2_000,
+        )
+
+    assert result["success"] is True
+    assert mock_get_data.call_args_list[0].kwargs["max_rows"] == 100
+    assert result["row_count"] == len(result["data"])
+    assert result["data"][-1] == {"id": 10_499}
+    assert len(json.dumps(result["data"])) <= 2_000
+    assert result["is_complete"] is False
+
+
+@pytest.mark.asyncio
+async def test_catalog_table_sample_negative_budget():
+    """Test catalog_table_sample rejects a negative budget."""
+    context = MockContext({"session_registry": MagicMock()})
+
+    result = await catalog_table_sample(
+        context, "enterprise:prod:analytics", "public", "users", max_tokens=-5
+    )
+
+    assert result["success"] is False
+    assert result["isError"] is True
+    assert "max_tokens must be non-negative" in result["error"]
+
+
 @pytest.mark.asyncio
 async def test_catalog_table_sample_not_enterprise_session():
     """Test catalog_table_sample with non-enterprise session."""
@@ -1249,9 +1751,19 @@ async def test_catalog_table_sample_response_too_large():
     mock_arrow_table.schema = MagicMock()
     mock_arrow_table.schema.__len__ = MagicMock(return_value=100)  # 100 columns
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table_data"
-    ) as mock_get_data:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.catalog.queries.get_catalog_table_data"
+        ) as mock_get_data,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=60_000_000,
+        ),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_max_rows",
+            return_value=800,
+        ),
+    ):
         mock_get_data.return_value = (mock_arrow_table, True)
 
         result = await catalog_table_sample(
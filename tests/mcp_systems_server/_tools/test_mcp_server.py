@@ -82,10 +82,20 @@ async def test_mcp_reload_success():
             "refresh_lock": refresh_lock,
         }
     )
-    result = await mcp_reload(context)
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.mcp_server.queries.invalidate_schema_cache"
+        ) as mock_invalidate,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.mcp_server.queries.drop_catalog_snapshot"
+        ) as mock_drop_snapshot,
+    ):
+        result = await mcp_reload(context)
     assert result == {"success": True}
     config_manager.clear_config_cache.assert_awaited_once()
     session_registry.close.assert_awaited_once()
+    mock_invalidate.assert_called_once_with()
+    mock_drop_snapshot.assert_called_once_with()
 
 
 @pytest.mark.asyncio
@@ -386,6 +386,35 @@ async def test_session_script_run_success():
     assert DummySession.called == "print(1)"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("script_error", [None, RuntimeError("boom")])
+async def test_session_script_run_invalidates_schema_cache(script_error):
+    """Test session_script_run drops the session's cached schemas and environment, even if the script fails."""
+    session = MagicMock()
+    session.run_script = AsyncMock(side_effect=script_error)
+    mock_session_manager = MagicMock()
+    mock_session_manager.get = AsyncMock(return_value=session)
+    session_registry = MagicMock()
+    session_registry.get = AsyncMock(return_value=mock_session_manager)
+    context = MockContext({"session_registry": session_registry})
+
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.script.queries.invalidate_schema_cache"
+        ) as mock_invalidate,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.script.queries.invalidate_session_environment"
+        ) as mock_invalidate_environment,
+    ):
+        result = await session_script_run(
+            context, session_id="community:local:worker", script="t = empty_table(1)"
+        )
+
+    mock_invalidate.assert_called_once_with("community:local:worker")
+    mock_invalidate_environment.assert_called_once_with(session)
+    assert result["success"] is (script_error is None)
+
+
 @pytest.mark.asyncio
 async def test_session_script_run_no_script():
     mock_session_manager = MagicMock()
@@ -15,6 +15,7 @@ from deephaven_mcp import config
 from deephaven_mcp._exceptions import RegistryItemNotFoundError
 from deephaven_mcp.mcp_systems_server._tools.session import (
     session_details,
+    sessions_details,
     sessions_list,
 )
 from deephaven_mcp.mcp_systems_server._tools.session_community import (
@@ -1324,6 +1325,35 @@ async def test_sessions_list_completed_with_errors():
     assert "connection issues" in result["initialization"]["status"]
 
 
+@pytest.mark.asyncio
+async def test_sessions_list_reports_community_warm_up():
+    """Test sessions_list surfaces a running community warm-up and its failures."""
+    mock_session_registry = MagicMock()
+    mock_session_registry.get_all = AsyncMock(
+        return_value=RegistrySnapshot.with_initialization(
+            items={},
+            phase=InitializationPhase.COMPLETED,
+            errors={},
+            warm_up_phase=InitializationPhase.LOADING,
+            warm_up_errors={"community:config:c1": "RuntimeError: refused"},
+        )
+    )
+
+    context = MockContext(
+        {
+            "config_manager": MagicMock(),
+            "session_registry": mock_session_registry,
+            "instance_tracker": create_mock_instance_tracker(),
+        }
+    )
+
+    result = await sessions_list(context)
+
+    warm_up = result["initialization"]["community_warm_up"]
+    assert "warm-up is running" in warm_up["status"]
+    assert warm_up["errors"] == {"community:config:c1": "RuntimeError: refused"}
+
+
 @pytest.mark.asyncio
 async def test_sessions_list_completed_no_errors():
     """Test sessions_list does not include status when everything is fine."""
@@ -1382,3 +1412,329 @@ async def test_sessions_list_shows_errors_even_with_sessions():
     assert "initialization" in result
     assert "errors" in result["initialization"]
     assert "factory1" in result["initialization"]["errors"]
+
+
+def _details_context(session, is_alive=True):
+    """Create a context whose registry returns a manager for the given session."""
+    mock_status = MagicMock()
+    mock_status.name = "ONLINE" if is_alive else "OFFLINE"
+    mgr = AsyncMock()
+    mgr.system_type = MagicMock()
+    mgr.system_type.name = "COMMUNITY"
+    mgr.source = "source1"
+    mgr.name = "session1"
+    mgr.is_alive = AsyncMock(return_value=is_alive)
+    mgr.get = AsyncMock(return_value=session)
+    mgr.liveness_status.return_value = (mock_status, None)
+    mock_registry = AsyncMock()
+    mock_registry.get.return_value = mgr
+    context = MagicMock()
+    context.request_context.lifespan_context = {"session_registry": mock_registry}
+    return context, mgr
+
+
+@pytest.mark.asyncio
+async def test_session_details_lookups_run_concurrently():
+    """Test the property lookups of session_details wait on each other without deadlocking."""
+    session = MagicMock()
+    session.programming_language = "python"
+    context, _ = _details_context(session)
+    started = 0
+    both_started = asyncio.Event()
+
+    async def rendezvous(result):
+        nonlocal started
+        started += 1
+        if started == 2:
+            both_started.set()
+        await both_started.wait()
+        return result
+
+    mock_queries = MagicMock()
+    mock_queries.get_programming_language_version = lambda s: rendezvous("3.12.1")
+    mock_queries.get_dh_versions = lambda s: rendezvous(("0.40.0", None))
+
+    with (
+        patch("deephaven_mcp.mcp_systems_server._tools.session.queries", mock_queries),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.session.DEFAULT_SESSION_PROPERTY_TIMEOUT_SECONDS",
+            5.0,
+        ),
+    ):
+        result = await session_details(context, "session1", attempt_to_connect=True)
+
+    assert result["session"]["programming_language_version"] == "3.12.1"
+    assert result["session"]["deephaven_community_version"] == "0.40.0"
+    assert "field_errors" not in result["session"]
+
+
+@pytest.mark.asyncio
+async def test_session_details_field_timeout_and_error():
+    """Test a slow or failing lookup drops only its own field, with a detail message."""
+    session = MagicMock()
+    session.programming_language = "python"
+    context, _ = _details_context(session)
+
+    async def hang(session):
+        await asyncio.sleep(10)
+
+    mock_queries = MagicMock()
+    mock_queries.get_programming_language_version = AsyncMock(side_effect=hang)
+    mock_queries.get_dh_versions = AsyncMock(side_effect=RuntimeError("no pip"))
+
+    with (
+        patch("deephaven_mcp.mcp_systems_server._tools.session.queries", mock_queries),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.session.DEFAULT_SESSION_PROPERTY_TIMEOUT_SECONDS",
+            0.01,
+        ),
+    ):
+        result = await session_details(context, "session1", attempt_to_connect=True)
+
+    assert result["success"] is True
+    assert result["session"]["programming_language"] == "python"
+    assert "programming_language_version" not in result["session"]
+    assert "deephaven_community_version" not in result["session"]
+    assert result["session"]["field_errors"] == {
+        "programming_language_version": "Timed out after 0.01s",
+        "deephaven_versions": "RuntimeError: no pip",
+    }
+
+
+@pytest.mark.asyncio
+async def test_session_details_liveness_timeout():
+    """Test a liveness check that does not connect is bounded by the timeout."""
+    context, mgr = _details_context(MagicMock())
+
+    async def hang(ensure_item):
+        await asyncio.sleep(10)
+
+    mgr.liveness_status.side_effect = hang
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.session.DEFAULT_SESSION_PROPERTY_TIMEOUT_SECONDS",
+        0.01,
+    ):
+        result = await session_details(context, "session1")
+
+    assert result["session"]["available"] is False
+    assert result["session"]["liveness_status"] == "UNKNOWN"
+    assert (
+        result["session"]["liveness_detail"] == "Liveness check timed out after 0.01s"
+    )
+    mgr.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_session_details_unavailable_skips_lookups():
+    """Test no property lookups are made for an unavailable session."""
+    context, mgr = _details_context(MagicMock(), is_alive=False)
+
+    result = await session_details(context, "session1")
+
+    assert result["session"]["available"] is False
+    assert "field_errors" not in result["session"]
+    mgr.get.assert_not_awaited()
+
+
+# =============================================================================
+# sessions_details tests
+# =============================================================================
+
+
+def _bulk_manager(name, is_alive=True, liveness=None):
+    """Create a community session manager whose session reports no properties."""
+    mock_status = MagicMock()
+    mock_status.name = "ONLINE" if is_alive else "OFFLINE"
+    mgr = AsyncMock()
+    mgr.system_type = MagicMock()
+    mgr.system_type.name = "COMMUNITY"
+    mgr.source = "source1"
+    mgr.name = name
+    mgr.is_alive = AsyncMock(return_value=is_alive)
+    session = MagicMock()
+    session.programming_language = "python"
+    mgr.get = AsyncMock(return_value=session)
+    if liveness is None:
+        mgr.liveness_status.return_value = (mock_status, None)
+    else:
+        mgr.liveness_status.side_effect = liveness
+    return mgr
+
+
+def _bulk_context(managers, snapshot=None):
+    """Create a context whose registry serves the given managers by session ID."""
+
+    async def get(session_id):
+        if session_id not in managers:
+            raise RegistryItemNotFoundError(f"No item with name '{session_id}' found")
+        return managers[session_id]
+
+    mock_registry = MagicMock()
+    mock_registry.get = AsyncMock(side_effect=get)
+    mock_registry.get_all = AsyncMock(
+        return_value=snapshot or RegistrySnapshot.simple(items=managers)
+    )
+    context = MagicMock()
+    context.request_context.lifespan_context = {"session_registry": mock_registry}
+    return context, mock_registry
+
+
+def _bulk_queries():
+    """Create a queries mock whose property lookups succeed immediately."""
+    mock_queries = MagicMock()
+    mock_queries.get_programming_language_version = AsyncMock(return_value="3.12.1")
+    mock_queries.get_dh_versions = AsyncMock(return_value=("0.40.0", None))
+    return mock_queries
+
+
+@pytest.mark.asyncio
+async def test_sessions_details_all_sessions():
+    """Test sessions_details inspects every registered session and reports initialization."""
+    managers = {
+        "community:source1:a": _bulk_manager("a"),
+        "community:source1:b": _bulk_manager("b", is_alive=False),
+    }
+    snapshot = RegistrySnapshot.with_initialization(
+        items=managers, phase=InitializationPhase.LOADING, errors={}
+    )
+    context, mock_registry = _bulk_context(managers, snapshot)
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.session.queries", _bulk_queries()
+    ):
+        result = await sessions_details(context)
+
+    assert result["success"] is True
+    assert "actively running" in result["initialization"]["status"]
+    assert result["summary"] == {"total": 2, "succeeded": 2, "failed": 0}
+    by_id = {r["session_id"]: r for r in result["results"]}
+    assert by_id["community:source1:a"]["session"]["available"] is True
+    assert (
+        by_id["community:source1:a"]["session"]["programming_language_version"]
+        == "3.12.1"
+    )
+    assert by_id["community:source1:b"]["session"]["available"] is False
+    mock_registry.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_sessions_details_explicit_ids():
+    """Test explicit session IDs are deduplicated and unknown IDs fail individually."""
+    managers = {"community:source1:a": _bulk_manager("a")}
+    context, mock_registry = _bulk_context(managers)
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.session.queries", _bulk_queries()
+    ):
+        result = await sessions_details(
+            context,
+            session_ids=[
+                "community:source1:a",
+                "community:source1:missing",
+                "community:source1:a",
+            ],
+        )
+
+    assert result["success"] is True
+    assert "initialization" not in result
+    assert result["summary"] == {"total": 2, "succeeded": 1, "failed": 1}
+    by_id = {r["session_id"]: r for r in result["results"]}
+    assert by_id["community:source1:a"]["success"] is True
+    assert by_id["community:source1:missing"]["success"] is False
+    assert by_id["community:source1:missing"]["error"].startswith(
+        "RegistryItemNotFoundError: "
+    )
+    mock_registry.get_all.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_sessions_details_timeout_in_completion_order():
+    """Test a slow session times out alone and is reported after the fast one."""
+
+    async def hang(ensure_item):
+        await asyncio.sleep(10)
+
+    managers = {
+        "community:source1:slow": _bulk_manager("slow", liveness=hang),
+        "community:source1:fast": _bulk_manager("fast"),
+    }
+    context, _ = _bulk_context(managers)
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.session.queries", _bulk_queries()
+    ):
+        result = await sessions_details(context, timeout_seconds=0.05)
+
+    assert [r["session_id"] for r in result["results"]] == [
+        "community:source1:fast",
+        "community:source1:slow",
+    ]
+    assert result["results"][1] == {
+        "session_id": "community:source1:slow",
+        "success": False,
+        "error": "Timed out after 0.05s",
+    }
+    assert result["summary"] == {"total": 2, "succeeded": 1, "failed": 1}
+
+
+@pytest.mark.asyncio
+async def test_sessions_details_respects_max_concurrent():
+    """Test no more than max_concurrent sessions are inspected at once."""
+    in_flight = 0
+    peak = 0
+
+    async def liveness(ensure_item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        status = MagicMock()
+        status.name = "ONLINE"
+        return status, None
+
+    managers = {
+        f"community:source1:s{i}": _bulk_manager(f"s{i}", liveness=liveness)
+        for i in range(5)
+    }
+    context, _ = _bulk_context(managers)
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.session.queries", _bulk_queries()
+    ):
+        result = await sessions_details(context, max_concurrent=2)
+
+    assert result["summary"] == {"total": 5, "succeeded": 5, "failed": 0}
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"max_concurrent": 0}, "max_concurrent must be at least 1"),
+        ({"timeout_seconds": 0}, "timeout_seconds must be positive"),
+    ],
+)
+async def test_sessions_details_invalid_parameters(kwargs, message):
+    """Test invalid limits are rejected before any session is inspected."""
+    context, mock_registry = _bulk_context({})
+
+    result = await sessions_details(context, **kwargs)
+
+    assert result["success"] is False
+    assert result["isError"] is True
+    assert message in result["error"]
+    mock_registry.get_all.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_sessions_details_registry_error():
+    """Test a registry failure while enumerating sessions fails the whole call."""
+    context, mock_registry = _bulk_context({})
+    mock_registry.get_all.side_effect = RuntimeError("registry down")
+
+    result = await sessions_details(context)
+
+    assert result == {"success": False, "error": "registry down", "isError": True}
@@ -675,6 +675,95 @@ async def test_enterprise_systems_status_liveness_error():
         assert "Liveness error" in result["error"]
 
 
+def _status_context(factories):
+    """Create a context whose enterprise registry holds the given factories."""
+    mock_enterprise_registry = AsyncMock()
+    mock_enterprise_registry.get_all = AsyncMock(
+        return_value=RegistrySnapshot.simple(items=factories)
+    )
+    mock_session_registry = MagicMock()
+    mock_session_registry.enterprise_registry = AsyncMock(
+        return_value=mock_enterprise_registry
+    )
+    mock_session_registry.get_all = AsyncMock(
+        return_value=RegistrySnapshot.simple(items={})
+    )
+    mock_config_manager = AsyncMock()
+    mock_config_manager.get_config = AsyncMock(return_value={})
+    return MockContext(
+        {
+            "session_registry": mock_session_registry,
+            "config_manager": mock_config_manager,
+            "instance_tracker": create_mock_instance_tracker(),
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_enterprise_systems_status_checks_systems_concurrently():
+    """Test systems are checked at the same time with one liveness check each."""
+    both_started = asyncio.Event()
+    started = 0
+
+    async def rendezvous(ensure_item):
+        nonlocal started
+        started += 1
+        if started == 2:
+            both_started.set()
+        await both_started.wait()
+        return ResourceLivenessStatus.ONLINE, None
+
+    factories = {}
+    for name in ("system1", "system2"):
+        factory = AsyncMock()
+        factory.liveness_status = AsyncMock(side_effect=rendezvous)
+        factories[name] = factory
+
+    result = await enterprise_systems_status(_status_context(factories))
+
+    assert [s["name"] for s in result["systems"]] == ["system1", "system2"]
+    assert all(s["is_alive"] is True for s in result["systems"])
+    for factory in factories.values():
+        factory.liveness_status.assert_awaited_once_with(ensure_item=False)
+        factory.is_alive.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_enterprise_systems_status_liveness_timeout():
+    """Test a hung system is reported as UNKNOWN without delaying the others."""
+
+    async def hang(ensure_item):
+        await asyncio.sleep(10)
+
+    hung_factory = AsyncMock()
+    hung_factory.liveness_status = AsyncMock(side_effect=hang)
+    healthy_factory = AsyncMock()
+    healthy_factory.liveness_status = AsyncMock(
+        return_value=(ResourceLivenessStatus.ONLINE, None)
+    )
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.session_enterprise.SYSTEM_STATUS_TIMEOUT_SECONDS",
+        0.01,
+    ):
+        result = await enterprise_systems_status(
+            _status_context({"hung": hung_factory, "healthy": healthy_factory}),
+            attempt_to_connect=True,
+        )
+
+    assert result["success"] is True
+    hung, healthy = result["systems"]
+    assert hung == {
+        "name": "hung",
+        "liveness_status": "UNKNOWN",
+        "liveness_detail": "Liveness check timed out after 0.01s",
+        "is_alive": False,
+        "config": {},
+    }
+    assert healthy["liveness_status"] == "ONLINE"
+    assert healthy["is_alive"] is True
+
+
 @pytest.mark.asyncio
 async def test_enterprise_systems_status_no_enterprise_registry():
     """Test enterprise systems status when enterprise_registry is None."""
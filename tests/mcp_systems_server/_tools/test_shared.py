@@ -3,23 +3,32 @@ Tests for deephaven_mcp.mcp_systems_server._tools.shared.
 """
 
 import asyncio
+import importlib
 import os
 import warnings
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
+import pyarrow as pa
 import pytest
 from conftest import MockContext, create_mock_instance_tracker
 
 from deephaven_mcp import config
 from deephaven_mcp._exceptions import RegistryItemNotFoundError
 from deephaven_mcp.client import BaseSession, CorePlusSession
+from deephaven_mcp.formatters import format_table_data
+from deephaven_mcp.mcp_systems_server._tools import shared as _shared_module
 from deephaven_mcp.mcp_systems_server._tools.shared import (
+    BUDGET_PROBE_ROWS,
+    _check_formatted_response_size,
     _check_response_size,
+    _fetch_table_within_budget,
     _format_initialization_status,
     _get_enterprise_session,
     _get_session_from_context,
     _get_system_config,
+    _rendered_size,
+    _validate_max_concurrent,
 )
 from deephaven_mcp.resource_manager import (
     DockerLaunchedSession,
@@ -97,6 +106,45 @@ def test_format_initialization_status_failed():
     assert "errors" not in result
 
 
+def test_format_initialization_status_warm_up_running():
+    """A running warm-up is reported even when discovery completed cleanly."""
+    result = _format_initialization_status(
+        InitializationPhase.COMPLETED, {}, warm_up_phase=InitializationPhase.LOADING
+    )
+    assert result is not None
+    assert "status" not in result
+    assert "warm-up is running" in result["community_warm_up"]["status"]
+    assert "errors" not in result["community_warm_up"]
+
+
+def test_format_initialization_status_warm_up_errors():
+    """Sessions that failed to warm up are listed separately from factory errors."""
+    warm_up_errors = {"community:config:c1": "timed out after 30.0s"}
+    result = _format_initialization_status(
+        InitializationPhase.COMPLETED,
+        {"prod": "timeout"},
+        warm_up_phase=InitializationPhase.COMPLETED,
+        warm_up_errors=warm_up_errors,
+    )
+    assert result is not None
+    assert result["errors"] == {"prod": "timeout"}
+    assert "could not be warmed up" in result["community_warm_up"]["status"]
+    assert result["community_warm_up"]["errors"] == warm_up_errors
+
+
+def test_format_initialization_status_warm_up_completed_cleanly():
+    """A finished warm-up without failures adds nothing."""
+    assert (
+        _format_initialization_status(
+            InitializationPhase.COMPLETED,
+            {},
+            warm_up_phase=InitializationPhase.COMPLETED,
+            warm_up_errors={},
+        )
+        is None
+    )
+
+
 def test_format_initialization_status_failed_with_errors():
     """FAILED phase with errors includes both status and errors."""
     errors = {"sys": "cancelled"}
@@ -226,6 +274,172 @@ def test_check_response_size_over_limit():
     }
 
 
+def test_check_response_size_over_limit_with_suggestion():
+    """Test _check_response_size includes the suggested max_rows when provided."""
+    result = _check_response_size("test_table", 60000000, suggested_max_rows=1234)
+    assert result["success"] is False
+    assert result["error"].endswith(
+        "Please reduce max_rows. About 1234 rows fit in this format."
+    )
+
+
+def test_check_formatted_response_size_acceptable():
+    """Test _check_formatted_response_size accepts a small real table."""
+    table = pa.table({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+    assert _check_formatted_response_size("t", table, "markdown-kv") is None
+
+
+def test_check_formatted_response_size_over_limit_suggests_rows():
+    """Test _check_formatted_response_size rejects oversized output with a suggestion."""
+    table = pa.table({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=60_000_000,
+        ) as mock_estimate,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_max_rows",
+            return_value=42,
+        ) as mock_max_rows,
+    ):
+        result = _check_formatted_response_size("t", table, "csv")
+
+    mock_estimate.assert_called_once_with(table, "csv")
+    mock_max_rows.assert_called_once_with(table, "csv", 50_000_000)
+    assert result["isError"] is True
+    assert "About 42 rows fit" in result["error"]
+
+
+def test_check_formatted_response_size_invalid_format():
+    """Test _check_formatted_response_size raises ValueError for unknown formats."""
+    table = pa.table({"id": [1]})
+    with pytest.raises(ValueError, match="Invalid format"):
+        _check_formatted_response_size("t", table, "bogus")
+
+
+def _budget_table(rows: int) -> pa.Table:
+    """Build a table whose rows all render to the same size."""
+    return pa.table(
+        {"id": list(range(10_000, 10_000 + rows)), "name": ["x" * 10] * rows}
+    )
+
+
+def _recording_fetch(table: pa.Table, calls: list):
+    """Build a fetch callable over a real table that records requested row counts."""
+
+    async def fetch(rows):
+        calls.append(rows)
+        if rows is None:
+            return table, True
+        return table.slice(0, rows), len(table) <= rows
+
+    return fetch
+
+
+def test_rendered_size_matches_formatted_payload():
+    """Test _rendered_size measures the exact UTF-8 size of text formats."""
+    table = _budget_table(5)
+    _, data = format_table_data(table, "csv")
+    assert _rendered_size(table, "csv") == len(data.encode("utf-8"))
+
+
+@pytest.mark.asyncio
+async def test_fetch_table_within_budget_without_budget():
+    """Test _fetch_table_within_budget fetches max_rows directly without a budget."""
+    calls = []
+    table, is_complete = await _fetch_table_within_budget(
+        _recording_fetch(_budget_table(500), calls), "t", "csv", 300, None
+    )
+    assert calls == [300]
+    assert len(table) == 300
+    assert is_complete is False
+
+
+@pytest.mark.asyncio
+async def test_fetch_table_within_budget_small_max_rows_skips_probe():
+    """Test _fetch_table_within_budget does one fetch when max_rows fits in a probe."""
+    calls = []
+    table, _ = await _fetch_table_within_budget(
+        _recording_fetch(_budget_table(500), calls), "t", "csv", 10, 1_000_000
+    )
+    assert calls == [10]
+    assert len(table) == 10
+
+
+@pytest.mark.asyncio
+async def test_fetch_table_within_budget_probe_holds_whole_table():
+    """Test _fetch_table_within_budget returns the probe when it is complete."""
+    calls = []
+    table, is_complete = await _fetch_table_within_budget(
+        _recording_fetch(_budget_table(7), calls), "t", "csv", None, 1_000_000
+    )
+    assert calls == [BUDGET_PROBE_ROWS]
+    assert len(table) == 7
+    assert is_complete is True
+
+
+@pytest.mark.asyncio
+async def test_fetch_table_within_budget_empty_probe():
+    """Test _fetch_table_within_budget returns an empty incomplete probe as is."""
+
+    async def fetch(rows):
+        return _budget_table(0), False
+
+    table, is_complete = await _fetch_table_within_budget(
+        fetch, "t", "csv", None, 1_000_000
+    )
+    assert len(table) == 0
+    assert is_complete is False
+
+
+@pytest.mark.asyncio
+async def test_fetch_table_within_budget_probe_covers_budget():
+    """Test _fetch_table_within_budget stops at the probe when it exceeds the budget."""
+    calls = []
+    table, is_complete = await _fetch_table_within_budget(
+        _recording_fetch(_budget_table(5000), calls), "t", "csv", None, 200
+    )
+    assert calls == [BUDGET_PROBE_ROWS]
+    assert len(table) == BUDGET_PROBE_ROWS
+    assert is_complete is False
+
+
+@pytest.mark.asyncio
+async def test_fetch_table_within_budget_fetches_rows_that_fit():
+    """Test _fetch_table_within_budget fetches the measured number of rows that fit."""
+    source = _budget_table(5000)
+    budget = _rendered_size(source.slice(0, 1000), "csv")
+    calls = []
+    table, is_complete = await _fetch_table_within_budget(
+        _recording_fetch(source, calls), "t", "csv", None, budget
+    )
+    assert calls[0] == BUDGET_PROBE_ROWS
+    assert calls[1] == 1000
+    assert len(table) == calls[1]
+    assert _rendered_size(table, "csv") <= budget
+    assert is_complete is False
+
+
+@pytest.mark.asyncio
+async def test_fetch_table_within_budget_caps_at_max_rows():
+    """Test _fetch_table_within_budget never fetches more than max_rows."""
+    calls = []
+    table, _ = await _fetch_table_within_budget(
+        _recording_fetch(_budget_table(5000), calls), "t", "csv", 250, 10_000_000
+    )
+    assert calls == [BUDGET_PROBE_ROWS, 250]
+    assert len(table) == 250
+
+
+@pytest.mark.asyncio
+async def test_fetch_table_within_budget_invalid_format():
+    """Test _fetch_table_within_budget raises ValueError for unknown formats."""
+    with pytest.raises(ValueError, match="Invalid format"):
+        await _fetch_table_within_budget(
+            _recording_fetch(_budget_table(500), []), "t", "bogus", None, 1000
+        )
+
+
 @pytest.mark.asyncio
 async def test_get_system_config_success():
     """Test _get_system_config when system exists in configuration."""
@@ -356,3 +570,25 @@ async def test_get_enterprise_session_not_enterprise():
     assert "test_function only works with enterprise (Core+) sessions" in error["error"]
     assert "test-session-id" in error["error"]
     assert error["isError"] is True
+
+
+def test_validate_max_concurrent_rejects_non_positive():
+    """Test _validate_max_concurrent names the calling tool in its error."""
+    with pytest.raises(ValueError, match=r"\[session_tables_schema\] max_concurrent"):
+        _validate_max_concurrent(0, "session_tables_schema")
+    assert _validate_max_concurrent(3, "session_tables_schema") == 3
+
+
+def test_default_schema_max_concurrent_env_override(monkeypatch):
+    """DH_MCP_DEFAULT_SCHEMA_MAX_CONCURRENT overrides DEFAULT_SCHEMA_MAX_CONCURRENT."""
+    try:
+        monkeypatch.setenv("DH_MCP_DEFAULT_SCHEMA_MAX_CONCURRENT", "4")
+        importlib.reload(_shared_module)
+        assert _shared_module.DEFAULT_SCHEMA_MAX_CONCURRENT == 4
+
+        monkeypatch.delenv("DH_MCP_DEFAULT_SCHEMA_MAX_CONCURRENT")
+        importlib.reload(_shared_module)
+        assert _shared_module.DEFAULT_SCHEMA_MAX_CONCURRENT == 10
+    finally:
+        monkeypatch.delenv("DH_MCP_DEFAULT_SCHEMA_MAX_CONCURRENT", raising=False)
+        importlib.reload(_shared_module)
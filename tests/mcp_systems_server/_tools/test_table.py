@@ -3,16 +3,21 @@ Tests for deephaven_mcp.mcp_systems_server._tools.table.
 """
 
 import asyncio
+import base64
 import os
 import warnings
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
+import pyarrow as pa
 import pytest
 from conftest import MockContext, create_mock_instance_tracker
 
 from deephaven_mcp import config
+from deephaven_mcp.formatters import format_table_data
 from deephaven_mcp.mcp_systems_server._tools.table import (
+    _build_table_data_response,
+    _format_within_budget,
     session_table_data,
     session_tables_list,
     session_tables_schema,
@@ -224,7 +229,7 @@ async def test_session_tables_schema_all_tables():
 
     # Set up side_effect for queries.get_meta_table to handle multiple calls
     # Will return different data based on which table is requested
-    def get_meta_table_side_effect(session, table_name):
+    def get_meta_table_side_effect(session, table_name, **kwargs):
         class MockArrowTable:
             def __init__(self, tname):
                 class MockField:
@@ -348,6 +353,69 @@ async def test_session_tables_schema_schema_key_error():
     assert result["schemas"][0]["data"][0]["foo"] == "bar"
 
 
+def _schema_context(table_names):
+    """Build a context whose session lists the given tables."""
+    session = MagicMock()
+    session.tables = AsyncMock(return_value=table_names)
+    mock_session_manager = MagicMock()
+    mock_session_manager.get = AsyncMock(return_value=session)
+    session_registry = MagicMock()
+    session_registry.get = AsyncMock(return_value=mock_session_manager)
+    return MockContext({"session_registry": session_registry})
+
+
+@pytest.mark.asyncio
+async def test_session_tables_schema_bounded_concurrency_keeps_order():
+    """Test schemas are fetched in parallel up to max_concurrent, results in input order."""
+    table_names = [f"t{i}" for i in range(8)]
+    in_flight = 0
+    peak = 0
+
+    async def fake_meta(session, table_name, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later tables finish first, so completion order differs from input order
+        await asyncio.sleep(0.001 * (len(table_names) - int(table_name[1:])))
+        in_flight -= 1
+        if table_name == "t5":
+            raise RuntimeError("t5 is broken")
+        return pa.table({"Name": [f"{table_name}_col"], "DataType": ["int"]})
+
+    with patch(
+        "deephaven_mcp.queries.get_session_meta_table", side_effect=fake_meta
+    ) as mock_meta:
+        result = await session_tables_schema(
+            _schema_context(table_names), session_id="s", max_concurrent=3
+        )
+
+    assert mock_meta.call_count == 8
+    assert peak == 3
+    assert result["success"] is True
+    assert result["count"] == 8
+    assert [entry["table"] for entry in result["schemas"]] == table_names
+    assert result["schemas"][5] == {
+        "success": False,
+        "table": "t5",
+        "error": "t5 is broken",
+        "isError": True,
+    }
+    assert result["schemas"][0]["data"] == [{"Name": "t0_col", "DataType": "int"}]
+
+
+@pytest.mark.asyncio
+async def test_session_tables_schema_invalid_max_concurrent():
+    """Test max_concurrent < 1 is rejected before contacting the session."""
+    context = _schema_context(["t"])
+
+    result = await session_tables_schema(context, session_id="s", max_concurrent=0)
+
+    assert result["success"] is False
+    assert result["isError"] is True
+    assert "max_concurrent must be at least 1" in result["error"]
+    context.request_context.lifespan_context["session_registry"].get.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_session_tables_schema_session_error():
     # Following the pattern in _mcp.py:
@@ -558,18 +626,20 @@ async def test_session_table_data_success_default_params():
     mock_arrow_table.schema = [mock_field1, mock_field2]
     mock_arrow_table.column_names = ["col1", "col2"]
 
-    # Mock batch for formatters
-    mock_batch = MagicMock()
-    mock_batch.to_pylist.return_value = [
-        {"col1": 1, "col2": "a"},
-        {"col1": 2, "col2": "b"},
-        {"col1": 3, "col2": "c"},
+    # Real batch for formatters
+    mock_arrow_table.to_batches.return_value = [
+        pa.record_batch({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
     ]
-    mock_arrow_table.to_batches.return_value = [mock_batch]
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table"
-    ) as mock_get_table:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table"
+        ) as mock_get_table,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=1000,
+        ),
+    ):
         mock_get_table.return_value = (mock_arrow_table, True)
 
         result = await session_table_data(context, "session1", "table1")
@@ -588,7 +658,12 @@ async def test_session_table_data_success_default_params():
 
         # Verify queries.get_table was called with correct parameters
         mock_get_table.assert_called_once_with(
-            mock_session, "table1", max_rows=1000, head=True
+            mock_session,
+            "table1",
+            max_rows=1000,
+            head=True,
+            columns=None,
+            filters=None,
         )
 
 
@@ -613,13 +688,26 @@ async def test_session_table_data_success_custom_params():
     mock_arrow_table.schema = [mock_field]
     mock_arrow_table.to_pylist.return_value = [{"col1": 1}, {"col1": 2}]
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table"
-    ) as mock_get_table:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table"
+        ) as mock_get_table,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=1000,
+        ),
+    ):
         mock_get_table.return_value = (mock_arrow_table, False)
 
         result = await session_table_data(
-            context, "session1", "table1", max_rows=50, head=False, format="json-row"
+            context,
+            "session1",
+            "table1",
+            max_rows=50,
+            head=False,
+            format="json-row",
+            columns=["col1"],
+            filters=["col1 > 0"],
         )
 
         assert result["success"] is True
@@ -627,7 +715,12 @@ async def test_session_table_data_success_custom_params():
         assert result["is_complete"] is False
 
         mock_get_table.assert_called_once_with(
-            mock_session, "table1", max_rows=50, head=False
+            mock_session,
+            "table1",
+            max_rows=50,
+            head=False,
+            columns=["col1"],
+            filters=["col1 > 0"],
         )
 
 
@@ -653,6 +746,10 @@ async def test_session_table_data_success_full_table():
 
     # Mock CSV output for large table
     with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=1000,
+        ),
         patch("deephaven_mcp.formatters._csv.io.BytesIO") as mock_bytesio,
         patch("deephaven_mcp.formatters._csv.csv.write_csv") as mock_write_csv,
         patch(
@@ -675,7 +772,12 @@ async def test_session_table_data_success_full_table():
         assert result["is_complete"] is True
 
         mock_get_table.assert_called_once_with(
-            mock_session, "table1", max_rows=None, head=True
+            mock_session,
+            "table1",
+            max_rows=None,
+            head=True,
+            columns=None,
+            filters=None,
         )
 
 
@@ -713,6 +815,400 @@ async def test_session_table_data_invalid_format():
         assert result["isError"] is True
 
 
+def test_format_within_budget_keeps_leading_rows():
+    """Test _format_within_budget keeps the first rows that fit when head=True."""
+    table = pa.table({"id": list(range(100, 200))})
+    _, full = format_table_data(table.slice(0, 10), "csv")
+    actual_format, data, row_count, truncated = _format_within_budget(
+        table, "csv", len(full), head=True
+    )
+    assert actual_format == "csv"
+    assert data == full
+    assert row_count == 10
+    assert truncated is True
+
+
+def test_format_within_budget_keeps_trailing_rows():
+    """Test _format_within_budget keeps the last rows, shrinking when they are larger."""
+    table = pa.table({"name": ["a"] * 10 + ["bbbbbbbbbb"] * 10})
+    budget = len(format_table_data(table.slice(0, 5), "csv")[1])
+    _, data, row_count, truncated = _format_within_budget(
+        table, "csv", budget, head=False
+    )
+    assert truncated is True
+    assert 0 < row_count < 5
+    assert data == format_table_data(table.slice(20 - row_count), "csv")[1]
+    assert len(data) <= budget
+
+
+def test_format_within_budget_nothing_fits():
+    """Test _format_within_budget returns the empty payload when no row fits."""
+    table = pa.table({"name": ["aaaaaaaaaa"] * 3})
+    _, data, row_count, truncated = _format_within_budget(
+        table, "json-row", 1, head=False
+    )
+    assert data == []
+    assert row_count == 0
+    assert truncated is True
+
+
+def test_build_table_data_response_with_budget():
+    """Test _build_table_data_response reports budget truncation as incomplete."""
+    table = pa.table({"id": list(range(1000))})
+    response = _build_table_data_response(
+        table, True, "json-row", table_name="t", budget=100
+    )
+    assert response["format"] == "json-row"
+    assert 0 < response["row_count"] < 1000
+    assert response["row_count"] == len(response["data"])
+    assert response["is_complete"] is False
+
+
+def test_build_table_data_response_budget_not_reached():
+    """Test _build_table_data_response keeps is_complete when the budget is not reached."""
+    table = pa.table({"id": [1, 2, 3]})
+    response = _build_table_data_response(table, True, "csv", budget=10_000)
+    assert response["data"] == format_table_data(table, "csv")[1]
+    assert response["row_count"] == 3
+    assert response["is_complete"] is True
+
+
+@pytest.mark.asyncio
+async def test_session_table_data_token_budget():
+    """Test session_table_data probes, fetches only the rows that fit, and cuts exactly."""
+    mock_registry = MagicMock()
+    mock_session_manager = MagicMock()
+    mock_session = MagicMock()
+    mock_registry.get = AsyncMock(return_value=mock_session_manager)
+    mock_session_manager.get = AsyncMock(return_value=mock_session)
+    context = MockContext({"session_registry": mock_registry})
+
+    source = pa.table({"id": list(range(10_000, 20_000)), "name": ["xyz"] * 10_000})
+
+    async def fake_get_table(session, table_name, *, max_rows, head, **kwargs):
+        return source.slice(0, max_rows), False
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table",
+        side_effect=fake_get_table,
+    ) as mock_get_table:
+        result = await session_table_data(
+            context, "session1", "table1", max_rows=None, format="csv", max_tokens=500
+        )
+
+    assert result["success"] is True
+    assert [c.kwargs["max_rows"] for c in mock_get_table.call_args_list] == [100, 165]
+    assert len(result["data"].encode("utf-8")) <= 2000
+    assert result["row_count"] == 165
+    assert result["is_complete"] is False
+
+
+@pytest.mark.asyncio
+async def test_session_table_data_optimize_throughput():
+    """Test session_table_data returns a decodable Arrow IPC stream with exact types."""
+    mock_registry = MagicMock()
+    mock_session_manager = MagicMock()
+    mock_registry.get = AsyncMock(return_value=mock_session_manager)
+    mock_session_manager.get = AsyncMock(return_value=MagicMock())
+    context = MockContext({"session_registry": mock_registry})
+
+    source = pa.table(
+        {"ts": pa.array([1, 2], pa.timestamp("ns")), "px": pa.array([1.5, None])}
+    )
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table",
+        AsyncMock(return_value=(source, True)),
+    ):
+        result = await session_table_data(
+            context, "session1", "table1", format="optimize-throughput"
+        )
+
+    assert result["success"] is True
+    assert result["format"] == "arrow-ipc-lz4"
+    assert result["schema"] == [
+        {"name": "ts", "type": "timestamp[ns]"},
+        {"name": "px", "type": "double"},
+    ]
+    decoded = pa.ipc.open_stream(base64.b64decode(result["data"])).read_all()
+    assert decoded.equals(source)
+
+
+@pytest.mark.asyncio
+async def test_session_table_data_negative_budget():
+    """Test session_table_data rejects a negative budget before fetching data."""
+    context = MockContext({"session_registry": MagicMock()})
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table"
+    ) as mock_get_table:
+        result = await session_table_data(context, "session1", "table1", max_bytes=-1)
+
+    mock_get_table.assert_not_called()
+    assert result["success"] is False
+    assert result["isError"] is True
+    assert "max_bytes must be non-negative" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_session_table_data_total_row_count_complete():
+    """Test include_total_row_count reuses the row count of a complete fetch."""
+    context = _export_context(None)
+    source = pa.table({"id": [1, 2, 3]})
+
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table",
+            new=AsyncMock(return_value=(source, True)),
+        ),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table_row_count"
+        ) as mock_count,
+    ):
+        result = await session_table_data(
+            context, "session1", "t", include_total_row_count=True
+        )
+
+    mock_count.assert_not_called()
+    assert result["success"] is True
+    assert result["total_row_count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_session_table_data_total_row_count_truncated():
+    """Test include_total_row_count asks the server only when the fetch was truncated."""
+    context = _export_context(None)
+    source = pa.table({"id": [1, 2]})
+
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table",
+            new=AsyncMock(return_value=(source, False)),
+        ),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table_row_count",
+            new=AsyncMock(return_value=500),
+        ) as mock_count,
+    ):
+        result = await session_table_data(
+            context,
+            "session1",
+            "t",
+            max_rows=2,
+            filters=["id > 0"],
+            include_total_row_count=True,
+        )
+
+    mock_count.assert_awaited_once()
+    assert mock_count.call_args.kwargs == {"filters": ["id > 0"]}
+    assert result["row_count"] == 2
+    assert result["is_complete"] is False
+    assert result["total_row_count"] == 500
+
+
+@pytest.mark.asyncio
+async def test_session_table_data_total_row_count_omitted_by_default():
+    """Test total_row_count is not added unless requested."""
+    context = _export_context(None)
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table",
+        new=AsyncMock(return_value=(pa.table({"id": [1]}), False)),
+    ):
+        result = await session_table_data(context, "session1", "t", max_rows=1)
+
+    assert result["success"] is True
+    assert "total_row_count" not in result
+
+
+def _export_context(export_config):
+    """Build a context with a resolvable session and the given 'table_export' config."""
+    mock_registry = MagicMock()
+    mock_session_manager = MagicMock()
+    mock_registry.get = AsyncMock(return_value=mock_session_manager)
+    mock_session_manager.get = AsyncMock(return_value=MagicMock())
+    mock_config_manager = MagicMock()
+    full_config = {} if export_config is None else {"table_export": export_config}
+    mock_config_manager.get_config = AsyncMock(return_value=full_config)
+    return MockContext(
+        {"session_registry": mock_registry, "config_manager": mock_config_manager}
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_table_data_export_parquet(tmp_path):
+    """Test export_parquet writes a Parquet file and returns only its metadata."""
+    import pyarrow.parquet as pq
+
+    export_dir = tmp_path / "spill"
+    context = _export_context({"directory": str(export_dir), "batch_rows": 7})
+    table = pa.table({"id": [1, 2, 3], "sym": ["a", "b", "c"]})
+
+    async def fake_export(
+        session, table_name, path, *, max_rows, head, batch_rows, **kwargs
+    ):
+        pq.write_table(table, path)
+        return table.schema, table.num_rows, False
+
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.table.queries.export_table_to_parquet",
+            side_effect=fake_export,
+        ) as mock_export,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table"
+        ) as mock_get_table,
+    ):
+        result = await session_table_data(
+            context,
+            "session1",
+            "my/table",
+            max_rows=3,
+            head=False,
+            format="csv",
+            export_parquet=True,
+            columns=["id", "sym"],
+            filters=["id > 0"],
+        )
+
+    mock_get_table.assert_not_called()
+    assert mock_export.call_args.kwargs == {
+        "max_rows": 3,
+        "head": False,
+        "batch_rows": 7,
+        "columns": ["id", "sym"],
+        "filters": ["id > 0"],
+    }
+    assert result["success"] is True
+    assert result["format"] == "parquet"
+    assert result["table_name"] == "my/table"
+    assert "data" not in result
+    assert os.path.dirname(result["path"]) == str(export_dir)
+    assert os.path.basename(result["path"]).startswith("my_table-")
+    assert result["path"].endswith(".parquet")
+    assert result["schema"] == [
+        {"name": "id", "type": "int64"},
+        {"name": "sym", "type": "string"},
+    ]
+    assert result["row_count"] == 3
+    assert result["is_complete"] is False
+    assert result["file_size_bytes"] == os.path.getsize(result["path"])
+    assert pq.read_table(result["path"]).equals(table)
+
+
+@pytest.mark.asyncio
+async def test_session_table_data_export_parquet_default_batch_rows(tmp_path):
+    """Test export_parquet uses DEFAULT_EXPORT_BATCH_ROWS when batch_rows is not set."""
+    context = _export_context({"directory": str(tmp_path)})
+
+    async def fake_export(
+        session, table_name, path, *, max_rows, head, batch_rows, **kwargs
+    ):
+        open(path, "wb").close()
+        return pa.schema([]), 0, True
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.table.queries.export_table_to_parquet",
+        side_effect=fake_export,
+    ) as mock_export:
+        result = await session_table_data(context, "session1", "t", export_parquet=True)
+
+    assert result["success"] is True
+    assert (
+        mock_export.call_args.kwargs["batch_rows"] == config.DEFAULT_EXPORT_BATCH_ROWS
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_table_data_export_parquet_total_row_count(tmp_path):
+    """Test include_total_row_count in export mode counts a truncated export."""
+    context = _export_context({"directory": str(tmp_path)})
+
+    async def fake_export(session, table_name, path, **kwargs):
+        open(path, "wb").close()
+        return pa.schema([]), 10, False
+
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.table.queries.export_table_to_parquet",
+            side_effect=fake_export,
+        ),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table_row_count",
+            new=AsyncMock(return_value=25),
+        ),
+    ):
+        result = await session_table_data(
+            context,
+            "session1",
+            "t",
+            max_rows=10,
+            export_parquet=True,
+            include_total_row_count=True,
+        )
+
+    assert result["success"] is True
+    assert result["row_count"] == 10
+    assert result["total_row_count"] == 25
+
+
+@pytest.mark.asyncio
+async def test_session_table_data_export_parquet_not_configured():
+    """Test export_parquet is rejected when 'table_export' is not configured."""
+    context = _export_context(None)
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.table.queries.export_table_to_parquet"
+    ) as mock_export:
+        result = await session_table_data(context, "session1", "t", export_parquet=True)
+
+    mock_export.assert_not_called()
+    assert result["success"] is False
+    assert result["isError"] is True
+    assert "Parquet export is disabled" in result["error"]
+    assert '"table_export"' in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_session_table_data_export_parquet_failure_removes_file(tmp_path):
+    """Test a failed export removes the partially written file."""
+    context = _export_context({"directory": str(tmp_path)})
+
+    async def failing_export(
+        session, table_name, path, *, max_rows, head, batch_rows, **kwargs
+    ):
+        with open(path, "wb") as f:
+            f.write(b"partial")
+        raise RuntimeError("connection lost")
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.table.queries.export_table_to_parquet",
+        side_effect=failing_export,
+    ):
+        result = await session_table_data(context, "session1", "t", export_parquet=True)
+
+    assert result["success"] is False
+    assert result["isError"] is True
+    assert "connection lost" in result["error"]
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_session_table_data_export_parquet_failure_before_file(tmp_path):
+    """Test a failed export that never created the file still reports the error."""
+    context = _export_context({"directory": str(tmp_path)})
+
+    with patch(
+        "deephaven_mcp.mcp_systems_server._tools.table.queries.export_table_to_parquet",
+        side_effect=RuntimeError("table not found"),
+    ):
+        result = await session_table_data(context, "session1", "t", export_parquet=True)
+
+    assert result["success"] is False
+    assert "table not found" in result["error"]
+    assert os.listdir(tmp_path) == []
+
+
 @pytest.mark.asyncio
 async def test_session_table_data_size_limit_exceeded():
     """Test get_table_data when response size exceeds limit."""
@@ -734,15 +1230,26 @@ async def test_session_table_data_size_limit_exceeded():
     mock_arrow_table.__len__ = MagicMock(return_value=large_row_count)
     mock_arrow_table.schema = [MagicMock() for _ in range(many_columns)]
 
-    with patch(
-        "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table"
-    ) as mock_get_table:
+    with (
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.table.queries.get_table"
+        ) as mock_get_table,
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_formatted_size",
+            return_value=60_000_000,
+        ),
+        patch(
+            "deephaven_mcp.mcp_systems_server._tools.shared.estimate_max_rows",
+            return_value=800,
+        ),
+    ):
         mock_get_table.return_value = (mock_arrow_table, True)
 
         result = await session_table_data(context, "session1", "table1")
 
         assert result["success"] is False
         assert "max 50MB" in result["error"]
+        assert "About 800 rows fit" in result["error"]
         assert result["isError"] is True
 
 
@@ -0,0 +1,67 @@
+"""
+Tests for deephaven_mcp.resource_manager._close_callbacks.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from deephaven_mcp.resource_manager._close_callbacks import (
+    register_close_callback,
+    run_close_callbacks,
+    unregister_close_callback,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_callbacks():
+    """Run each test against an empty callback list."""
+    with patch("deephaven_mcp.resource_manager._close_callbacks._CLOSE_CALLBACKS", []):
+        yield
+
+
+def test_callbacks_run_in_registration_order():
+    calls = []
+    register_close_callback(lambda name, item: calls.append(("first", name, item)))
+    register_close_callback(lambda name, item: calls.append(("second", name, item)))
+
+    item = object()
+    run_close_callbacks("community:s:n", item)
+
+    assert calls == [
+        ("first", "community:s:n", item),
+        ("second", "community:s:n", item),
+    ]
+
+
+def test_register_twice_runs_once():
+    callback = MagicMock()
+    register_close_callback(callback)
+    register_close_callback(callback)
+
+    run_close_callbacks("community:s:n", None)
+
+    callback.assert_called_once_with("community:s:n", None)
+
+
+def test_unregister_removes_callback_and_ignores_unknown():
+    callback = MagicMock()
+    register_close_callback(callback)
+    unregister_close_callback(callback)
+    unregister_close_callback(callback)
+
+    run_close_callbacks("community:s:n", None)
+
+    callback.assert_not_called()
+
+
+def test_failing_callback_does_not_stop_others(caplog):
+    failing = MagicMock(side_effect=RuntimeError("boom"))
+    following = MagicMock()
+    register_close_callback(failing)
+    register_close_callback(following)
+
+    run_close_callbacks("community:s:n", None)
+
+    following.assert_called_once_with("community:s:n", None)
+    assert "failed for 'community:s:n'" in caplog.text
@@ -137,6 +137,30 @@ async def test_close():
     item.close.assert_called_once()  # Still called only once
 
 
+@pytest.mark.asyncio
+async def test_close_runs_close_callbacks():
+    """Test close runs the registered close callbacks with the name and the closed item."""
+    from deephaven_mcp.resource_manager import (
+        register_close_callback,
+        unregister_close_callback,
+    )
+
+    manager = ConcreteItemManager(SystemType.COMMUNITY, "test-source", "test")
+    item = await manager.get()
+    callback = MagicMock()
+    register_close_callback(callback)
+    try:
+        await manager.close()
+        await manager.close()  # nothing cached any more
+    finally:
+        unregister_close_callback(callback)
+
+    assert callback.call_args_list == [
+        call("community:test-source:test", item),
+        call("community:test-source:test", None),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_close_not_alive():
     """Test that close handles an item that is not alive."""
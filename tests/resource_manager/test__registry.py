@@ -82,6 +82,23 @@ def test_snapshot_with_initialization_completed_with_errors():
     assert snapshot.initialization_errors == errors
 
 
+def test_snapshot_with_initialization_warm_up_state():
+    """with_initialization() carries the community warm-up state; it defaults to none."""
+    snapshot = RegistrySnapshot.with_initialization(
+        items={},
+        phase=InitializationPhase.COMPLETED,
+        errors={},
+        warm_up_phase=InitializationPhase.LOADING,
+        warm_up_errors={"community:config:c1": "refused"},
+    )
+    assert snapshot.warm_up_phase == InitializationPhase.LOADING
+    assert snapshot.warm_up_errors == {"community:config:c1": "refused"}
+
+    plain = RegistrySnapshot.simple(items={})
+    assert plain.warm_up_phase is None
+    assert plain.warm_up_errors == {}
+
+
 def test_snapshot_direct_construction_requires_all_fields():
     """Test that omitting any field raises TypeError."""
     with pytest.raises(TypeError):
@@ -13,6 +13,7 @@ Structure:
   TestCountAddedSessions         — count_added_sessions()
   TestIsAddedSession             — is_added_session()
   TestSyncEnterpriseSessions     — _sync_enterprise_sessions() orchestration
+  TestSyncCoalescing             — single-flight and reuse window of _sync_enterprise_sessions()
   TestSnapshotFactoryState       — _snapshot_factory_state()
   TestGetFactoryKeys             — _get_factory_keys()
   TestRemoveFactorySessionsByKeys — _remove_factory_sessions_by_keys()
@@ -20,14 +21,18 @@ Structure:
   TestApplyFactorySuccess        — _apply_factory_success()
   TestApplyFactoryError          — _apply_factory_error()
   TestApplyResults               — _apply_results() dispatch
+  TestEnterpriseWatchers         — _start_watchers(), _watch_factory(), lookups of watched factories
   TestDiscoverEnterpriseSessions — _discover_enterprise_sessions()
+  TestWarmUpCommunitySessions    — _warm_up_community_sessions()
   TestBuildNotFoundMessage       — _build_not_found_message()
   TestMakeEnterpriseSessionManager — static helper
   TestQueryFactory               — module-level _fetch_factory_pqs()
 """
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
@@ -100,10 +105,25 @@ def _make_mock_factory_manager() -> MagicMock:
 def _make_mock_controller_client() -> MagicMock:
     m = MagicMock(spec=CorePlusControllerClient)
     m.ping = AsyncMock(return_value=True)
-    m.map = AsyncMock(return_value={})
+    m.query_names_and_version = _query_names()
+    m.wait_for_change_from_version = AsyncMock(side_effect=_wait_forever)
     return m
 
 
+async def _wait_forever(version, timeout_seconds, executor=None):
+    """Stand-in for a long-poll that never sees a change."""
+    await asyncio.Event().wait()
+
+
+def _query_names(*names: str, version: int = 1) -> AsyncMock:
+    """query_names_and_version() stand-in reporting *names* at map *version*."""
+
+    async def query_names_and_version(known_version=None):
+        return (None if known_version == version else set(names)), version
+
+    return AsyncMock(side_effect=query_names_and_version)
+
+
 # ---------------------------------------------------------------------------
 # TestConstruction
 # ---------------------------------------------------------------------------
@@ -263,6 +283,47 @@ class TestInitialize:
             await registry.initialize(cfg)
             assert registry._discovery_task is task1  # same task, not replaced
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("argument, expected", [(None, 7), (3, 3), (0, 0)])
+    async def test_initialize_sets_warm_up_concurrency(
+        self,
+        registry,
+        mock_community_registry,
+        mock_enterprise_registry,
+        argument,
+        expected,
+    ):
+        """The warm-up argument overrides COMMUNITY_WARMUP_MAX_CONCURRENT."""
+        with (
+            patch(
+                "deephaven_mcp.resource_manager._registry_combined.CommunitySessionRegistry",
+                return_value=mock_community_registry,
+            ),
+            patch(
+                "deephaven_mcp.resource_manager._registry_combined.CorePlusSessionFactoryRegistry",
+                return_value=mock_enterprise_registry,
+            ),
+            patch(
+                "deephaven_mcp.resource_manager._registry_combined.COMMUNITY_WARMUP_MAX_CONCURRENT",
+                7,
+            ),
+            patch.object(registry, "_discover_enterprise_sessions", AsyncMock()),
+            patch.object(
+                registry, "_warm_up_community_sessions", AsyncMock()
+            ) as warm_up,
+        ):
+            await registry.initialize(
+                MagicMock(spec=ConfigManager), warm_up_max_concurrent=argument
+            )
+            await registry._discovery_task
+            if expected:
+                await registry._warm_up_task
+                warm_up.assert_awaited_once_with([], expected)
+            else:
+                assert registry._warm_up_task is None
+                warm_up.assert_not_called()
+        assert registry._warm_up_max_concurrent == expected
+
     @pytest.mark.asyncio
     async def test_initialize_propagates_load_error(
         self, registry, mock_community_registry, mock_enterprise_registry
@@ -345,6 +406,7 @@ class TestClose:
     async def test_close_resets_state(self, initialized_registry):
         """After close(), extra state is cleared."""
         initialized_registry._controller_clients["f1"] = MagicMock()
+        initialized_registry._client_verified_at["f1"] = 1.0
         initialized_registry._added_session_ids.add("enterprise:f1:s1")
         initialized_registry._errors["f1"] = "err"
         mock_item = MagicMock(spec=BaseItemManager)
@@ -354,6 +416,7 @@ class TestClose:
         await initialized_registry.close()
 
         assert initialized_registry._controller_clients == {}
+        assert initialized_registry._client_verified_at == {}
         assert initialized_registry._added_session_ids == set()
         assert initialized_registry._errors == {}
         assert initialized_registry._phase == InitializationPhase.NOT_STARTED
@@ -483,6 +546,33 @@ class TestGet:
         assert result is mock_item
         mock_sync.assert_awaited_once_with(["factory1"])
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("watched", [False, True])
+    async def test_get_enterprise_miss_forces_fresh_refresh(
+        self, initialized_registry, watched
+    ):
+        """A missing enterprise session triggers one refresh that ignores reuse and watchers."""
+        mock_item = MagicMock(spec=BaseItemManager)
+        if watched:
+            initialized_registry._watched_factories.add("factory1")
+
+        async def sync(factory_names, max_age_seconds=None):
+            if max_age_seconds == 0:
+                initialized_registry._items["enterprise:factory1:new"] = mock_item
+
+        with patch.object(
+            initialized_registry,
+            "_sync_enterprise_sessions",
+            AsyncMock(side_effect=sync),
+        ) as mock_sync:
+            result = await initialized_registry.get("enterprise:factory1:new")
+
+        assert result is mock_item
+        expected = [call(["factory1"], max_age_seconds=0)]
+        if not watched:
+            expected.insert(0, call(["factory1"]))
+        assert mock_sync.await_args_list == expected
+
     @pytest.mark.asyncio
     async def test_get_enterprise_no_refresh_during_loading(self, initialized_registry):
         """No refresh during LOADING phase — background task is sole writer."""
@@ -649,6 +739,21 @@ class TestAddSession:
         with pytest.raises(ValueError, match="already exists"):
             await initialized_registry.add_session(m)
 
+    @pytest.mark.asyncio
+    async def test_add_enterprise_session_forgets_map_version(
+        self, initialized_registry
+    ):
+        """Adding an enterprise session forces its factory's next refresh to reconcile."""
+        initialized_registry._map_versions = {"f1": 7, "f2": 3}
+        m = MagicMock(spec=BaseItemManager)
+        m.full_name = "enterprise:f1:s1"
+        m.system_type = SystemType.ENTERPRISE
+        m.source = "f1"
+
+        await initialized_registry.add_session(m)
+
+        assert initialized_registry._map_versions == {"f2": 3}
+
 
 # ---------------------------------------------------------------------------
 # TestRemoveSession
@@ -686,6 +791,21 @@ class TestRemoveSession:
         assert result1 is None
         assert result2 is None
 
+    @pytest.mark.asyncio
+    async def test_remove_enterprise_session_forgets_map_version(
+        self, initialized_registry
+    ):
+        """Removing an enterprise session forces its factory's next refresh to reconcile."""
+        m = MagicMock(spec=BaseItemManager)
+        m.system_type = SystemType.ENTERPRISE
+        m.source = "f1"
+        initialized_registry._items["enterprise:f1:s1"] = m
+        initialized_registry._map_versions = {"f1": 7}
+
+        assert await initialized_registry.remove_session("enterprise:f1:s1") is m
+
+        assert initialized_registry._map_versions == {}
+
 
 # ---------------------------------------------------------------------------
 # TestCountAddedSessions
@@ -852,9 +972,7 @@ class TestSyncEnterpriseSessions:
         mock_factory = _make_mock_factory_manager()
         mock_client = _make_mock_controller_client()
 
-        session_info = MagicMock()
-        session_info.config.pb.name = "pq1"
-        mock_client.map = AsyncMock(return_value={"k": session_info})
+        mock_client.query_names_and_version = _query_names("pq1")
 
         initialized_registry._enterprise_registry.get = AsyncMock(
             return_value=mock_factory
@@ -871,7 +989,7 @@ class TestSyncEnterpriseSessions:
         """Sessions no longer in controller are removed and closed."""
         mock_factory = _make_mock_factory_manager()
         mock_client = _make_mock_controller_client()
-        mock_client.map = AsyncMock(return_value={})
+        mock_client.query_names_and_version = _query_names()
 
         stale_key = BaseItemManager.make_full_name(SystemType.ENTERPRISE, "f1", "old")
         stale_mgr = MagicMock(spec=BaseItemManager)
@@ -958,6 +1076,161 @@ class TestSyncEnterpriseSessions:
         ends = [i for i, x in enumerate(call_order) if x.startswith("end_")]
         assert max(starts) < min(ends)
 
+    @pytest.mark.asyncio
+    async def test_sync_skips_reconcile_when_version_unchanged(
+        self, initialized_registry
+    ):
+        """A second refresh with an unchanged controller map reconciles nothing."""
+        mock_client = _make_mock_controller_client()
+        mock_client.query_names_and_version = _query_names("pq1", version=4)
+        initialized_registry._controller_clients["f1"] = mock_client
+        initialized_registry._enterprise_registry.get = AsyncMock(
+            return_value=_make_mock_factory_manager()
+        )
+
+        with patch.multiple(
+            "deephaven_mcp.resource_manager._registry_combined",
+            ENTERPRISE_WATCH_POLL_SECONDS=0,
+            ENTERPRISE_SYNC_MAX_AGE_SECONDS=0,
+        ):
+            await initialized_registry._sync_enterprise_sessions(["f1"])
+            items = dict(initialized_registry._items)
+            with patch.object(
+                initialized_registry, "_get_factory_keys"
+            ) as factory_keys:
+                await initialized_registry._sync_enterprise_sessions(["f1"])
+
+        assert mock_client.query_names_and_version.await_args_list == [
+            call(None),
+            call(4),
+        ]
+        mock_client.wait_for_change_from_version.assert_not_awaited()
+        factory_keys.assert_not_called()
+        assert initialized_registry._items == items
+        assert initialized_registry._map_versions == {"f1": 4}
+
+
+# ---------------------------------------------------------------------------
+# TestSyncCoalescing
+# ---------------------------------------------------------------------------
+
+
+class TestSyncCoalescing:
+    @pytest.fixture
+    def counted_registry(self, initialized_registry):
+        """Registry whose factory queries are counted and yield once; watchers off."""
+        initialized_registry._enterprise_registry.get = AsyncMock(
+            return_value=_make_mock_factory_manager()
+        )
+        initialized_registry.queries = []
+
+        async def query(snapshot: _FactorySnapshot):
+            initialized_registry.queries.append(snapshot.factory_name)
+            await asyncio.sleep(0)
+            return _FactoryQueryResult(
+                snapshot.factory_name, _make_mock_controller_client(), set()
+            )
+
+        with (
+            patch(
+                "deephaven_mcp.resource_manager._registry_combined._fetch_factory_pqs",
+                side_effect=query,
+            ),
+            patch(
+                "deephaven_mcp.resource_manager._registry_combined.ENTERPRISE_WATCH_POLL_SECONDS",
+                0,
+            ),
+        ):
+            yield initialized_registry
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_refresh(self, counted_registry):
+        await asyncio.gather(
+            *(counted_registry._sync_enterprise_sessions(["f1"]) for _ in range(10)),
+            counted_registry._sync_enterprise_sessions(["f1", "f2"]),
+        )
+
+        assert sorted(counted_registry.queries) == ["f1", "f2"]
+        assert counted_registry._sync_flights == {}
+
+    @pytest.mark.asyncio
+    async def test_recent_refresh_is_reused(self, counted_registry):
+        await counted_registry._sync_enterprise_sessions(["f1"])
+        await counted_registry._sync_enterprise_sessions(["f1"])
+        assert counted_registry.queries == ["f1"]
+
+        await counted_registry._sync_enterprise_sessions(["f1"], max_age_seconds=0)
+        assert counted_registry.queries == ["f1", "f1"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_older_than_window_is_repeated(self, counted_registry):
+        await counted_registry._sync_enterprise_sessions(["f1"])
+        counted_registry._synced_at["f1"] -= 60
+
+        await counted_registry._sync_enterprise_sessions(["f1"], max_age_seconds=30)
+
+        assert counted_registry.queries == ["f1", "f1"]
+
+    @pytest.mark.asyncio
+    async def test_factory_error_is_not_reused(self, counted_registry):
+        """Only factories whose controller answered are marked as recently refreshed."""
+
+        async def query(snapshot: _FactorySnapshot):
+            counted_registry.queries.append(snapshot.factory_name)
+            if snapshot.factory_name == "f2":
+                return _FactoryQueryError("f2", None, "controller down")
+            return _FactoryQueryResult(
+                snapshot.factory_name, _make_mock_controller_client(), set()
+            )
+
+        counted_registry._synced_at["f2"] = time.monotonic() - 60
+        with patch(
+            "deephaven_mcp.resource_manager._registry_combined._fetch_factory_pqs",
+            side_effect=query,
+        ):
+            await counted_registry._sync_enterprise_sessions(
+                ["f1", "f2"], max_age_seconds=0
+            )
+            assert set(counted_registry._synced_at) == {"f1"}
+
+            await counted_registry._sync_enterprise_sessions(["f1", "f2"])
+
+        assert counted_registry.queries == ["f1", "f2", "f2"]
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_reaches_every_caller_and_is_not_reused(
+        self, counted_registry
+    ):
+        with patch.object(
+            counted_registry, "_apply_results", side_effect=InternalError("bug")
+        ):
+            results = await asyncio.gather(
+                counted_registry._sync_enterprise_sessions(["f1"]),
+                counted_registry._sync_enterprise_sessions(["f1"]),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, InternalError) for r in results)
+        assert counted_registry.queries == ["f1"]
+        assert counted_registry._sync_flights == {}
+        assert "f1" not in counted_registry._synced_at
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_refresh(
+        self, counted_registry
+    ):
+        first = asyncio.create_task(counted_registry._sync_enterprise_sessions(["f1"]))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(counted_registry._sync_enterprise_sessions(["f1"]))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        await second
+
+        assert first.cancelled()
+        assert counted_registry.queries == ["f1"]
+        assert "f1" in counted_registry._synced_at
+
 
 # ---------------------------------------------------------------------------
 # TestSnapshotFactoryState
@@ -995,6 +1268,28 @@ class TestSnapshotFactoryState:
         assert len(snapshots) == 1
         assert snapshots[0].client is mock_client
 
+    @pytest.mark.asyncio
+    async def test_captures_map_version(self, initialized_registry):
+        initialized_registry._enterprise_registry.get = AsyncMock(
+            return_value=_make_mock_factory_manager()
+        )
+        initialized_registry._map_versions["f1"] = 12
+
+        snapshots = await initialized_registry._snapshot_factory_state(["f1", "f1"])
+
+        assert [snap.map_version for snap in snapshots] == [12, 12]
+
+    @pytest.mark.asyncio
+    async def test_captures_client_verified_at(self, initialized_registry):
+        initialized_registry._enterprise_registry.get = AsyncMock(
+            return_value=_make_mock_factory_manager()
+        )
+        initialized_registry._client_verified_at["f1"] = 42.0
+
+        snapshots = await initialized_registry._snapshot_factory_state(["f1", "f2"])
+
+        assert [snap.verified_at for snap in snapshots] == [42.0, None]
+
 
 # ---------------------------------------------------------------------------
 # TestGetFactoryKeys
@@ -1223,6 +1518,55 @@ class TestApplyFactorySuccess:
 
         assert stale_key not in initialized_registry._added_session_ids
 
+    def test_unchanged_map_leaves_items_untouched(self, initialized_registry):
+        """A result without query_names only refreshes the client and clears the error."""
+        key = BaseItemManager.make_full_name(SystemType.ENTERPRISE, "f1", "s1")
+        mgr = MagicMock(spec=BaseItemManager)
+        initialized_registry._items[key] = mgr
+        initialized_registry._errors["f1"] = "old error"
+        initialized_registry._map_versions["f1"] = 5
+        mock_client = _make_mock_controller_client()
+
+        with patch.object(initialized_registry, "_get_factory_keys") as get_keys:
+            managers_to_close = initialized_registry._apply_factory_success(
+                _FactoryQueryResult("f1", mock_client, None, map_version=5),
+                self._make_snapshot().factory_manager,
+            )
+
+        assert managers_to_close == []
+        get_keys.assert_not_called()
+        assert initialized_registry._items == {key: mgr}
+        assert initialized_registry._controller_clients["f1"] is mock_client
+        assert "f1" not in initialized_registry._errors
+        assert initialized_registry._map_versions["f1"] == 5
+
+    @pytest.mark.parametrize("map_version, expected", [(9, {"f1": 9}), (None, {})])
+    def test_records_reconciled_map_version(
+        self, initialized_registry, map_version, expected
+    ):
+        initialized_registry._map_versions["f1"] = 5
+        initialized_registry._apply_factory_success(
+            _FactoryQueryResult(
+                "f1", _make_mock_controller_client(), set(), map_version=map_version
+            ),
+            self._make_snapshot().factory_manager,
+        )
+        assert initialized_registry._map_versions == expected
+
+    @pytest.mark.parametrize("verified_at, expected", [(8.0, 8.0), (None, 5.0)])
+    def test_records_client_verified_at(
+        self, initialized_registry, verified_at, expected
+    ):
+        """A query that skipped the ping keeps the previous verification time."""
+        initialized_registry._client_verified_at["f1"] = 5.0
+        initialized_registry._apply_factory_success(
+            _FactoryQueryResult(
+                "f1", _make_mock_controller_client(), None, verified_at=verified_at
+            ),
+            self._make_snapshot().factory_manager,
+        )
+        assert initialized_registry._client_verified_at["f1"] == expected
+
 
 # ---------------------------------------------------------------------------
 # TestApplyFactoryError
@@ -1246,6 +1590,24 @@ class TestApplyFactoryError:
         assert mgr in managers_to_close
         assert key not in initialized_registry._items
 
+    def test_forgets_map_version(self, initialized_registry):
+        initialized_registry._map_versions["f1"] = 5
+        initialized_registry._apply_factory_error(
+            _FactoryQueryError(factory_name="f1", new_client=None, error="boom")
+        )
+        assert "f1" not in initialized_registry._map_versions
+
+    def test_forgets_client_verified_at(self, initialized_registry):
+        initialized_registry._client_verified_at["f1"] = 5.0
+        initialized_registry._apply_factory_error(
+            _FactoryQueryError(
+                factory_name="f1",
+                new_client=_make_mock_controller_client(),
+                error="boom",
+            )
+        )
+        assert "f1" not in initialized_registry._client_verified_at
+
     def test_caches_new_client_when_present(self, initialized_registry):
         new_client = _make_mock_controller_client()
         result = _FactoryQueryError(
@@ -1501,6 +1863,469 @@ class TestDiscoverEnterpriseSessions:
         assert initialized_registry._phase == InitializationPhase.COMPLETED
 
 
+# ---------------------------------------------------------------------------
+# TestEnterpriseWatchers
+# ---------------------------------------------------------------------------
+
+
+async def _settle(predicate) -> None:
+    """Yield to the event loop until *predicate* holds (bounded)."""
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+def _watched_client(*name_sets, changes=()) -> MagicMock:
+    """Controller client whose versioned map goes through *name_sets* in order.
+
+    *changes* are the results of successive wait_for_change_from_version calls;
+    once exhausted, the client waits forever.
+    """
+    client = _make_mock_controller_client()
+    client.query_names_and_version = AsyncMock(
+        side_effect=[(names, version) for version, names in enumerate(name_sets)]
+    )
+    results = list(changes)
+
+    async def wait_for_change(version, timeout_seconds, executor=None):
+        if results:
+            return results.pop(0)
+        await _wait_forever(version, timeout_seconds)
+
+    client.wait_for_change_from_version = AsyncMock(side_effect=wait_for_change)
+    return client
+
+
+class TestEnterpriseWatchers:
+    @pytest.fixture
+    def factory_registry(self, initialized_registry):
+        """Registry whose enterprise registry holds factory 'f1'."""
+        initialized_registry._enterprise_registry.get = AsyncMock(
+            return_value=_make_mock_factory_manager()
+        )
+        return initialized_registry
+
+    @pytest.mark.asyncio
+    async def test_sync_starts_watcher_and_close_stops_it(self, factory_registry):
+        """A successful refresh starts a watcher; close() cancels it."""
+        client = _watched_client({"pq1"}, {"pq1"})
+        factory_registry._controller_clients["f1"] = client
+
+        await factory_registry._sync_enterprise_sessions(["f1"])
+        task = factory_registry._watch_tasks["f1"]
+        await _settle(lambda: "f1" in factory_registry._watched_factories)
+
+        await factory_registry.close()
+
+        assert task.cancelled()
+        assert factory_registry._watch_tasks == {}
+        assert factory_registry._watched_factories == set()
+
+    @pytest.mark.asyncio
+    async def test_watchers_poll_on_own_executor(self, factory_registry):
+        """Long-polls run on the registry's watcher pool, which close() shuts down."""
+        client = _watched_client({"pq1"}, {"pq1"})
+        factory_registry._controller_clients["f1"] = client
+
+        await factory_registry._sync_enterprise_sessions(["f1"])
+        await _settle(lambda: client.wait_for_change_from_version.await_count == 1)
+        executor = factory_registry._watch_executor
+
+        assert isinstance(executor, ThreadPoolExecutor)
+        assert client.wait_for_change_from_version.await_args.kwargs == {
+            "executor": executor
+        }
+        with patch.object(executor, "shutdown") as shutdown:
+            await factory_registry.close()
+        shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert factory_registry._watch_executor is None
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_refresh_error_stops_watcher(self, factory_registry):
+        """A failed refresh of a watched factory stops its watcher; the next success restarts it."""
+        client = _watched_client({"pq1"}, {"pq1"})
+        factory_registry._controller_clients["f1"] = client
+        key = BaseItemManager.make_full_name(SystemType.ENTERPRISE, "f1", "pq1")
+        await factory_registry._sync_enterprise_sessions(["f1"])
+        old_task = factory_registry._watch_tasks["f1"]
+        await _settle(lambda: "f1" in factory_registry._watched_factories)
+
+        new_client = _watched_client({"pq1"})
+        with (
+            patch(
+                "deephaven_mcp.resource_manager._registry_combined.ENTERPRISE_SYNC_MAX_AGE_SECONDS",
+                0,
+            ),
+            patch(
+                "deephaven_mcp.resource_manager._registry_combined._fetch_factory_pqs",
+                new=AsyncMock(
+                    side_effect=[
+                        _FactoryQueryError("f1", None, "controller down"),
+                        _FactoryQueryResult("f1", new_client, {"pq1"}),
+                    ]
+                ),
+            ),
+        ):
+            await factory_registry._sync_enterprise_sessions(["f1"])
+
+            with pytest.raises(asyncio.CancelledError):
+                await old_task
+            assert "f1" not in factory_registry._watched_factories
+            assert "f1" not in factory_registry._watch_tasks
+            assert key not in factory_registry._items
+            assert factory_registry._errors["f1"] == "controller down"
+
+            await factory_registry._sync_enterprise_sessions(["f1"])
+
+        assert key in factory_registry._items
+        assert "f1" not in factory_registry._errors
+        assert factory_registry._watch_tasks["f1"] is not old_task
+        await _settle(lambda: "f1" in factory_registry._watched_factories)
+        await factory_registry.close()
+
+    @pytest.mark.asyncio
+    async def test_replaced_watcher_keeps_new_watchers_mark(self, factory_registry):
+        """A watcher exiting after being replaced does not unmark its successor."""
+        client = _make_mock_controller_client()
+        client.query_names_and_version = AsyncMock(
+            side_effect=RuntimeError("stream lost")
+        )
+        successor = asyncio.create_task(asyncio.sleep(9999))
+        factory_registry._watch_tasks["f1"] = successor
+        factory_registry._watched_factories.add("f1")
+
+        await factory_registry._watch_factory("f1", client)
+
+        assert factory_registry._watch_tasks == {"f1": successor}
+        assert "f1" in factory_registry._watched_factories
+        successor.cancel()
+
+    @pytest.mark.asyncio
+    async def test_start_watchers_skips_errors_running_and_disabled(
+        self, initialized_registry
+    ):
+        """Watchers start only for new successful results, and only when enabled."""
+        running = asyncio.create_task(asyncio.sleep(9999))
+        initialized_registry._watch_tasks["f1"] = running
+        results = [
+            _FactoryQueryResult("f1", _make_mock_controller_client(), set()),
+            _FactoryQueryError("f2", None, "boom"),
+        ]
+
+        initialized_registry._start_watchers(results)
+        assert initialized_registry._watch_tasks == {"f1": running}
+
+        del initialized_registry._watch_tasks["f1"]
+        with patch(
+            "deephaven_mcp.resource_manager._registry_combined.ENTERPRISE_WATCH_POLL_SECONDS",
+            0,
+        ):
+            initialized_registry._start_watchers(results)
+        assert initialized_registry._watch_tasks == {}
+        running.cancel()
+
+    @pytest.mark.asyncio
+    async def test_watcher_applies_only_name_changes(self, factory_registry):
+        """Version changes are applied only when the set of PQ names changes."""
+        client = _watched_client({"a"}, {"a"}, {"a", "b"}, changes=[False, True, True])
+        key_b = BaseItemManager.make_full_name(SystemType.ENTERPRISE, "f1", "b")
+
+        with patch.object(
+            factory_registry,
+            "_apply_factory_success",
+            wraps=factory_registry._apply_factory_success,
+        ) as apply:
+            task = asyncio.create_task(factory_registry._watch_factory("f1", client))
+            await _settle(lambda: key_b in factory_registry._items)
+
+        assert apply.call_count == 2
+        assert client.query_names_and_version.await_count == 3
+        assert "f1" in factory_registry._watched_factories
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert "f1" not in factory_registry._watched_factories
+
+    @pytest.mark.asyncio
+    async def test_watcher_closes_removed_sessions(self, factory_registry):
+        """Sessions dropped by the controller are removed and closed; close errors are logged."""
+        stale_key = BaseItemManager.make_full_name(SystemType.ENTERPRISE, "f1", "old")
+        stale_mgr = MagicMock(spec=BaseItemManager)
+        stale_mgr.full_name = stale_key
+        stale_mgr.close = AsyncMock(side_effect=RuntimeError("close boom"))
+        factory_registry._items[stale_key] = stale_mgr
+
+        assert await factory_registry._apply_watched_names(
+            "f1", _make_mock_controller_client(), set()
+        )
+
+        assert stale_key not in factory_registry._items
+        stale_mgr.close.assert_awaited_once()
+        assert "f1" in factory_registry._watched_factories
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cached_is_watcher_client", [True, False])
+    async def test_watcher_error_falls_back_to_refresh(
+        self, factory_registry, cached_is_watcher_client
+    ):
+        """A failing watcher unmarks its factory and evicts its own client."""
+        client = _make_mock_controller_client()
+        client.query_names_and_version = AsyncMock(
+            side_effect=RuntimeError("stream lost")
+        )
+        other_client = _make_mock_controller_client()
+        factory_registry._controller_clients["f1"] = (
+            client if cached_is_watcher_client else other_client
+        )
+        factory_registry._client_verified_at["f1"] = 1.0
+        task = asyncio.create_task(factory_registry._watch_factory("f1", client))
+        factory_registry._watch_tasks["f1"] = task
+
+        await task
+
+        assert "f1" not in factory_registry._watched_factories
+        assert factory_registry._watch_tasks == {}
+        if cached_is_watcher_client:
+            assert "f1" not in factory_registry._controller_clients
+            assert "f1" not in factory_registry._client_verified_at
+        else:
+            assert factory_registry._controller_clients["f1"] is other_client
+            assert factory_registry._client_verified_at["f1"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_watcher_stops_when_factory_removed(self, initialized_registry):
+        """The watcher exits when its factory leaves the enterprise registry."""
+        initialized_registry._enterprise_registry.get = AsyncMock(
+            side_effect=RegistryItemNotFoundError("f1")
+        )
+        client = _watched_client({"a"})
+
+        await initialized_registry._watch_factory("f1", client)
+
+        assert "f1" not in initialized_registry._watched_factories
+        assert initialized_registry._items == {}
+
+    @pytest.mark.asyncio
+    async def test_watcher_stops_when_registry_closing(self, factory_registry):
+        """The watcher applies nothing once the registry is shutting down."""
+        factory_registry._initialized = False
+        client = _watched_client({"a"})
+
+        await factory_registry._watch_factory("f1", client)
+
+        assert factory_registry._watched_factories == set()
+        assert factory_registry._items == {}
+
+    @pytest.mark.asyncio
+    async def test_get_skips_refresh_for_watched_factory(self, initialized_registry):
+        """get() is a pure lookup for a factory kept current by a watcher."""
+        mock_item = MagicMock(spec=BaseItemManager)
+        initialized_registry._items["enterprise:factory1:session1"] = mock_item
+        initialized_registry._watched_factories.add("factory1")
+
+        with patch.object(
+            initialized_registry, "_sync_enterprise_sessions", AsyncMock()
+        ) as mock_sync:
+            result = await initialized_registry.get("enterprise:factory1:session1")
+
+        assert result is mock_item
+        mock_sync.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_all_refreshes_only_unwatched_factories(
+        self, initialized_registry
+    ):
+        """get_all() refreshes the factories without a running watcher."""
+        initialized_registry._enterprise_registry.get_all = AsyncMock(
+            return_value=RegistrySnapshot.simple(
+                items={"f1": MagicMock(), "f2": MagicMock()}
+            )
+        )
+        initialized_registry._watched_factories.add("f1")
+
+        with patch.object(
+            initialized_registry, "_sync_enterprise_sessions", AsyncMock()
+        ) as mock_sync:
+            await initialized_registry.get_all()
+            mock_sync.assert_awaited_once_with(["f2"])
+
+            initialized_registry._watched_factories.add("f2")
+            await initialized_registry.get_all()
+            mock_sync.assert_awaited_once()
+
+
+def _community_manager(name: str, get=None) -> MagicMock:
+    mgr = MagicMock(spec=BaseItemManager)
+    mgr.system_type = SystemType.COMMUNITY
+    mgr.full_name = BaseItemManager.make_full_name(SystemType.COMMUNITY, "config", name)
+    mgr.get = get or AsyncMock()
+    return mgr
+
+
+class TestWarmUpCommunitySessions:
+    @pytest.fixture
+    def warm_up_registry(
+        self, registry, mock_community_registry, mock_enterprise_registry
+    ):
+        """Patches the sub-registries so initialize() loads one blocking community session."""
+        release = asyncio.Event()
+        community = _community_manager("c1", AsyncMock(side_effect=release.wait))
+        mock_community_registry.get_all = AsyncMock(
+            return_value=RegistrySnapshot.simple(items={"c1": community})
+        )
+        registry.release = release
+        registry.community = community
+        with (
+            patch(
+                "deephaven_mcp.resource_manager._registry_combined.CommunitySessionRegistry",
+                return_value=mock_community_registry,
+            ),
+            patch(
+                "deephaven_mcp.resource_manager._registry_combined.CorePlusSessionFactoryRegistry",
+                return_value=mock_enterprise_registry,
+            ),
+        ):
+            yield registry
+
+    @pytest.mark.asyncio
+    async def test_discovery_completes_without_waiting_for_warm_up(
+        self, warm_up_registry, caplog
+    ):
+        """Warm-up runs as its own task and does not hold the phase at LOADING."""
+        caplog.set_level("INFO")
+        await warm_up_registry.initialize(
+            MagicMock(spec=ConfigManager), warm_up_max_concurrent=2
+        )
+        await warm_up_registry._discovery_task
+
+        assert warm_up_registry._phase == InitializationPhase.COMPLETED
+        assert warm_up_registry._warm_up_phase == InitializationPhase.LOADING
+        assert not warm_up_registry._warm_up_task.done()
+
+        warm_up_registry.release.set()
+        await warm_up_registry._warm_up_task
+        warm_up_registry.community.get.assert_awaited_once()
+        assert "warmed up 1/1 community sessions" in caplog.text
+        await warm_up_registry.close()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_disabled_by_default(self, warm_up_registry):
+        await warm_up_registry.initialize(MagicMock(spec=ConfigManager))
+        await warm_up_registry._discovery_task
+
+        assert warm_up_registry._warm_up_task is None
+        warm_up_registry.community.get.assert_not_called()
+        await warm_up_registry.close()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_warm_up(self, warm_up_registry, caplog):
+        caplog.set_level("INFO")
+        await warm_up_registry.initialize(
+            MagicMock(spec=ConfigManager), warm_up_max_concurrent=1
+        )
+        warm_up_task = warm_up_registry._warm_up_task
+        await _settle(lambda: warm_up_registry.community.get.await_count == 1)
+
+        await warm_up_registry.close()
+
+        assert warm_up_task.cancelled()
+        assert warm_up_registry._warm_up_task is None
+        assert warm_up_registry._warm_up_phase is None
+        assert "cancelled community session warm-up" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency(self, initialized_registry):
+        active = 0
+        peak = 0
+
+        async def connect():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        managers = [
+            _community_manager(f"c{i}", AsyncMock(side_effect=connect))
+            for i in range(5)
+        ]
+
+        await initialized_registry._warm_up_community_sessions(managers, 2)
+
+        assert peak == 2
+        for mgr in managers:
+            mgr.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failures_and_timeouts_do_not_stop_others(
+        self, initialized_registry, caplog
+    ):
+        async def hang():
+            await asyncio.Event().wait()
+
+        slow = _community_manager("slow", AsyncMock(side_effect=hang))
+        broken = _community_manager(
+            "broken", AsyncMock(side_effect=RuntimeError("refused"))
+        )
+        healthy = _community_manager("healthy")
+        caplog.set_level("INFO")
+
+        with patch(
+            "deephaven_mcp.resource_manager._registry_combined.COMMUNITY_WARMUP_TIMEOUT_SECONDS",
+            0.01,
+        ):
+            await initialized_registry._warm_up_community_sessions(
+                [slow, broken, healthy], 3
+            )
+
+        healthy.get.assert_awaited_once()
+        assert initialized_registry._warm_up_errors == {
+            "community:config:slow": "timed out after 0.01s",
+            "community:config:broken": "RuntimeError: refused",
+        }
+        assert initialized_registry._warm_up_phase == InitializationPhase.COMPLETED
+        assert "'community:config:slow' failed: timed out" in caplog.text
+        assert "'community:config:broken' failed: RuntimeError: refused" in caplog.text
+        assert "warmed up 1/3 community sessions" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_get_all_reports_warm_up_progress(self, initialized_registry):
+        """get_all() shows warm-up running, then its per-session failures."""
+        release = asyncio.Event()
+        slow = _community_manager("slow", AsyncMock(side_effect=release.wait))
+        broken = _community_manager(
+            "broken", AsyncMock(side_effect=RuntimeError("refused"))
+        )
+        initialized_registry._warm_up_phase = InitializationPhase.LOADING
+        task = asyncio.create_task(
+            initialized_registry._warm_up_community_sessions([slow, broken], 2)
+        )
+        await _settle(lambda: initialized_registry._warm_up_errors)
+
+        running = await initialized_registry.get_all()
+        release.set()
+        await task
+        finished = await initialized_registry.get_all()
+
+        assert running.warm_up_phase == InitializationPhase.LOADING
+        assert running.initialization_phase == InitializationPhase.COMPLETED
+        assert finished.warm_up_phase == InitializationPhase.COMPLETED
+        assert finished.warm_up_errors == {
+            "community:config:broken": "RuntimeError: refused"
+        }
+        assert finished.initialization_errors == {}
+
+    @pytest.mark.asyncio
+    async def test_no_managers_is_noop(self, initialized_registry, caplog):
+        caplog.set_level("INFO")
+        await initialized_registry._warm_up_community_sessions([], 4)
+        assert "warming up" not in caplog.text
+        assert initialized_registry._warm_up_phase == InitializationPhase.COMPLETED
+
+
 # ---------------------------------------------------------------------------
 # TestBuildNotFoundMessage
 # ---------------------------------------------------------------------------
@@ -1675,9 +2500,7 @@ class TestQueryFactory:
     @pytest.mark.asyncio
     async def test_extracts_pq_names_from_map(self):
         mock_client = _make_mock_controller_client()
-        session_info = MagicMock()
-        session_info.config.pb.name = "pq1"
-        mock_client.map = AsyncMock(return_value={"k": session_info})
+        mock_client.query_names_and_version = _query_names("pq1")
         snapshot = self._make_snapshot(client=mock_client)
 
         result = await _fetch_factory_pqs(snapshot)
@@ -1701,14 +2524,153 @@ class TestQueryFactory:
     @pytest.mark.asyncio
     async def test_extracts_multiple_pq_names_from_map(self):
         mock_client = _make_mock_controller_client()
-        info1 = MagicMock()
-        info1.config.pb.name = "alpha"
-        info2 = MagicMock()
-        info2.config.pb.name = "beta"
-        mock_client.map = AsyncMock(return_value={"k1": info1, "k2": info2})
+        mock_client.query_names_and_version = _query_names("alpha", "beta")
         snapshot = self._make_snapshot(client=mock_client)
 
         result = await _fetch_factory_pqs(snapshot)
 
         assert isinstance(result, _FactoryQueryResult)
         assert result.query_names == {"alpha", "beta"}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_version_returns_no_names(self):
+        """A cached client whose map has not changed returns no names."""
+        mock_client = _make_mock_controller_client()
+        mock_client.query_names_and_version = _query_names("pq1", version=3)
+        snapshot = self._make_snapshot(client=mock_client)
+        snapshot.map_version = 3
+
+        result = await _fetch_factory_pqs(snapshot)
+
+        assert isinstance(result, _FactoryQueryResult)
+        assert result.query_names is None
+        assert result.map_version == 3
+        mock_client.query_names_and_version.assert_awaited_once_with(3)
+        mock_client.wait_for_change_from_version.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_changed_version_reads_map(self):
+        mock_client = _make_mock_controller_client()
+        mock_client.query_names_and_version = _query_names("pq1", version=4)
+        snapshot = self._make_snapshot(client=mock_client)
+        snapshot.map_version = 3
+
+        result = await _fetch_factory_pqs(snapshot)
+
+        assert isinstance(result, _FactoryQueryResult)
+        assert result.query_names == {"pq1"}
+        assert result.map_version == 4
+
+    @pytest.mark.asyncio
+    async def test_recreated_client_ignores_cached_version(self):
+        """Versions are per client, so a recreated client always reads the full map."""
+        dead_client = _make_mock_controller_client()
+        dead_client.ping = AsyncMock(return_value=False)
+        new_client = _make_mock_controller_client()
+        new_client.query_names_and_version = _query_names("pq1", version=3)
+        snapshot = self._make_snapshot(client=dead_client)
+        snapshot.map_version = 3
+        snapshot.factory_manager.get.return_value.controller_client = new_client
+
+        result = await _fetch_factory_pqs(snapshot)
+
+        assert result.query_names == {"pq1"}
+        assert result.map_version == 3
+
+    @pytest.mark.asyncio
+    async def test_new_and_pinged_clients_are_verified(self):
+        """Connecting or pinging a client reports when it was verified."""
+        created = await _fetch_factory_pqs(self._make_snapshot(client=None))
+        pinged_client = _make_mock_controller_client()
+        pinged = await _fetch_factory_pqs(self._make_snapshot(client=pinged_client))
+
+        assert created.verified_at is not None
+        assert pinged.verified_at is not None
+        pinged_client.ping.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_recently_verified_client_skips_ping(self):
+        mock_client = _make_mock_controller_client()
+        mock_client.query_names_and_version = _query_names("pq1", version=2)
+        snapshot = self._make_snapshot(client=mock_client)
+        snapshot.verified_at = time.monotonic()
+
+        result = await _fetch_factory_pqs(snapshot)
+
+        assert result.query_names == {"pq1"}
+        assert result.new_client is mock_client
+        assert result.verified_at is None
+        mock_client.ping.assert_not_awaited()
+        snapshot.factory_manager.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stale_verification_pings(self):
+        mock_client = _make_mock_controller_client()
+        snapshot = self._make_snapshot(client=mock_client)
+        snapshot.verified_at = time.monotonic() - 1000
+
+        with patch(
+            "deephaven_mcp.resource_manager._registry_combined.CONTROLLER_PING_INTERVAL_SECONDS",
+            10.0,
+        ):
+            result = await _fetch_factory_pqs(snapshot)
+
+        mock_client.ping.assert_awaited_once()
+        assert result.verified_at > snapshot.verified_at
+
+    @pytest.mark.asyncio
+    async def test_failed_read_on_unpinged_client_retries_once(self):
+        """A failed read stands in for the skipped ping: recreate and read the full map."""
+        cached_client = _make_mock_controller_client()
+        cached_client.query_names_and_version = AsyncMock(
+            side_effect=RuntimeError("closed")
+        )
+        new_client = _make_mock_controller_client()
+        new_client.query_names_and_version = _query_names("pq1", version=3)
+        snapshot = self._make_snapshot(client=cached_client)
+        snapshot.map_version = 3
+        snapshot.verified_at = time.monotonic()
+        snapshot.factory_manager.get.return_value.controller_client = new_client
+
+        result = await _fetch_factory_pqs(snapshot)
+
+        assert isinstance(result, _FactoryQueryResult)
+        assert result.new_client is new_client
+        assert result.query_names == {"pq1"}
+        assert result.map_version == 3
+        assert result.verified_at is not None
+        cached_client.ping.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_retry_returns_error_with_new_client(self):
+        cached_client = _make_mock_controller_client()
+        cached_client.query_names_and_version = AsyncMock(
+            side_effect=RuntimeError("closed")
+        )
+        new_client = _make_mock_controller_client()
+        new_client.query_names_and_version = AsyncMock(
+            side_effect=RuntimeError("still down")
+        )
+        snapshot = self._make_snapshot(client=cached_client)
+        snapshot.verified_at = time.monotonic()
+        snapshot.factory_manager.get.return_value.controller_client = new_client
+
+        result = await _fetch_factory_pqs(snapshot)
+
+        assert isinstance(result, _FactoryQueryError)
+        assert result.new_client is new_client
+        assert "still down" in result.error
+
+    @pytest.mark.asyncio
+    async def test_failed_read_on_pinged_client_does_not_retry(self):
+        mock_client = _make_mock_controller_client()
+        mock_client.query_names_and_version = AsyncMock(
+            side_effect=RuntimeError("boom")
+        )
+        snapshot = self._make_snapshot(client=mock_client)
+
+        result = await _fetch_factory_pqs(snapshot)
+
+        assert isinstance(result, _FactoryQueryError)
+        assert result.new_client is None
+        snapshot.factory_manager.get.assert_not_awaited()
@@ -37,6 +37,9 @@ def test_imports_and_all():
         "launch_session",
         "find_available_port",
         "generate_auth_token",
+        "CloseCallback",
+        "register_close_callback",
+        "unregister_close_callback",
     ]
     assert sorted(mod.__all__) == sorted(expected_all)
 
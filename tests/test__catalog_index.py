@@ -0,0 +1,90 @@
+import pytest
+
+from deephaven_mcp._catalog_index import (
+    CatalogIndex,
+    CatalogMatch,
+    _trigrams,
+    trigram_similarity,
+)
+
+
+def _index() -> CatalogIndex:
+    """Build a small index with one null row."""
+    return CatalogIndex(
+        ["market_data", "market_data", "reference", None, "risk"],
+        ["TradeQuotes", "Trades", "Symbols", "Orphan", "FxTrades"],
+    )
+
+
+def test_trigrams_pads_and_lowercases():
+    """Test _trigrams pads the text with spaces and lowercases it"""
+    assert _trigrams("Ab") == {" ab", "ab "}
+    assert _trigrams("") == set()
+
+
+def test_catalog_index_skips_null_rows():
+    """Test rows with a null namespace or table name are not indexed"""
+    index = CatalogIndex(["ns", None, "ns"], ["a", "b", None])
+
+    assert len(index) == 1
+    assert index.search("b", 10) == []
+
+
+def test_catalog_index_mismatched_lengths():
+    """Test the namespace and table name sequences must be aligned"""
+    with pytest.raises(ValueError):
+        CatalogIndex(["ns"], ["a", "b"])
+
+
+def test_catalog_index_exact_match_ranks_first():
+    """Test an exact table name match outranks longer names containing the query"""
+    matches = _index().search("trades", 10)
+
+    assert [match.table for match in matches[:3]] == [
+        "Trades",
+        "FxTrades",
+        "TradeQuotes",
+    ]
+    assert matches[0] == CatalogMatch("market_data", "Trades", score=matches[0].score)
+    assert matches[0].score > 1.0
+    assert 0.5 < matches[1].score < 1.0
+
+
+def test_catalog_index_tolerates_typos():
+    """Test a misspelled query still finds the intended table"""
+    matches = _index().search("tradeqoutes", 3)
+
+    assert matches[0].table == "TradeQuotes"
+    assert matches[0].score < 0.5
+
+
+def test_catalog_index_namespace_substring():
+    """Test namespace matches are returned with the smaller namespace bonus"""
+    matches = _index().search("reference", 10)
+
+    assert matches[0].namespace == "reference"
+    assert matches[0].table == "Symbols"
+    assert 0.25 < matches[0].score < 1.0
+
+
+def test_catalog_index_coverage_threshold_and_limit():
+    """Test unrelated queries return nothing and results respect the limit"""
+    index = _index()
+
+    assert index.search("zzzz", 10) == []
+    assert len(index.search("trades", 1)) == 1
+
+
+def test_catalog_index_ties_keep_catalog_order():
+    """Test equally scored rows are returned in catalog order"""
+    index = CatalogIndex(["a", "b", "c"], ["same", "same", "same"])
+
+    assert [match.namespace for match in index.search("same", 2)] == ["a", "b"]
+
+
+def test_trigram_similarity():
+    """Test trigram_similarity scores exact, substring, fuzzy and unrelated texts"""
+    assert trigram_similarity("Price", "price") == pytest.approx(2.0)
+    assert 0.5 < trigram_similarity("price", "BidPrice") < 1.0
+    assert 0 < trigram_similarity("prics", "Price") < 0.5
+    assert trigram_similarity("volume", "Price") == 0.0
@@ -1,26 +1,41 @@
 import asyncio
 import logging
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pyarrow
+import pyarrow.compute
+import pyarrow.parquet
 import pytest
 
 from deephaven_mcp._exceptions import UnsupportedOperationError
 from deephaven_mcp.queries import (
     _apply_filters,
+    _apply_filters_and_view,
     _apply_row_limit,
+    _apply_view,
+    _compile_catalog_filter,
     _extract_meta_table,
     _load_catalog_table,
+    _SchemaCache,
     _validate_python_session,
+    drop_catalog_snapshot,
+    export_table_to_parquet,
     get_catalog_meta_table,
+    get_catalog_meta_tables,
     get_catalog_table,
     get_catalog_table_data,
     get_dh_versions,
     get_pip_packages_table,
     get_programming_language_version,
     get_programming_language_version_table,
+    get_schema_cache_stats,
+    get_session_environment_table,
     get_session_meta_table,
     get_table,
+    get_table_row_count,
+    invalidate_schema_cache,
+    invalidate_session_environment,
+    search_catalog,
 )
 
 # ===== Helper function tests =====
@@ -102,6 +117,59 @@ async def test_apply_filters_empty_list():
     assert not hasattr(table_mock, "where") or not table_mock.where.called
 
 
+@pytest.mark.asyncio
+async def test_apply_view_with_columns():
+    """Test _apply_view projects the table with view()."""
+    table_mock = MagicMock()
+    viewed_table_mock = MagicMock()
+    table_mock.view = MagicMock(return_value=viewed_table_mock)
+
+    async def fake_to_thread(fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
+        result_table = await _apply_view(
+            table_mock, columns=["Sym", "Price"], context_name="test table"
+        )
+    assert result_table is viewed_table_mock
+    table_mock.view.assert_called_once_with(["Sym", "Price"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("columns", [None, []])
+async def test_apply_view_no_columns(columns):
+    """Test _apply_view leaves the table unchanged without columns."""
+    table_mock = MagicMock()
+
+    result_table = await _apply_view(
+        table_mock, columns=columns, context_name="test table"
+    )
+    assert result_table is table_mock
+    table_mock.view.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_apply_filters_and_view_filters_first():
+    """Test _apply_filters_and_view runs where() before view()."""
+    table_mock = MagicMock()
+    filtered_table_mock = MagicMock()
+    viewed_table_mock = MagicMock()
+    table_mock.where = MagicMock(return_value=filtered_table_mock)
+    filtered_table_mock.view = MagicMock(return_value=viewed_table_mock)
+
+    async def fake_to_thread(fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
+        result_table = await _apply_filters_and_view(
+            table_mock, ["Size > 100"], ["Price"], context_name="test table"
+        )
+    assert result_table is viewed_table_mock
+    table_mock.where.assert_called_once_with(["Size > 100"])
+    filtered_table_mock.view.assert_called_once_with(["Price"])
+    table_mock.view.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_apply_row_limit_with_head_complete():
     """Test _apply_row_limit with head=True when table is smaller than max_rows."""
@@ -231,6 +299,41 @@ async def test_get_table_success_full_table():
         session_mock.open_table.assert_awaited_once_with("foo")
 
 
+@pytest.mark.asyncio
+async def test_get_table_with_columns_and_filters():
+    """Test get_table filters and projects before limiting rows"""
+    original_table_mock = MagicMock()
+    filtered_table_mock = MagicMock()
+    viewed_table_mock = MagicMock()
+    head_table_mock = MagicMock()
+    arrow_mock = MagicMock(spec=pyarrow.Table)
+    original_table_mock.where = MagicMock(return_value=filtered_table_mock)
+    filtered_table_mock.view = MagicMock(return_value=viewed_table_mock)
+    arrow_mock.num_rows = 3
+    viewed_table_mock.head = MagicMock(return_value=head_table_mock)
+    head_table_mock.to_arrow = lambda: arrow_mock
+    session_mock = MagicMock()
+    session_mock.open_table = AsyncMock(return_value=original_table_mock)
+
+    async def fake_to_thread(fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
+        result_table, is_complete = await get_table(
+            session_mock,
+            "trades",
+            max_rows=10,
+            columns=["Sym", "Price"],
+            filters=["Sym = `AAPL`"],
+        )
+
+    assert result_table is arrow_mock
+    assert is_complete is True
+    original_table_mock.where.assert_called_once_with(["Sym = `AAPL`"])
+    filtered_table_mock.view.assert_called_once_with(["Sym", "Price"])
+    viewed_table_mock.head.assert_called_once_with(11)
+
+
 @pytest.mark.asyncio
 async def test_get_table_open_table_error():
     session_mock = MagicMock()
@@ -254,17 +357,17 @@ async def test_get_table_to_arrow_error():
             await get_table(session_mock, "foo", max_rows=None)
 
 
-@pytest.mark.asyncio
-async def test_get_table_head_complete_table():
-    """Test get_table with head=True when table is smaller than max_rows"""
+def _limited_source(method, rows):
+    """Mock a Deephaven table whose head() or tail() returns a table of the given Arrow rows."""
+    arrow_table = pyarrow.table({"id": rows})
+    limited_table_mock = MagicMock()
+    limited_table_mock.to_arrow = MagicMock(return_value=arrow_table)
     original_table_mock = MagicMock()
-    original_table_mock.size = 500  # Table has 500 rows
-    head_table_mock = MagicMock()
-    arrow_mock = MagicMock(spec=pyarrow.Table)
-    arrow_mock.__len__ = lambda: 500  # Arrow table also has 500 rows
-    head_table_mock.to_arrow = lambda: arrow_mock
-    original_table_mock.head = lambda n: head_table_mock
+    setattr(original_table_mock, method, MagicMock(return_value=limited_table_mock))
+    return original_table_mock, arrow_table
 
+
+async def _get_limited_table(original_table_mock, **kwargs):
     session_mock = MagicMock()
     session_mock.open_table = AsyncMock(return_value=original_table_mock)
 
@@ -272,111 +375,107 @@ async def test_get_table_head_complete_table():
         return fn(*args, **kwargs)
 
     with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
-        result_table, is_complete = await get_table(
-            session_mock, "foo", max_rows=1000, head=True
-        )
-        assert result_table is arrow_mock
-        assert is_complete is True  # 500 <= 1000, so complete
+        return await get_table(session_mock, "foo", **kwargs)
 
 
 @pytest.mark.asyncio
-async def test_get_table_head_incomplete_table():
-    """Test get_table with head=True when table is larger than max_rows"""
-    original_table_mock = MagicMock()
-    original_table_mock.size = 2000  # Table has 2000 rows
-    head_table_mock = MagicMock()
-    arrow_mock = MagicMock(spec=pyarrow.Table)
-    arrow_mock.__len__ = lambda: 1000  # Arrow table has 1000 rows (limited)
-    head_table_mock.to_arrow = lambda: arrow_mock
-    original_table_mock.head = lambda n: head_table_mock
+async def test_get_table_head_complete_table():
+    """Test get_table with head=True when table is smaller than max_rows"""
+    original_table_mock, arrow_table = _limited_source("head", list(range(500)))
 
-    session_mock = MagicMock()
-    session_mock.open_table = AsyncMock(return_value=original_table_mock)
+    result_table, is_complete = await _get_limited_table(
+        original_table_mock, max_rows=1000, head=True
+    )
 
-    async def fake_to_thread(fn, *args, **kwargs):
-        return fn(*args, **kwargs)
+    assert result_table is arrow_table
+    assert is_complete is True  # 500 <= 1000, so complete
+    original_table_mock.head.assert_called_once_with(1001)
+    original_table_mock.tail.assert_not_called()
 
-    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
-        result_table, is_complete = await get_table(
-            session_mock, "foo", max_rows=1000, head=True
-        )
-        assert result_table is arrow_mock
-        assert is_complete is False  # 2000 > 1000, so incomplete
+
+@pytest.mark.asyncio
+async def test_get_table_head_incomplete_table():
+    """Test get_table with head=True drops the sentinel row of a larger table"""
+    original_table_mock, _ = _limited_source("head", list(range(1001)))
+
+    result_table, is_complete = await _get_limited_table(
+        original_table_mock, max_rows=1000, head=True
+    )
+
+    assert result_table.column("id").to_pylist() == list(range(1000))
+    assert is_complete is False  # head(1001) returned 1001 rows, so incomplete
+    original_table_mock.head.assert_called_once_with(1001)
 
 
 @pytest.mark.asyncio
 async def test_get_table_tail_complete_table():
     """Test get_table with head=False (tail) when table is smaller than max_rows"""
-    original_table_mock = MagicMock()
-    original_table_mock.size = 300  # Table has 300 rows
-    tail_table_mock = MagicMock()
-    arrow_mock = MagicMock(spec=pyarrow.Table)
-    arrow_mock.__len__ = lambda: 300  # Arrow table has 300 rows
-    tail_table_mock.to_arrow = lambda: arrow_mock
-    original_table_mock.tail = lambda n: tail_table_mock
+    original_table_mock, arrow_table = _limited_source("tail", list(range(300)))
 
-    session_mock = MagicMock()
-    session_mock.open_table = AsyncMock(return_value=original_table_mock)
-
-    async def fake_to_thread(fn, *args, **kwargs):
-        return fn(*args, **kwargs)
+    result_table, is_complete = await _get_limited_table(
+        original_table_mock, max_rows=500, head=False
+    )
 
-    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
-        result_table, is_complete = await get_table(
-            session_mock, "foo", max_rows=500, head=False
-        )
-        assert result_table is arrow_mock
-        assert is_complete is True  # 300 <= 500, so complete
+    assert result_table is arrow_table
+    assert is_complete is True  # 300 <= 500, so complete
+    original_table_mock.tail.assert_called_once_with(501)
+    original_table_mock.head.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_get_table_tail_incomplete_table():
-    """Test get_table with head=False (tail) when table is larger than max_rows"""
-    original_table_mock = MagicMock()
-    original_table_mock.size = 1500  # Table has 1500 rows
-    tail_table_mock = MagicMock()
-    arrow_mock = MagicMock(spec=pyarrow.Table)
-    arrow_mock.__len__ = lambda: 800  # Arrow table has 800 rows (limited)
-    tail_table_mock.to_arrow = lambda: arrow_mock
-    original_table_mock.tail = lambda n: tail_table_mock
+    """Test get_table with head=False (tail) drops the leading sentinel row"""
+    original_table_mock, _ = _limited_source("tail", list(range(699, 1500)))
 
-    session_mock = MagicMock()
-    session_mock.open_table = AsyncMock(return_value=original_table_mock)
-
-    async def fake_to_thread(fn, *args, **kwargs):
-        return fn(*args, **kwargs)
+    result_table, is_complete = await _get_limited_table(
+        original_table_mock, max_rows=800, head=False
+    )
 
-    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
-        result_table, is_complete = await get_table(
-            session_mock, "foo", max_rows=800, head=False
-        )
-        assert result_table is arrow_mock
-        assert is_complete is False  # 1500 > 800, so incomplete
+    assert result_table.column("id").to_pylist() == list(range(700, 1500))
+    assert is_complete is False  # tail(801) returned 801 rows, so incomplete
+    original_table_mock.tail.assert_called_once_with(801)
 
 
 @pytest.mark.asyncio
 async def test_get_table_exact_size_match():
     """Test get_table when original table size exactly matches max_rows"""
-    original_table_mock = MagicMock()
-    original_table_mock.size = 1000  # Table has exactly 1000 rows
-    head_table_mock = MagicMock()
-    arrow_mock = MagicMock(spec=pyarrow.Table)
-    arrow_mock.__len__ = lambda: 1000  # Arrow table has 1000 rows
-    head_table_mock.to_arrow = lambda: arrow_mock
-    original_table_mock.head = lambda n: head_table_mock
+    original_table_mock, arrow_table = _limited_source("head", list(range(1000)))
 
-    session_mock = MagicMock()
-    session_mock.open_table = AsyncMock(return_value=original_table_mock)
+    result_table, is_complete = await _get_limited_table(
+        original_table_mock, max_rows=1000, head=True
+    )
 
-    async def fake_to_thread(fn, *args, **kwargs):
-        return fn(*args, **kwargs)
+    assert result_table is arrow_table
+    assert is_complete is True  # 1000 <= 1000, so complete
 
-    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
-        result_table, is_complete = await get_table(
-            session_mock, "foo", max_rows=1000, head=True
-        )
-        assert result_table is arrow_mock
-        assert is_complete is True  # 1000 <= 1000, so complete
+
+@pytest.mark.asyncio
+async def test_get_table_zero_rows():
+    """Test get_table with max_rows=0 returns no rows and reports truncation"""
+    original_table_mock, _ = _limited_source("tail", [7])
+
+    result_table, is_complete = await _get_limited_table(
+        original_table_mock, max_rows=0, head=False
+    )
+
+    assert result_table.num_rows == 0
+    assert is_complete is False
+
+
+@pytest.mark.asyncio
+async def test_get_table_does_not_read_size():
+    """Test get_table never reads the source table size when limiting rows"""
+    original_table_mock, _ = _limited_source("head", [1, 2])
+    type(original_table_mock).size = PropertyMock(
+        side_effect=AssertionError("size must not be read")
+    )
+
+    result_table, is_complete = await _get_limited_table(
+        original_table_mock, max_rows=5
+    )
+
+    assert result_table.num_rows == 2
+    assert is_complete is True
 
 
 @pytest.mark.asyncio
@@ -416,6 +515,236 @@ async def test_get_table_head_parameter_ignored_with_full_table():
         assert complete2 is True
 
 
+@pytest.mark.asyncio
+async def test_get_table_row_count():
+    """Test get_table_row_count reads the size of the table without fetching data"""
+    table_mock = MagicMock()
+    table_mock.size = 1234
+    session_mock = MagicMock()
+    session_mock.open_table = AsyncMock(return_value=table_mock)
+
+    assert await get_table_row_count(session_mock, "foo") == 1234
+    session_mock.open_table.assert_awaited_once_with("foo")
+    table_mock.to_arrow.assert_not_called()
+    table_mock.where.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_table_row_count_with_filters():
+    """Test get_table_row_count counts the filtered table"""
+    table_mock = MagicMock()
+    filtered_table_mock = MagicMock()
+    filtered_table_mock.size = 7
+    table_mock.where = MagicMock(return_value=filtered_table_mock)
+    session_mock = MagicMock()
+    session_mock.open_table = AsyncMock(return_value=table_mock)
+
+    assert await get_table_row_count(session_mock, "foo", filters=["X > 1"]) == 7
+    table_mock.where.assert_called_once_with(["X > 1"])
+
+
+class _FakeTable:
+    """Minimal stand-in for pydeephaven.table.Table backed by a pyarrow.Table."""
+
+    def __init__(self, arrow_table, is_refreshing=False):
+        self._arrow_table = arrow_table
+        self.is_refreshing = is_refreshing
+        self.slices = []
+
+    @property
+    def size(self):
+        return self._arrow_table.num_rows
+
+    def head(self, n):
+        return _FakeTable(self._arrow_table.slice(0, n))
+
+    def tail(self, n):
+        return _FakeTable(
+            self._arrow_table.slice(max(self._arrow_table.num_rows - n, 0))
+        )
+
+    def snapshot(self):
+        return _FakeTable(self._arrow_table)
+
+    def where(self, filters):
+        # Only "<column> > <int>" filters are needed by these tests
+        filtered = self._arrow_table
+        for expression in filters:
+            name, _, bound = expression.split()
+            filtered = filtered.filter(
+                pyarrow.compute.greater(filtered[name], int(bound))
+            )
+        return _FakeTable(filtered)
+
+    def view(self, columns):
+        return _FakeTable(self._arrow_table.select(columns))
+
+    def slice(self, start, stop):
+        self.slices.append((start, stop))
+        return _FakeTable(self._arrow_table.slice(start, stop - start))
+
+    def to_arrow(self):
+        return self._arrow_table
+
+
+def _export_session(fake_table):
+    session_mock = MagicMock()
+    session_mock.open_table = AsyncMock(return_value=fake_table)
+    return session_mock
+
+
+@pytest.mark.asyncio
+async def test_export_table_to_parquet_full_table_in_batches(tmp_path):
+    """Test export_table_to_parquet writes every row, one slice window per batch"""
+    arrow_table = pyarrow.table(
+        {"id": list(range(25)), "name": [f"n{i}" for i in range(25)]}
+    )
+    fake_table = _FakeTable(arrow_table)
+    path = str(tmp_path / "out.parquet")
+
+    schema, row_count, is_complete = await export_table_to_parquet(
+        _export_session(fake_table), "foo", path, max_rows=None, batch_rows=10
+    )
+
+    assert fake_table.slices == [(0, 10), (10, 20), (20, 25)]
+    assert schema == arrow_table.schema
+    assert row_count == 25
+    assert is_complete is True
+    parquet_file = pyarrow.parquet.ParquetFile(path)
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.read().equals(arrow_table)
+
+
+@pytest.mark.asyncio
+async def test_export_table_to_parquet_tail_limited(tmp_path):
+    """Test export_table_to_parquet honors max_rows and head=False"""
+    arrow_table = pyarrow.table({"id": list(range(25))})
+    path = str(tmp_path / "out.parquet")
+
+    _, row_count, is_complete = await export_table_to_parquet(
+        _export_session(_FakeTable(arrow_table)),
+        "foo",
+        path,
+        max_rows=5,
+        head=False,
+        batch_rows=10,
+    )
+
+    assert row_count == 5
+    assert is_complete is False
+    assert pyarrow.parquet.read_table(path).column("id").to_pylist() == [
+        20,
+        21,
+        22,
+        23,
+        24,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_table_to_parquet_columns_and_filters(tmp_path):
+    """Test export_table_to_parquet exports only the selected columns of matching rows"""
+    arrow_table = pyarrow.table(
+        {"id": list(range(10)), "name": [f"n{i}" for i in range(10)], "x": [0.5] * 10}
+    )
+    path = str(tmp_path / "out.parquet")
+
+    schema, row_count, is_complete = await export_table_to_parquet(
+        _export_session(_FakeTable(arrow_table)),
+        "foo",
+        path,
+        max_rows=None,
+        batch_rows=4,
+        columns=["name", "id"],
+        filters=["id > 5"],
+    )
+
+    assert schema.names == ["name", "id"]
+    assert row_count == 4
+    assert is_complete is True
+    assert pyarrow.parquet.read_table(path).to_pydict() == {
+        "name": ["n6", "n7", "n8", "n9"],
+        "id": [6, 7, 8, 9],
+    }
+
+
+@pytest.mark.asyncio
+async def test_export_table_to_parquet_snapshots_refreshing_table(tmp_path):
+    """Test export_table_to_parquet snapshots a refreshing table before slicing"""
+    arrow_table = pyarrow.table({"id": [1, 2, 3]})
+    fake_table = _FakeTable(arrow_table, is_refreshing=True)
+    snapshot = _FakeTable(arrow_table)
+    fake_table.snapshot = MagicMock(return_value=snapshot)
+    path = str(tmp_path / "out.parquet")
+
+    _, row_count, _ = await export_table_to_parquet(
+        _export_session(fake_table), "ticking", path, max_rows=None, batch_rows=2
+    )
+
+    fake_table.snapshot.assert_called_once_with()
+    assert snapshot.slices == [(0, 2), (2, 3)]
+    assert fake_table.slices == []
+    assert row_count == 3
+
+
+@pytest.mark.asyncio
+async def test_export_table_to_parquet_empty_table(tmp_path):
+    """Test export_table_to_parquet writes a schema-only file for an empty table"""
+    arrow_table = pyarrow.table({"id": pyarrow.array([], pyarrow.int64())})
+    path = str(tmp_path / "out.parquet")
+
+    schema, row_count, is_complete = await export_table_to_parquet(
+        _export_session(_FakeTable(arrow_table)),
+        "foo",
+        path,
+        max_rows=None,
+        batch_rows=10,
+    )
+
+    assert schema == arrow_table.schema
+    assert row_count == 0
+    assert is_complete is True
+    assert pyarrow.parquet.read_table(path).num_rows == 0
+
+
+@pytest.mark.asyncio
+async def test_export_table_to_parquet_fetch_error_closes_writer(tmp_path):
+    """Test export_table_to_parquet closes the writer and propagates fetch errors"""
+    arrow_table = pyarrow.table({"id": list(range(10))})
+    fake_table = _FakeTable(arrow_table)
+    original_slice = fake_table.slice
+
+    def failing_slice(start, stop):
+        if start:
+            raise RuntimeError("fail slice")
+        return original_slice(start, stop)
+
+    fake_table.slice = failing_slice
+    path = str(tmp_path / "out.parquet")
+
+    with pytest.raises(RuntimeError, match="fail slice"):
+        await export_table_to_parquet(
+            _export_session(fake_table), "foo", path, max_rows=None, batch_rows=5
+        )
+
+    # The first batch was flushed and the file closed, so it is still readable
+    assert pyarrow.parquet.read_table(path).num_rows == 5
+
+
+@pytest.mark.asyncio
+async def test_export_table_to_parquet_open_table_error(tmp_path):
+    session_mock = MagicMock()
+    session_mock.open_table = AsyncMock(side_effect=RuntimeError("fail open"))
+    with pytest.raises(RuntimeError, match="fail open"):
+        await export_table_to_parquet(
+            session_mock,
+            "foo",
+            str(tmp_path / "out.parquet"),
+            max_rows=None,
+            batch_rows=5,
+        )
+
+
 @pytest.mark.asyncio
 async def test_get_session_meta_table_success():
     session_mock = MagicMock()
@@ -516,82 +845,301 @@ async def test_extract_meta_table_error():
             await _extract_meta_table(table_mock, "test_table")
 
 
-@pytest.mark.asyncio
-async def test_get_pip_packages_table_success(caplog):
-    session_mock = MagicMock()
-    session_mock.programming_language = "python"
-    session_mock.run_script = AsyncMock()
-
-    async def fake_to_thread(fn, *args, **kwargs):
-        return fn(*args, **kwargs)
-
-    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
-        arrow_mock = MagicMock()
-        with patch(
-            "deephaven_mcp.queries.get_table",
-            AsyncMock(return_value=(arrow_mock, True)),
-        ) as mock_get_table:
-            with caplog.at_level("DEBUG"):
-                result = await get_pip_packages_table(session_mock)
-            assert result is arrow_mock
-            assert "Running pip packages script in session..." in caplog.text
-            assert "Script executed successfully." in caplog.text
-            assert "Table '_pip_packages_table' retrieved successfully." in caplog.text
-            session_mock.run_script.assert_awaited_once()
-            mock_get_table.assert_awaited_once_with(
-                session_mock, "_pip_packages_table", max_rows=None
-            )
+_ENVIRONMENT = pyarrow.table(
+    {
+        "Kind": ["python"] * 6 + ["package"] * 2,
+        "Name": [
+            "Version",
+            "Major",
+            "Minor",
+            "Micro",
+            "Implementation",
+            "FullVersion",
+            "deephaven-core",
+            "numpy",
+        ],
+        "Value": [
+            "3.12.1",
+            "3",
+            "12",
+            "1",
+            "CPython",
+            "3.12.1 (main) [GCC 12]",
+            "0.40.0",
+            "2.0.0",
+        ],
+    }
+)
 
 
-@pytest.mark.asyncio
-async def test_get_pip_packages_table_script_failure():
+def _python_session(*script_effects) -> MagicMock:
+    """Create a mock Python session whose run_script calls have the given side effects."""
     session_mock = MagicMock()
     session_mock.programming_language = "python"
-    session_mock.run_script = AsyncMock(side_effect=RuntimeError("fail-script"))
+    session_mock.run_script = AsyncMock(side_effect=list(script_effects) or None)
+    return session_mock
 
-    async def fake_to_thread(fn, *args, **kwargs):
-        if fn == session_mock.run_script:
-            raise RuntimeError("fail-script")
-        return fn(*args, **kwargs)
 
-    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
-        with pytest.raises(RuntimeError, match="fail-script"):
-            await get_pip_packages_table(session_mock)
+@pytest.mark.asyncio
+async def test_get_session_environment_table_single_probe(caplog):
+    """Test one probe script and one fetch gather the environment, then remove the probe variable"""
+    session_mock = _python_session()
 
+    with patch(
+        "deephaven_mcp.queries.get_table",
+        AsyncMock(return_value=(_ENVIRONMENT, True)),
+    ) as mock_get_table:
+        with caplog.at_level("DEBUG"):
+            result = await get_session_environment_table(session_mock)
 
-@pytest.mark.asyncio
-async def test_get_pip_packages_table_table_failure():
-    session_mock = MagicMock()
-    session_mock.programming_language = "python"
-    session_mock.run_script = AsyncMock()
+    assert result is _ENVIRONMENT
+    assert "Running probe script in session..." in caplog.text
+    mock_get_table.assert_awaited_once_with(
+        session_mock, "_dh_mcp_session_environment", max_rows=None
+    )
+    probe, cleanup = [call.args[0] for call in session_mock.run_script.await_args_list]
+    assert "_dh_mcp_session_environment = _dh_mcp_probe_environment()" in probe
+    assert "finally:\n    del _dh_mcp_probe_environment" in probe
+    assert cleanup == "globals().pop('_dh_mcp_session_environment', None)"
 
-    async def fake_to_thread(fn, *args, **kwargs):
-        return fn(*args, **kwargs)
 
+def test_environment_probe_script_removes_helper_when_it_fails():
+    """Test the probe script deletes its helper function even when the helper raises"""
+    from deephaven_mcp.queries import _ENVIRONMENT_PROBE_SCRIPT
+
+    namespace: dict = {}
     with (
-        patch(
-            "deephaven_mcp.queries.asyncio.to_thread",
-            new=fake_to_thread,
-        ),
-        patch(
-            "deephaven_mcp.queries.get_table",
-            AsyncMock(side_effect=RuntimeError("fail-table")),
-        ),
+        patch.dict("sys.modules", {"deephaven": None}),
+        pytest.raises(ImportError),
     ):
-        with pytest.raises(RuntimeError, match="fail-table"):
-            await get_pip_packages_table(session_mock)
-        session_mock.run_script.assert_awaited_once()
+        exec(_ENVIRONMENT_PROBE_SCRIPT, namespace)
+    assert "_dh_mcp_probe_environment" not in namespace
+    assert "_dh_mcp_session_environment" not in namespace
 
 
 @pytest.mark.asyncio
-async def test_get_pip_packages_table_unsupported_language():
-    session_mock = MagicMock()
-    session_mock.programming_language = "groovy"
+async def test_get_session_environment_table_cleanup_failure(caplog):
+    """Test a failed removal of the probe variable is logged and the table still returned"""
+    session_mock = _python_session(None, RuntimeError("gone"))
+
+    with patch(
+        "deephaven_mcp.queries.get_table",
+        AsyncMock(return_value=(_ENVIRONMENT, True)),
+    ):
+        result = await get_session_environment_table(session_mock)
+
+    assert result is _ENVIRONMENT
+    assert "Could not remove '_dh_mcp_session_environment'" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_get_session_environment_table_fetch_failure_still_cleans_up():
+    """Test the probe variable is removed even when fetching it fails"""
+    session_mock = _python_session()
+
+    with patch(
+        "deephaven_mcp.queries.get_table",
+        AsyncMock(side_effect=RuntimeError("fail-table")),
+    ):
+        with pytest.raises(RuntimeError, match="fail-table"):
+            await get_session_environment_table(session_mock)
+
+    assert session_mock.run_script.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_session_environment_table_script_failure():
+    """Test a failed probe script is raised without fetching anything"""
+    session_mock = _python_session(RuntimeError("fail-script"))
+
+    with patch("deephaven_mcp.queries.get_table", AsyncMock()) as mock_get_table:
+        with pytest.raises(RuntimeError, match="fail-script"):
+            await get_session_environment_table(session_mock)
+
+    mock_get_table.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_session_environment_table_unsupported_language():
+    """Test only Python sessions can be probed"""
+    session_mock = MagicMock()
+    session_mock.programming_language = "groovy"
+
+    with pytest.raises(
+        UnsupportedOperationError, match="only supports Python sessions"
+    ):
+        await get_session_environment_table(session_mock)
+
+
+@pytest.mark.asyncio
+async def test_environment_cached_per_session():
+    """Test version, package and Deephaven version lookups share one probe per session object"""
+    session_mock = _python_session()
+    other_session = _python_session()
+
+    with patch(
+        "deephaven_mcp.queries.get_table",
+        AsyncMock(return_value=(_ENVIRONMENT, True)),
+    ) as mock_get_table:
+        assert await get_programming_language_version(session_mock) == "3.12.1"
+        assert await get_dh_versions(session_mock) == ("0.40.0", None)
+        assert (await get_pip_packages_table(session_mock)).num_rows == 2
+        assert session_mock.run_script.await_count == 2  # probe and cleanup
+        assert mock_get_table.await_count == 1
+
+        await get_dh_versions(other_session)
+        assert other_session.run_script.await_count == 2
+
+        invalidate_session_environment(session_mock)
+        invalidate_session_environment(session_mock)  # nothing cached any more
+        await get_dh_versions(session_mock)
+
+    assert session_mock.run_script.await_count == 4
+    assert other_session.run_script.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_environment_not_cached_on_failure():
+    """Test a failed probe is not cached and is retried on the next call"""
+    session_mock = _python_session(RuntimeError("busy"), None, None)
+
+    with patch(
+        "deephaven_mcp.queries.get_table",
+        AsyncMock(return_value=(_ENVIRONMENT, True)),
+    ):
+        with pytest.raises(RuntimeError, match="busy"):
+            await get_pip_packages_table(session_mock)
+        assert (await get_pip_packages_table(session_mock)).num_rows == 2
+
+
+@pytest.mark.asyncio
+async def test_environment_probe_shared_by_concurrent_callers():
+    """Test concurrent callers share one probe, which survives a cancelled caller"""
+    from deephaven_mcp import queries as queries_module
+
+    session_mock = _python_session()
+    release = asyncio.Event()
+
+    async def gated_get_table(session, table_name, max_rows):
+        await release.wait()
+        return _ENVIRONMENT, True
+
+    with patch(
+        "deephaven_mcp.queries.get_table", AsyncMock(side_effect=gated_get_table)
+    ) as mock_get_table:
+        impatient = asyncio.create_task(get_session_environment_table(session_mock))
+        waiting = asyncio.create_task(get_pip_packages_table(session_mock))
+        await asyncio.sleep(0)
+        impatient.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await impatient
+        release.set()
+        packages = await waiting
+
+    assert packages.num_rows == 2
+    mock_get_table.assert_awaited_once()
+    assert queries_module._SESSION_ENVIRONMENT[session_mock] is _ENVIRONMENT
+    assert session_mock not in queries_module._SESSION_ENVIRONMENT_PROBES
+
+
+@pytest.mark.asyncio
+async def test_environment_probe_invalidated_while_running():
+    """Test a probe that finishes after an invalidation is returned but not cached"""
+    from deephaven_mcp import queries as queries_module
+
+    session_mock = _python_session()
+    release = asyncio.Event()
+
+    async def gated_get_table(session, table_name, max_rows):
+        await release.wait()
+        return _ENVIRONMENT, True
+
+    with patch(
+        "deephaven_mcp.queries.get_table", AsyncMock(side_effect=gated_get_table)
+    ):
+        probe = asyncio.create_task(get_session_environment_table(session_mock))
+        await asyncio.sleep(0)
+        invalidate_session_environment(session_mock)
+        release.set()
+        assert await probe is _ENVIRONMENT
+        await asyncio.sleep(0)  # let the done callback run
+
+    assert session_mock not in queries_module._SESSION_ENVIRONMENT
+
+
+@pytest.mark.parametrize("has_session", [True, False])
+def test_closed_session_manager_drops_session_caches(has_session):
+    """Test the close callback queries registers drops every cache of the closed session"""
+    from deephaven_mcp import queries as queries_module
+    from deephaven_mcp.resource_manager import _close_callbacks
+
+    assert queries_module._forget_closed_session in _close_callbacks._CLOSE_CALLBACKS
+    from deephaven_mcp.client import BaseSession
+
+    session_mock = MagicMock(spec=BaseSession) if has_session else None
+
+    with (
+        patch("deephaven_mcp.queries.invalidate_session_environment") as env,
+        patch("deephaven_mcp.queries.invalidate_schema_cache") as schemas,
+        patch("deephaven_mcp.queries.drop_catalog_snapshot") as snapshot,
+    ):
+        _close_callbacks.run_close_callbacks("community:s:n", session_mock)
+
+    if has_session:
+        env.assert_called_once_with(session_mock)
+    else:
+        env.assert_not_called()
+    schemas.assert_called_once_with("community:s:n")
+    snapshot.assert_called_once_with("community:s:n")
+
+
+@pytest.mark.asyncio
+async def test_get_pip_packages_table_from_environment():
+    """Test get_pip_packages_table returns the package rows of the environment table"""
+    with patch(
+        "deephaven_mcp.queries.get_session_environment_table",
+        AsyncMock(return_value=_ENVIRONMENT),
+    ):
+        result = await get_pip_packages_table(MagicMock())
+
+    assert result.to_pydict() == {
+        "Package": ["deephaven-core", "numpy"],
+        "Version": ["0.40.0", "2.0.0"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_programming_language_version_table_from_environment():
+    """Test get_programming_language_version_table rebuilds the one-row version table"""
+    with patch(
+        "deephaven_mcp.queries.get_session_environment_table",
+        AsyncMock(return_value=_ENVIRONMENT),
+    ):
+        result = await get_programming_language_version_table(MagicMock())
+
+    assert result.to_pylist() == [
+        {
+            "Version": "3.12.1",
+            "Major": 3,
+            "Minor": 12,
+            "Micro": 1,
+            "Implementation": "CPython",
+            "FullVersion": "3.12.1 (main) [GCC 12]",
+        }
+    ]
+    assert result.schema.field("Major").type == pyarrow.int32()
+
+
+@pytest.mark.asyncio
+async def test_get_programming_language_version_table_unsupported_language():
+    """Test get_programming_language_version_table rejects non-Python sessions"""
+    session_mock = MagicMock()
+    session_mock.programming_language = "groovy"
 
     with pytest.raises(
         UnsupportedOperationError, match="only supports Python sessions"
     ):
-        await get_pip_packages_table(session_mock)
+        await get_programming_language_version_table(session_mock)
 
 
 @pytest.mark.asyncio
@@ -707,86 +1255,6 @@ async def test_get_dh_versions_arrow_table_none():
         assert coreplus is None
 
 
-@pytest.mark.asyncio
-async def test_get_programming_language_version_table_success(caplog):
-    session_mock = MagicMock()
-    session_mock.programming_language = "python"
-    session_mock.run_script = AsyncMock()
-
-    async def fake_to_thread(fn, *args, **kwargs):
-        return fn(*args, **kwargs)
-
-    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
-        arrow_mock = MagicMock()
-        with patch(
-            "deephaven_mcp.queries.get_table",
-            AsyncMock(return_value=(arrow_mock, True)),
-        ) as mock_get_table:
-            with caplog.at_level("DEBUG"):
-                result = await get_programming_language_version_table(session_mock)
-            assert result is arrow_mock
-            assert "Running Python version script in session..." in caplog.text
-            assert "Script executed successfully." in caplog.text
-            assert (
-                "Table '_python_version_table' retrieved successfully." in caplog.text
-            )
-            session_mock.run_script.assert_awaited_once()
-            mock_get_table.assert_awaited_once_with(
-                session_mock, "_python_version_table", max_rows=None
-            )
-
-
-@pytest.mark.asyncio
-async def test_get_programming_language_version_table_script_failure():
-    session_mock = MagicMock()
-    session_mock.programming_language = "python"
-    session_mock.run_script = AsyncMock(side_effect=RuntimeError("fail-script"))
-
-    async def fake_to_thread(fn, *args, **kwargs):
-        if fn == session_mock.run_script:
-            raise RuntimeError("fail-script")
-        return fn(*args, **kwargs)
-
-    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
-        with pytest.raises(RuntimeError, match="fail-script"):
-            await get_programming_language_version_table(session_mock)
-
-
-@pytest.mark.asyncio
-async def test_get_programming_language_version_table_table_failure():
-    session_mock = MagicMock()
-    session_mock.programming_language = "python"
-    session_mock.run_script = AsyncMock()
-
-    async def fake_to_thread(fn, *args, **kwargs):
-        return fn(*args, **kwargs)
-
-    with (
-        patch(
-            "deephaven_mcp.queries.asyncio.to_thread",
-            new=fake_to_thread,
-        ),
-        patch(
-            "deephaven_mcp.queries.get_table",
-            AsyncMock(side_effect=RuntimeError("fail-table")),
-        ),
-    ):
-        with pytest.raises(RuntimeError, match="fail-table"):
-            await get_programming_language_version_table(session_mock)
-        session_mock.run_script.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_get_programming_language_version_table_unsupported_language():
-    session_mock = MagicMock()
-    session_mock.programming_language = "groovy"
-
-    with pytest.raises(
-        UnsupportedOperationError, match="only supports Python sessions"
-    ):
-        await get_programming_language_version_table(session_mock)
-
-
 @pytest.mark.asyncio
 async def test_get_programming_language_version_success(caplog):
     """Test successful extraction of version string from pyarrow table."""
@@ -910,9 +1378,9 @@ async def test_get_catalog_table_success_no_filters():
 
     # Create mock catalog table
     catalog_table_mock = MagicMock()
-    catalog_table_mock.size = 5000
     limited_table_mock = MagicMock()
     arrow_mock = MagicMock(spec=pyarrow.Table)
+    arrow_mock.num_rows = 1001  # head(1001) of a 5000-row catalog
     limited_table_mock.to_arrow = lambda: arrow_mock
     catalog_table_mock.head = lambda n: limited_table_mock
 
@@ -927,8 +1395,9 @@ async def test_get_catalog_table_success_no_filters():
         result_table, is_complete = await get_catalog_table(
             session_mock, max_rows=1000, filters=None, distinct_namespaces=False
         )
-        assert result_table is arrow_mock
-        assert is_complete is False  # 5000 > 1000, so incomplete
+        assert result_table is arrow_mock.slice.return_value
+        arrow_mock.slice.assert_called_once_with(0, 1000)
+        assert is_complete is False  # 1001 > 1000, so incomplete
         session_mock.catalog_table.assert_awaited_once()
 
 
@@ -939,9 +1408,9 @@ async def test_get_catalog_table_success_with_filters():
 
     # Create mock filtered table
     filtered_table_mock = MagicMock()
-    filtered_table_mock.size = 50
     filtered_table_mock.head = lambda n: filtered_table_mock
     arrow_mock = MagicMock(spec=pyarrow.Table)
+    arrow_mock.num_rows = 50
     filtered_table_mock.to_arrow = lambda: arrow_mock
 
     # Create mock catalog table with where method
@@ -998,57 +1467,558 @@ async def test_get_catalog_table_not_enterprise_session():
     """Test get_catalog_table raises error for non-enterprise session"""
     from deephaven_mcp.client import BaseSession
 
-    # Create mock community session (not CorePlusSession)
-    session_mock = MagicMock(spec=BaseSession)
+    # Create mock community session (not CorePlusSession)
+    session_mock = MagicMock(spec=BaseSession)
+
+    with pytest.raises(
+        UnsupportedOperationError,
+        match="get_catalog_table only supports enterprise.*sessions",
+    ):
+        await get_catalog_table(session_mock, max_rows=1000, distinct_namespaces=False)
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_table_catalog_retrieval_error():
+    """Test get_catalog_table handles catalog_table() errors"""
+    from deephaven_mcp.client import CorePlusSession
+
+    # Create mock session that fails to get catalog
+    session_mock = MagicMock(spec=CorePlusSession)
+    session_mock.catalog_table = AsyncMock(
+        side_effect=RuntimeError("Catalog not available")
+    )
+
+    with pytest.raises(RuntimeError, match="Catalog not available"):
+        await get_catalog_table(session_mock, max_rows=1000, distinct_namespaces=False)
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_table_filter_error():
+    """Test get_catalog_table handles invalid filter syntax"""
+    from deephaven_mcp.client import CorePlusSession
+
+    # Create mock catalog table with where method that raises error
+    catalog_table_mock = MagicMock()
+    catalog_table_mock.where = MagicMock(
+        side_effect=RuntimeError("Invalid filter syntax")
+    )
+
+    # Create mock session
+    session_mock = MagicMock(spec=CorePlusSession)
+    session_mock.catalog_table = AsyncMock(return_value=catalog_table_mock)
+
+    async def fake_to_thread(fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
+        with pytest.raises(RuntimeError, match="Invalid filter syntax"):
+            await get_catalog_table(
+                session_mock,
+                max_rows=1000,
+                filters=["InvalidFilter!!!"],
+                distinct_namespaces=False,
+            )
+
+
+# ===== catalog snapshot tests =====
+
+_SNAPSHOT_CATALOG = pyarrow.table(
+    {
+        "Namespace": ["md", "md", "ref", None, "md"],
+        "TableName": ["trades", "quotes", "symbols", "orphan", "daily_prices"],
+        "RowCount": pyarrow.array([1, 2, 3, 4, 5], pyarrow.int64()),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "filter_str, expected",
+    [
+        ("Namespace = `md`", ["trades", "quotes", "daily_prices"]),
+        ("Namespace == `ref`", ["symbols"]),
+        ("Namespace != `md`", ["symbols", "orphan"]),
+        ("TableName in `trades`, `symbols`", ["trades", "symbols"]),
+        ("Namespace not in `md`", ["symbols", "orphan"]),
+        ("TableName.startsWith(`d`)", ["daily_prices"]),
+        ("TableName.endsWith(`s`)", ["trades", "quotes", "symbols", "daily_prices"]),
+        ("TableName.contains(`ot`)", ["quotes"]),
+        ("Namespace.contains(`e`)", ["symbols"]),
+    ],
+)
+def test_compile_catalog_filter_supported(filter_str, expected):
+    """Test _compile_catalog_filter evaluates simple string filters like the server would"""
+    compiled = _compile_catalog_filter(filter_str, _SNAPSHOT_CATALOG.schema)
+
+    filtered = _SNAPSHOT_CATALOG.filter(compiled(_SNAPSHOT_CATALOG))
+    assert filtered["TableName"].to_pylist() == expected
+
+
+@pytest.mark.parametrize(
+    "filter_str",
+    [
+        "RowCount > 2",
+        "RowCount = `2`",
+        "Missing = `x`",
+        "Missing.contains(`x`)",
+        "RowCount.startsWith(`1`)",
+        "TableName.matches(`t.*`)",
+        "Namespace = `md` || Namespace = `ref`",
+    ],
+)
+def test_compile_catalog_filter_unsupported(filter_str):
+    """Test _compile_catalog_filter leaves anything but simple string filters to the server"""
+    assert _compile_catalog_filter(filter_str, _SNAPSHOT_CATALOG.schema) is None
+
+
+def _snapshot_session(*arrow_tables) -> MagicMock:
+    """Create a mock Core+ session whose catalog_table().to_arrow() returns the given tables in turn."""
+    from deephaven_mcp.client import CorePlusSession
+
+    catalog_table_mock = MagicMock()
+    catalog_table_mock.to_arrow = MagicMock(side_effect=list(arrow_tables))
+    session_mock = MagicMock(spec=CorePlusSession)
+    session_mock.catalog_table = AsyncMock(return_value=catalog_table_mock)
+    return session_mock
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_table_served_from_snapshot():
+    """Test get_catalog_table answers list, filter and namespace queries from one catalog fetch"""
+    session_mock = _snapshot_session(_SNAPSHOT_CATALOG)
+
+    with patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True):
+        listing, listing_complete = await get_catalog_table(
+            session_mock, max_rows=2, distinct_namespaces=False, session_name="s"
+        )
+        filtered, filtered_complete = await get_catalog_table(
+            session_mock,
+            max_rows=10,
+            filters=["Namespace = `md`", "TableName.contains(`es`)"],
+            distinct_namespaces=False,
+            session_name="s",
+        )
+        namespaces, namespaces_complete = await get_catalog_table(
+            session_mock,
+            max_rows=10,
+            filters=["Namespace != `ref`"],
+            distinct_namespaces=True,
+            session_name="s",
+        )
+
+    session_mock.catalog_table.assert_awaited_once()
+    assert listing["TableName"].to_pylist() == ["trades", "quotes"]
+    assert listing_complete is False
+    assert filtered["TableName"].to_pylist() == ["trades", "quotes", "daily_prices"]
+    assert filtered_complete is True
+    assert namespaces.column_names == ["Namespace"]
+    assert namespaces["Namespace"].to_pylist() == ["md", None]
+    assert namespaces_complete is True
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_table_snapshot_falls_back_for_server_filters():
+    """Test get_catalog_table runs filters it cannot evaluate locally on the server"""
+    session_mock = _snapshot_session(_SNAPSHOT_CATALOG)
+    server_catalog = session_mock.catalog_table.return_value
+    server_catalog.where = MagicMock(return_value=server_catalog)
+    server_catalog.head = MagicMock(return_value=server_catalog)
+    server_result = pyarrow.table({"TableName": ["quotes"]})
+
+    with (
+        patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True),
+        patch(
+            "deephaven_mcp.queries._fetch_limited_arrow",
+            new=AsyncMock(return_value=(server_result, True)),
+        ),
+    ):
+        result, is_complete = await get_catalog_table(
+            session_mock,
+            max_rows=10,
+            filters=["RowCount > 1"],
+            distinct_namespaces=False,
+            session_name="s",
+        )
+
+    assert result is server_result
+    server_catalog.where.assert_called_once_with(["RowCount > 1"])
+    server_catalog.to_arrow.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_table_snapshot_compiles_filters_against_cached_schema():
+    """Test filters on string columns of an existing snapshot beyond the known ones run locally"""
+    catalog = _SNAPSHOT_CATALOG.append_column(
+        "Owner", pyarrow.array(["a", "b", "a", "b", "a"])
+    )
+    session_mock = _snapshot_session(catalog)
+
+    with patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True):
+        await get_catalog_table(
+            session_mock, max_rows=1, distinct_namespaces=False, session_name="s"
+        )
+        result, is_complete = await get_catalog_table(
+            session_mock,
+            max_rows=10,
+            filters=["Owner = `b`"],
+            distinct_namespaces=False,
+            session_name="s",
+        )
+
+    session_mock.catalog_table.assert_awaited_once()
+    assert result["TableName"].to_pylist() == ["quotes", "orphan"]
+    assert is_complete is True
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_table_snapshot_schema_rejects_filters():
+    """Test a fetched snapshot whose columns are not strings sends the filters to the server"""
+    catalog = pyarrow.table(
+        {"Namespace": pyarrow.array([1, 2]), "TableName": ["a", "b"]}
+    )
+    session_mock = _snapshot_session(catalog)
+    server_catalog = session_mock.catalog_table.return_value
+    server_catalog.where = MagicMock(return_value=server_catalog)
+    server_catalog.head = MagicMock(return_value=server_catalog)
+    server_result = pyarrow.table({"TableName": ["a"]})
+
+    with (
+        patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True),
+        patch(
+            "deephaven_mcp.queries._fetch_limited_arrow",
+            new=AsyncMock(return_value=(server_result, True)),
+        ),
+    ):
+        result, _ = await get_catalog_table(
+            session_mock,
+            max_rows=10,
+            filters=["Namespace = `1`"],
+            distinct_namespaces=False,
+            session_name="s",
+        )
+
+    assert result is server_result
+    server_catalog.where.assert_called_once_with(["Namespace = `1`"])
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_table_snapshot_background_refresh():
+    """Test a stale snapshot is served while a background refresh replaces it"""
+    from deephaven_mcp import queries as queries_module
+
+    refreshed = _SNAPSHOT_CATALOG.slice(0, 1)
+    session_mock = _snapshot_session(_SNAPSHOT_CATALOG, refreshed)
+    catalog_table_mock = session_mock.catalog_table.return_value
+    release_refresh = asyncio.Event()
+
+    async def gated_catalog_table():
+        if session_mock.catalog_table.await_count > 1:
+            await release_refresh.wait()
+        return catalog_table_mock
+
+    session_mock.catalog_table.side_effect = gated_catalog_table
+
+    with (
+        patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True),
+        patch("deephaven_mcp.queries.CATALOG_SNAPSHOT_REFRESH_SECONDS", 60.0),
+        patch("deephaven_mcp.queries.time", monotonic=MagicMock(return_value=1000.0)),
+    ):
+        await get_catalog_table(
+            session_mock, max_rows=None, distinct_namespaces=False, session_name="s"
+        )
+        with patch(
+            "deephaven_mcp.queries.time", monotonic=MagicMock(return_value=1060.0)
+        ):
+            stale, _ = await get_catalog_table(
+                session_mock, max_rows=None, distinct_namespaces=False, session_name="s"
+            )
+            task = queries_module._CATALOG_SNAPSHOTS["s"].refresh_task
+            # A second stale read while the refresh runs does not start another one
+            await get_catalog_table(
+                session_mock, max_rows=None, distinct_namespaces=False, session_name="s"
+            )
+            assert queries_module._CATALOG_SNAPSHOTS["s"].refresh_task is task
+            release_refresh.set()
+            await task
+        fresh, _ = await get_catalog_table(
+            session_mock, max_rows=None, distinct_namespaces=False, session_name="s"
+        )
+
+    assert stale.num_rows == 5
+    assert fresh.num_rows == 1
+    assert session_mock.catalog_table.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_table_snapshot_refresh_failure_keeps_snapshot(caplog):
+    """Test a failed background refresh is logged and the previous snapshot is kept"""
+    from deephaven_mcp import queries as queries_module
+
+    session_mock = _snapshot_session(_SNAPSHOT_CATALOG, RuntimeError("worker down"))
+
+    with (
+        patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True),
+        patch("deephaven_mcp.queries.CATALOG_SNAPSHOT_REFRESH_SECONDS", 60.0),
+        patch("deephaven_mcp.queries.time", monotonic=MagicMock(return_value=1000.0)),
+    ):
+        await get_catalog_table(
+            session_mock, max_rows=None, distinct_namespaces=False, session_name="s"
+        )
+        with patch(
+            "deephaven_mcp.queries.time", monotonic=MagicMock(return_value=2000.0)
+        ):
+            await get_catalog_table(
+                session_mock, max_rows=None, distinct_namespaces=False, session_name="s"
+            )
+            task = queries_module._CATALOG_SNAPSHOTS["s"].refresh_task
+            with pytest.raises(RuntimeError):
+                await task
+            await asyncio.sleep(0)  # let the done callback run
+        result, _ = await get_catalog_table(
+            session_mock, max_rows=None, distinct_namespaces=False, session_name="s"
+        )
+
+    assert result.num_rows == 5
+    assert "Background catalog refresh failed for 's'" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_table_snapshot_first_fetch_failure():
+    """Test a failed first catalog fetch is raised and retried on the next call"""
+    session_mock = _snapshot_session(RuntimeError("worker down"), _SNAPSHOT_CATALOG)
+
+    with patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True):
+        with pytest.raises(RuntimeError, match="worker down"):
+            await get_catalog_table(
+                session_mock, max_rows=None, distinct_namespaces=False, session_name="s"
+            )
+        result, _ = await get_catalog_table(
+            session_mock, max_rows=None, distinct_namespaces=False, session_name="s"
+        )
+
+    assert result.num_rows == 5
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_table_snapshot_shared_first_fetch():
+    """Test concurrent first calls share a single catalog fetch"""
+    session_mock = _snapshot_session(_SNAPSHOT_CATALOG)
+
+    with patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True):
+        results = await asyncio.gather(
+            *(
+                get_catalog_table(
+                    session_mock,
+                    max_rows=None,
+                    distinct_namespaces=False,
+                    session_name="s",
+                )
+                for _ in range(3)
+            )
+        )
+
+    assert all(table.num_rows == 5 for table, _ in results)
+    session_mock.catalog_table.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_table_snapshot_disabled():
+    """Test a refresh interval of 0 disables catalog snapshots"""
+    session_mock = _snapshot_session()
+    server_result = pyarrow.table({"TableName": ["quotes"]})
+
+    with (
+        patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True),
+        patch("deephaven_mcp.queries.CATALOG_SNAPSHOT_REFRESH_SECONDS", 0.0),
+        patch(
+            "deephaven_mcp.queries._fetch_limited_arrow",
+            new=AsyncMock(return_value=(server_result, True)),
+        ),
+    ):
+        result, _ = await get_catalog_table(
+            session_mock, max_rows=10, distinct_namespaces=False, session_name="s"
+        )
+        from deephaven_mcp import queries as queries_module
+
+        assert queries_module._CATALOG_SNAPSHOTS == {}
+
+    assert result is server_result
+    session_mock.catalog_table.return_value.to_arrow.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_drop_catalog_snapshot():
+    """Test drop_catalog_snapshot discards snapshots and cancels background refreshes"""
+    from deephaven_mcp import queries as queries_module
+
+    refresh_started = asyncio.Event()
+
+    async def slow_catalog_table():
+        refresh_started.set()
+        await asyncio.sleep(10)
+
+    session_mock = _snapshot_session(_SNAPSHOT_CATALOG, _SNAPSHOT_CATALOG)
+
+    with (
+        patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True),
+        patch("deephaven_mcp.queries.CATALOG_SNAPSHOT_REFRESH_SECONDS", 60.0),
+    ):
+        with patch(
+            "deephaven_mcp.queries.time", monotonic=MagicMock(return_value=1000.0)
+        ):
+            await get_catalog_table(
+                session_mock, max_rows=None, distinct_namespaces=False, session_name="a"
+            )
+            await get_catalog_table(
+                session_mock, max_rows=None, distinct_namespaces=False, session_name="b"
+            )
+        session_mock.catalog_table = AsyncMock(side_effect=slow_catalog_table)
+        with patch(
+            "deephaven_mcp.queries.time", monotonic=MagicMock(return_value=2000.0)
+        ):
+            await get_catalog_table(
+                session_mock, max_rows=None, distinct_namespaces=False, session_name="a"
+            )
+        task = queries_module._CATALOG_SNAPSHOTS["a"].refresh_task
+        await refresh_started.wait()
+
+        drop_catalog_snapshot("a")
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert list(queries_module._CATALOG_SNAPSHOTS) == ["b"]
+
+        drop_catalog_snapshot()
+        drop_catalog_snapshot("missing")
+        assert queries_module._CATALOG_SNAPSHOTS == {}
+
+
+# ===== search_catalog tests =====
+
+
+@pytest.mark.asyncio
+async def test_search_catalog_reuses_index_until_refresh():
+    """Test search_catalog builds one index per snapshot and rebuilds it after a refresh"""
+    from deephaven_mcp import queries as queries_module
+
+    session_mock = _snapshot_session(_SNAPSHOT_CATALOG)
+
+    with (
+        patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True),
+        patch(
+            "deephaven_mcp.queries._build_catalog_index",
+            wraps=queries_module._build_catalog_index,
+        ) as build_mock,
+    ):
+        first, searched = await search_catalog(
+            session_mock, "trades", session_name="s", limit=2, include_columns=False
+        )
+        second, _ = await search_catalog(
+            session_mock, "quote", session_name="s", limit=5, include_columns=False
+        )
+        assert build_mock.call_count == 1
+
+        queries_module._CATALOG_SNAPSHOTS["s"].table = _SNAPSHOT_CATALOG.slice(2, 1)
+        refreshed, refreshed_searched = await search_catalog(
+            session_mock, "trades", session_name="s", limit=2, include_columns=False
+        )
+
+    session_mock.catalog_table.assert_awaited_once()
+    assert build_mock.call_count == 2
+    assert searched == 4  # the row with a null namespace is not indexed
+    assert [(m.namespace, m.table) for m in first] == [("md", "trades")]
+    assert first[0].score > 1.0
+    assert [m.table for m in second] == ["quotes"]
+    assert (refreshed, refreshed_searched) == ([], 1)
 
-    with pytest.raises(
-        UnsupportedOperationError,
-        match="get_catalog_table only supports enterprise.*sessions",
+
+@pytest.mark.asyncio
+async def test_search_catalog_snapshot_dropped_during_search():
+    """Test search_catalog still answers when the snapshot is dropped while it loads"""
+    with (
+        patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True),
+        patch(
+            "deephaven_mcp.queries._get_catalog_snapshot",
+            new=AsyncMock(return_value=_SNAPSHOT_CATALOG),
+        ),
     ):
-        await get_catalog_table(session_mock, max_rows=1000, distinct_namespaces=False)
+        matches, searched = await search_catalog(
+            _snapshot_session(), "symbols", session_name="s", limit=1
+        )
+
+    assert [m.table for m in matches] == ["symbols"]
+    assert searched == 4
 
 
 @pytest.mark.asyncio
-async def test_get_catalog_table_catalog_retrieval_error():
-    """Test get_catalog_table handles catalog_table() errors"""
-    from deephaven_mcp.client import CorePlusSession
+async def test_search_catalog_snapshot_disabled():
+    """Test search_catalog fetches the whole catalog when snapshots are disabled"""
+    session_mock = _snapshot_session()
 
-    # Create mock session that fails to get catalog
-    session_mock = MagicMock(spec=CorePlusSession)
-    session_mock.catalog_table = AsyncMock(
-        side_effect=RuntimeError("Catalog not available")
-    )
+    with (
+        patch("deephaven_mcp.queries.CATALOG_SNAPSHOT_REFRESH_SECONDS", 0.0),
+        patch(
+            "deephaven_mcp.queries.get_catalog_table",
+            new=AsyncMock(return_value=(_SNAPSHOT_CATALOG, True)),
+        ) as get_catalog_mock,
+    ):
+        matches, searched = await search_catalog(
+            session_mock, "daily", session_name="s", limit=3
+        )
 
-    with pytest.raises(RuntimeError, match="Catalog not available"):
-        await get_catalog_table(session_mock, max_rows=1000, distinct_namespaces=False)
+    get_catalog_mock.assert_awaited_once_with(
+        session_mock, max_rows=None, distinct_namespaces=False
+    )
+    assert [m.table for m in matches] == ["daily_prices"]
+    assert searched == 4
 
 
 @pytest.mark.asyncio
-async def test_get_catalog_table_filter_error():
-    """Test get_catalog_table handles invalid filter syntax"""
-    from deephaven_mcp.client import CorePlusSession
+async def test_search_catalog_matches_cached_columns():
+    """Test search_catalog merges column name matches from the schema cache"""
+    cache = _SchemaCache(60, 10)
+    for key, meta_table in [
+        (("s", "md", "trades"), pyarrow.table({"Name": ["TradePrice", "Size"]})),
+        (("s", "md", "daily_prices"), pyarrow.table({"Name": ["ClosePrice"]})),
+        (("s", "ref", "symbols"), pyarrow.table({"Name": ["Ticker", None]})),
+        (("s", "ref", "raw"), pyarrow.table({"Other": ["Price"]})),
+        (("s", None, "session_table"), pyarrow.table({"Name": ["Price"]})),
+        (("other", "md", "quotes"), pyarrow.table({"Name": ["BidPrice"]})),
+    ]:
+        cache.put(key, meta_table, cache.generation(key[0]))
 
-    # Create mock catalog table with where method that raises error
-    catalog_table_mock = MagicMock()
-    catalog_table_mock.where = MagicMock(
-        side_effect=RuntimeError("Invalid filter syntax")
-    )
+    with (
+        patch.dict("deephaven_mcp.queries._CATALOG_SNAPSHOTS", clear=True),
+        patch("deephaven_mcp.queries._SCHEMA_CACHE", cache),
+    ):
+        matches, _ = await search_catalog(
+            _snapshot_session(_SNAPSHOT_CATALOG), "price", session_name="s", limit=5
+        )
+        names_only, _ = await search_catalog(
+            _snapshot_session(_SNAPSHOT_CATALOG),
+            "price",
+            session_name="s",
+            limit=5,
+            include_columns=False,
+        )
 
-    # Create mock session
-    session_mock = MagicMock(spec=CorePlusSession)
-    session_mock.catalog_table = AsyncMock(return_value=catalog_table_mock)
+    by_table = {m.table: m for m in matches}
+    assert list(by_table) == ["daily_prices", "trades"]
+    assert by_table["trades"].matched_columns == ["TradePrice"]
+    assert 0 < by_table["trades"].score < 0.5
+    # The name match of daily_prices scores higher than its weighted column match
+    assert by_table["daily_prices"].matched_columns == ["ClosePrice"]
+    assert by_table["daily_prices"].score == names_only[0].score
+    assert [m.matched_columns for m in names_only] == [[]]
 
-    async def fake_to_thread(fn, *args, **kwargs):
-        return fn(*args, **kwargs)
 
-    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
-        with pytest.raises(RuntimeError, match="Invalid filter syntax"):
-            await get_catalog_table(
-                session_mock,
-                max_rows=1000,
-                filters=["InvalidFilter!!!"],
-                distinct_namespaces=False,
-            )
+@pytest.mark.asyncio
+async def test_search_catalog_not_enterprise():
+    """Test search_catalog rejects community sessions"""
+    from deephaven_mcp.client import CoreSession
+
+    with pytest.raises(UnsupportedOperationError, match="enterprise"):
+        await search_catalog(
+            MagicMock(spec=CoreSession), "x", session_name="s", limit=1
+        )
 
 
 # ===== get_catalog_table with distinct_namespaces tests =====
@@ -1062,9 +2032,9 @@ async def test_get_catalog_table_distinct_namespaces_success_no_filters():
 
     # Create mock namespace table (after sort)
     sorted_namespace_table_mock = MagicMock()
-    sorted_namespace_table_mock.size = 50
     sorted_namespace_table_mock.head = lambda n: sorted_namespace_table_mock
     arrow_mock = MagicMock(spec=pyarrow.Table)
+    arrow_mock.num_rows = 50
     sorted_namespace_table_mock.to_arrow = lambda: arrow_mock
 
     # Create mock namespace table (after select_distinct)
@@ -1098,9 +2068,9 @@ async def test_get_catalog_namespaces_success_with_filters():
 
     # Create mock filtered namespace table (after where)
     filtered_namespace_table_mock = MagicMock()
-    filtered_namespace_table_mock.size = 10
     filtered_namespace_table_mock.head = lambda n: filtered_namespace_table_mock
     arrow_mock = MagicMock(spec=pyarrow.Table)
+    arrow_mock.num_rows = 10
     filtered_namespace_table_mock.to_arrow = lambda: arrow_mock
 
     # Create mock sorted namespace table (after sort)
@@ -1176,11 +2146,11 @@ async def test_get_catalog_namespaces_incomplete():
     # Create mock limited table (after head)
     limited_table_mock = MagicMock()
     arrow_mock = MagicMock(spec=pyarrow.Table)
+    arrow_mock.num_rows = 1001  # head(1001) of 2000 namespaces
     limited_table_mock.to_arrow = lambda: arrow_mock
 
     # Create mock sorted namespace table with more rows than max_rows
     sorted_namespace_table_mock = MagicMock()
-    sorted_namespace_table_mock.size = 2000
     sorted_namespace_table_mock.head = lambda n: limited_table_mock
 
     # Create mock namespace table (after select_distinct)
@@ -1202,8 +2172,8 @@ async def test_get_catalog_namespaces_incomplete():
         result_table, is_complete = await get_catalog_table(
             session_mock, max_rows=1000, distinct_namespaces=True
         )
-        assert result_table is arrow_mock
-        assert is_complete is False  # 2000 > 1000, so incomplete
+        assert result_table is arrow_mock.slice.return_value
+        assert is_complete is False  # 1001 > 1000, so incomplete
 
 
 @pytest.mark.asyncio
@@ -1331,6 +2301,471 @@ async def test_get_catalog_meta_table_both_fail():
         await get_catalog_meta_table(session_mock, "market_data", "missing_table")
 
 
+# ===== get_catalog_meta_tables tests =====
+
+
+def _catalog_meta_kind(variable: str) -> str:
+    """Return 'tables' or 'errors' for a catalog meta script result variable."""
+    prefix, kind, suffix = variable.rsplit("_", 2)
+    assert prefix == "_dh_mcp_catalog_meta"
+    assert len(suffix) == 32
+    return kind
+
+
+def _catalog_meta_session() -> MagicMock:
+    """Create a mock Python Core+ session whose run_script succeeds."""
+    from deephaven_mcp.client import CorePlusSession
+
+    session_mock = MagicMock(spec=CorePlusSession)
+    session_mock.programming_language = "python"
+    session_mock.run_script = AsyncMock()
+    return session_mock
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_meta_tables_splits_merged_table():
+    """Test get_catalog_meta_tables splits the merged meta table and maps script errors"""
+    session_mock = _catalog_meta_session()
+    merged = pyarrow.table(
+        {
+            "Name": ["Date", "Price", "Sym"],
+            "DataType": ["LocalDate", "double", "String"],
+            "McpCatalogIndex": pyarrow.array([0, 0, 2], pyarrow.int32()),
+            "McpLiveOnly": [False, False, False],
+        }
+    )
+    errors = pyarrow.table(
+        {
+            "McpCatalogIndex": pyarrow.array([1], pyarrow.int32()),
+            "Error": ["Failed to load catalog table 'md.missing'"],
+        }
+    )
+    tables = {"tables": merged, "errors": errors}
+
+    async def fake_get_table(session, table_name, max_rows, head=True):
+        return tables[_catalog_meta_kind(table_name)], True
+
+    with patch("deephaven_mcp.queries.get_table", new=fake_get_table):
+        result = await get_catalog_meta_tables(
+            session_mock, [("md", "prices"), ("md", "missing"), ("ref", "symbols")]
+        )
+
+    assert result[0].to_pydict() == {
+        "Name": ["Date", "Price"],
+        "DataType": ["LocalDate", "double"],
+    }
+    assert isinstance(result[1], Exception)
+    assert str(result[1]) == "Failed to load catalog table 'md.missing'"
+    assert result[2].to_pydict() == {"Name": ["Sym"], "DataType": ["String"]}
+
+    assert session_mock.run_script.await_count == 2
+    script = session_mock.run_script.call_args_list[0].args[0]
+    compile(script, "<catalog_meta_script>", "exec")
+    assert '[["md", "prices"], ["md", "missing"], ["ref", "symbols"]]' in script
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_meta_tables_missing_result():
+    """Test get_catalog_meta_tables reports pairs that produced neither meta rows nor an error"""
+    session_mock = _catalog_meta_session()
+    merged = pyarrow.table(
+        {
+            "Name": pyarrow.array([], pyarrow.string()),
+            "McpCatalogIndex": pyarrow.array([], pyarrow.int32()),
+            "McpLiveOnly": pyarrow.array([], pyarrow.bool_()),
+        }
+    )
+    errors = pyarrow.table(
+        {
+            "McpCatalogIndex": pyarrow.array([], pyarrow.int32()),
+            "Error": pyarrow.array([], pyarrow.string()),
+        }
+    )
+    tables = {"tables": merged, "errors": errors}
+
+    async def fake_get_table(session, table_name, max_rows, head=True):
+        return tables[_catalog_meta_kind(table_name)], True
+
+    with patch("deephaven_mcp.queries.get_table", new=fake_get_table):
+        result = await get_catalog_meta_tables(session_mock, [("md", "empty")])
+
+    assert len(result) == 1
+    assert "No meta table returned for catalog table 'md.empty'" in str(result[0])
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_meta_tables_uses_and_updates_live_only_memo():
+    """Test remembered live-only pairs are sent to the script and its live_table results update the memo"""
+    from deephaven_mcp import queries as queries_module
+
+    session_mock = _catalog_meta_session()
+    queries_module._LIVE_ONLY_CATALOG_TABLES[session_mock] = {
+        ("md", "intraday"),
+        ("md", "now_historical"),
+        ("md", "gone"),
+    }
+    merged = pyarrow.table(
+        {
+            "Name": ["A", "B", "C"],
+            "McpCatalogIndex": pyarrow.array([0, 1, 2], pyarrow.int32()),
+            "McpLiveOnly": [True, False, True],
+        }
+    )
+    errors = pyarrow.table(
+        {
+            "McpCatalogIndex": pyarrow.array([3], pyarrow.int32()),
+            "Error": ["both failed"],
+        }
+    )
+    tables = {"tables": merged, "errors": errors}
+
+    async def fake_get_table(session, table_name, max_rows, head=True):
+        return tables[_catalog_meta_kind(table_name)], True
+
+    with patch("deephaven_mcp.queries.get_table", new=fake_get_table):
+        result = await get_catalog_meta_tables(
+            session_mock,
+            [
+                ("md", "intraday"),
+                ("md", "now_historical"),
+                ("md", "new_intraday"),
+                ("md", "gone"),
+            ],
+        )
+
+    assert [meta.to_pydict() for meta in result[:3]] == [
+        {"Name": ["A"]},
+        {"Name": ["B"]},
+        {"Name": ["C"]},
+    ]
+    script = session_mock.run_script.call_args_list[0].args[0]
+    compile(script, "<catalog_meta_script>", "exec")
+    assert "'[0, 1, 3]'" in script
+    assert queries_module._LIVE_ONLY_CATALOG_TABLES[session_mock] == {
+        ("md", "intraday"),
+        ("md", "new_intraday"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_meta_tables_uses_unique_variables_and_removes_them():
+    """Test each call binds its own result variables and deletes them after fetching"""
+    session_mock = _catalog_meta_session()
+    empty = {
+        "tables": pyarrow.table(
+            {
+                "McpCatalogIndex": pyarrow.array([], pyarrow.int32()),
+                "McpLiveOnly": pyarrow.array([], pyarrow.bool_()),
+            }
+        ),
+        "errors": pyarrow.table(
+            {
+                "McpCatalogIndex": pyarrow.array([], pyarrow.int32()),
+                "Error": pyarrow.array([], pyarrow.string()),
+            }
+        ),
+    }
+    fetched = []
+
+    async def fake_get_table(session, table_name, max_rows, head=True):
+        fetched.append(table_name)
+        return empty[_catalog_meta_kind(table_name)], True
+
+    with patch("deephaven_mcp.queries.get_table", new=fake_get_table):
+        await get_catalog_meta_tables(session_mock, [("md", "a")])
+        await get_catalog_meta_tables(session_mock, [("md", "a")])
+
+    assert len(set(fetched)) == 4
+    scripts = [c.args[0] for c in session_mock.run_script.call_args_list]
+    for script, cleanup, names in zip(
+        scripts[::2], scripts[1::2], (fetched[:2], fetched[2:]), strict=True
+    ):
+        assert all(name in script for name in names)
+        assert "finally:\n    del _dh_mcp_make_catalog_meta_tables" in script
+        assert cleanup == "\n".join(f"globals().pop({name!r}, None)" for name in names)
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_meta_tables_removes_variables_when_fetch_fails(caplog):
+    """Test a failed fetch still deletes the result variables, and a failed delete is only logged"""
+    session_mock = _catalog_meta_session()
+    session_mock.run_script = AsyncMock(side_effect=[None, RuntimeError("gone")])
+
+    with (
+        patch(
+            "deephaven_mcp.queries.get_table",
+            new=AsyncMock(side_effect=RuntimeError("fetch failed")),
+        ),
+        pytest.raises(RuntimeError, match="fetch failed"),
+    ):
+        await get_catalog_meta_tables(session_mock, [("md", "a")])
+
+    assert session_mock.run_script.await_count == 2
+    assert "Could not remove '_dh_mcp_catalog_meta_tables_" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_meta_tables_script_removes_helper_when_it_fails():
+    """Test the worker script deletes its helper function even when the helper raises"""
+    session_mock = _catalog_meta_session()
+    session_mock.run_script = AsyncMock(side_effect=[RuntimeError("script failed")])
+
+    with pytest.raises(RuntimeError, match="script failed"):
+        await get_catalog_meta_tables(session_mock, [("md", "a")])
+
+    namespace: dict = {}
+    with (
+        patch.dict("sys.modules", {"deephaven": None}),
+        pytest.raises(ImportError),
+    ):
+        exec(session_mock.run_script.await_args.args[0], namespace)
+    assert "_dh_mcp_make_catalog_meta_tables" not in namespace
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_meta_tables_empty_input():
+    """Test get_catalog_meta_tables returns an empty list without running a script"""
+    session_mock = _catalog_meta_session()
+
+    assert await get_catalog_meta_tables(session_mock, []) == []
+    session_mock.run_script.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_meta_tables_non_python_session():
+    """Test get_catalog_meta_tables rejects non-Python sessions"""
+    session_mock = _catalog_meta_session()
+    session_mock.programming_language = "groovy"
+
+    with pytest.raises(UnsupportedOperationError):
+        await get_catalog_meta_tables(session_mock, [("md", "prices")])
+    session_mock.run_script.assert_not_called()
+
+
+# ===== schema cache tests =====
+
+
+def _meta(name: str) -> pyarrow.Table:
+    """Build a one-row meta table."""
+    return pyarrow.table({"Name": [name], "DataType": ["int"]})
+
+
+def test_schema_cache_hit_miss_and_ttl():
+    """Test _SchemaCache counts hits and misses and expires entries after the TTL"""
+    cache = _SchemaCache(ttl_seconds=10, max_entries=4)
+    key = ("community:local:a", None, "t")
+
+    with patch("deephaven_mcp.queries.time", monotonic=MagicMock(return_value=100.0)):
+        assert cache.get(key) is None
+        cache.put(key, _meta("x"), cache.generation("community:local:a"))
+        assert cache.get(key).equals(_meta("x"))
+
+    with patch("deephaven_mcp.queries.time", monotonic=MagicMock(return_value=110.0)):
+        assert cache.get(key) is None
+
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(cache._entries) == 0
+
+
+def test_schema_cache_lru_eviction():
+    """Test _SchemaCache evicts the least recently used entry when full"""
+    cache = _SchemaCache(ttl_seconds=60, max_entries=2)
+    keys = [("s", None, name) for name in ("a", "b", "c")]
+
+    cache.put(keys[0], _meta("a"), cache.generation("s"))
+    cache.put(keys[1], _meta("b"), cache.generation("s"))
+    assert cache.get(keys[0]) is not None  # "a" becomes most recently used
+    cache.put(keys[2], _meta("c"), cache.generation("s"))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_schema_cache_invalidate_session_and_all():
+    """Test _SchemaCache.invalidate drops one session's entries or every entry"""
+    cache = _SchemaCache(ttl_seconds=60, max_entries=10)
+    cache.put(("s1", None, "a"), _meta("a"), cache.generation("s1"))
+    cache.put(("s1", "ns", "b"), _meta("b"), cache.generation("s1"))
+    cache.put(("s2", None, "a"), _meta("a"), cache.generation("s2"))
+
+    assert cache.invalidate("s1") == 2
+    assert cache.get(("s1", None, "a")) is None
+    assert cache.get(("s2", None, "a")) is not None
+
+    assert cache.invalidate(None) == 1
+    assert len(cache._entries) == 0
+
+
+def test_schema_cache_put_after_invalidation_is_dropped():
+    """Test a fetch that started before an invalidation does not repopulate the cache"""
+    cache = _SchemaCache(ttl_seconds=60, max_entries=10)
+    session_generation = cache.generation("s1")
+    cache.invalidate("s1")
+    cache.put(("s1", None, "a"), _meta("a"), session_generation)
+
+    global_generation = cache.generation("s1")
+    cache.invalidate(None)
+    cache.put(("s1", None, "a"), _meta("a"), global_generation)
+
+    assert len(cache._entries) == 0
+
+
+def test_schema_cache_entries():
+    """Test _SchemaCache.entries lists a session's unexpired entries without counting hits"""
+    cache = _SchemaCache(ttl_seconds=10, max_entries=10)
+    with patch("deephaven_mcp.queries.time", monotonic=MagicMock(return_value=100.0)):
+        cache.put(("s1", "ns", "a"), _meta("a"), cache.generation("s1"))
+        cache.put(("s2", "ns", "b"), _meta("b"), cache.generation("s2"))
+    with patch("deephaven_mcp.queries.time", monotonic=MagicMock(return_value=105.0)):
+        cache.put(("s1", None, "c"), _meta("c"), cache.generation("s1"))
+
+    with patch("deephaven_mcp.queries.time", monotonic=MagicMock(return_value=108.0)):
+        assert [key for key, _ in cache.entries("s1")] == [
+            ("s1", "ns", "a"),
+            ("s1", None, "c"),
+        ]
+    with patch("deephaven_mcp.queries.time", monotonic=MagicMock(return_value=111.0)):
+        assert [key for key, _ in cache.entries("s1")] == [("s1", None, "c")]
+
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_schema_cache_disabled():
+    """Test a non-positive TTL or size disables the cache"""
+    for cache in (_SchemaCache(0, 10), _SchemaCache(60, 0)):
+        assert cache.enabled is False
+        cache.put(("s", None, "a"), _meta("a"), cache.generation("s"))
+        assert len(cache._entries) == 0
+
+
+def test_schema_cache_env_overrides(monkeypatch):
+    """Test the schema cache and catalog snapshot settings can be overridden with environment variables"""
+    import importlib
+
+    import deephaven_mcp.queries as queries_module
+
+    monkeypatch.setenv("DH_MCP_SCHEMA_CACHE_TTL_SECONDS", "5.5")
+    monkeypatch.setenv("DH_MCP_SCHEMA_CACHE_MAX_ENTRIES", "7")
+    monkeypatch.setenv("DH_MCP_CATALOG_SNAPSHOT_REFRESH_SECONDS", "42")
+    try:
+        importlib.reload(queries_module)
+        assert queries_module.SCHEMA_CACHE_TTL_SECONDS == 5.5
+        assert queries_module.SCHEMA_CACHE_MAX_ENTRIES == 7
+        assert queries_module.CATALOG_SNAPSHOT_REFRESH_SECONDS == 42.0
+    finally:
+        monkeypatch.delenv("DH_MCP_SCHEMA_CACHE_TTL_SECONDS")
+        monkeypatch.delenv("DH_MCP_SCHEMA_CACHE_MAX_ENTRIES")
+        monkeypatch.delenv("DH_MCP_CATALOG_SNAPSHOT_REFRESH_SECONDS")
+        importlib.reload(queries_module)
+
+
+@pytest.mark.asyncio
+async def test_get_session_meta_table_uses_schema_cache():
+    """Test get_session_meta_table serves repeated requests from the schema cache"""
+    session_mock = MagicMock()
+    table_mock = MagicMock()
+    table_mock.meta_table.to_arrow.return_value = _meta("x")
+    session_mock.open_table = AsyncMock(return_value=table_mock)
+
+    with patch("deephaven_mcp.queries._SCHEMA_CACHE", _SchemaCache(60, 10)):
+        first = await get_session_meta_table(session_mock, "t", session_name="s")
+        second = await get_session_meta_table(session_mock, "t", session_name="s")
+        assert get_schema_cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+        invalidate_schema_cache("s")
+        await get_session_meta_table(session_mock, "t", session_name="s")
+
+    assert first is second
+    assert session_mock.open_table.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_meta_table_uses_schema_cache():
+    """Test get_catalog_meta_table serves repeated requests from the schema cache"""
+    from deephaven_mcp.client import CorePlusSession
+
+    session_mock = MagicMock(spec=CorePlusSession)
+    table_mock = MagicMock()
+    table_mock.meta_table.to_arrow.return_value = _meta("x")
+    session_mock.historical_table = AsyncMock(return_value=table_mock)
+
+    with patch("deephaven_mcp.queries._SCHEMA_CACHE", _SchemaCache(60, 10)):
+        first = await get_catalog_meta_table(
+            session_mock, "md", "prices", session_name="s"
+        )
+        second = await get_catalog_meta_table(
+            session_mock, "md", "prices", session_name="s"
+        )
+        invalidate_schema_cache()
+        assert get_schema_cache_stats() == {"hits": 1, "misses": 1, "size": 0}
+
+    assert first is second
+    session_mock.historical_table.assert_awaited_once_with("md", "prices")
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_meta_tables_uses_schema_cache():
+    """Test get_catalog_meta_tables only sends uncached tables to the server and caches successes"""
+    session_mock = _catalog_meta_session()
+    cache = _SchemaCache(60, 10)
+    cached_meta = _meta("cached")
+    cache.put(("s", "md", "cached"), cached_meta, cache.generation("s"))
+
+    merged = pyarrow.table(
+        {
+            "Name": ["Sym"],
+            "DataType": ["String"],
+            "McpCatalogIndex": pyarrow.array([0], pyarrow.int32()),
+            "McpLiveOnly": [False],
+        }
+    )
+    errors = pyarrow.table(
+        {
+            "McpCatalogIndex": pyarrow.array([1], pyarrow.int32()),
+            "Error": ["missing"],
+        }
+    )
+    tables = {"tables": merged, "errors": errors}
+
+    async def fake_get_table(session, table_name, max_rows, head=True):
+        return tables[_catalog_meta_kind(table_name)], True
+
+    with (
+        patch("deephaven_mcp.queries._SCHEMA_CACHE", cache),
+        patch("deephaven_mcp.queries.get_table", new=fake_get_table),
+    ):
+        result = await get_catalog_meta_tables(
+            session_mock,
+            [("md", "cached"), ("md", "fresh"), ("md", "missing")],
+            session_name="s",
+        )
+
+    assert result[0] is cached_meta
+    assert result[1].to_pydict() == {"Name": ["Sym"], "DataType": ["String"]}
+    assert str(result[2]) == "missing"
+    script = session_mock.run_script.call_args_list[0].args[0]
+    assert '[["md", "fresh"], ["md", "missing"]]' in script
+    assert cache.get(("s", "md", "fresh")) is result[1]
+    assert cache.get(("s", "md", "missing")) is None
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_meta_tables_all_cached_skips_script():
+    """Test get_catalog_meta_tables runs no script when every table is cached"""
+    session_mock = _catalog_meta_session()
+    cache = _SchemaCache(60, 10)
+    cache.put(("s", "md", "a"), _meta("a"), cache.generation("s"))
+
+    with patch("deephaven_mcp.queries._SCHEMA_CACHE", cache):
+        result = await get_catalog_meta_tables(
+            session_mock, [("md", "a")], session_name="s"
+        )
+
+    assert result[0].equals(_meta("a"))
+    session_mock.run_script.assert_not_called()
+
+
 # ===== _load_catalog_table tests =====
 
 
@@ -1395,6 +2830,61 @@ async def test_load_catalog_table_both_fail():
         await _load_catalog_table(session_mock, "market_data", "missing_table")
 
 
+@pytest.mark.asyncio
+async def test_load_catalog_table_remembers_live_tables():
+    """Test _load_catalog_table goes straight to live_table once a table needed the fallback"""
+    from deephaven_mcp.client import CorePlusSession
+
+    session_mock = MagicMock(spec=CorePlusSession)
+    mock_table = MagicMock()
+    session_mock.historical_table = AsyncMock(
+        side_effect=Exception("Historical table not found")
+    )
+    session_mock.live_table = AsyncMock(return_value=mock_table)
+
+    for _ in range(3):
+        assert (
+            await _load_catalog_table(session_mock, "market_data", "live_trades")
+            is mock_table
+        )
+
+    session_mock.historical_table.assert_called_once_with("market_data", "live_trades")
+    assert session_mock.live_table.await_count == 3
+
+    # The memo is per session: another session starts with historical_table again
+    other_session = MagicMock(spec=CorePlusSession)
+    other_session.historical_table = AsyncMock(return_value=mock_table)
+    await _load_catalog_table(other_session, "market_data", "live_trades")
+    other_session.historical_table.assert_called_once_with("market_data", "live_trades")
+
+
+@pytest.mark.asyncio
+async def test_load_catalog_table_forgets_failed_live_memo():
+    """Test _load_catalog_table retries historical_table when a remembered live_table load fails"""
+    from deephaven_mcp.client import CorePlusSession
+
+    session_mock = MagicMock(spec=CorePlusSession)
+    live_table = MagicMock()
+    historical_table = MagicMock()
+    session_mock.historical_table = AsyncMock(
+        side_effect=[Exception("Historical table not found"), historical_table]
+    )
+    session_mock.live_table = AsyncMock(
+        side_effect=[live_table, Exception("Live table gone")]
+    )
+
+    assert await _load_catalog_table(session_mock, "md", "t") is live_table
+    # Remembered live_table now fails, so the table is loaded via historical_table
+    assert await _load_catalog_table(session_mock, "md", "t") is historical_table
+    # The memo was dropped, so the next load starts with historical_table again
+    session_mock.historical_table.side_effect = None
+    session_mock.historical_table.return_value = historical_table
+    assert await _load_catalog_table(session_mock, "md", "t") is historical_table
+
+    assert session_mock.live_table.await_count == 2
+    assert session_mock.historical_table.await_count == 3
+
+
 # ===== get_catalog_table_data tests =====
 
 
@@ -1408,10 +2898,7 @@ async def test_get_catalog_table_data_success_with_limit():
     mock_table = MagicMock()
     mock_limited_table = MagicMock()
     mock_arrow_table = MagicMock(spec=pyarrow.Table)
-    mock_arrow_table.num_rows = 100
-
-    # Mock table size
-    mock_table.size = 1000
+    mock_arrow_table.num_rows = 101
 
     # Mock head() for row limiting
     mock_table.head = MagicMock(return_value=mock_limited_table)
@@ -1429,10 +2916,52 @@ async def test_get_catalog_table_data_success_with_limit():
             session_mock, "market_data", "daily_prices", max_rows=100, head=True
         )
 
-    assert result is mock_arrow_table
-    assert is_complete is False  # 100 rows retrieved from 1000 total
+    assert result is mock_arrow_table.slice.return_value
+    mock_arrow_table.slice.assert_called_once_with(0, 100)
+    assert is_complete is False  # head(101) returned 101 rows
     session_mock.historical_table.assert_called_once_with("market_data", "daily_prices")
-    mock_table.head.assert_called_once_with(100)
+    mock_table.head.assert_called_once_with(101)
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_table_data_with_columns_and_filters():
+    """Test get_catalog_table_data filters and projects before limiting rows"""
+    from deephaven_mcp.client import CorePlusSession
+
+    session_mock = MagicMock(spec=CorePlusSession)
+    mock_table = MagicMock()
+    mock_filtered_table = MagicMock()
+    mock_viewed_table = MagicMock()
+    mock_limited_table = MagicMock()
+    mock_arrow_table = MagicMock(spec=pyarrow.Table)
+    mock_arrow_table.num_rows = 6
+
+    mock_table.where = MagicMock(return_value=mock_filtered_table)
+    mock_filtered_table.view = MagicMock(return_value=mock_viewed_table)
+    mock_viewed_table.tail = MagicMock(return_value=mock_limited_table)
+    mock_limited_table.to_arrow = MagicMock(return_value=mock_arrow_table)
+    session_mock.historical_table = AsyncMock(return_value=mock_table)
+
+    async def fake_to_thread(fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+    with patch("deephaven_mcp.queries.asyncio.to_thread", new=fake_to_thread):
+        result, is_complete = await get_catalog_table_data(
+            session_mock,
+            "market_data",
+            "trades",
+            max_rows=5,
+            head=False,
+            columns=["Timestamp", "Price"],
+            filters=["Sym = `AAPL`"],
+        )
+
+    assert result is mock_arrow_table.slice.return_value
+    mock_arrow_table.slice.assert_called_once_with(1)
+    assert is_complete is False
+    mock_table.where.assert_called_once_with(["Sym = `AAPL`"])
+    mock_filtered_table.view.assert_called_once_with(["Timestamp", "Price"])
+    mock_viewed_table.tail.assert_called_once_with(6)
 
 
 @pytest.mark.asyncio
@@ -1475,10 +3004,7 @@ async def test_get_catalog_table_data_with_tail():
     mock_table = MagicMock()
     mock_limited_table = MagicMock()
     mock_arrow_table = MagicMock(spec=pyarrow.Table)
-    mock_arrow_table.num_rows = 50
-
-    # Mock table size
-    mock_table.size = 1000
+    mock_arrow_table.num_rows = 51
 
     # Mock tail() for row limiting
     mock_table.tail = MagicMock(return_value=mock_limited_table)
@@ -1496,10 +3022,11 @@ async def test_get_catalog_table_data_with_tail():
             session_mock, "market_data", "trades", max_rows=50, head=False
         )
 
-    assert result is mock_arrow_table
-    assert is_complete is False  # 50 rows retrieved from 1000 total
+    assert result is mock_arrow_table.slice.return_value
+    mock_arrow_table.slice.assert_called_once_with(1)
+    assert is_complete is False  # tail(51) returned 51 rows
     session_mock.historical_table.assert_called_once_with("market_data", "trades")
-    mock_table.tail.assert_called_once_with(50)
+    mock_table.tail.assert_called_once_with(51)
 
 
 @pytest.mark.asyncio